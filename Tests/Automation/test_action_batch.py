@@ -0,0 +1,109 @@
+"""
+ActionBatch 테스트
+
+core/action_batch.py, AutomationClient.batch() - FakeHwp로 큐 실행/결과/타이밍 확인
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.action_batch import ActionBatch, BatchError
+from core.automation_client import AutomationClient
+from core.com_backend import use_hwp_factory
+from core.fake_hwp import FakeBackend, FakeDocument, FakeHwp
+
+
+def _fake_hwp(paragraphs=("첫 문단", "둘째 문단"), columns: int = 2) -> FakeHwp:
+    hwp = FakeHwp()
+    hwp.document = FakeDocument.from_problems([list(paragraphs)], columns=columns)
+    return hwp
+
+
+def test_client_batch_records_timings():
+    """client.batch()가 with 블록 종료 시 실행되고 타이밍을 남김"""
+    backend = FakeBackend()
+    with use_hwp_factory(backend):
+        client = AutomationClient()
+        hwp = client.hwp
+        hwp.document = FakeDocument.from_problems([["문제", "보기"]])
+
+        with client.batch() as batch:
+            batch.run("MoveDocBegin", "SelectAll", "Copy")
+            assert len(batch) == 3
+            assert backend.stats.calls["Run:Copy"] == 0  # 아직 실행 전
+
+        assert backend.stats.calls["Run:SelectAll"] == 1
+        assert backend.clipboard["document"].text() == "문제\r\n보기"
+        assert batch.stats.actions == 3
+        assert len(client.batch_timings) == 1
+        assert client.batch_timings[0].flushes == 1
+        assert client.batch_timings[0].last_elapsed >= 0
+
+
+def test_client_batch_timings_are_per_flush():
+    """batch_timings 항목은 누적값이 아니라 flush 한 번의 통계"""
+    backend = FakeBackend()
+    with use_hwp_factory(backend):
+        client = AutomationClient()
+        client.hwp.document = FakeDocument.from_problems([["문제", "보기"]])
+
+        batch = client.batch()
+        batch.run("MoveDocBegin", "SelectAll")
+        batch.flush()
+        batch.run("Copy")
+        batch.get_pos()
+        batch.flush()
+
+        first, second = client.batch_timings
+        assert (first.flushes, first.actions, first.queries) == (1, 2, 0)
+        assert (second.flushes, second.actions, second.queries) == (1, 1, 1)
+        assert second.elapsed == second.last_elapsed
+        assert batch.stats.flushes == 2 and batch.stats.actions == 3
+
+
+def test_pending_results_and_execute():
+    """GetPos 결과는 Pending으로, 파라미터 셋 변경은 execute로"""
+    hwp = _fake_hwp()
+    batch = ActionBatch(hwp)
+
+    begin = batch.run("MoveDocBegin").get_pos()
+    end = batch.run("MoveParaEnd").get_pos()
+    columns = batch.execute("MultiColumn", "HColDef", Count=1, ApplyTo=6)
+    assert not end.done
+
+    results = batch.flush()
+    assert begin.value == (0, 0, 0)
+    assert end.value == (0, 0, len("첫 문단"))
+    assert columns.value is True
+    assert hwp.document.columns == 1
+    assert len(results) == 5
+    assert batch.stats.operations == 5
+
+
+def test_failure_discards_rest():
+    """실패한 작업 이후는 실행하지 않고 순번을 알려줌"""
+    hwp = _fake_hwp()
+    batch = ActionBatch(hwp)
+    batch.run("MoveDocEnd").call("NoSuchMethod")
+    batch.run("MoveDocBegin")
+
+    with pytest.raises(BatchError) as info:
+        batch.flush()
+
+    assert info.value.index == 1
+    assert len(batch) == 0
+    assert hwp.GetPos() != (0, 0, 0)  # MoveDocBegin은 실행되지 않음
+
+
+if __name__ == "__main__":
+    test_client_batch_records_timings()
+    test_client_batch_timings_are_per_flush()
+    test_pending_results_and_execute()
+    test_failure_discards_rest()
+    print("✅ ActionBatch 테스트 통과!")
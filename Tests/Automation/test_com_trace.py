@@ -0,0 +1,112 @@
+"""
+COM 호출 추적 테스트
+
+core/com_trace.py - FakeHwp 작업을 기록 → 보고서 집계 → 다른 FakeHwp로 재생
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.com_backend import use_hwp_factory
+from core.com_trace import (
+    KIND_CALL,
+    KIND_NEW,
+    TRACE_ENV,
+    TraceProxy,
+    ObjectRef,
+    tracing,
+    read_trace,
+    replay_trace,
+    summarize_trace,
+)
+from core.fake_hwp import FakeBackend, FakeDocument
+from core.hwp_extractor import open_hwp, iter_note_blocks
+from core.hwp_extractor_copypaste import extract_block_copypaste
+
+
+def _record_extract(temp: Path) -> tuple:
+    source = temp / "source.hwp"
+    FakeDocument.from_problems([["문제 1", "보기"], ["문제 2", "보기"]]).save(source)
+    trace_path = temp / "extract.hwptrace"
+    backend = FakeBackend()
+
+    with use_hwp_factory(backend), tracing(trace_path):
+        with open_hwp(str(source)) as hwp:
+            assert isinstance(hwp, TraceProxy)
+            blocks = list(iter_note_blocks(hwp))
+            assert extract_block_copypaste(hwp, blocks[1], temp / "block.hwp")
+
+    return trace_path, backend
+
+
+def test_trace_records_calls():
+    """프록시가 Run/HAction.Execute/속성 접근을 기록"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        trace_path, backend = _record_extract(Path(temp_dir))
+        events = list(read_trace(trace_path))
+
+        assert events[0].kind == KIND_NEW
+        runs = [e.args[0] for e in events if e.kind == KIND_CALL and e.name == "Run"]
+        assert runs.count("MoveDocBegin") == backend.stats.calls["Run:MoveDocBegin"]
+
+        execute = next(e for e in events if e.name == "Execute" and e.args[0] == "FileSaveAs_S")
+        assert isinstance(execute.args[1], ObjectRef)  # 파라미터셋은 핸들로 기록
+        assert execute.result is True
+        assert all(e.duration >= 0 for e in events)
+
+        hotspots, total = summarize_trace(trace_path)
+        keys = {h.key: h for h in hotspots}
+        assert keys["HAction.Execute:FileSaveAs_S"].count == 1
+        assert keys["Run:MoveDocBegin"].count == backend.stats.calls["Run:MoveDocBegin"]
+        assert "HParameterSet.HFileOpenSave.filename=" in keys
+        assert total >= max(h.total_time for h in hotspots)
+
+
+def test_replay_on_fake_backend():
+    """기록한 추적을 새 FakeHwp에 재생하면 같은 호출과 결과가 나옴"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        trace_path, recorded = _record_extract(temp)
+        (temp / "block.hwp").unlink()
+
+        backend = FakeBackend()
+        result = replay_trace(trace_path, backend)
+
+        assert result.instances == 1
+        assert not result.errors
+        assert not result.mismatches
+        assert backend.stats.calls == recorded.stats.calls
+        assert (temp / "block.hwp").exists()
+
+
+def test_env_tracing_is_written_at_exit():
+    """HWP_TRACE로 켠 추적은 프로세스가 정상 종료하면 버퍼까지 기록됨"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        snippet = (
+            "import sys\n"
+            f"sys.path.insert(0, {str(project_root)!r})\n"
+            "from core.com_backend import dispatch_hwp\n"
+            "hwp = dispatch_hwp()\n"
+            "hwp.Run('MoveDocBegin')\n"
+            "hwp.Run('MoveDocEnd')\n"
+        )
+        env = dict(os.environ, HWP_BACKEND="fake", **{TRACE_ENV: temp_dir})
+        subprocess.run([sys.executable, "-c", snippet], env=env, check=True)
+
+        [trace_path] = Path(temp_dir).iterdir()
+        calls = [event.name for event in read_trace(trace_path) if event.kind == KIND_CALL]
+        assert calls == ["Run", "Run"]
+
+
+if __name__ == "__main__":
+    test_trace_records_calls()
+    test_replay_on_fake_backend()
+    test_env_tracing_is_written_at_exit()
+    print("✅ COM 추적 테스트 통과!")
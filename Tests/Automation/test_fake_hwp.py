@@ -0,0 +1,101 @@
+"""
+FakeHwp 백엔드 테스트
+
+core/fake_hwp.py, core/com_backend.py - Windows 없이 추출/합병/변환 경로 실행
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.com_backend import use_hwp_factory, dispatch_hwp, is_com_backend
+from core.fake_hwp import FakeBackend, FakeDocument, FakeHwp
+from core.hwp_extractor import open_hwp, iter_note_blocks
+from core.hwp_extractor_copypaste import extract_block_copypaste
+from core.hwp_to_pdf import worker_convert_to_pdf
+
+
+def _source(path: Path, problems: int = 3, trailing_empty: int = 0) -> Path:
+    texts = [[f"문제 {i}", f"보기 {i}"] for i in range(1, problems + 1)]
+    FakeDocument.from_problems(texts, trailing_empty=trailing_empty).save(path)
+    return path
+
+
+def test_factory_injection():
+    """주입된 factory가 dispatch_hwp를 대체"""
+    backend = FakeBackend()
+    with use_hwp_factory(backend):
+        assert not is_com_backend()
+        hwp = dispatch_hwp()
+        assert isinstance(hwp, FakeHwp)
+    assert backend.instances == [hwp]
+
+
+def test_extract_blocks_with_fake_backend():
+    """open_hwp → iter_note_blocks → SaveBlock 추출"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        source = _source(temp / "source.hwp")
+        backend = FakeBackend(latency=0.001)
+
+        with use_hwp_factory(backend):
+            with open_hwp(str(source)) as hwp:
+                blocks = list(iter_note_blocks(hwp))
+                assert len(blocks) == 4  # 미주 3개 + 마지막 블록
+                assert blocks[0] == ((0, 0, 0), (0, 0, 4))
+
+                output = temp / "block_2.hwp"
+                assert extract_block_copypaste(hwp, blocks[1], output)
+
+        extracted = FakeDocument.load(output)
+        assert [p.text for p in extracted.paragraphs] == ["", "보기 1", "문제 2"]
+
+        stats = backend.stats
+        assert stats.calls["Run:MoveDocBegin"] == 1
+        assert stats.calls["HAction.Execute:FileSaveAs_S"] == 1
+        assert stats.calls["Ctrl.GetAnchorPos"] == 3
+        assert abs(stats.simulated_time - stats.total_calls * 0.001) < 1e-9
+
+
+def test_remove_trailing_empty_paras():
+    """para_scanner가 FakeHwp에서 끝쪽 빈 문단을 제거"""
+    from automations.merger.para_scanner import scan_paras, remove_empty_paras
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        source = _source(Path(temp_dir) / "source.hwp", problems=1, trailing_empty=3)
+        hwp = FakeHwp()
+        assert hwp.Open(str(source), "HWP", "")
+
+        paras = scan_paras(hwp)
+        assert len(paras) == 5
+        assert sum(1 for p in paras if p.is_empty) == 3
+
+        assert remove_empty_paras(hwp, paras) == 3
+        assert [p.text for p in hwp.document.paragraphs] == ["문제 1", "보기 1"]
+
+
+def test_convert_to_pdf_with_fake_backend():
+    """worker_convert_to_pdf가 FakeHwp로 PDF 생성"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        source = _source(Path(temp_dir) / "source.hwp")
+        backend = FakeBackend()
+
+        with use_hwp_factory(backend):
+            success, pdf_path, error = worker_convert_to_pdf(str(source))
+
+        assert success, error
+        assert Path(pdf_path).read_bytes().startswith(b"%PDF-1.4")
+        assert backend.stats.calls["HAction.Execute:FileSaveAsPdf"] == 1
+        assert backend.stats.calls["Quit"] == 1
+
+
+if __name__ == "__main__":
+    test_factory_injection()
+    test_extract_blocks_with_fake_backend()
+    test_remove_trailing_empty_paras()
+    test_convert_to_pdf_with_fake_backend()
+    print("✅ FakeHwp 테스트 통과!")
@@ -0,0 +1,109 @@
+"""
+파라미터 셋 캐시 테스트
+
+core/param_cache.py - GetDefault 생략, 바뀐 항목만 기록, parameter_table.json 형식 검사
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.fake_hwp import FakeDocument, FakeHwp
+from core.hwp_extractor import save_block
+from core.action_batch import ActionBatch
+from core.automation_client import AutomationClient
+from core.param_cache import parameter_cache, parameter_set_spec
+
+
+def test_repeated_save_writes_only_changes():
+    """같은 액션 반복 시 GetDefault 생략, 파일명만 다시 기록"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        hwp = FakeHwp()
+        hwp.document = FakeDocument.from_problems([["문제", "보기"]])
+
+        for index in range(3):
+            assert save_block(hwp, filepath=temp / f"block_{index}.hwp")
+
+        stats = parameter_cache(hwp).stats
+        assert stats.executes == 3
+        assert stats.get_defaults == 1
+        assert stats.skipped_get_defaults == 2
+        assert stats.writes == 3 + 2  # 첫 호출 3개 + 파일명 2번
+        assert stats.skipped_writes == 4  # Format, Attributes × 2
+        assert hwp.stats.calls["HAction.GetDefault:FileSaveAs_S"] == 1
+        assert hwp.stats.calls["HParameterSet.HFileOpenSave"] == 1
+        assert all((temp / f"block_{i}.hwp").exists() for i in range(3))
+
+
+def test_dropped_field_or_new_action_resets():
+    """직전에 쓴 항목이 빠지거나 액션이 바뀌면 GetDefault부터 다시"""
+    hwp = FakeHwp()
+    params = parameter_cache(hwp)
+
+    params.prepare("FileSaveAs_S", "HFileOpenSave", filename="a.hwp", Argument="saveblock")
+    hset = params.prepare("FileSaveAs_S", "HFileOpenSave", filename="a.hwp")
+    assert hset.items() == {"filename": "a.hwp"}  # Argument가 남아 있지 않음
+
+    params.prepare("FileSaveAsPdf", "HFileOpenSave", filename="a.hwp")
+    assert params.stats.get_defaults == 3
+
+    params.invalidate()
+    params.prepare("FileSaveAsPdf", "HFileOpenSave", filename="a.hwp")
+    assert params.stats.get_defaults == 4
+
+
+def test_subset_and_typed_fields():
+    """하위 셋(PageDef) 기록과 parameter_table.json 형식 검사"""
+    hwp = FakeHwp()
+    params = parameter_cache(hwp)
+
+    assert params.execute(
+        "PageSetup", "HSecDef", items={"ApplyTo": 3}, PageDef={"PaperWidth": 72851}
+    )
+    assert hwp.document.page_setup == {"PaperWidth": 72851}
+
+    assert parameter_set_spec("HColDef").field_type("count") == "PIT_UI1"
+    with pytest.raises(ValueError):
+        params.prepare("MultiColumn", "HColDef", Count="2")
+    with pytest.raises(ValueError):
+        params.prepare("InsertFile", "HInsertFile", items={"FileName": 3})
+
+
+def test_document_sets_and_document_switch():
+    """문서 의존 셋(HSecDef)은 매번 GetDefault, 문서를 열거나 바꾸면 캐시 무효화"""
+    hwp = FakeHwp()
+    params = parameter_cache(hwp)
+
+    for _ in range(2):
+        params.execute("PageSetup", "HSecDef", items={"ApplyTo": 3}, PageDef={"PaperWidth": 72851})
+    assert params.stats.get_defaults == 2 and params.stats.skipped_get_defaults == 0
+
+    params.prepare("FileSaveAs_S", "HFileOpenSave", filename="a.hwp")
+    ActionBatch(hwp).run("FileNew").flush()
+    params.prepare("FileSaveAs_S", "HFileOpenSave", filename="a.hwp")
+    assert params.stats.get_defaults == 4
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "doc.hwp"
+        FakeDocument.from_problems([["문제"]]).save(path)
+        client = AutomationClient()
+        client._hwp = hwp
+        params.prepare("FileSaveAs_S", "HFileOpenSave", filename="a.hwp")
+        assert client.open_document(str(path)).success
+        params.prepare("FileSaveAs_S", "HFileOpenSave", filename="a.hwp")
+        assert params.stats.get_defaults == 5 and params.stats.skipped_get_defaults == 1
+
+
+if __name__ == "__main__":
+    test_repeated_save_writes_only_changes()
+    test_dropped_field_or_new_action_resets()
+    test_subset_and_typed_fields()
+    test_document_sets_and_document_switch()
+    print("✅ 파라미터 셋 캐시 테스트 통과!")
@@ -0,0 +1,107 @@
+"""
+parameter_table.json 인덱스 테스트
+
+core/param_index.py - 컴파일, O(1) 검증, pickle 저장/mtime 무효화
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.param_index import (
+    INDEX_ENV,
+    TYPE_UI1,
+    TYPE_BSTR,
+    ENUM_NONE,
+    build_index,
+    load_index,
+    get_index,
+    validate,
+)
+
+
+def test_compiled_index_layout():
+    """액션별 정렬된 파라미터, 형식 코드, 열거 범위"""
+    index = get_index()
+
+    assert len(index.actions) == 132
+    assert list(index.actions) == sorted(index.actions)
+    names = index.params("CharShape")
+    assert len(names) == 65
+    assert list(names) == sorted(names)
+
+    assert index.param_type("InsertText", "Text") == TYPE_BSTR
+    assert index.param_type("CharShape", "bold") == TYPE_UI1  # 대소문자 무시
+    assert index.enum("Caption", "Side") == (0, 3)
+    assert index.enum("BorderFill", "SlashFlag") is None  # 비트 플래그는 열거 아님
+    assert ENUM_NONE in index.enum_low
+
+
+def test_validate():
+    """형식/범위는 오류, 알 수 없는 파라미터와 열거 범위 밖은 경고"""
+    assert validate(
+        "CharShape", {"FaceNameHangul": "맑은 고딕", "Height": 1000, "Bold": True}
+    ).success
+
+    result = validate("CharShape", {"Bold": 300, "Italic": "yes"})
+    assert {e.error_type for e in result.errors} == {"ValueOutOfRange", "TypeMismatch"}
+
+    result = validate("InsertText", {"Text": "Hello", "UnknownParam": 1})
+    assert result.success
+    assert result.warnings[0].error_type == "UnknownParameter"
+
+    result = validate("Caption", {"Side": 7})
+    assert result.success
+    assert result.warnings[0].error_type == "EnumOutOfRange"
+
+    assert validate("NoSuchAction", {}).warnings[0].error_type == "UnknownAction"
+
+
+def test_cache_invalidated_by_mtime():
+    """저장된 인덱스를 재사용하고, JSON이 바뀌면 다시 컴파일"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        source = temp / "table.json"
+        cache = temp / "table.index.pickle"
+        table = {
+            "actions": {
+                "InsertText": [
+                    {"param_name": "Text", "param_type": "PIT_BSTR", "description": "텍스트"}
+                ]
+            }
+        }
+        source.write_text(json.dumps(table), encoding="utf-8")
+
+        previous = os.environ.get(INDEX_ENV)
+        os.environ[INDEX_ENV] = str(cache)
+        try:
+            build_index(source)
+            assert cache.exists()
+            assert load_index(source).params("InsertText") == ("Text",)
+
+            table["actions"]["InsertText"].append(
+                {"param_name": "Code", "param_type": "PIT_UI2", "description": ""}
+            )
+            source.write_text(json.dumps(table), encoding="utf-8")
+            stat = source.stat()
+            os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+            assert load_index(source).params("InsertText") == ("Code", "Text")
+        finally:
+            if previous is None:
+                os.environ.pop(INDEX_ENV, None)
+            else:
+                os.environ[INDEX_ENV] = previous
+
+
+if __name__ == "__main__":
+    test_compiled_index_layout()
+    test_validate()
+    test_cache_invalidated_by_mtime()
+    print("✅ 파라미터 인덱스 테스트 통과!")
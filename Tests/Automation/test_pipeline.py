@@ -0,0 +1,182 @@
+"""
+스트리밍 파이프라인 테스트
+
+core/pipeline.py - 단계 겹침, 크기 제한 큐(역압), 실패 항목 제외,
+우회(캐시 적중), 단계별 지표, 같은 스레드 진행 이벤트, ProgressAbort 취소
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.pipeline import PipelineStage, StreamingPipeline
+from core.progress import ProgressAbort, progress_bus
+
+
+def timed(log, name, seconds):
+    """(단계, 항목, 시작, 끝)을 기록하는 워커"""
+
+    def work(item):
+        start = time.perf_counter()
+        time.sleep(seconds)
+        log.append((name, item, start, time.perf_counter()))
+        return True, item, None
+
+    return work
+
+
+def test_stages_overlap_and_keep_input_order():
+    """첫 항목의 다음 단계가 마지막 항목의 첫 단계보다 먼저 시작
+
+    결과는 입력 순서
+    """
+    log = []
+    stages = [
+        PipelineStage("first", timed(log, "first", 0.02), workers=1, executor="thread"),
+        PipelineStage("second", timed(log, "second", 0.01), workers=2, executor="thread"),
+    ]
+    outcomes = StreamingPipeline(stages).run(range(6))
+
+    assert [outcome.source for outcome in outcomes] == list(range(6))
+    assert all(outcome.ok and outcome.stage == "second" for outcome in outcomes)
+    first_done = max(end for name, _, _, end in log if name == "first")
+    second_started = min(start for name, _, start, _ in log if name == "second")
+    assert second_started < first_done
+
+
+def test_bounded_queue_applies_backpressure():
+    """느린 다음 단계의 큐가 차면 앞 단계가 기다림 (큐 길이 ≤ queue_size)"""
+    log = []
+    stages = [
+        PipelineStage("fast", timed(log, "fast", 0.0), workers=1, executor="thread"),
+        PipelineStage("slow", timed(log, "slow", 0.02), workers=1, executor="thread", queue_size=1),
+    ]
+    pipeline = StreamingPipeline(stages)
+    pipeline.run(range(8))
+
+    report = pipeline.report()["stages"]
+    assert report["slow"]["max_queue"] <= 1
+    assert report["fast"]["blocked_seconds"] > 0.05
+    # 앞 단계는 뒤 단계보다
+    # queue_size + 작업 중 1개 + 전달 대기 1개 이상 앞서지 못함
+    fast_ends = sorted(end for name, _, _, end in log if name == "fast")
+    slow_starts = sorted(start for name, _, start, _ in log if name == "slow")
+    assert fast_ends[5] > slow_starts[1]
+
+
+def test_failures_bypass_and_metrics():
+    """실패 항목은 다음 단계로 가지 않음
+
+    우회 항목은 워커를 거치지 않음
+    """
+    calls = []
+
+    def check(item):
+        calls.append(item)
+        return (item % 3 != 0, item * 10, None if item % 3 else "3의 배수")
+
+    stages = [
+        PipelineStage(
+            "check",
+            check,
+            workers=2,
+            executor="thread",
+            bypass=lambda item: (True, -1, None) if item == 4 else None,
+        ),
+        PipelineStage(
+            "double",
+            lambda item: (True, item * 2, None),
+            workers=1,
+            executor="thread",
+            complete=lambda item, result: (result[0], result[1] + 1, None),
+        ),
+    ]
+    received = []
+    pipeline = StreamingPipeline(
+        stages, on_result=lambda stage, source, result: received.append((stage, source))
+    )
+    outcomes = pipeline.run([1, 3, 4, 5])
+
+    assert 4 not in calls
+    assert [(o.source, o.stage, o.result) for o in outcomes] == [
+        (1, "double", (True, 21, None)),
+        (3, "check", (False, 30, "3의 배수")),
+        (4, "double", (True, -1, None)),
+        (5, "double", (True, 101, None)),
+    ]
+    assert sorted(received) == sorted(
+        [
+            ("check", 1),
+            ("check", 3),
+            ("check", 4),
+            ("check", 5),
+            ("double", 1),
+            ("double", 4),
+            ("double", 5),
+        ]
+    )
+    report = pipeline.report()["stages"]
+    metrics = report["check"]
+    assert (metrics["processed"], metrics["failed"], metrics["bypassed"]) == (3, 1, 1)
+    assert report["double"]["processed"] == 3
+    assert 0.0 <= report["check"]["occupancy"] <= 1.0
+
+
+def test_worker_exception_is_a_failed_item():
+    """워커 예외는 그 항목의 실패 결과 (파이프라인은 계속)"""
+
+    def explode(item):
+        if item == 2:
+            raise RuntimeError("boom")
+        return True, item, None
+
+    stages = [PipelineStage("work", explode, workers=2, executor="thread")]
+    outcomes = StreamingPipeline(stages).run([1, 2, 3])
+    assert [outcome.ok for outcome in outcomes] == [True, False, True]
+    assert "boom" in outcomes[1].result[2]
+
+
+def test_progress_on_caller_thread_and_abort():
+    """진행 이벤트는 run()을 부른 스레드에서 (same_thread 구독)
+
+    ProgressAbort는 취소 후 전파
+    """
+    threads = set()
+
+    def on_event(event):
+        threads.add(threading.get_ident())
+        if event.stage == "slow" and event.completed >= 2:
+            raise ProgressAbort("사용자 취소")
+
+    started = []
+    stages = [
+        PipelineStage("fast", lambda item: (True, item, None), workers=1, executor="thread"),
+        PipelineStage(
+            "slow",
+            lambda item: (started.append(item), time.sleep(0.01), (True, item, None))[-1],
+            workers=1,
+            executor="thread",
+        ),
+    ]
+    with progress_bus.subscribed(on_event, same_thread=True, stages=("fast", "slow")):
+        with pytest.raises(ProgressAbort):
+            StreamingPipeline(stages).run(range(50))
+
+    assert threads == {threading.get_ident()}
+    assert len(started) < 50
+
+
+if __name__ == "__main__":
+    test_stages_overlap_and_keep_input_order()
+    test_bounded_queue_applies_backpressure()
+    test_failures_bypass_and_metrics()
+    test_worker_exception_is_a_failed_item()
+    test_progress_on_caller_thread_and_abort()
+    print("✅ 스트리밍 파이프라인 테스트 통과!")
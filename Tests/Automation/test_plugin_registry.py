@@ -0,0 +1,70 @@
+"""
+플러그인 레지스트리 테스트
+
+automations/registry.py - 매니페스트 선언, 첫 get_plugin() 때 import
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from automations import PluginManifest, PluginMetadata, PluginRegistry
+from automations.manifest import BUILTIN_PLUGINS, MERGER_METADATA
+
+
+def test_listing_does_not_import_plugins():
+    """새 프로세스에서 목록만 읽으면 플러그인 모듈을 import하지 않음"""
+    snippet = (
+        "import sys\n"
+        f"sys.path.insert(0, {str(project_root)!r})\n"
+        "from automations import get_registry\n"
+        "ids = [m.id for m in get_registry().get_all_metadata()]\n"
+        "loaded = sorted(n for n in sys.modules\n"
+        "                if n.endswith('.plugin') and n.startswith('automations.'))\n"
+        "print(','.join(ids)); print(','.join(loaded))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", snippet], capture_output=True, text=True, check=True
+    )
+    ids, loaded = result.stdout.splitlines()
+
+    assert ids.split(",") == [manifest.id for manifest in BUILTIN_PLUGINS]
+    assert loaded == ""
+    assert "Registered plugin" not in result.stdout
+
+
+def test_get_plugin_imports_on_first_use():
+    """선언된 플러그인은 get_plugin() 때 로드, 실패하면 None"""
+    registry = PluginRegistry()
+    registry.declare(PluginManifest(MERGER_METADATA, "automations.merger.plugin:MergerPlugin"))
+    registry.declare(
+        PluginManifest(
+            PluginMetadata("broken", "없는 플러그인", "", "0.0.0", "test"),
+            "automations.no_such_plugin:Missing",
+        )
+    )
+
+    assert [m.id for m in registry.get_all_metadata(exclude=("broken",))] == ["merger"]
+    assert not registry.is_loaded("merger")
+
+    plugin = registry.get_plugin("merger")
+    assert plugin is registry.get_plugin("merger")
+    assert plugin.get_metadata() is MERGER_METADATA
+    assert registry.is_loaded("merger")
+
+    assert registry.get_plugin("broken") is None
+    assert registry.get_plugin("unknown") is None
+
+    # @register_plugin으로 같은 클래스가 다시 등록돼도 ID는 매니페스트 기준
+    registry.register(type(plugin))
+    assert registry.list_plugins() == ["merger", "broken"]
+
+
+if __name__ == "__main__":
+    test_listing_does_not_import_plugins()
+    test_get_plugin_imports_on_first_use()
+    print("✅ 플러그인 레지스트리 테스트 통과!")
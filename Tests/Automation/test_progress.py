@@ -0,0 +1,149 @@
+"""
+진행 이벤트 버스 테스트
+
+core/progress.py - 빈도 제한, 스레드별 구독, 취소(ProgressAbort) 전파
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.progress import ProgressAbort, ProgressBus, ProgressEvent
+from automations.merger.parallel_preprocessor import _legacy_progress
+
+
+def test_rate_limit_keeps_final_and_failed_events():
+    """간격 안의 중간 이벤트는 보류, 실패/마지막 이벤트는 항상 전달"""
+    bus = ProgressBus()
+    received = []
+    with bus.subscribed(received.append, min_interval=60.0):
+        bus.publish(ProgressEvent("pdf", 1, 5, "a.hwp", timestamp=100.0))
+        bus.publish(ProgressEvent("pdf", 2, 5, "b.hwp", timestamp=100.1))
+        bus.publish(
+            ProgressEvent("pdf", 3, 5, "c.hwp", ok=False, message="열기 실패", timestamp=100.2)
+        )
+        bus.publish(ProgressEvent("pdf", 4, 5, "d.hwp", timestamp=100.3))
+        bus.publish(ProgressEvent("pdf", 5, 5, "e.hwp", timestamp=100.4))
+        bus.publish(ProgressEvent("image", 1, None, "f.pdf", timestamp=100.5))
+
+    # 마지막 보류 이벤트(image 1)는 구독 해제 때 전달
+    assert [(e.stage, e.item) for e in received] == [
+        ("pdf", "a.hwp"),
+        ("pdf", "c.hwp"),
+        ("pdf", "e.hwp"),
+        ("image", "f.pdf"),
+    ]
+    assert received[1].describe() == "pdf 3/5 c.hwp 실패: 열기 실패"
+    assert received[2].is_final and received[2].percent == 100
+    assert not bus.active
+
+
+def test_same_thread_and_stage_filters():
+    """same_thread 구독은 다른 스레드의 이벤트를 받지 않음"""
+    bus = ProgressBus()
+    mine, merge_only = [], []
+    bus.subscribe(mine.append, same_thread=True)
+    bus.subscribe(merge_only.append, stages=("merge",))
+
+    stage = bus.stage("merge", 2)
+    stage.advance("a.hwp")
+    worker = threading.Thread(target=lambda: bus.emit("separate", 1, 1, "b.hwp"))
+    worker.start()
+    worker.join()
+    bus.emit("separate", 1, 1, "c.hwp")
+
+    assert [e.item for e in mine] == ["a.hwp", "c.hwp"]
+    assert [e.item for e in merge_only] == ["a.hwp"]
+    assert mine[0].latency >= 0.0 and stage.completed == 1
+
+
+def test_abort_propagates_but_errors_are_ignored():
+    """구독자 예외는 파이프라인을 깨지 않지만 ProgressAbort는 전파"""
+    bus = ProgressBus()
+    calls = []
+
+    def broken(event):
+        calls.append(event.completed)
+        raise RuntimeError("UI 닫힘")
+
+    bus.subscribe(broken)
+    bus.emit("preprocess", 1, 3)
+    assert calls == [1]
+
+    def cancel(event):
+        if event.completed >= 2:
+            raise ProgressAbort()
+
+    bus.subscribe(cancel)
+    stage = bus.stage("preprocess", 3)
+    stage.advance("a.hwp")
+    with pytest.raises(ProgressAbort):
+        stage.advance("b.hwp")
+
+
+def test_rate_limit_is_thread_safe():
+    """여러 스레드가 같은 구독에 발행해도 이벤트가 두 번 전달되지 않고
+    실패/마지막 이벤트는 빠지지 않음"""
+    bus = ProgressBus()
+    received = []
+    lock = threading.Lock()
+
+    def record(event):
+        with lock:
+            received.append(event.item)
+
+    def publish(worker):
+        for index in range(300):
+            ok = index % 50 != 0
+            bus.publish(ProgressEvent("pdf", index, 300, f"{worker}-{index}", ok=ok))
+        bus.publish(ProgressEvent("pdf", 300, 300, f"{worker}-done"))
+
+    with bus.subscribed(record, min_interval=0.0005):
+        threads = [threading.Thread(target=publish, args=(worker,)) for worker in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert len(received) == len(set(received))
+    for worker in range(6):
+        assert f"{worker}-done" in received
+        assert all(f"{worker}-{index}" in received for index in range(0, 300, 50))
+
+
+def test_legacy_progress_callback():
+    """사용 중단된 progress_callback: 4인자 형식, 안 되면 2인자 형식으로 전달"""
+    four, two = [], []
+    _legacy_progress(lambda *args: four.append(args))(ProgressEvent("preprocess", 1, 2, "a.hwp"))
+    _legacy_progress(lambda completed, total: two.append((completed, total)))(
+        ProgressEvent("preprocess", 2, 2, "b.hwp", ok=False)
+    )
+    _legacy_progress(four.append)(ProgressEvent("preprocess", 0, 2))  # start 이벤트는 건너뜀
+    assert four == [("preprocess", 1, 2, "✅ a.hwp")]
+    assert two == [(2, 2)]
+
+    # 4인자 콜백 안의 TypeError는 2인자로 다시 부르지 않고 그대로 전파
+    calls = []
+
+    def broken(stage, completed, total, message):
+        calls.append(completed)
+        raise TypeError("콜백 버그")
+
+    with pytest.raises(TypeError, match="콜백 버그"):
+        _legacy_progress(broken)(ProgressEvent("preprocess", 1, 2, "a.hwp"))
+    assert calls == [1]
+
+
+if __name__ == "__main__":
+    test_rate_limit_keeps_final_and_failed_events()
+    test_same_thread_and_stage_filters()
+    test_abort_propagates_but_errors_are_ignored()
+    test_rate_limit_is_thread_safe()
+    test_legacy_progress_callback()
+    print("✅ 진행 이벤트 버스 테스트 통과!")
@@ -0,0 +1,104 @@
+"""
+시작 시간 프로파일러 테스트
+
+core/startup.py - 모듈별 import 시간(self/cumulative), 구간/시점 기록, 보고서,
+런처 경로의 무거운 모듈 지연 import
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.startup import STARTUP_EXIT_ENV, StartupProfiler
+
+
+def test_import_times_nested_modules():
+    """하위 import 시간은 부모 cumulative에 포함되고 self에서는 빠짐"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        package = Path(temp_dir) / "startup_probe"
+        package.mkdir()
+        (package / "__init__.py").write_text("import time\nfrom . import child\ntime.sleep(0.02)\n")
+        (package / "child.py").write_text("import time\ntime.sleep(0.05)\n")
+        sys.path.insert(0, temp_dir)
+        os.environ.pop(STARTUP_EXIT_ENV, None)
+
+        profiler = StartupProfiler()
+        profiler.start("probe", str(Path(temp_dir) / "report.json"))
+        try:
+            with profiler.phase("plugins"):
+                import startup_probe
+        finally:
+            sys.path.remove(temp_dir)
+            assert profiler.finish("first_paint") is False
+            sys.modules.pop("startup_probe", None)
+            sys.modules.pop("startup_probe.child", None)
+
+        records = {record.name: record for record in profiler.imports.records}
+        parent, child = records["startup_probe"], records["startup_probe.child"]
+        assert (parent.depth, child.depth) == (0, 1)
+        assert child.cumulative_us >= 50_000
+        assert parent.cumulative_us >= child.cumulative_us + 20_000
+        assert parent.self_us <= parent.cumulative_us - child.cumulative_us
+
+        # 모듈에는 원래 로더가 남음
+        assert type(startup_probe.__loader__).__name__ == "SourceFileLoader"
+        assert startup_probe.__spec__.loader is startup_probe.__loader__
+        assert profiler.imports not in sys.meta_path
+
+        report = json.loads((Path(temp_dir) / "report.json").read_text(encoding="utf-8"))
+        assert report["entry"] == "probe"
+        assert report["phases"]["plugins"] >= 0.07
+        assert report["marks"]["first_paint"] >= report["phases"]["plugins"]
+        assert report["top_imports"][0]["name"] == "startup_probe"
+
+
+def test_disabled_profiler_is_noop():
+    """start() 전에는 기록하지 않고 종료 요청도 하지 않음"""
+    os.environ[STARTUP_EXIT_ENV] = "1"
+    try:
+        profiler = StartupProfiler()
+        with profiler.phase("plugins"):
+            pass
+        profiler.mark("ready")
+        assert profiler.finish("ready") is False
+        assert profiler.phases == {} and profiler.marks == {}
+
+        profiler.start("exit")
+        assert profiler.finish("ready") is True
+    finally:
+        os.environ.pop(STARTUP_EXIT_ENV, None)
+
+
+def test_launcher_path_defers_heavy_modules():
+    """프로파일러/진행 버스/플러그인 목록은 무거운 모듈을 끌어오지 않음
+
+    pydantic, pypdfium2, PIL은 없고 Tk 플러그인은 tkinter만
+    """
+    snippet = (
+        "import sys\n"
+        f"sys.path.insert(0, {str(project_root)!r})\n"
+        "import core.startup, core.progress\n"
+        "from automations import get_registry\n"
+        "get_registry().get_all_metadata()\n"
+        "import automations.seperate2Img.plugin\n"
+        "heavy = ('pydantic', 'tkinter', 'pypdfium2', 'PIL')\n"
+        "print(','.join(n for n in heavy if n in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", snippet], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip().splitlines()[-1] == "tkinter"
+
+
+if __name__ == "__main__":
+    test_import_times_nested_modules()
+    test_disabled_profiler_is_noop()
+    test_launcher_path_defers_heavy_modules()
+    print("✅ 시작 시간 프로파일러 테스트 통과!")
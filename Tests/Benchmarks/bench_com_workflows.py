@@ -0,0 +1,219 @@
+"""
+COM 워크플로우 벤치마크 (FakeHwp)
+
+core/fake_hwp.py 백엔드로 추출/합병/변환 경로를 실행하고, 워크플로우별
+COM 호출 수와 모의 소요 시간, 파라미터 셋 캐시(core/param_cache.py)가 생략한
+GetDefault/항목 쓰기 수를 보고합니다. Windows/한글 없이 실행됩니다.
+
+모의 소요 시간 = 실제 실행 시간 + 호출당 지연 합계 + time.sleep 합계
+(--real-sleep 없이 실행하면 코드의 time.sleep은 기록만 하고 건너뜁니다)
+
+사용법:
+    python Tests/Benchmarks/bench_com_workflows.py
+    python Tests/Benchmarks/bench_com_workflows.py --problems 40 --latency 0.003 --json out.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.com_backend import use_hwp_factory
+from core.fake_hwp import FakeBackend, FakeDocument
+from core.param_cache import cache_stats
+
+# 실측 기반 대략적인 호출 지연 (초) - 파일 I/O가 있는 호출은 더 느림
+DEFAULT_LATENCY_MAP = {
+    "Open": 0.25,
+    "Quit": 0.10,
+    "SaveAs": 0.15,
+    "HAction.Execute:FileSaveAs_S": 0.15,
+    "HAction.Execute:FileSaveAsPdf": 0.40,
+    "HAction.Execute:InsertFile": 0.20,
+    "Run:Paste": 0.05,
+    "Run:Copy": 0.03,
+}
+
+
+class SleepRecorder:
+    """time.sleep 호출을 기록 (skip=True이면 실제로 자지 않음)"""
+
+    def __init__(self, skip: bool = True):
+        self.skip = skip
+        self.total = 0.0
+        self._original = time.sleep
+
+    def __call__(self, seconds: float):
+        self.total += seconds
+        if not self.skip:
+            self._original(seconds)
+
+    def __enter__(self):
+        time.sleep = self
+        return self
+
+    def __exit__(self, *exc):
+        time.sleep = self._original
+
+
+def _write_problems(folder: Path, count: int) -> List[Path]:
+    paths = []
+    for index in range(1, count + 1):
+        path = folder / f"problem_{index:03d}.hwp"
+        texts = [[f"{index}. 문제 본문", "① 1 ② 2 ③ 3 ④ 4 ⑤ 5", "풀이"]]
+        FakeDocument.from_problems(texts, trailing_empty=2).save(path)
+        paths.append(path)
+    return paths
+
+
+# ============================================================================
+# 워크플로우
+# ============================================================================
+
+
+def workflow_extract(work: Path, count: int):
+    """원본 1개 → 블록 N개 SaveBlock 추출"""
+    from core.hwp_extractor_copypaste import extract_all_blocks_copypaste
+
+    source = work / "source.hwp"
+    texts = [[f"{i}. 문제", "보기", "풀이"] for i in range(1, count + 1)]
+    FakeDocument.from_problems(texts).save(source)
+    extract_all_blocks_copypaste(str(source), list(range(1, count + 1)), work / "extracted")
+
+
+def workflow_merge_copypaste(work: Path, count: int):
+    """ProblemMerger (열기 → 1단 → 빈 문단 제거 → 복사/붙여넣기)"""
+    from automations.merger.merger import ProblemMerger
+    from automations.merger.types import ProblemFile, MergeConfig
+
+    template = work / "template.hwp"
+    FakeDocument(columns=2).save(template)
+    problems = [ProblemFile(p, p.name, i) for i, p in enumerate(_write_problems(work, count), 1)]
+    ProblemMerger().merge_files(MergeConfig(template, problems, work / "merged.hwp", True))
+
+
+def workflow_merge_insertfile(work: Path, count: int):
+    """merge_with_insertfile (전처리 저장 → InsertFile + BreakColumn)"""
+    from automations.merger.file_inserter import merge_with_insertfile
+    from automations.merger.types import ProblemFile
+
+    template = work / "template.hwp"
+    FakeDocument(columns=2).save(template)
+    problems = [ProblemFile(p, p.name, i) for i, p in enumerate(_write_problems(work, count), 1)]
+    merge_with_insertfile(template, problems, work / "merged.hwp")
+
+
+def workflow_convert_pdf(work: Path, count: int):
+    """worker_convert_to_pdf × N (순차)"""
+    from core.hwp_to_pdf import worker_convert_to_pdf
+
+    for path in _write_problems(work, count):
+        worker_convert_to_pdf(str(path))
+
+
+WORKFLOWS: Dict[str, Callable[[Path, int], None]] = {
+    "extract": workflow_extract,
+    "merge_copypaste": workflow_merge_copypaste,
+    "merge_insertfile": workflow_merge_insertfile,
+    "convert_pdf": workflow_convert_pdf,
+}
+
+
+def run_workflow(name: str, count: int, latency: float, real_sleep: bool) -> Dict:
+    """워크플로우 1개 실행 → 측정 결과"""
+    backend = FakeBackend(latency=latency, latency_map=DEFAULT_LATENCY_MAP)
+    params = cache_stats()
+    params.reset()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with use_hwp_factory(backend), SleepRecorder(skip=not real_sleep) as sleeps:
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                WORKFLOWS[name](Path(temp_dir), count)
+            elapsed = time.perf_counter() - start
+
+    stats = backend.stats
+    slept = 0.0 if real_sleep else sleeps.total
+    return {
+        "workflow": name,
+        "items": count,
+        "com_calls": stats.total_calls,
+        "calls_per_item": stats.total_calls / count if count else 0,
+        "com_time": stats.simulated_time,
+        "sleep_time": sleeps.total,
+        "elapsed": elapsed,
+        "simulated_wall": elapsed + stats.simulated_time + slept,
+        "instances": len(backend.instances),
+        "param_executes": params.executes,
+        "param_writes": params.writes + params.get_defaults,
+        "param_writes_avoided": params.avoided_calls,
+        "top_calls": stats.calls.most_common(8),
+    }
+
+
+def print_report(results: List[Dict]):
+    print("=" * 92)
+    print(
+        f'{"워크플로우":18s} {"항목":>5s} {"COM 호출":>9s} {"항목당":>7s} '
+        f'{"COM 지연":>9s} {"sleep":>8s} {"실행":>8s} {"모의 합계":>10s}'
+    )
+    print("-" * 92)
+    for r in results:
+        print(
+            f'{r["workflow"]:18s} {r["items"]:5d} {r["com_calls"]:9,d} '
+            f'{r["calls_per_item"]:7.1f} {r["com_time"]:8.2f}s {r["sleep_time"]:7.2f}s '
+            f'{r["elapsed"]:7.3f}s {r["simulated_wall"]:9.2f}s'
+        )
+    print("=" * 92)
+
+    print(f'{"파라미터 셋":18s} {"Execute":>8s} {"쓰기":>8s} {"생략":>8s}')
+    for r in results:
+        print(
+            f'{r["workflow"]:18s} {r["param_executes"]:8d} {r["param_writes"]:8d} '
+            f'{r["param_writes_avoided"]:8d}'
+        )
+    print("=" * 92)
+
+    for r in results:
+        top = ", ".join(f"{name}×{count}" for name, count in r["top_calls"])
+        print(f'{r["workflow"]}: {top}')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="FakeHwp COM 워크플로우 벤치마크")
+    parser.add_argument("--problems", type=int, default=20, help="문항/파일 수")
+    parser.add_argument("--latency", type=float, default=0.002, help="기본 호출당 지연 (초)")
+    parser.add_argument(
+        "--workflow",
+        action="append",
+        choices=sorted(WORKFLOWS),
+        help="실행할 워크플로우 (기본: 전체)",
+    )
+    parser.add_argument("--real-sleep", action="store_true", help="코드의 time.sleep을 실제로 실행")
+    parser.add_argument("--json", type=Path, help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    results = [
+        run_workflow(name, args.problems, args.latency, args.real_sleep)
+        for name in (args.workflow or WORKFLOWS)
+    ]
+    print_report(results)
+
+    if args.json:
+        args.json.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\n결과 저장: {args.json}")
+
+    return results
+
+
+if __name__ == "__main__":
+    main()
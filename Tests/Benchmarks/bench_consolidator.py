@@ -0,0 +1,134 @@
+"""
+폴더 통합 벤치마크
+
+이전 구현(프로세스 풀 + shutil.copy2/move) vs I/O 엔진 (core/folder_consolidator.py)
+
+폴더 여러 개에 나눠진 파일 트리(기본 1만 개)를 만들어
+방식마다 새 대상 폴더로 통합합니다.
+이동은 원본이 사라지므로 실행마다 트리를 다시 만듭니다
+(생성 시간 제외).
+dedupe는 해시 + 계획 포함 첫 실행,
+"dedupe 재실행"은 같은 대상 폴더에 다시 실행 (바뀐 파일 없음).
+
+사용법:
+    python Tests/Benchmarks/bench_consolidator.py
+    python Tests/Benchmarks/bench_consolidator.py \
+        --files 10000 --folders 20 --size-kb 32 --workers 5
+    # reflink 되는 파일시스템
+    python Tests/Benchmarks/bench_consolidator.py --dir /mnt/btrfs/tmp
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.consolidation_plan import MANIFEST_FILE
+from core.folder_consolidator import consolidate_parallel, scan_folders
+
+
+def legacy_copy(source_path, target_dir):
+    shutil.copy2(source_path, Path(target_dir) / Path(source_path).name)
+
+
+def legacy_move(source_path, target_dir):
+    shutil.move(source_path, str(Path(target_dir) / Path(source_path).name))
+
+
+def legacy_consolidate(sources, target_dir, mode, workers):
+    """이전 consolidate_parallel의 처리 루프 그대로 (로그/진행 표시 제외)"""
+    worker_fn = legacy_move if mode == "move" else legacy_copy
+    Path(target_dir).mkdir()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(worker_fn, path, target_dir) for path in scan_folders(sources)]
+        for future in as_completed(futures):
+            future.result()
+
+
+def make_tree(root: Path, files: int, folders: int, size: int) -> list:
+    payload = os.urandom(size)
+    sources = []
+    for i in range(folders):
+        folder = root / f"source{i:02d}"
+        folder.mkdir(parents=True)
+        sources.append(str(folder))
+    for j in range(files):
+        path = Path(sources[j % folders]) / f"q{j:05d}.png"
+        path.write_bytes(j.to_bytes(4, "little") + payload)
+    return sources
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="폴더 통합: 이전 구현 vs I/O 엔진")
+    parser.add_argument("--files", type=int, default=10000)
+    parser.add_argument("--folders", type=int, default=20)
+    parser.add_argument("--size-kb", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=5)
+    parser.add_argument("--dir", type=Path, default=None, help="트리를 만들 위치 (기본: 임시 폴더)")
+    args = parser.parse_args(argv)
+
+    runs = [
+        ("이전 copy2", "copy", None),
+        ("process", "copy", dict(engine="process")),
+        ("thread", "copy", dict(engine="thread")),
+        ("thread+hardlink", "copy", dict(engine="thread", link_mode="hardlink")),
+        ("thread+reflink", "copy", dict(engine="thread", link_mode="reflink")),
+        ("thread+dedupe", "copy", dict(engine="thread", dedupe=True)),
+        ("dedupe 재실행", "copy", dict(engine="thread", dedupe=True)),
+        ("이전 move", "move", None),
+        ("thread move", "move", dict(engine="thread")),
+    ]
+
+    timings = {}
+    with tempfile.TemporaryDirectory(dir=args.dir) as temp_dir:
+        temp = Path(temp_dir)
+        size = args.size_kb * 1024
+        copy_sources = make_tree(temp / "copy_src", args.files, args.folders, size)
+        for index, (name, mode, options) in enumerate(runs):
+            sources = copy_sources
+            if mode == "move":
+                sources = make_tree(temp / f"move_src{index}", args.files, args.folders, size)
+            dedupe = options and options.get("dedupe")
+            target = temp / ("out_dedupe" if dedupe else f"out{index}")
+
+            start = time.perf_counter()
+            if options is None:
+                legacy_consolidate(sources, str(target), mode, args.workers)
+            else:
+                total, success, failed = consolidate_parallel(
+                    sources,
+                    str(temp),
+                    target.name,
+                    mode=mode,
+                    max_workers=args.workers,
+                    **options,
+                )
+                assert failed == 0, f"{name}: 실패 {failed}개"
+            timings[name] = time.perf_counter() - start
+            copied = [entry for entry in os.listdir(target) if entry != MANIFEST_FILE]
+            assert len(copied) == args.files
+
+    print("=" * 60)
+    print(
+        f"파일 {args.files}개 ({args.folders}개 폴더, {args.size_kb} KB), " f"워커 {args.workers}"
+    )
+    print("-" * 60)
+    print(f'{"방식":16s} {"시간(s)":>9s} {"파일/s":>9s} {"배율":>7s}')
+    for name, mode, _ in runs:
+        baseline = timings["이전 move" if mode == "move" else "이전 copy2"]
+        seconds = timings[name]
+        print(f"{name:16s} {seconds:9.2f} {args.files / seconds:9.0f} {baseline / seconds:6.2f}x")
+    print("=" * 60)
+    return timings
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+인코더 벤치마크 - 설정별 이미지당 바이트, 인코딩 ms, 원본과의 평균 오차
+
+배포 환경의 문제 PDF로 돌려 인코더 프리셋(또는 직접 만든 설정)을 고를 때 씁니다.
+페이지를 여백 제거 렌더링한 이미지를 메모리에서 인코딩 (렌더링/디스크 시간 제외).
+
+사용법:
+    python Tests/Benchmarks/bench_encoders.py
+    python Tests/Benchmarks/bench_encoders.py --pdf-dir Tests/hwp2pdf --limit 5 --dpi 300
+    python Tests/Benchmarks/bench_encoders.py --encoder png-fast \
+        --encoder '{"format": "png", "compress_level": 3}'
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import pypdfium2 as pdfium
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from automations.seperate2Img.encoders import ENCODER_PRESETS, benchmark_encoders
+from automations.seperate2Img.pdf_to_image import render_page_image
+
+DEFAULT_PDF_DIR = project_root / "Tests" / "hwp2pdf"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="인코더 설정별 크기/속도")
+    parser.add_argument("--pdf-dir", type=Path, default=DEFAULT_PDF_DIR)
+    parser.add_argument("--limit", type=int, default=3, help="사용할 PDF 수")
+    parser.add_argument("--dpi", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument(
+        "--encoder",
+        action="append",
+        default=[],
+        help="프리셋 이름 또는 JSON 설정 (여러 번, 없으면 프리셋 전부)",
+    )
+    args = parser.parse_args(argv)
+
+    pdf_files = sorted(args.pdf_dir.glob("*.pdf"))[: args.limit]
+    if not pdf_files:
+        raise SystemExit(f"PDF 없음: {args.pdf_dir}")
+
+    images = []
+    for pdf_file in pdf_files:
+        pdf = pdfium.PdfDocument(str(pdf_file))
+        try:
+            images.extend(
+                render_page_image(page, args.dpi / 72.0, trim_whitespace=True) for page in pdf
+            )
+        finally:
+            pdf.close()
+
+    encoders = {
+        spec: json.loads(spec) if spec.startswith("{") else spec for spec in args.encoder
+    } or ENCODER_PRESETS
+    results = benchmark_encoders(images, encoders, repeat=args.repeat)
+    baseline = next((result for result in results if result.name == "png"), results[0])
+
+    print("=" * 60)
+    print(f"PDF {len(pdf_files)}개, 이미지 {len(images)}장, {args.dpi} DPI (여백 제거)")
+    print("-" * 60)
+    print(f'{"설정":16s} {"KB/장":>8s} {"ms/장":>8s} {"크기비":>7s} {"속도비":>7s} {"오차":>6s}')
+    for result in results:
+        print(
+            f"{result.name[:16]:16s} {result.bytes_per_image / 1024:8.1f} {result.encode_ms:8.1f} "
+            f"{result.bytes_per_image / baseline.bytes_per_image:7.2f} "
+            f"{baseline.encode_ms / result.encode_ms:6.2f}x {result.mean_error:6.2f}"
+        )
+    print("=" * 60)
+    return results
+
+
+if __name__ == "__main__":
+    main()
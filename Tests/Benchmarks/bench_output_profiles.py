@@ -0,0 +1,100 @@
+"""
+출력 프로필 벤치마크 - DPI별 convert_pdfs_to_images 3회 vs 프로필 1회 (렌더링 1회 + 축소)
+
+원본 PNG(300 DPI) + 웹 JPEG(폭 1200) + 썸네일 JPEG(폭 240), 모두 여백 제거.
+
+- separate: 크기마다 convert_pdfs_to_images를 따로 실행 (웹/썸네일은 해당 폭이 나오는 DPI로 렌더링)
+- profiles: convert_pdfs_to_images(profiles=...) 한 번
+- 둘 다 직렬 경로(max_workers=1)로 비교 - 병렬 워커 수와 무관한 페이지당 비용
+
+사용법:
+    python Tests/Benchmarks/bench_output_profiles.py
+    python Tests/Benchmarks/bench_output_profiles.py --pdf-dir Tests/hwp2pdf --limit 2
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from automations.seperate2Img.output_profiles import parse_output_profiles
+from automations.seperate2Img.pdf_to_image import convert_pdfs_to_images
+
+DEFAULT_PDF_DIR = project_root / "Tests" / "hwp2pdf"
+
+PROFILES = [
+    {"name": "full", "format": "png", "dpi": 300, "trim": True},
+    {"name": "web", "format": "jpg", "max_width": 1200, "quality": 85, "trim": True},
+    {"name": "thumb", "format": "jpg", "max_width": 240, "quality": 80, "trim": True},
+]
+# separate 방식의 DPI (A4 폭 595pt 기준으로 웹/썸네일 폭에 해당하는 해상도)
+SEPARATE_RUNS = [("full", "png", 300), ("web", "jpg", 145), ("thumb", "jpg", 29)]
+
+
+def _size_mb(folder: Path) -> float:
+    return sum(path.stat().st_size for path in folder.rglob("*") if path.is_file()) / 1024 / 1024
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="출력 프로필 벤치마크 (3회 변환 vs 1회 렌더링)")
+    parser.add_argument("--pdf-dir", type=Path, default=DEFAULT_PDF_DIR)
+    parser.add_argument("--limit", type=int, default=1, help="사용할 PDF 수")
+    args = parser.parse_args(argv)
+
+    pdf_files = [str(path) for path in sorted(args.pdf_dir.glob("*.pdf"))[: args.limit]]
+    if not pdf_files:
+        raise SystemExit(f"PDF 없음: {args.pdf_dir}")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        # 워밍업
+        convert_pdfs_to_images(pdf_files[:1], str(temp / "warmup"), dpi=72, trim_whitespace=True)
+
+        start = time.perf_counter()
+        for name, format, dpi in SEPARATE_RUNS:
+            results = convert_pdfs_to_images(
+                pdf_files,
+                str(temp / "separate" / name),
+                dpi=dpi,
+                format=format,
+                trim_whitespace=True,
+            )
+        separate_seconds = time.perf_counter() - start
+        pages = sum(1 for ok, _, _ in results if ok)
+
+        start = time.perf_counter()
+        profile_results = convert_pdfs_to_images(
+            pdf_files,
+            str(temp / "profiles"),
+            profiles=parse_output_profiles(PROFILES),
+        )
+        profile_seconds = time.perf_counter() - start
+        images = sum(1 for ok, _, _ in profile_results if ok)
+
+        rows = [
+            ("separate x3", separate_seconds, _size_mb(temp / "separate")),
+            ("profiles", profile_seconds, _size_mb(temp / "profiles")),
+        ]
+
+    print("=" * 60)
+    print(
+        f"PDF {len(pdf_files)}개, 페이지 {pages}장 × 프로필 {len(PROFILES)}개 = 이미지 {images}장"
+    )
+    print("-" * 60)
+    print(f'{"방식":12s} {"시간(s)":>9s} {"페이지/s":>10s} {"배율":>7s} {"출력 MB":>9s}')
+    for label, seconds, size in rows:
+        print(
+            f"{label:12s} {seconds:9.2f} {pages / seconds:10.1f} "
+            f"{separate_seconds / seconds:7.2f}x {size:9.1f}"
+        )
+    print("=" * 60)
+    return rows
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+parameter_table.json 인덱스 시작 시간 벤치마크
+
+새 Python 프로세스에서 "처음 validate() 한 번"까지 걸리는 시간을 세 방식으로 비교하고,
+프로세스 안에서 validate() 호출당 시간을 JSON 선형 탐색과 비교합니다.
+
+- json: parameter_table.json 로드 + 액션/파라미터 선형 탐색 (기존 방식)
+- cold: 인덱스 파일 없음 → JSON 컴파일 + 저장
+- warm: 저장된 pickle 인덱스 로드
+
+cold/warm은 core 패키지 import 이후부터 측정합니다 (core import 시간은 따로 표시).
+
+사용법:
+    python Tests/Benchmarks/bench_param_index.py
+    python Tests/Benchmarks/bench_param_index.py --runs 10 --calls 20000
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.param_index import INDEX_ENV, PARAMETER_TABLE_PATH, load_index
+
+SAMPLE_ACTION = "CharShape"
+SAMPLE_PARAMS = {"FaceNameHangul": "맑은 고딕", "Height": 1000, "Bold": 1, "Italic": 0}
+
+# 하위 프로세스에서 실행 (import 시간 포함, 첫 검증까지)
+_JSON_SNIPPET = f"""
+import time
+start = time.perf_counter()
+import json
+table = json.load(open({str(PARAMETER_TABLE_PATH)!r}, encoding="utf-8"))["actions"]
+params = {SAMPLE_PARAMS!r}
+for name in params:
+    next(p for p in table[{SAMPLE_ACTION!r}] if p["param_name"] == name)
+print(time.perf_counter() - start)
+"""
+
+# core 패키지 __init__ (core.types → pydantic) import는 따로 측정
+_CORE_SNIPPET = f"""
+import sys, time
+sys.path.insert(0, {str(project_root)!r})
+start = time.perf_counter()
+import core
+print(time.perf_counter() - start)
+"""
+
+_INDEX_SNIPPET = f"""
+import sys, time
+sys.path.insert(0, {str(project_root)!r})
+import core
+start = time.perf_counter()
+from core.param_index import validate
+assert validate({SAMPLE_ACTION!r}, {SAMPLE_PARAMS!r}).success
+print(time.perf_counter() - start)
+"""
+
+
+def _run(snippet: str, env: dict) -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", snippet], env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def measure_startup(runs: int) -> dict:
+    results = {"json": [], "cold": [], "warm": [], "core": []}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = Path(temp_dir) / "index.pickle"
+        env = dict(os.environ, **{INDEX_ENV: str(cache)})
+        env.pop("PYTHONDONTWRITEBYTECODE", None)  # .pyc 컴파일 시간은 제외
+        _run(_INDEX_SNIPPET, env)
+        for _ in range(runs):
+            results["json"].append(_run(_JSON_SNIPPET, env))
+            cache.unlink(missing_ok=True)
+            results["cold"].append(_run(_INDEX_SNIPPET, env))
+            results["warm"].append(_run(_INDEX_SNIPPET, env))
+            results["core"].append(_run(_CORE_SNIPPET, env))
+        results["index_bytes"] = cache.stat().st_size
+    return results
+
+
+def measure_calls(calls: int) -> dict:
+    table = json.loads(PARAMETER_TABLE_PATH.read_text(encoding="utf-8"))["actions"]
+    index = load_index()
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        for name in SAMPLE_PARAMS:
+            next(p for p in table[SAMPLE_ACTION] if p["param_name"] == name)
+    scan = (time.perf_counter() - start) / calls
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        index.validate(SAMPLE_ACTION, SAMPLE_PARAMS)
+    indexed = (time.perf_counter() - start) / calls
+    return {"scan": scan, "index": indexed}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="parameter_table 인덱스 벤치마크")
+    parser.add_argument("--runs", type=int, default=5, help="하위 프로세스 반복 횟수")
+    parser.add_argument("--calls", type=int, default=10000, help="프로세스 내 검증 반복 횟수")
+    args = parser.parse_args(argv)
+
+    startup = measure_startup(args.runs)
+    calls = measure_calls(args.calls)
+
+    print("=" * 60)
+    print(
+        f"JSON: {PARAMETER_TABLE_PATH.stat().st_size:,} bytes, "
+        f'인덱스: {startup["index_bytes"]:,} bytes'
+    )
+    print("-" * 60)
+    print(f'{"첫 검증까지":20s} {"중앙값(ms)":>12s} {"최소(ms)":>12s}')
+    for key, label in (
+        ("json", "JSON 로드+탐색"),
+        ("cold", "인덱스 컴파일"),
+        ("warm", "인덱스 로드"),
+        ("core", "(참고) core import"),
+    ):
+        values = startup[key]
+        print(f"{label:20s} {statistics.median(values) * 1000:12.2f} {min(values) * 1000:12.2f}")
+    print("-" * 60)
+    print(
+        f'검증 1회 (파라미터 {len(SAMPLE_PARAMS)}개): 선형 탐색 {calls["scan"] * 1e6:.2f}µs, '
+        f'인덱스 {calls["index"] * 1e6:.2f}µs'
+    )
+    print("=" * 60)
+    return startup, calls
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+PDF → Image 렌더링 처리량 벤치마크 (직렬 vs 페이지 단위 프로세스 풀)
+
+convert_pdfs_to_images(max_workers=1) 직렬 경로와 render_pdfs_parallel을
+같은 PDF 묶음으로 실행해 페이지/초를 비교합니다.
+
+- 기본 입력: Tests/hwp2pdf/*.pdf (--pdf-dir로 변경)
+- --copies: 입력 PDF를 복사해 작업 크기를 늘림 (예: 400문항 작업 흉내)
+- 병렬 결과는 직렬 결과와 파일 이름/순서가 같은지 확인
+
+사용법:
+    python Tests/Benchmarks/bench_pdf_render.py
+    python Tests/Benchmarks/bench_pdf_render.py --dpi 300 --workers 2 4 8 --copies 4
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from automations.seperate2Img.page_renderer import render_pdfs_parallel
+from automations.seperate2Img.pdf_to_image import convert_pdfs_to_images
+
+DEFAULT_PDF_DIR = project_root / "Tests" / "hwp2pdf"
+
+
+def _prepare_inputs(pdf_dir: Path, copies: int, temp: Path) -> list:
+    sources = sorted(pdf_dir.glob("*.pdf"))
+    if not sources:
+        raise SystemExit(f"PDF 없음: {pdf_dir}")
+    input_dir = temp / "input"
+    input_dir.mkdir()
+    pdf_files = []
+    for copy in range(copies):
+        for index, source in enumerate(sources):
+            target = input_dir / f"{copy:03d}_{index:03d}.pdf"
+            shutil.copyfile(source, target)
+            pdf_files.append(str(target))
+    return pdf_files
+
+
+def _run(pdf_files: list, output_dir: Path, dpi: int, format: str, trim: bool, workers: int = 0):
+    """workers=0이면 직렬 경로, 그 밖에는 프로세스 풀 (워커 1개도 풀로 실행)"""
+    start = time.perf_counter()
+    if workers:
+        results = render_pdfs_parallel(
+            pdf_files,
+            str(output_dir),
+            dpi=dpi,
+            format=format,
+            trim_whitespace=trim,
+            max_workers=workers,
+        )
+    else:
+        results = convert_pdfs_to_images(
+            pdf_files,
+            str(output_dir),
+            dpi=dpi,
+            format=format,
+            trim_whitespace=trim,
+            max_workers=1,
+        )
+    return time.perf_counter() - start, results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PDF → Image 렌더링 처리량 벤치마크")
+    parser.add_argument("--pdf-dir", type=Path, default=DEFAULT_PDF_DIR)
+    parser.add_argument("--copies", type=int, default=1, help="입력 PDF 복사 횟수")
+    parser.add_argument("--dpi", type=int, default=150)
+    parser.add_argument("--format", choices=["png", "jpg"], default="png")
+    parser.add_argument("--trim", action="store_true", help="여백 제거 포함")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[os.cpu_count() or 1],
+        help="병렬 워커 수 (여러 개 가능)",
+    )
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        pdf_files = _prepare_inputs(args.pdf_dir, args.copies, temp)
+
+        # 워밍업 (pdfium/PIL 로드, 디스크 캐시)
+        _run(pdf_files[:1], temp / "warmup", args.dpi, args.format, args.trim)
+
+        rows = []
+        serial_seconds, serial = _run(pdf_files, temp / "serial", args.dpi, args.format, args.trim)
+        pages = sum(1 for ok, _, _ in serial if ok)
+        rows.append(("serial", serial_seconds, True))
+
+        for workers in args.workers:
+            seconds, results = _run(
+                pdf_files,
+                temp / f"parallel_{workers}",
+                args.dpi,
+                args.format,
+                args.trim,
+                workers,
+            )
+            same = [(ok, Path(p).name if p else None) for ok, p, _ in results] == [
+                (ok, Path(p).name if p else None) for ok, p, _ in serial
+            ]
+            rows.append((f"pool x{workers}", seconds, same))
+
+    print("=" * 60)
+    print(
+        f"PDF {len(pdf_files)}개, 페이지 {pages}장, {args.dpi} DPI {args.format}"
+        f'{" +trim" if args.trim else ""} (CPU {os.cpu_count()})'
+    )
+    print("-" * 60)
+    print(f'{"방식":12s} {"시간(s)":>9s} {"페이지/s":>10s} {"배율":>7s}  결과 일치')
+    for label, seconds, same in rows:
+        print(
+            f"{label:12s} {seconds:9.2f} {pages / seconds:10.1f} {serial_seconds / seconds:7.2f}x  "
+            f'{"예" if same else "아니오"}'
+        )
+    print("=" * 60)
+    return rows
+
+
+if __name__ == "__main__":
+    main()
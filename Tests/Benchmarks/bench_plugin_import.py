@@ -0,0 +1,115 @@
+"""
+런처 시작 import 시간 벤치마크
+
+새 Python 프로세스에서 "플러그인 목록을 그릴 수 있을 때"까지 걸리는 시간을 비교합니다.
+
+- eager: 예전 _load_plugins처럼 모든 플러그인 패키지 import 후 목록 조회
+- lazy: 매니페스트 메타데이터만 조회 (플러그인 모듈은 get_plugin() 때 import)
+- first: lazy + 플러그인 하나(--plugin) 첫 get_plugin()
+
+무거운 모듈(win32com, tkinter, pypdfium2, PIL, langgraph, pydantic) 중 어느 것이
+로드됐는지와 sys.modules 개수도 함께 표시합니다.
+
+사용법:
+    python Tests/Benchmarks/bench_plugin_import.py
+    python Tests/Benchmarks/bench_plugin_import.py --runs 10 --plugin seperate2img
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from automations.manifest import BUILTIN_PLUGINS
+
+HEAVY_MODULES = ("win32com", "tkinter", "pypdfium2", "PIL", "langgraph", "pydantic")
+
+# 하위 프로세스에서 실행: {"seconds", "modules", "heavy"} 출력
+_SNIPPET = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+{body}
+seconds = time.perf_counter() - start
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{"seconds": seconds, "modules": len(sys.modules), "heavy": heavy}}))
+"""
+
+_EAGER = "\n".join(
+    ["import importlib"]
+    + [
+        f"try:\n    importlib.import_module({manifest.module!r})\nexcept ImportError:\n    pass"
+        for manifest in BUILTIN_PLUGINS
+    ]
+    + ["from automations import get_registry", "get_registry().get_all_metadata()"]
+)
+
+_LAZY = "from automations import get_registry\nget_registry().get_all_metadata()"
+
+
+def _run(body: str, env: dict) -> dict:
+    snippet = _SNIPPET.format(root=str(project_root), body=body, heavy=HEAVY_MODULES)
+    output = subprocess.run(
+        [sys.executable, "-c", snippet], env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def measure(runs: int, plugin_id: str) -> dict:
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)  # .pyc 컴파일 시간은 제외
+
+    cases = {
+        "eager": _EAGER,
+        "lazy": _LAZY,
+        "first": f"{_LAZY}\nget_registry().get_plugin({plugin_id!r})",
+    }
+    results = {}
+    for key, body in cases.items():
+        _run(body, env)  # .pyc 준비
+        samples = [_run(body, env) for _ in range(runs)]
+        results[key] = {
+            "seconds": [sample["seconds"] for sample in samples],
+            "modules": samples[-1]["modules"],
+            "heavy": samples[-1]["heavy"],
+        }
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="런처 시작 import 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=5, help="하위 프로세스 반복 횟수")
+    parser.add_argument("--plugin", default="hwp2pdf", help="first 케이스에서 로드할 플러그인 ID")
+    args = parser.parse_args(argv)
+
+    results = measure(args.runs, args.plugin)
+
+    print("=" * 60)
+    print(
+        f'{"목록 표시까지":16s} {"중앙값(ms)":>11s} {"최소(ms)":>10s} {"모듈 수":>8s}  무거운 모듈'
+    )
+    print("-" * 60)
+    for key, label in (
+        ("eager", "eager import"),
+        ("lazy", "manifest"),
+        ("first", f"+ {args.plugin}"),
+    ):
+        result = results[key]
+        values = result["seconds"]
+        print(
+            f"{label:16s} {statistics.median(values) * 1000:11.2f} {min(values) * 1000:10.2f} "
+            f'{result["modules"]:8d}  {", ".join(result["heavy"]) or "-"}'
+        )
+    print("=" * 60)
+    return results
+
+
+if __name__ == "__main__":
+    main()
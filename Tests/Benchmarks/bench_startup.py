@@ -0,0 +1,163 @@
+"""
+시작 시간 예산 회귀 벤치마크
+
+런처/MCP 서버를 새 프로세스로 띄워 첫 화면(MCP는 요청 대기)까지 걸린 시간을 재고,
+예산(STARTUP_BUDGET_MS)을 넘으면 종료 코드 1로 실패합니다.
+
+각 프로세스는 HWP_STARTUP_PROFILE로 core/startup.py 프로파일러를 켜고
+HWP_STARTUP_EXIT=1로 첫 화면 직후 종료합니다. 보고서의 import/플러그인 시간도 표시합니다.
+
+- wall: 프로세스 시작 ~ 종료 (인터프리터 시작 포함, 예산 비교 기준)
+- paint: 프로파일러 시작 ~ first_paint/ready
+- 실행할 수 없는 대상(디스플레이 없음, PyQt5 미설치 등)은 건너뜀 (--strict면 실패)
+
+사용법:
+    python Tests/Benchmarks/bench_startup.py
+    python Tests/Benchmarks/bench_startup.py --runs 5 --budget run_ui=1200 \
+        --report-dir startup_reports
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.startup import STARTUP_EXIT_ENV, STARTUP_PROFILE_ENV
+
+# 대상별 실행 명령 (프로젝트 루트 기준)
+TARGETS = {
+    "run_ui": [sys.executable, "run_ui.py"],
+    "main_pyqt": [sys.executable, "ui/main_pyqt.py"],
+    "mcp_server": [sys.executable, "-m", "automations.mcp.server"],
+}
+
+# 대상별 예산 (ms, wall 중앙값 기준) - 운영 PC 기준으로 조정
+STARTUP_BUDGET_MS = {
+    "run_ui": 1500,
+    "main_pyqt": 2500,
+    "mcp_server": 3000,
+}
+
+
+def _run_once(command: list, report: Path, timeout: float) -> dict:
+    env = dict(os.environ, **{STARTUP_PROFILE_ENV: str(report), STARTUP_EXIT_ENV: "1"})
+    env.pop("PYTHONDONTWRITEBYTECODE", None)  # .pyc 컴파일 시간은 제외
+    started = time.perf_counter()
+    result = subprocess.run(
+        command,
+        cwd=project_root,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+    wall = time.perf_counter() - started
+    if result.returncode != 0 or not report.exists():
+        lines = (result.stderr or result.stdout).strip().splitlines()
+        return {"error": lines[-1] if lines else f"exit code {result.returncode}"}
+    return {"wall": wall, "report": json.loads(report.read_text(encoding="utf-8"))}
+
+
+def measure(target: str, runs: int, timeout: float, report_dir: Path = None) -> dict:
+    command = TARGETS[target]
+    with tempfile.TemporaryDirectory() as temp_dir:
+        report = Path(temp_dir) / f"{target}.json"
+        first = _run_once(command, report, timeout)  # .pyc 준비 겸 실행 가능 여부 확인
+        if "error" in first:
+            return first
+        samples = [_run_once(command, report, timeout) for _ in range(runs)]
+
+    errors = [sample["error"] for sample in samples if "error" in sample]
+    if errors:
+        return {"error": errors[0]}
+
+    last = samples[-1]["report"]
+    if report_dir is not None:
+        report_dir.mkdir(parents=True, exist_ok=True)
+        (report_dir / f"{target}.json").write_text(
+            json.dumps(last, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+
+    def _mark(report):
+        marks = report["marks"]
+        return marks.get("first_paint", marks.get("ready", 0.0))
+
+    return {
+        "wall": [sample["wall"] for sample in samples],
+        "paint": [_mark(sample["report"]) for sample in samples],
+        "imports": last["import_seconds"],
+        "plugins": last["phases"].get("plugins", 0.0),
+        "top": last["top_imports"][:3],
+    }
+
+
+def _parse_budgets(values: list) -> dict:
+    budgets = dict(STARTUP_BUDGET_MS)
+    for value in values:
+        target, _, ms = value.partition("=")
+        if target not in TARGETS or not ms:
+            raise SystemExit(f"--budget 형식: <{'|'.join(TARGETS)}>=<ms>")
+        budgets[target] = float(ms)
+    return budgets
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="시작 시간 예산 회귀 벤치마크")
+    parser.add_argument("--runs", type=int, default=3, help="대상별 반복 횟수")
+    parser.add_argument("--targets", nargs="+", choices=list(TARGETS), default=list(TARGETS))
+    parser.add_argument("--budget", action="append", default=[], help="예산 변경 (예: run_ui=1200)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="프로세스 1회 제한 시간 (초)")
+    parser.add_argument("--report-dir", type=Path, help="대상별 마지막 보고서 JSON 저장 위치")
+    parser.add_argument("--strict", action="store_true", help="실행할 수 없는 대상도 실패로 처리")
+    args = parser.parse_args(argv)
+
+    budgets = _parse_budgets(args.budget)
+    failed = []
+
+    print("=" * 60)
+    print(
+        f'{"대상":12s} {"wall(ms)":>9s} {"paint(ms)":>10s} '
+        f'{"import":>8s} {"plugins":>8s} {"예산":>7s}  결과'
+    )
+    print("-" * 60)
+    results = {}
+    for target in args.targets:
+        result = results[target] = measure(target, args.runs, args.timeout, args.report_dir)
+        if "error" in result:
+            print(f'{target:12s} 건너뜀: {result["error"][:44]}')
+            if args.strict:
+                failed.append(target)
+            continue
+
+        wall = statistics.median(result["wall"]) * 1000
+        ok = wall <= budgets[target]
+        if not ok:
+            failed.append(target)
+        print(
+            f'{target:12s} {wall:9.0f} {statistics.median(result["paint"]) * 1000:10.0f} '
+            f'{result["imports"] * 1000:8.0f} {result["plugins"] * 1000:8.1f} '
+            f"{budgets[target]:7.0f}  "
+            f'{"OK" if ok else "초과"}'
+        )
+        for record in result["top"]:
+            print(f'{"":12s} {record["cumulative_us"] / 1000:9.1f}  {record["name"]}')
+    print("=" * 60)
+
+    if failed:
+        print(f'예산 초과/실행 실패: {", ".join(failed)}')
+        sys.exit(1)
+    return results
+
+
+if __name__ == "__main__":
+    main()
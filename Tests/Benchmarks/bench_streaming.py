@@ -0,0 +1,105 @@
+"""
+스트리밍 파이프라인 벤치마크 - 단계별 일괄 실행 vs 스트리밍 (core/pipeline.py)
+
+한글 COM 없이 비교하려고 단계 시간을 sleep으로 흉내 냅니다 (문제마다 길이가 다름).
+- staged: 단계마다 같은 워커 수의 스레드 풀로 전부 처리한 뒤 다음 단계
+- streaming: StreamingPipeline (단계별 점유율도 출력)
+
+사용법:
+    python Tests/Benchmarks/bench_streaming.py
+    python Tests/Benchmarks/bench_streaming.py --files 60 --preprocess-ms 300 \
+        --pdf-ms 400 --image-ms 80
+"""
+
+import argparse
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.pipeline import PipelineStage, StreamingPipeline
+
+
+def simulated(mean_ms: float, jitter: float, seed: int):
+    """항목마다 mean_ms × (1 ± jitter) 걸리는 워커 (항목별 시간은 고정)"""
+
+    def work(item):
+        rng = random.Random(hash((seed, item)))
+        time.sleep(mean_ms / 1000 * (1 + rng.uniform(-jitter, jitter)))
+        return True, item, None
+
+    return work
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="단계별 일괄 실행 vs 스트리밍")
+    parser.add_argument("--files", type=int, default=40)
+    parser.add_argument("--preprocess-ms", type=float, default=200)
+    parser.add_argument("--pdf-ms", type=float, default=300)
+    parser.add_argument("--image-ms", type=float, default=60)
+    parser.add_argument("--jitter", type=float, default=0.8, help="문제별 시간 편차 (0~1)")
+    parser.add_argument("--com-workers", type=int, default=5)
+    parser.add_argument("--image-workers", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    def stages():
+        return [
+            PipelineStage(
+                "preprocess",
+                simulated(args.preprocess_ms, args.jitter, 1),
+                args.com_workers,
+                "thread",
+            ),
+            PipelineStage(
+                "pdf", simulated(args.pdf_ms, args.jitter, 2), args.com_workers, "thread"
+            ),
+            PipelineStage(
+                "image", simulated(args.image_ms, args.jitter, 3), args.image_workers, "thread"
+            ),
+        ]
+
+    items = list(range(args.files))
+
+    start = time.perf_counter()
+    for stage in stages():
+        with ThreadPoolExecutor(max_workers=stage.workers) as pool:
+            list(pool.map(stage.func, items))
+    staged_seconds = time.perf_counter() - start
+
+    pipeline = StreamingPipeline(stages())
+    start = time.perf_counter()
+    pipeline.run(items)
+    streaming_seconds = time.perf_counter() - start
+    report = pipeline.report()
+
+    print("=" * 60)
+    print(
+        f"문제 {args.files}개, "
+        f"단계 평균 {args.preprocess_ms:.0f}/{args.pdf_ms:.0f}/{args.image_ms:.0f}ms "
+        f"(편차 ±{args.jitter:.0%})"
+    )
+    print("-" * 60)
+    print(f'{"방식":12s} {"시간(s)":>9s} {"배율":>7s}')
+    print(f'{"staged":12s} {staged_seconds:9.2f} {1.0:7.2f}x')
+    print(f'{"streaming":12s} {streaming_seconds:9.2f} {staged_seconds / streaming_seconds:7.2f}x')
+    print("-" * 60)
+    print(
+        f'{"단계":12s} {"워커":>5s} {"점유율":>7s} {"굶음(s)":>8s} {"막힘(s)":>8s} {"최대 큐":>7s}'
+    )
+    for name, metrics in report["stages"].items():
+        print(
+            f'{name:12s} {metrics["workers"]:5d} {metrics["occupancy"]:7.0%} '
+            f'{metrics["starved_seconds"]:8.2f} {metrics["blocked_seconds"]:8.2f} '
+            f'{metrics["max_queue"]:7d}'
+        )
+    print("=" * 60)
+    return staged_seconds, streaming_seconds, report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+여백 제거 벤치마크 - PIL(trim_image_whitespace) vs NumPy(trim_bitmap)
+vs 렌더링 전 자르기(render_trimmed)
+
+페이지마다 렌더링 + 여백 제거 시간과 최대 메모리(RSS) 증가량을 300/600 DPI에서 비교합니다.
+
+- pil: page.render().to_pil() → trim_image_whitespace (배경 이미지, ImageChops 2회)
+- numpy: page.render(rev_byteorder=True) → trim_bitmap (비트맵 버퍼 뷰, 잘린 영역만 복사)
+- clip: render_trimmed (페이지 객체 경계 영역만 렌더링, 안 되는 페이지는 numpy 방식으로)
+    render 칸에 객체 경계 계산 + 영역 렌더링 + 영역 안 판정이 모두 들어감,
+    trim 칸은 대체 렌더링 비용
+- 메모리: 방식/DPI마다 새 프로세스에서 "비트맵 렌더링만 했을 때" 최대 RSS 대비 증가량
+  (resource 모듈이 없는 Windows에서는 표시하지 않음)
+
+사용법:
+    python Tests/Benchmarks/bench_trim.py
+    python Tests/Benchmarks/bench_trim.py --pdf Tests/hwp2pdf/xxx.pdf --pages 5 --dpi 300 600
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+DEFAULT_PDF = sorted((project_root / "Tests" / "hwp2pdf").glob("*.pdf"))[0]
+METHODS = ("pil", "numpy", "clip")
+
+
+def _peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def _child(method: str, pdf_path: str, dpi: int, pages: int) -> dict:
+    """하위 프로세스: 한 방식 × 한 DPI 측정"""
+    import pypdfium2 as pdfium
+    from automations.seperate2Img.pdf_to_image import trim_image_whitespace
+    from automations.seperate2Img.trim import render_trimmed, trim_bitmap
+
+    scale = dpi / 72.0
+    pdf = pdfium.PdfDocument(pdf_path)
+    pages = min(pages, len(pdf))
+
+    # 기준: 비트맵 렌더링만 (두 방식 공통 비용)
+    for index in range(pages):
+        bitmap = pdf[index].render(scale=scale, rev_byteorder=True)
+        bitmap_bytes = bitmap.stride * bitmap.height
+        del bitmap
+    baseline = _peak_rss_mb()
+
+    render_times, trim_times, sizes = [], [], []
+    for index in range(pages):
+        page = pdf[index]
+        start = time.perf_counter()
+        if method == "pil":
+            image = page.render(scale=scale).to_pil()
+            rendered = time.perf_counter()
+            image = trim_image_whitespace(image, padding=10)
+        elif method == "clip":
+            image = render_trimmed(page, scale, padding=10)
+            rendered = time.perf_counter()
+            if image is None:
+                image = trim_bitmap(page.render(scale=scale, rev_byteorder=True), padding=10)
+        else:
+            bitmap = page.render(scale=scale, rev_byteorder=True)
+            rendered = time.perf_counter()
+            image = trim_bitmap(bitmap, padding=10)
+            del bitmap
+        done = time.perf_counter()
+        render_times.append(rendered - start)
+        trim_times.append(done - rendered)
+        sizes.append(image.size)
+        del image
+
+    peak = _peak_rss_mb()
+    pdf.close()
+    return {
+        "render": statistics.median(render_times),
+        "trim": statistics.median(trim_times),
+        "extra_mb": None if peak is None else max(0.0, peak - baseline),
+        "bitmap_mb": bitmap_bytes / 1024 / 1024,
+        "sizes": sizes,
+    }
+
+
+def measure(method: str, pdf_path: Path, dpi: int, pages: int) -> dict:
+    output = subprocess.run(
+        [
+            sys.executable,
+            __file__,
+            "--child",
+            method,
+            "--pdf",
+            str(pdf_path),
+            "--dpi",
+            str(dpi),
+            "--pages",
+            str(pages),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="여백 제거 벤치마크 (PIL vs NumPy vs 렌더링 전 자르기)"
+    )
+    parser.add_argument("--pdf", type=Path, default=DEFAULT_PDF)
+    parser.add_argument("--pages", type=int, default=3, help="측정할 페이지 수 (앞에서부터)")
+    parser.add_argument("--dpi", type=int, nargs="+", default=[300, 600])
+    parser.add_argument("--child", choices=METHODS, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(_child(args.child, str(args.pdf), args.dpi[0], args.pages)))
+        return None
+
+    results = {
+        (method, dpi): measure(method, args.pdf, dpi, args.pages)
+        for dpi in args.dpi
+        for method in METHODS
+    }
+
+    print("=" * 60)
+    print(f"{args.pdf.name} 앞 {args.pages}페이지, 페이지당 중앙값")
+    print("-" * 60)
+    print(
+        f'{"DPI":>4s} {"방식":6s} {"render(ms)":>11s} {"trim(ms)":>9s} '
+        f'{"추가 MB":>8s} {"비트맵 MB":>9s}  결과 일치'
+    )
+    for dpi in args.dpi:
+        for method in METHODS:
+            result = results[(method, dpi)]
+            same = result["sizes"] == results[("pil", dpi)]["sizes"]
+            extra = "-" if result["extra_mb"] is None else f'{result["extra_mb"]:.1f}'
+            print(
+                f'{dpi:4d} {method:6s} {result["render"] * 1000:11.1f} '
+                f'{result["trim"] * 1000:9.1f} '
+                f'{extra:>8s} {result["bitmap_mb"]:9.1f}  {"예" if same else "아니오"}'
+            )
+    print("=" * 60)
+    return results
+
+
+if __name__ == "__main__":
+    main()
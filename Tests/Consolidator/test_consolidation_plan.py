@@ -0,0 +1,235 @@
+"""
+Consolidation Plan 테스트
+
+core/consolidation_plan.py - 같은 이름 다른 내용(충돌)은 결정적 이름 변경, 같은 내용(중복)은 건너뜀,
+매니페스트, 다시 실행하면 새 파일/바뀐 파일만 복사 (consolidate_parallel(dedupe=True))
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import core.consolidation_plan as consolidation_plan
+from core.consolidation_plan import (
+    COPY,
+    DUPLICATE,
+    MANIFEST_FILE,
+    UNCHANGED,
+    file_digest,
+    plan_consolidation,
+)
+from core.folder_consolidator import consolidate_parallel, scan_folders
+
+
+def make_sources(root: Path) -> list:
+    """
+    a/문제1.hwp  "first"      ← 원래 이름
+    b/문제1.hwp  "second"     ← 이름 충돌
+    b/문제2.hwp  "first"      ← a/문제1.hwp와 중복
+    c/문제1.hwp  "first"      ← 이름도 내용도 같음 (중복)
+    c/문제3.hwp  "third"
+    """
+    layout = {
+        "a": {"문제1.hwp": b"first"},
+        "b": {"문제1.hwp": b"second", "문제2.hwp": b"first"},
+        "c": {"문제1.hwp": b"first", "문제3.hwp": b"third"},
+    }
+    sources = []
+    for folder, files in layout.items():
+        (root / folder).mkdir()
+        for name, data in files.items():
+            (root / folder / name).write_bytes(data)
+        sources.append(str(root / folder))
+    return sources
+
+
+def target_contents(target: Path) -> dict:
+    return {path.name: path.read_bytes() for path in target.iterdir() if path.name != MANIFEST_FILE}
+
+
+def test_plan_separates_duplicates_and_collisions():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        sources = make_sources(temp)
+        (temp / "out").mkdir()
+
+        # 폴더 안 스캔 순서(iterdir)와 무관한 결과
+        files = scan_folders(sources)
+        shuffled = sorted(files[::-1], key=lambda path: Path(path).parent.name)
+        plans = [plan_consolidation(order, str(temp / "out")) for order in (files, shuffled)]
+        plan = plans[0]
+        actions = {
+            (Path(item.source).parent.name, Path(item.source).name): (item.action, item.dest_name)
+            for item in plan.files
+        }
+
+        second = file_digest(str(temp / "b" / "문제1.hwp"))
+        assert actions[("a", "문제1.hwp")] == (COPY, "문제1.hwp")
+        assert actions[("b", "문제1.hwp")] == (COPY, f"문제1_{second[:8]}.hwp")
+        assert actions[("b", "문제2.hwp")][0] == DUPLICATE
+        assert actions[("c", "문제1.hwp")][0] == DUPLICATE
+        assert actions[("c", "문제3.hwp")] == (COPY, "문제3.hwp")
+        assert {item.duplicate_of for item in plan.files if item.action == DUPLICATE} == {
+            "문제1.hwp"
+        }
+        assert plan.summary() == {
+            "copy": 3,
+            "unchanged": 0,
+            "duplicate": 2,
+            "renamed": 1,
+            "unreadable": 0,
+        }
+        assert [item.dest_name for item in plans[1].files] == [
+            item.dest_name for item in plan.files
+        ]
+
+        # 대상에 매니페스트 밖의 다른 파일이 같은 이름으로 있으면 덮어쓰지 않음
+        (temp / "out" / "문제3.hwp").write_bytes(b"someone else's")
+        item = next(
+            item
+            for item in plan_consolidation(files, str(temp / "out")).files
+            if item.source.endswith("문제3.hwp")
+        )
+        assert item.action == COPY and item.dest_name.startswith("문제3_")
+        # 같은 내용이면 그대로
+        (temp / "out" / "문제3.hwp").write_bytes(b"third")
+        item = next(
+            item
+            for item in plan_consolidation(files, str(temp / "out")).files
+            if item.source.endswith("문제3.hwp")
+        )
+        assert (item.action, item.dest_name) == (UNCHANGED, "문제3.hwp")
+
+
+def test_collision_name_skips_existing_files():
+    """충돌 이름 후보가 대상 폴더에 다른 내용으로 있으면 해시를 더 길게 (덮어쓰지 않음)"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        sources = make_sources(temp)
+        (temp / "out").mkdir()
+        second = file_digest(str(temp / "b" / "문제1.hwp"))
+        (temp / "out" / f"문제1_{second[:8]}.hwp").write_bytes(b"someone else's")
+
+        plan = plan_consolidation(scan_folders(sources), str(temp / "out"))
+        item = next(item for item in plan.files if item.source == str(temp / "b" / "문제1.hwp"))
+        assert (item.action, item.dest_name) == (COPY, f"문제1_{second[:12]}.hwp")
+
+        # 후보에 같은 내용이 이미 있으면 그 이름 그대로 (복사 안 함)
+        (temp / "out" / f"문제1_{second[:8]}.hwp").write_bytes(b"second")
+        plan = plan_consolidation(scan_folders(sources), str(temp / "out"))
+        item = next(item for item in plan.files if item.source == str(temp / "b" / "문제1.hwp"))
+        assert (item.action, item.dest_name) == (UNCHANGED, f"문제1_{second[:8]}.hwp")
+
+
+def test_names_differing_only_in_case_collide():
+    """대소문자만 다른 이름은 같은 파일로 취급 (Windows/NTFS)"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        sources = make_sources(temp)
+        (temp / "b" / "문제1.hwp").rename(temp / "b" / "문제1.HWP")
+        (temp / "out").mkdir()
+        (temp / "out" / "문제3.HWP").write_bytes(b"someone else's")
+
+        plan = plan_consolidation(scan_folders(sources), str(temp / "out"))
+        names = {item.source: item.dest_name for item in plan.files if item.action == COPY}
+        second = file_digest(str(temp / "b" / "문제1.HWP"))
+        third = file_digest(str(temp / "c" / "문제3.hwp"))
+        assert names[str(temp / "a" / "문제1.hwp")] == "문제1.hwp"
+        assert names[str(temp / "b" / "문제1.HWP")] == f"문제1_{second[:8]}.HWP"
+        assert names[str(temp / "c" / "문제3.hwp")] == f"문제3_{third[:8]}.hwp"
+
+        # 같은 내용이 대소문자만 다른 이름으로 있으면 그 파일을 그대로 씀
+        (temp / "out" / "문제3.HWP").write_bytes(b"third")
+        plan = plan_consolidation(scan_folders(sources), str(temp / "out"))
+        item = next(item for item in plan.files if item.source.endswith("문제3.hwp"))
+        assert (item.action, item.dest_name) == (UNCHANGED, "문제3.HWP")
+
+
+def test_manifest_skips_duplicates_of_failed_copies():
+    """대표 원본 복사가 실패하면 그 중복도 매니페스트에 남기지 않음"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        sources = make_sources(temp)
+        (temp / "out").mkdir()
+        plan = plan_consolidation(scan_folders(sources), str(temp / "out"))
+
+        manifest = plan.manifest(failed=[str(temp / "a" / "문제1.hwp")])
+        assert sorted(manifest["sources"]) == [
+            str(temp / "b" / "문제1.hwp"),
+            str(temp / "c" / "문제3.hwp"),
+        ]
+        assert "문제1.hwp" not in manifest["files"]
+
+
+def test_consolidate_dedupe_and_incremental_rerun():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        sources = make_sources(temp)
+        target = temp / "merged"
+
+        assert consolidate_parallel(sources, str(temp), "merged", dedupe=True) == (5, 5, 0)
+        second = file_digest(str(temp / "b" / "문제1.hwp"))
+        assert target_contents(target) == {
+            "문제1.hwp": b"first",
+            f"문제1_{second[:8]}.hwp": b"second",
+            "문제3.hwp": b"third",
+        }
+        manifest = json.loads((target / MANIFEST_FILE).read_text(encoding="utf-8"))
+        assert manifest["files"]["문제1.hwp"]["source"] == str(temp / "a" / "문제1.hwp")
+        assert manifest["sources"][str(temp / "c" / "문제1.hwp")]["dest"] == "문제1.hwp"
+
+        # 다시 실행: 해시도 복사도 없음
+        hashed = []
+        original_hash = consolidation_plan.hash_files
+        consolidation_plan.hash_files = lambda paths, max_workers=4: hashed.extend(
+            paths
+        ) or original_hash(paths)
+        try:
+            plan = plan_consolidation(scan_folders(sources), str(target))
+            assert hashed == [] and plan.to_copy == []
+
+            # 바뀐 파일 + 새 파일만 (바뀐 파일은 이전 대상 이름 유지)
+            changed = temp / "b" / "문제1.hwp"
+            changed.write_bytes(b"second, edited")
+            os.utime(changed, ns=(1, 1))
+            (temp / "c" / "문제4.hwp").write_bytes(b"fourth")
+            plan = plan_consolidation(scan_folders(sources), str(target))
+            assert sorted(Path(path).name for path in hashed) == ["문제1.hwp", "문제4.hwp"]
+            assert sorted(item.dest_name for item in plan.to_copy) == [
+                f"문제1_{second[:8]}.hwp",
+                "문제4.hwp",
+            ]
+        finally:
+            consolidation_plan.hash_files = original_hash
+
+        assert consolidate_parallel(sources, str(temp), "merged", dedupe=True) == (6, 6, 0)
+        assert (target / f"문제1_{second[:8]}.hwp").read_bytes() == b"second, edited"
+        assert (target / "문제4.hwp").read_bytes() == b"fourth"
+
+
+def test_move_dedupe_leaves_skipped_files():
+    """이동 모드: 옮긴 파일은 원본에서 사라지고 중복은 원본에 남음"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        sources = make_sources(temp)
+        stats = consolidate_parallel(sources, str(temp), "moved", mode="move", dedupe=True)
+        assert stats == (5, 5, 0)
+        assert not (temp / "a").exists()
+        assert sorted(path.name for path in (temp / "b").iterdir()) == ["문제2.hwp"]
+        assert len(target_contents(temp / "moved")) == 3
+
+
+if __name__ == "__main__":
+    test_plan_separates_duplicates_and_collisions()
+    test_collision_name_skips_existing_files()
+    test_names_differing_only_in_case_collide()
+    test_manifest_skips_duplicates_of_failed_copies()
+    test_consolidate_dedupe_and_incremental_rerun()
+    test_move_dedupe_leaves_skipped_files()
+    print("✅ 통합 계획 테스트 통과!")
@@ -0,0 +1,161 @@
+"""
+Folder Consolidator I/O 엔진 테스트
+
+core/folder_consolidator.py - 커널 복사(copy_file_range/sendfile/버퍼 대체 경로)가
+copy2와 같은 결과인지, 하드링크/reflink 모드, rename 이동, 스레드/프로세스 엔진 결과 비교
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import core.folder_consolidator as consolidator
+from core.folder_consolidator import consolidate_parallel, fast_copy, fast_move, link_or_copy
+
+
+def make_sources(root: Path, folders=2, files=4) -> list:
+    """폴더마다 크기가 다른 파일 (빈 파일 포함)"""
+    sources = []
+    for i in range(folders):
+        folder = root / f"source{i}"
+        folder.mkdir()
+        for j in range(files):
+            (folder / f"file{i}_{j}.bin").write_bytes(os.urandom(j * 70_000))
+        sources.append(str(folder))
+    return sources
+
+
+def snapshot(folder: Path) -> dict:
+    return {path.name: path.read_bytes() for path in sorted(folder.iterdir())}
+
+
+def test_fast_copy_matches_copy2_on_every_path():
+    """copy_file_range / sendfile / 버퍼 복사 모두 내용과 수정 시간이 copy2와 같음"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        source = temp / "source.bin"
+        source.write_bytes(os.urandom(3 * 1024 * 1024 + 17))
+        os.utime(source, (1_600_000_000, 1_600_000_000))
+        shutil.copy2(source, temp / "reference.bin")
+
+        saved = consolidator._KERNEL_COPIES
+        try:
+            for name, syscalls in (
+                ("range", [consolidator._copy_file_range]),
+                ("sendfile", [consolidator._sendfile]),
+                ("buffer", []),
+            ):
+                consolidator._KERNEL_COPIES = syscalls
+                dest = temp / f"{name}.bin"
+                dest.write_bytes(b"old contents that are longer than nothing")
+                fast_copy(str(source), str(dest))
+                assert dest.read_bytes() == source.read_bytes(), name
+                assert dest.stat().st_mtime == (temp / "reference.bin").stat().st_mtime
+        finally:
+            consolidator._KERNEL_COPIES = saved
+
+        with pytest.raises(shutil.SameFileError):
+            fast_copy(str(source), str(source))
+
+
+def test_zero_returning_kernel_copy_falls_back_to_buffer():
+    """첫 copy_file_range/sendfile이 0을 돌려줘도 (procfs, 일부 FUSE) 빈 파일이 남지 않음"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        source = temp / "source.bin"
+        source.write_bytes(os.urandom(100_000))
+        calls = []
+
+        def returns_zero(src_fd, dst_fd):
+            calls.append(src_fd)
+            return 0
+
+        saved = consolidator._KERNEL_COPIES
+        try:
+            consolidator._KERNEL_COPIES = [returns_zero, returns_zero]
+            fast_copy(str(source), str(temp / "dest.bin"))
+        finally:
+            consolidator._KERNEL_COPIES = saved
+        assert len(calls) == 2
+        assert (temp / "dest.bin").read_bytes() == source.read_bytes()
+
+        # 빈 파일도 그대로
+        (temp / "empty.bin").write_bytes(b"")
+        fast_copy(str(temp / "empty.bin"), str(temp / "empty_copy.bin"))
+        assert (temp / "empty_copy.bin").read_bytes() == b""
+
+
+def test_link_modes():
+    """하드링크는 inode 공유 + 재실행 무해, reflink는 미지원 파일시스템이면 복사로 대체"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        source = temp / "a.bin"
+        source.write_bytes(b"payload" * 1000)
+
+        hard = temp / "hard.bin"
+        hard.write_bytes(b"stale")
+        assert link_or_copy(str(source), str(hard), "hardlink") == "hardlink"
+        assert os.path.samefile(source, hard)
+        assert link_or_copy(str(source), str(hard), "hardlink") == "hardlink"
+        assert source.read_bytes() == b"payload" * 1000
+
+        ref = temp / "ref.bin"
+        assert link_or_copy(str(source), str(ref), "reflink") in ("reflink", "copy")
+        assert ref.read_bytes() == source.read_bytes() and not os.path.samefile(source, ref)
+
+        moved = temp / "moved.bin"
+        inode = ref.stat().st_ino
+        fast_move(str(ref), str(moved))
+        assert not ref.exists() and moved.stat().st_ino == inode  # 같은 파일시스템: rename
+
+
+def test_thread_engine_matches_process_engine():
+    """복사/하드링크/이동 모두 이전 프로세스 엔진과 같은 결과"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        sources = make_sources(temp)
+        expected = {}
+        for folder in sources:
+            expected.update(snapshot(Path(folder)))
+
+        for engine in ("process", "thread"):
+            stats = consolidate_parallel(sources, str(temp), f"copy_{engine}", engine=engine)
+            assert stats == (8, 8, 0)
+            assert snapshot(temp / f"copy_{engine}") == expected
+
+        assert consolidate_parallel(sources, str(temp), "linked", link_mode="hardlink") == (8, 8, 0)
+        assert all(
+            os.path.samefile(Path(sources[0]) / name, temp / "linked" / name)
+            for name in os.listdir(sources[0])
+        )
+
+        assert consolidate_parallel(sources, str(temp), "moved", mode="move") == (8, 8, 0)
+        assert snapshot(temp / "moved") == expected
+        assert not any(Path(folder).exists() for folder in sources)
+
+
+def test_engine_validation():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with pytest.raises(ValueError):
+            consolidate_parallel([temp_dir], temp_dir, "out", engine="asyncio")
+        with pytest.raises(ValueError):
+            consolidate_parallel([temp_dir], temp_dir, "out", link_mode="symlink")
+        with pytest.raises(ValueError):
+            consolidate_parallel([temp_dir], temp_dir, "out", mode="move", link_mode="hardlink")
+
+
+if __name__ == "__main__":
+    test_fast_copy_matches_copy2_on_every_path()
+    test_zero_returning_kernel_copy_falls_back_to_buffer()
+    test_link_modes()
+    test_thread_engine_matches_process_engine()
+    test_engine_validation()
+    print("✅ I/O 엔진 테스트 통과!")
@@ -0,0 +1,224 @@
+"""
+HWPX 합병 엔진 테스트
+
+automations/merger/hwpx_merger.py - 문단 삽입, header ID 병합, BinData 재번호
+"""
+
+import sys
+import zipfile
+import tempfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.hwpx_xml import HP_P, HP_RUN, HP_SEC_PR, NS_HEAD, NS_CORE, paragraph_text, qname
+from automations.merger.hwpx_merger import merge_hwpx_files
+
+NS_DECL = (
+    ' xmlns:hp="http://www.hancom.co.kr/hwpml/2011/paragraph"'
+    ' xmlns:hs="http://www.hancom.co.kr/hwpml/2011/section"'
+    ' xmlns:hh="http://www.hancom.co.kr/hwpml/2011/head"'
+    ' xmlns:hc="http://www.hancom.co.kr/hwpml/2011/core"'
+)
+
+
+def _header(font: str, char_height: int, style_name: str = "바탕글") -> str:
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f'<hh:head{NS_DECL} version="1.4" secCnt="1"><hh:refList>'
+        '<hh:fontfaces itemCnt="1"><hh:fontface lang="HANGUL" fontCnt="1">'
+        f'<hh:font id="0" face="{font}" type="TTF"/></hh:fontface></hh:fontfaces>'
+        '<hh:borderFills itemCnt="1"><hh:borderFill id="1" threeD="0"/></hh:borderFills>'
+        '<hh:charProperties itemCnt="1">'
+        f'<hh:charPr id="0" height="{char_height}" borderFillIDRef="1">'
+        '<hh:fontRef hangul="0" latin="0"/></hh:charPr></hh:charProperties>'
+        '<hh:paraProperties itemCnt="1"><hh:paraPr id="0" align="LEFT"/></hh:paraProperties>'
+        f'<hh:styles itemCnt="1"><hh:style id="0" name="{style_name}"'
+        ' paraPrIDRef="0" charPrIDRef="0" nextStyleIDRef="0"/></hh:styles>'
+        "</hh:refList></hh:head>"
+    )
+
+
+def _section(body: str) -> str:
+    return '<?xml version="1.0" encoding="UTF-8"?>' f"<hs:sec{NS_DECL}>{body}</hs:sec>"
+
+
+SEC_RUN = (
+    '<hp:run charPrIDRef="0"><hp:secPr textDirection="HORIZONTAL"/>'
+    '<hp:ctrl><hp:colPr type="NEWSPAPER" colCount="{cols}"/></hp:ctrl></hp:run>'
+)
+
+CONTENT_HPF = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<opf:package xmlns:opf="http://www.idpf.org/2007/opf/"><opf:manifest>'
+    '<opf:item id="header" href="Contents/header.xml" media-type="application/xml"/>'
+    '<opf:item id="section0" href="Contents/section0.xml" media-type="application/xml"/>'
+    "{items}</opf:manifest></opf:package>"
+)
+
+
+def _write_hwpx(path: Path, header: str, section: str, images=None):
+    images = images or {}
+    items = "".join(
+        f'<opf:item id="{Path(name).stem}" href="BinData/{name}" '
+        'media-type="image/png" isEmbeded="1"/>'
+        for name in images
+    )
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("mimetype", "application/hwp+zip", compress_type=zipfile.ZIP_STORED)
+        zf.writestr("Contents/content.hpf", CONTENT_HPF.format(items=items), zipfile.ZIP_DEFLATED)
+        zf.writestr("Contents/header.xml", header, zipfile.ZIP_DEFLATED)
+        zf.writestr("Contents/section0.xml", section, zipfile.ZIP_DEFLATED)
+        for name, data in images.items():
+            zf.writestr(f"BinData/{name}", data, zipfile.ZIP_STORED)
+
+
+def _problem(path: Path, text: str, font: str, height: int, image: bytes):
+    body = (
+        '<hp:p paraPrIDRef="0" styleIDRef="0">'
+        + SEC_RUN.format(cols=1)
+        + f'<hp:run charPrIDRef="0"><hp:t>{text}</hp:t></hp:run>'
+        '<hp:linesegarray><hp:lineseg textpos="0"/></hp:linesegarray></hp:p>'
+        '<hp:p paraPrIDRef="0" styleIDRef="0"><hp:run charPrIDRef="0">'
+        '<hc:img binaryItemIDRef="image1"/></hp:run></hp:p>'
+        '<hp:p paraPrIDRef="0" styleIDRef="0"><hp:run charPrIDRef="0"><hp:t/></hp:run></hp:p>'
+    )
+    _write_hwpx(path, _header(font, height), _section(body), {"image1.png": image})
+
+
+def test_merge_problems_into_template():
+    """문항 본문 삽입 + 단 나누기 + header/BinData 재매핑"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        template = temp / "template.hwpx"
+        _write_hwpx(
+            template,
+            _header("함초롬바탕", 1000),
+            _section(
+                '<hp:p paraPrIDRef="0" styleIDRef="0">'
+                + SEC_RUN.format(cols=2)
+                + '<hp:run charPrIDRef="0"><hp:t/></hp:run></hp:p>'
+            ),
+        )
+
+        problems = []
+        # 1, 3: 양식과 같은 글자 모양 / 2: 다른 글꼴과 크기
+        for index, (font, height) in enumerate(
+            [("함초롬바탕", 1000), ("맑은 고딕", 1200), ("함초롬바탕", 1000)], 1
+        ):
+            path = temp / f"{index:03d}.hwpx"
+            _problem(path, f"문제 {index}", font, height, bytes([index]) * 128)
+            problems.append(path)
+
+        output = temp / "merged.hwpx"
+        result = merge_hwpx_files(template, problems, output, verbose=False)
+
+        assert result.success
+        assert result.inserted_count == 3
+        assert result.bindata_count == 3
+        # 문항 2의 글꼴/글자 모양만 새로 추가됨
+        assert result.added_definitions == {"font": 1, "charPr": 1}
+
+        with zipfile.ZipFile(output) as zf:
+            assert zf.namelist()[0] == "mimetype"
+            assert zf.getinfo("mimetype").compress_type == zipfile.ZIP_STORED
+            assert sorted(n for n in zf.namelist() if n.startswith("BinData/")) == [
+                "BinData/image1.png",
+                "BinData/image2.png",
+                "BinData/image3.png",
+            ]
+            assert zf.read("BinData/image2.png") == bytes([2]) * 128
+            section = ET.fromstring(zf.read("Contents/section0.xml"))
+            header = ET.fromstring(zf.read("Contents/header.xml"))
+            manifest = zf.read("Contents/content.hpf").decode("utf-8")
+
+        assert 'href="BinData/image3.png"' in manifest
+
+        paragraphs = section.findall(HP_P)
+        heads = [p for p in paragraphs if paragraph_text(p).startswith("문제")]
+        assert [paragraph_text(p) for p in heads] == ["문제 1", "문제 2", "문제 3"]
+        assert [p.get("columnBreak") for p in heads] == ["0", "1", "1"]
+
+        # 양식의 구역 정의만 남고 첫 문단에 위치
+        assert len(section.findall(f".//{HP_SEC_PR}")) == 1
+        assert paragraphs[0].find(HP_RUN).find(HP_SEC_PR) is not None
+        assert (
+            section.find(f".//{{http://www.hancom.co.kr/hwpml/2011/paragraph}}colPr").get(
+                "colCount"
+            )
+            == "2"
+        )
+
+        # 끝쪽 빈 문단 제거: 문항당 2문단
+        assert len(paragraphs) == 6
+
+        # 문항 2의 글자 모양 → 새 charPr(1), 이미지 → image2
+        assert heads[1].find(HP_RUN).get("charPrIDRef") == "1"
+        assert heads[0].find(HP_RUN).get("charPrIDRef") == "0"
+        images = [img.get("binaryItemIDRef") for img in section.iter(qname(NS_CORE, "img"))]
+        assert images == ["image1", "image2", "image3"]
+
+        char_props = header.find(f".//{qname(NS_HEAD, 'charProperties')}")
+        assert char_props.get("itemCnt") == "2"
+        new_char = char_props.findall(qname(NS_HEAD, "charPr"))[1]
+        assert new_char.find(qname(NS_HEAD, "fontRef")).get("hangul") == "1"
+        assert len(header.findall(f".//{qname(NS_HEAD, 'style')}")) == 1
+
+
+def test_failed_problem_is_reported():
+    """잘못된 문항은 건너뛰고 결과에 기록"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        template = temp / "template.hwpx"
+        _write_hwpx(
+            template, _header("함초롬바탕", 1000), _section("<hp:p><hp:run><hp:t/></hp:run></hp:p>")
+        )
+        good = temp / "good.hwpx"
+        _problem(good, "문제", "함초롬바탕", 1000, b"img")
+        broken = temp / "broken.hwpx"
+        broken.write_bytes(b"not a zip")
+
+        result = merge_hwpx_files(template, [broken, good], temp / "out.hwpx", verbose=False)
+        assert result.success
+        assert result.inserted_count == 1
+        assert [p for p, _ in result.failed] == [broken]
+
+
+def test_failed_problem_leaves_template_header():
+    """섹션이 없거나 깨진 문항은 양식 header에 글꼴/정의를 추가하지 않음"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        template = temp / "template.hwpx"
+        _write_hwpx(
+            template, _header("함초롬바탕", 1000), _section("<hp:p><hp:run><hp:t/></hp:run></hp:p>")
+        )
+        good = temp / "good.hwpx"
+        _problem(good, "문제", "함초롬바탕", 1000, b"img")
+        broken_section = temp / "broken_section.hwpx"
+        _write_hwpx(broken_section, _header("나눔고딕", 1400, "본문"), "<hs:sec")
+        no_section = temp / "no_section.hwpx"
+        with zipfile.ZipFile(no_section, "w") as zf:
+            zf.writestr("Contents/header.xml", _header("맑은 고딕", 1600, "제목"))
+
+        output = temp / "out.hwpx"
+        result = merge_hwpx_files(
+            template, [broken_section, no_section, good], output, verbose=False
+        )
+        assert result.inserted_count == 1
+        assert [p for p, _ in result.failed] == [broken_section, no_section]
+        assert result.added_definitions == {}
+
+        with zipfile.ZipFile(output) as zf:
+            header = ET.fromstring(zf.read("Contents/header.xml"))
+        assert [font.get("face") for font in header.iter(qname(NS_HEAD, "font"))] == ["함초롬바탕"]
+        assert [style.get("name") for style in header.iter(qname(NS_HEAD, "style"))] == ["바탕글"]
+
+
+if __name__ == "__main__":
+    test_merge_problems_into_template()
+    test_failed_problem_is_reported()
+    test_failed_problem_leaves_template_header()
+    print("✅ HWPX 합병 테스트 통과!")
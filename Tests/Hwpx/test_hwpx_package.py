@@ -0,0 +1,152 @@
+"""
+HWPX 패키지 리더 테스트
+
+core/hwpx_package.py - mmap 기반 멤버 접근 및 공유 매핑
+"""
+
+import sys
+import zipfile
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.hwpx_package import HwpxPackage, open_package, is_hwpx_package
+from automations.separator.xml_parser import HwpxParser
+from core.hwpx_converter import inspect_hwpx
+
+SECTION_XML = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<hs:sec xmlns:hs="http://www.hancom.co.kr/hwpml/2011/section"'
+    ' xmlns:hp="http://www.hancom.co.kr/hwpml/2011/paragraph">'
+    "<hp:p><hp:run><hp:t>문제 1</hp:t>"
+    '<hp:ctrl><hp:endNote number="1" suffixChar="46" instId="1">'
+    "<hp:subList><hp:p><hp:run><hp:t>[정답] 3</hp:t></hp:run></hp:p></hp:subList>"
+    "</hp:endNote></hp:ctrl></hp:run></hp:p>"
+    "</hs:sec>"
+)
+
+
+def _make_hwpx(path: Path, image: bytes = b"\x89PNG" + bytes(range(256)) * 64):
+    """최소 HWPX 패키지 생성 (section0: DEFLATED, BinData: STORED)"""
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("mimetype", "application/hwp+zip", compress_type=zipfile.ZIP_STORED)
+        zf.writestr("Contents/section0.xml", SECTION_XML, compress_type=zipfile.ZIP_DEFLATED)
+        zf.writestr("BinData/image1.png", image, compress_type=zipfile.ZIP_STORED)
+        zf.writestr("BinData/image2.bmp", image * 4, compress_type=zipfile.ZIP_DEFLATED)
+    return image
+
+
+def test_stored_member_is_zero_copy():
+    """STORED 멤버는 매핑의 memoryview로 노출"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "sample.hwpx"
+        image = _make_hwpx(path)
+
+        with open_package(path) as pkg:
+            view = pkg.open_view("BinData/image1.png")
+            assert isinstance(view, memoryview)
+            assert view.tobytes() == image
+            assert pkg.read("mimetype") == b"application/hwp+zip"
+            view.release()
+
+
+def test_deflated_member_streaming():
+    """DEFLATED 멤버는 청크 단위로 압축 해제"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "sample.hwpx"
+        image = _make_hwpx(path)
+
+        with open_package(path) as pkg:
+            chunks = list(pkg.iter_chunks("BinData/image2.bmp", chunk_size=4096))
+            assert len(chunks) > 1
+            assert all(len(c) <= 4096 for c in chunks)
+            assert b"".join(chunks) == image * 4
+
+            with pkg.open("Contents/section0.xml") as stream:
+                assert stream.read().decode("utf-8") == SECTION_XML
+
+            try:
+                pkg.open_view("Contents/section0.xml")
+                assert False, "압축된 멤버는 memoryview로 열 수 없어야 함"
+            except ValueError:
+                pass
+
+
+def test_mapping_is_shared():
+    """같은 파일은 하나의 매핑을 공유하고 마지막 close에서 해제"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "sample.hwpx"
+        _make_hwpx(path)
+
+        first = open_package(path)
+        second = open_package(str(path))
+        assert first is second
+
+        first.close()
+        assert not second.closed
+        second.close()
+        assert second.closed
+
+        # 해제 후에는 새 매핑
+        third = open_package(path)
+        assert third is not first
+        third.close()
+
+
+def test_parser_uses_package():
+    """HwpxParser가 공유 매핑으로 section0.xml을 읽음"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "sample.hwpx"
+        _make_hwpx(path)
+
+        with HwpxParser(str(path)) as parser:
+            endnotes = parser.parse()
+            assert len(endnotes) == 1
+            assert endnotes[0].number.value == 1
+            assert parser.package is not None
+        assert parser.package is None
+
+
+def test_inspect_hwpx_borrows_open_mapping():
+    """inspect_hwpx는 열린 매핑을 빌려 쓰고, 혼자면 검사 후 해제"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "sample.hwpx"
+        _make_hwpx(path)
+
+        with open_package(path) as held:
+            assert inspect_hwpx(str(path)) == (True, None)
+            assert not held.closed
+            assert open_package(path) is held
+            held.close()
+
+        alone = open_package(path)
+        alone.close()
+        assert inspect_hwpx(str(path)) == (True, None)
+        assert alone.closed
+
+
+def test_invalid_package():
+    """ZIP이 아닌 파일은 ValueError"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "broken.hwpx"
+        path.write_bytes(b"not a zip file")
+
+        assert not is_hwpx_package(path)
+        try:
+            HwpxPackage(path)
+            assert False, "ValueError 예상"
+        except ValueError:
+            pass
+
+
+if __name__ == "__main__":
+    test_stored_member_is_zero_copy()
+    test_deflated_member_streaming()
+    test_mapping_is_shared()
+    test_parser_uses_package()
+    test_inspect_hwpx_borrows_open_mapping()
+    test_invalid_package()
+    print("✅ HWPX 패키지 테스트 통과!")
@@ -0,0 +1,126 @@
+"""
+HWPX 전처리 테스트
+
+automations/merger/hwpx_preprocessor.py - 1단 변환, 끝쪽 빈 문단 제거, 일괄 처리
+"""
+
+import sys
+import time
+import zipfile
+import tempfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.hwpx_xml import HP_P, HP_COL_PR, paragraph_text
+import automations.merger.hwpx_preprocessor as hwpx_preprocessor
+from automations.merger.hwpx_preprocessor import preprocess_hwpx, preprocess_hwpx_folder
+from test_hwpx_merger import _write_hwpx, _header, _section, SEC_RUN
+
+
+def _two_column_problem(path: Path, text: str):
+    body = (
+        "<hp:p>" + SEC_RUN.format(cols=2) + f"<hp:run><hp:t>{text}</hp:t></hp:run>"
+        '<hp:linesegarray><hp:lineseg textpos="0"/></hp:linesegarray></hp:p>'
+        "<hp:p><hp:run><hp:t> </hp:t></hp:run></hp:p>"  # 공백 문단은 유지
+        "<hp:p><hp:run><hp:t/></hp:run></hp:p>"
+        "<hp:p><hp:run/></hp:p>"
+    )
+    _write_hwpx(path, _header("함초롬바탕", 1000), _section(body), {"image1.png": b"png"})
+
+
+def test_single_column_and_trailing_paras():
+    """colCount=1, 끝쪽 빈 문단만 제거"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        source = temp / "문항_1.hwpx"
+        _two_column_problem(source, "문제")
+
+        result = preprocess_hwpx(source, temp / "out", 7)
+        assert result.success, result.error_message
+        assert result.removed_count == 2
+        assert result.para_count == 2
+        assert Path(result.preprocessed_path).name == "preprocessed_007_문항.hwpx"
+
+        with zipfile.ZipFile(result.preprocessed_path) as zf:
+            assert zf.namelist()[0] == "mimetype"
+            assert zf.read("BinData/image1.png") == b"png"
+            section = ET.fromstring(zf.read("Contents/section0.xml"))
+
+        assert section.find(f".//{HP_COL_PR}").get("colCount") == "1"
+        paragraphs = section.findall(HP_P)
+        assert [paragraph_text(p) for p in paragraphs] == ["문제", " "]
+
+
+def test_deterministic_output():
+    """deterministic 모드는 실행마다 같은 바이트"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        source = temp / "source.hwpx"
+        _two_column_problem(source, "문제")
+
+        first = preprocess_hwpx(source, temp / "a", 1, deterministic=True)
+        time.sleep(2.1)  # ZIP 타임스탬프 해상도(2초)를 넘김
+        second = preprocess_hwpx(source, temp / "b", 1, deterministic=True)
+
+        assert (
+            Path(first.preprocessed_path).read_bytes()
+            == Path(second.preprocessed_path).read_bytes()
+        )
+
+
+def test_failed_write_removes_temp_file():
+    """쓰기 중 실패하면 .tmp를 지우고 이전 결과는 그대로"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        source = temp / "source.hwpx"
+        _two_column_problem(source, "문제")
+        first = preprocess_hwpx(source, temp / "out", 1)
+        previous = Path(first.preprocessed_path).read_bytes()
+
+        def broken_copy(*args, **kwargs):
+            raise OSError("디스크 가득 참")
+
+        original = hwpx_preprocessor.copy_member
+        hwpx_preprocessor.copy_member = broken_copy
+        try:
+            result = preprocess_hwpx(source, temp / "out", 1)
+        finally:
+            hwpx_preprocessor.copy_member = original
+
+        assert not result.success and "디스크" in result.error_message
+        assert [path.name for path in (temp / "out").iterdir()] == [
+            Path(first.preprocessed_path).name
+        ]
+        assert Path(first.preprocessed_path).read_bytes() == previous
+
+
+def test_folder_batch():
+    """폴더 일괄 처리 - 이름순 번호, 실패 분리"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        inputs = temp / "in"
+        inputs.mkdir()
+        for index in range(1, 5):
+            _two_column_problem(inputs / f"{index:02d}.hwpx", f"문제 {index}")
+        (inputs / "99.hwpx").write_bytes(b"broken")
+
+        success, failure = preprocess_hwpx_folder(
+            inputs, temp / "out", max_workers=2, deterministic=True, verbose=False
+        )
+
+        assert [Path(r.preprocessed_path).name for r in success] == [
+            f"preprocessed_{i:03d}_{i:02d}.hwpx" for i in range(1, 5)
+        ]
+        assert [Path(r.original_path).name for r in failure] == ["99.hwpx"]
+
+
+if __name__ == "__main__":
+    test_single_column_and_trailing_paras()
+    test_deterministic_output()
+    test_failed_write_removes_temp_file()
+    test_folder_batch()
+    print("✅ HWPX 전처리 테스트 통과!")
@@ -0,0 +1,94 @@
+"""
+header 정의 인터닝 테스트
+
+automations/merger/style_interner.py - 정의 해시, header ID 매핑 캐시
+"""
+
+import sys
+import zipfile
+import tempfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.hwpx_xml import NS_HEAD, qname
+from automations.merger.style_interner import StyleInterner, definition_digest
+from automations.merger.hwpx_merger import merge_hwpx_files
+from test_hwpx_merger import _write_hwpx, _header, _section, _problem
+
+
+def test_definition_digest_ignores_id():
+    """ID만 다른 정의는 같은 해시, 요소는 변경하지 않음"""
+    first = ET.fromstring('<charPr id="3" height="1000"><fontRef hangul="0"/></charPr>')
+    second = ET.fromstring('<charPr id="7" height="1000"><fontRef hangul="0"/></charPr>')
+    third = ET.fromstring('<charPr id="3" height="1200"><fontRef hangul="0"/></charPr>')
+
+    assert definition_digest(first) == definition_digest(second)
+    assert definition_digest(first) != definition_digest(third)
+    assert first.get("id") == "3"
+
+    interner = StyleInterner()
+    interner.seed("charPr", first)
+    assert interner.lookup("charPr", second) == "3"
+    assert interner.lookup("charPr", third) is None
+    assert interner.stats.reused == 1
+
+
+def test_definition_digest_ignores_indentation():
+    """들여쓰기(공백 텍스트, tail)만 다른 정의는 같은 해시"""
+    header = ET.fromstring(
+        "<charProperties>\n"
+        '  <charPr id="0" height="1000">\n'
+        '    <fontRef hangul="0"/>\n'
+        "  </charPr>\n"
+        '      <charPr id="1" height="1000"><fontRef hangul="0"/></charPr>'
+        '<charPr id="2" height="1000"><fontRef hangul="0"/>본문</charPr>\n'
+        "</charProperties>"
+    )
+    first, second, third = list(header)
+    assert first.tail != second.tail
+    assert definition_digest(first) == definition_digest(second)
+    assert definition_digest(first) != definition_digest(third)
+
+    interner = StyleInterner()
+    interner.seed("charPr", first)
+    assert interner.lookup("charPr", second) == "0"
+
+
+def test_repeated_headers_use_cache():
+    """같은 header의 문항은 한 번만 병합하고 정의는 한 번만 추가"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        template = temp / "template.hwpx"
+        _write_hwpx(
+            template, _header("함초롬바탕", 1000), _section("<hp:p><hp:run><hp:t/></hp:run></hp:p>")
+        )
+
+        problems = []
+        for index in range(1, 11):
+            path = temp / f"{index:03d}.hwpx"
+            _problem(path, f"문제 {index}", "맑은 고딕", 1200, bytes([index]))
+            problems.append(path)
+
+        output = temp / "merged.hwpx"
+        result = merge_hwpx_files(template, problems, output, verbose=False)
+
+        assert result.success
+        assert result.inserted_count == 10
+        assert result.header_cache_hits == 9
+        assert result.added_definitions == {"font": 1, "charPr": 1}
+
+        with zipfile.ZipFile(output) as zf:
+            header = ET.fromstring(zf.read("Contents/header.xml"))
+        char_props = header.findall(f".//{qname(NS_HEAD, 'charPr')}")
+        assert [c.get("id") for c in char_props] == ["0", "1"]
+
+
+if __name__ == "__main__":
+    test_definition_digest_ignores_id()
+    test_definition_digest_ignores_indentation()
+    test_repeated_headers_use_cache()
+    print("✅ 정의 인터닝 테스트 통과!")
@@ -0,0 +1,119 @@
+"""
+MCP COM 실행기 테스트
+
+automations/mcp/executor.py - 전용 스레드 실행, 이벤트 루프 응답성, timeout, 취소
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from automations.mcp.executor import ComExecutor, ComTimeoutError
+from core.fake_hwp import FakeHwp
+
+
+def test_calls_share_one_thread():
+    """생성과 호출이 모두 같은 스레드에서 실행"""
+    executor = ComExecutor(initialize=False)
+    threads = []
+
+    def work(hwp=None):
+        threads.append(threading.get_ident())
+        return hwp or FakeHwp()
+
+    async def main():
+        hwp = await executor.run(work)
+        for _ in range(3):
+            await executor.run(work, hwp)
+        return hwp
+
+    try:
+        asyncio.run(main())
+        assert len(set(threads)) == 1
+        assert threads[0] == executor.thread_id != threading.get_ident()
+        assert executor.stats.completed == 4
+    finally:
+        executor.shutdown()
+
+
+def test_event_loop_stays_responsive():
+    """느린 COM 호출 중에도 다른 코루틴이 계속 실행"""
+    executor = ComExecutor(initialize=False)
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.01)
+
+    async def main():
+        task = asyncio.create_task(ticker())
+        await executor.run(time.sleep, 0.2)
+        task.cancel()
+
+    try:
+        asyncio.run(main())
+        assert len(ticks) >= 5
+    finally:
+        executor.shutdown()
+
+
+def test_timeout_and_cancel_queued():
+    """timeout은 ComTimeoutError, 대기 중에 취소된 작업은 실행되지 않음"""
+    executor = ComExecutor(initialize=False)
+    ran = []
+
+    async def main():
+        with pytest.raises(ComTimeoutError) as info:
+            await executor.run(time.sleep, 0.3, timeout=0.05)
+        assert info.value.timeout == 0.05
+
+        # 앞의 sleep이 끝나기 전에 들어간 작업 → 큐에서 취소
+        queued = asyncio.create_task(executor.run(ran.append, "queued"))
+        await asyncio.sleep(0.01)
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+
+        await executor.run(ran.append, "after")
+
+    try:
+        asyncio.run(main())
+        assert ran == ["after"]
+        assert executor.stats.cancelled == 1
+        assert executor.stats.timed_out == 1
+    finally:
+        executor.shutdown()
+
+
+def test_errors_and_shutdown_cleanup():
+    """예외 전달, 종료 시 정리 함수도 같은 스레드에서 실행"""
+    executor = ComExecutor(initialize=False)
+    cleaned = []
+
+    async def main():
+        with pytest.raises(ZeroDivisionError):
+            await executor.run(lambda: 1 / 0)
+
+    asyncio.run(main())
+    worker = executor.thread_id
+    executor.shutdown(cleanup=lambda: cleaned.append(threading.get_ident()))
+    assert cleaned == [worker]
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+
+
+if __name__ == "__main__":
+    test_calls_share_one_thread()
+    test_event_loop_stays_responsive()
+    test_timeout_and_cancel_queued()
+    test_errors_and_shutdown_cleanup()
+    print("✅ MCP COM 실행기 테스트 통과!")
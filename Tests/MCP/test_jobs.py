@@ -0,0 +1,239 @@
+"""
+MCP 백그라운드 작업 테스트
+
+automations/mcp/jobs.py, job_tools.py - 작업 ID, 파일별 결과 스트리밍, 진행 알림, 취소
+"""
+
+import asyncio
+import json
+import sys
+import threading
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from automations.mcp.job_tools import handle_job_tool
+from automations.mcp.jobs import CANCELLED, FAILED, SUCCEEDED, JobManager, run_separate
+from core.progress import progress_bus
+
+
+def run_files(reporter, files, gate=None):
+    """파일마다 결과 1개 + 진행 이벤트 (gate가 있으면 파일마다 대기)"""
+    stage = progress_bus.stage("files", len(files))
+    stage.start()
+    for name in files:
+        if gate is not None:
+            gate.wait(5)
+            gate.clear()
+        reporter.result(file=name, success=True)
+        stage.advance(name)
+    return {"count": len(files)}
+
+
+def run_broken(reporter):
+    raise RuntimeError("COM 오류")
+
+
+def _manager() -> JobManager:
+    return JobManager(runners={"files": run_files, "broken": run_broken})
+
+
+def test_results_stream_with_cursor():
+    """since/next 커서로 파일별 결과를 순서대로 받음"""
+    jobs = _manager()
+    gate = threading.Event()
+    progress = []
+
+    async def on_change(job):
+        progress.append((job.done, job.total))
+
+    async def main():
+        job = jobs.submit("files", {"files": ["a.hwp", "b.hwp", "c.hwp"], "gate": gate})
+        received, cursor = [], 0
+        while True:
+            gate.set()
+            snapshot = await jobs.wait(job.job_id, since=cursor, timeout=5, on_change=on_change)
+            received += [r["file"] for r in snapshot["results"]]
+            cursor = snapshot["next"]
+            if snapshot["state"] == SUCCEEDED:
+                return received, snapshot
+
+    try:
+        received, snapshot = asyncio.run(main())
+        assert received == ["a.hwp", "b.hwp", "c.hwp"]
+        assert snapshot["summary"] == {"count": 3}
+        assert snapshot["progress"]["done"] == 3
+        assert (3, 3) in progress
+    finally:
+        jobs.shutdown(wait=True)
+
+
+def test_cancel_and_failure():
+    """실행 중 취소는 다음 보고 때 중단, 예외는 failed"""
+    jobs = _manager()
+    gate = threading.Event()
+
+    async def main():
+        running = jobs.submit("files", {"files": ["a", "b", "c"], "gate": gate})
+        gate.set()
+        await jobs.wait(running.job_id, since=0, timeout=5)
+        assert jobs.cancel(running.job_id)
+        gate.set()
+        cancelled = await jobs.wait(running.job_id, since=99, timeout=5)
+
+        broken = jobs.submit("broken")
+        failed = await jobs.wait(broken.job_id, timeout=5)
+        return cancelled, failed
+
+    try:
+        cancelled, failed = asyncio.run(main())
+        assert cancelled["state"] == CANCELLED
+        assert cancelled["next"] == 1
+        assert failed["state"] == FAILED
+        assert "COM 오류" in failed["error"]
+    finally:
+        jobs.shutdown(wait=True)
+
+
+def test_wait_timeout_drops_waiter():
+    """결과 없이 timeout으로 끝난 대기는 _waiters에 남지 않음"""
+    jobs = _manager()
+    gate = threading.Event()
+
+    async def main():
+        job = jobs.submit("files", {"files": ["a"], "gate": gate})
+        for _ in range(3):
+            snapshot = await jobs.wait(job.job_id, since=0, timeout=0.05)
+            assert snapshot["results"] == []
+            assert job.job_id not in jobs._waiters
+        gate.set()
+        return await jobs.wait(job.job_id, since=0, timeout=5)
+
+    try:
+        assert asyncio.run(main())["results"][0]["file"] == "a"
+    finally:
+        jobs.shutdown(wait=True)
+
+
+def test_separate_reports_each_file():
+    """문제 분리: Separator.run이 끝나기 전에 파일마다 결과가 쌓임"""
+    from automations.separator.separator import Separator
+    from automations.separator.types import BatchWriteResult
+
+    jobs = JobManager(runners={"separate": run_separate})
+    seen = []
+
+    def fake_run(self):
+        job = next(iter(jobs.jobs.values()))
+        stage = progress_bus.stage("separate", 2)
+        stage.start()
+        stage.advance("문제001.hwp")
+        seen.append(len(job.results))
+        stage.advance("문제002.hwp", ok=False, message="저장 실패")
+        seen.append(len(job.results))
+        return BatchWriteResult(2, 1, 1, 0, [str(Path(self.config.output_dir) / "문제001.hwp")])
+
+    async def main():
+        job = jobs.submit("separate", {"input_path": "in.hwpx", "output_dir": "out"})
+        return await jobs.wait(job.job_id, since=2, timeout=5)
+
+    original = Separator.run
+    Separator.run = fake_run
+    try:
+        snapshot = asyncio.run(main())
+    finally:
+        Separator.run = original
+        jobs.shutdown(wait=True)
+    assert seen == [1, 2]
+    assert snapshot["state"] == SUCCEEDED
+    assert snapshot["summary"]["failed_count"] == 1
+    results = jobs.get(snapshot["job_id"]).results
+    assert [(r["file"], r["success"]) for r in results] == [
+        (str(Path("out") / "문제001.hwp"), True),
+        ("문제002.hwp", False),
+    ]
+
+
+def test_separate_names_files_for_output_format():
+    """hwpx/md 출력은 그 확장자로 저장 (SeparatorConfig.for_hwpx 기본값 .hwp가 아님)"""
+    from automations.separator.separator import Separator
+    from automations.separator.types import BatchWriteResult, GroupInfo, ProblemNumber
+
+    jobs = JobManager(runners={"separate": run_separate})
+
+    def fake_run(self):
+        group = GroupInfo(1, ProblemNumber(1), ProblemNumber(1), 1)
+        filename = self.config.naming_rule.generate_group_filename(group)
+        stage = progress_bus.stage("separate", 1)
+        stage.start()
+        stage.advance(filename)
+        return BatchWriteResult(1, 1, 0, 0, [filename])
+
+    async def main(output_format):
+        job = jobs.submit(
+            "separate",
+            {
+                "input_path": "in.hwpx",
+                "output_dir": "out",
+                "output_format": output_format,
+            },
+        )
+        snapshot = await jobs.wait(job.job_id, since=1, timeout=5)
+        return jobs.get(snapshot["job_id"]).results
+
+    original = Separator.run
+    Separator.run = fake_run
+    try:
+        names = {fmt: Path(asyncio.run(main(fmt))[0]["file"]).name for fmt in ("hwp", "hwpx", "md")}
+    finally:
+        Separator.run = original
+        jobs.shutdown(wait=True)
+    assert names == {"hwp": "문제_001.hwp", "hwpx": "문제_001.hwpx", "md": "문제_001.md"}
+
+
+def test_job_tools():
+    """hwp_job_* 도구: 시작 → 상태(진행 알림) → 목록"""
+    jobs = _manager()
+    sent = []
+
+    async def send_progress(progress, total, message):
+        sent.append((progress, total, message))
+
+    async def call(name, arguments, sender=None):
+        content = await handle_job_tool(jobs, name, arguments, sender)
+        return content[0].text
+
+    async def main():
+        started = json.loads(await call("hwp_job_files", {"files": ["a", "b"]}))
+        status = json.loads(
+            await call(
+                "hwp_job_status",
+                {"job_id": started["job_id"], "since": 2, "wait_seconds": 5},
+                send_progress,
+            )
+        )
+        listed = json.loads(await call("hwp_job_list", {}))
+        unknown = await call("hwp_job_nothing", {})
+        return status, listed, unknown
+
+    try:
+        status, listed, unknown = asyncio.run(main())
+        assert status["state"] == SUCCEEDED
+        assert status["results"] == []  # since=2 → 이미 받은 결과 제외
+        assert sent and sent[-1][:2] == (2, 2)
+        assert listed[0]["results"] == 2
+        assert unknown.startswith("❌")
+    finally:
+        jobs.shutdown(wait=True)
+
+
+if __name__ == "__main__":
+    test_results_stream_with_cursor()
+    test_cancel_and_failure()
+    test_wait_timeout_drops_waiter()
+    test_separate_reports_each_file()
+    test_separate_names_files_for_output_format()
+    test_job_tools()
+    print("✅ MCP 백그라운드 작업 테스트 통과!")
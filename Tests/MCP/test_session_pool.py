@@ -0,0 +1,199 @@
+"""
+MCP 세션 풀 테스트
+
+automations/mcp/sessions.py - 세션별 워커 프로세스, 병렬 실행, 할당량, 유휴 회수, timeout
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from automations.mcp.executor import ComTimeoutError
+from automations.mcp.sessions import (
+    QuotaExceededError,
+    SessionError,
+    SessionLimitError,
+    SessionPool,
+    SessionQuota,
+    WorkerCrashedError,
+    split_session_argument,
+)
+
+
+class RecordingHandler:
+    """워커 프로세스 안의 문서 상태 대용 (호출 기록)"""
+
+    def __init__(self):
+        self.lines = []
+
+    def handle_call(self, name, arguments):
+        if name == "sleep":
+            time.sleep(arguments["seconds"])
+        elif name == "insert":
+            self.lines.append(arguments["text"])
+        return {"pid": os.getpid(), "lines": list(self.lines)}
+
+    def cleanup(self):
+        self.lines.clear()
+
+
+def _pool(**kwargs) -> SessionPool:
+    return SessionPool(handler_factory=RecordingHandler, **kwargs)
+
+
+def test_sessions_are_isolated_and_parallel():
+    """세션마다 다른 프로세스/문서 상태, 서로 다른 세션은 동시에 실행"""
+    pool = _pool(max_workers=2)
+
+    async def main():
+        try:
+            a = await pool.call("a", "insert", {"text": "A1"})
+            b = await pool.call("b", "insert", {"text": "B1"})
+            a = await pool.call("a", "insert", {"text": "A2"})
+            assert a["lines"] == ["A1", "A2"]
+            assert b["lines"] == ["B1"]
+            assert a["pid"] != b["pid"] != os.getpid()
+
+            start = time.perf_counter()
+            await asyncio.gather(
+                pool.call("a", "sleep", {"seconds": 0.5}),
+                pool.call("b", "sleep", {"seconds": 0.5}),
+            )
+            assert time.perf_counter() - start < 0.9
+
+            with pytest.raises(SessionLimitError):
+                await pool.call("c", "insert", {"text": "C1"})
+
+            # 닫힌 세션의 워커는 정리 후 재사용 (같은 프로세스, 빈 문서)
+            assert await pool.close("a")
+            c = await pool.call("c", "insert", {"text": "C1"})
+            assert c == {"pid": a["pid"], "lines": ["C1"]}
+        finally:
+            await pool.shutdown()
+
+    asyncio.run(main())
+
+
+def test_quota_idle_eviction_and_timeout():
+    """호출 수 제한, 유휴 세션 회수, timeout 시 워커 재시작"""
+    pool = _pool(max_workers=1, idle_timeout=60, quota=SessionQuota(max_calls=2))
+
+    async def main():
+        try:
+            await pool.call("a", "insert", {"text": "A1"})
+            await pool.call("a", "insert", {"text": "A2"})
+            with pytest.raises(QuotaExceededError):
+                await pool.call("a", "insert", {"text": "A3"})
+
+            assert await pool.evict_idle(now=time.monotonic() + 61) == ["a"]
+            first = await pool.call("b", "insert", {"text": "B1"})
+
+            # 이벤트 루프는 종료(join) 중에도 돌아감
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.02)
+                    ticks += 1
+
+            ticking = asyncio.create_task(ticker())
+            with pytest.raises(ComTimeoutError):
+                await pool.call("b", "sleep", {"seconds": 5}, timeout=0.2)
+            ticking.cancel()
+            assert "b" not in pool.sessions
+            assert ticks >= 5
+
+            # 반환된 워커는 실행 스레드가 비어 있고 새 프로세스가 떠 있음
+            worker = pool._free[-1]
+            assert worker.executor.current() is None
+            assert worker.is_alive() and worker.pid != first["pid"]
+
+            again = await pool.call("b", "insert", {"text": "B2"})
+            assert again["lines"] == ["B2"]
+            assert again["pid"] != first["pid"]
+        finally:
+            await pool.shutdown()
+
+    asyncio.run(main())
+
+
+def test_worker_kill_is_idempotent_across_threads():
+    """실행 스레드와 다른 스레드가 동시에 kill해도 예외 없음"""
+    pool = _pool(max_workers=1)
+
+    async def main():
+        try:
+            await pool.call("a", "insert", {"text": "A1"})
+            worker = pool.sessions["a"].worker
+            pending = worker.executor.submit(worker.call, "sleep", {"seconds": 5})
+            await asyncio.sleep(0.2)
+            threads = [threading.Thread(target=worker.kill) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            with pytest.raises(WorkerCrashedError):
+                pending.result(timeout=5)
+            assert worker.process is None and worker.conn is None
+            worker.kill()
+        finally:
+            await pool.shutdown()
+
+    asyncio.run(main())
+
+
+def test_concurrent_timeouts_recycle_worker_once():
+    """같은 세션의 호출 두 개가 함께 timeout되어도 워커는 한 번만 반환
+
+    대기 중이던 같은 세션의 호출은 새 프로세스에서 실행하지 않음
+    """
+    pool = _pool(max_workers=2, call_timeout=1)
+
+    async def main():
+        try:
+            first = await pool.call("a", "insert", {"text": "A1"}, timeout=30)
+            outcomes = await asyncio.gather(
+                pool.call("a", "sleep", {"seconds": 3}),
+                pool.call("a", "sleep", {"seconds": 3}),
+                pool.call("a", "insert", {"text": "late"}, timeout=30),
+                return_exceptions=True,
+            )
+            assert [type(outcome) for outcome in outcomes[:2]] == [ComTimeoutError, ComTimeoutError]
+            assert type(outcomes[2]) is SessionError
+            assert "a" not in pool.sessions
+            assert len(pool._free) == len(set(pool._free)) == 1
+
+            s1 = await pool.call("s1", "insert", {"text": "S1"}, timeout=30)
+            s2 = await pool.call("s2", "insert", {"text": "S2"}, timeout=30)
+            assert s1["lines"] == ["S1"] and s2["lines"] == ["S2"]
+            assert s1["pid"] != s2["pid"]
+            assert first["pid"] not in (s1["pid"], s2["pid"])
+        finally:
+            await pool.shutdown()
+
+    asyncio.run(main())
+
+
+def test_split_session_argument():
+    """session_id는 도구 인자에서 분리, 없으면 default"""
+    assert split_session_argument({"session_id": "s1", "text": "x"}) == ("s1", {"text": "x"})
+    assert split_session_argument(None) == ("default", {})
+
+
+if __name__ == "__main__":
+    test_sessions_are_isolated_and_parallel()
+    test_quota_idle_eviction_and_timeout()
+    test_worker_kill_is_idempotent_across_threads()
+    test_concurrent_timeouts_recycle_worker_once()
+    test_split_session_argument()
+    print("✅ MCP 세션 풀 테스트 통과!")
@@ -0,0 +1,51 @@
+"""
+MCP 액션 도구 파라미터 검증 테스트
+
+automations/mcp/validation.py - hwp_action_* 인자를 실행 전에 core.param_index로 검사
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from automations.mcp.validation import rejection_message, validate_action_call
+
+
+def test_valid_action_arguments_pass():
+    """형식이 맞는 인자는 통과"""
+    result = validate_action_call("hwp_action_insert_text", {"Text": "문제 1"})
+    assert result is not None and result.success
+    assert result.action == "InsertText"
+
+
+def test_type_mismatch_rejects_call():
+    """형식 오류는 실행 전에 거부"""
+    result = validate_action_call("hwp_action_insert_text", {"Text": 123})
+    assert not result.success
+    assert result.errors[0].error_type == "TypeMismatch"
+    message = rejection_message("hwp_action_insert_text", result)
+    assert message.startswith("❌ hwp_action_insert_text rejected")
+    assert "InsertText.Text" in message
+
+
+def test_unknown_parameter_is_only_a_warning():
+    """표에 없는 파라미터는 경고만 (표가 불완전함)"""
+    result = validate_action_call("hwp_action_open_document", {"Argument": "a.hwp", "Extra": 1})
+    assert result.success
+    assert [w.error_type for w in result.warnings] == ["UnknownParameter"]
+
+
+def test_tools_without_action_are_not_checked():
+    """액션 ID가 없는 도구는 검사하지 않음"""
+    assert validate_action_call("hwp_auto_open", {"path": 1}) is None
+
+
+if __name__ == "__main__":
+    test_valid_action_arguments_pass()
+    test_type_mismatch_rejects_call()
+    test_unknown_parameter_is_only_a_warning()
+    test_tools_without_action_are_not_checked()
+    print("✅ MCP 도구 파라미터 검증 테스트 통과!")
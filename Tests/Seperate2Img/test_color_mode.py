@@ -0,0 +1,132 @@
+"""
+Seperate2Img 색 모드 테스트
+
+pdf_to_image.py - gray(pdfium 회색조 렌더링), bilevel(1비트) 렌더링을 RGB 렌더링과 시각 비교,
+여백 제거/프로필/인코딩 경로 전체
+
+pdfium 회색조 비트맵은 글자 안티앨리어싱이 RGB와 조금 달라 픽셀 단위로 같지 않습니다.
+그래서 σ=1 블러 후(보는 눈에 가까운 비교) 차이와 잉크 양으로 비교합니다.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pypdfium2 as pdfium
+from PIL import Image, ImageFilter
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from automations.seperate2Img.output_profiles import OutputProfile
+from automations.seperate2Img.pdf_to_image import (
+    BILEVEL_THRESHOLD,
+    apply_color_mode,
+    convert_pdfs_to_images,
+    render_page_image,
+)
+
+# 벡터 글자가 있는 실제 문제 PDF
+SAMPLE_PDF = sorted((project_root / "Tests" / "hwp2pdf").glob("*.pdf"))[0]
+SCALE = 150 / 72
+
+
+def gray_pixels(image: Image.Image) -> np.ndarray:
+    return np.asarray(image.convert("L"), dtype=np.int16)
+
+
+def visual_diff(first: Image.Image, second: Image.Image) -> np.ndarray:
+    """σ=1 블러 후 회색조 절대 차이 (여백 제거 경계가 1px 다를 수 있어 ±1px 중 가장 잘 맞는 위치)"""
+    blur = [
+        gray_pixels(image.convert("L").filter(ImageFilter.GaussianBlur(1)))
+        for image in (first, second)
+    ]
+    height = min(blur[0].shape[0], blur[1].shape[0]) - 1
+    width = min(blur[0].shape[1], blur[1].shape[1]) - 1
+    candidates = [
+        np.abs(
+            blur[0][dy : dy + height, dx : dx + width] - blur[1][ey : ey + height, ex : ex + width]
+        )
+        for dy in (0, 1)
+        for dx in (0, 1)
+        for ey in (0, 1)
+        for ex in (0, 1)
+    ]
+    return min(candidates, key=lambda diff: diff.mean())
+
+
+def test_gray_render_matches_rgb_visually():
+    """전체/여백 제거 렌더링 모두: 블러 차이 평균 < 1, 32 넘는 픽셀 < 0.2%,
+    잉크 양 ±6%, 크기 ±1px"""
+    pdf = pdfium.PdfDocument(str(SAMPLE_PDF))
+    try:
+        page = pdf[0]
+        for trim in (False, True):
+            rgb = render_page_image(page, SCALE, trim)
+            gray = render_page_image(page, SCALE, trim, grayscale=True)
+            assert gray.mode == "L" and rgb.mode == "RGB"
+            assert abs(gray.width - rgb.width) <= 1 and abs(gray.height - rgb.height) <= 1
+
+            diff = visual_diff(rgb, gray)
+            assert diff.mean() < 1.0
+            assert (diff > 32).mean() < 0.002
+            ink = [(255 - gray_pixels(image)).sum() for image in (rgb, gray)]
+            assert abs(ink[1] - ink[0]) / ink[0] < 0.06
+            # 비트맵 메모리 1/3
+            assert len(gray.tobytes()) * 3 <= len(rgb.tobytes()) + 3 * rgb.height
+    finally:
+        pdf.close()
+
+
+def test_bilevel_matches_thresholded_rgb():
+    """1비트: RGB 렌더링을 같은 임계값으로 자른 것과 0.5% 미만만 다름"""
+    pdf = pdfium.PdfDocument(str(SAMPLE_PDF))
+    try:
+        page = pdf[0]
+        reference = gray_pixels(render_page_image(page, SCALE)) > BILEVEL_THRESHOLD
+        bilevel = apply_color_mode(render_page_image(page, SCALE, grayscale=True), "bilevel")
+        assert bilevel.mode == "1"
+        assert (np.asarray(bilevel) != reference).mean() < 0.005
+    finally:
+        pdf.close()
+
+    assert (
+        apply_color_mode(Image.new("L", (2, 1), 200), "bilevel", threshold=220).getpixel((0, 0))
+        == 0
+    )
+
+
+def test_color_modes_through_convert_and_profiles():
+    """convert_pdfs_to_images(color_mode)와 프로필별 색 모드: 저장 모드와 파일 크기 순서"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        sizes = {}
+        for mode, expected in (("rgb", "RGB"), ("gray", "L"), ("bilevel", "1")):
+            results = convert_pdfs_to_images(
+                [str(SAMPLE_PDF)], str(temp / mode), dpi=100, trim_whitespace=True, color_mode=mode
+            )
+            assert all(ok for ok, _, _ in results)
+            image = Image.open(results[0][1])
+            assert image.mode == expected
+            sizes[mode] = Path(results[0][1]).stat().st_size
+        assert sizes["bilevel"] < sizes["gray"] < sizes["rgb"]
+
+        profiles = [
+            OutputProfile("full", dpi=100, trim=True, color_mode="gray"),
+            OutputProfile("thumb", max_width=120, trim=True, color_mode="bilevel", threshold=200),
+            OutputProfile("web", format="jpg", max_width=300, trim=True, color_mode="bilevel"),
+        ]
+        results = convert_pdfs_to_images(
+            [str(SAMPLE_PDF)], str(temp / "profiles"), profiles=profiles
+        )
+        modes = {Path(path).parent.name: Image.open(path).mode for ok, path, _ in results[:3]}
+        assert modes == {"full": "L", "thumb": "1", "web": "L"}  # JPEG는 1비트를 회색조로 저장
+
+
+if __name__ == "__main__":
+    test_gray_render_matches_rgb_visually()
+    test_bilevel_matches_thresholded_rgb()
+    test_color_modes_through_convert_and_profiles()
+    print("✅ 색 모드 테스트 통과!")
@@ -0,0 +1,139 @@
+"""
+Seperate2Img 인코더 테스트
+
+automations/seperate2Img/encoders.py - 기본 인코더가 기존 저장과 같은지, 회색 팔레트(흑백 판정),
+프리셋/프로필 검증, 벤치마크 결과, 인코더로 PDF 변환
+"""
+
+import io
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw, ImageFilter
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from automations.seperate2Img.encoders import (
+    ImageEncoder,
+    benchmark_encoders,
+    default_encoder,
+    gray_palette,
+    is_mostly_monochrome,
+    resolve_encoder,
+)
+from automations.seperate2Img.output_profiles import OutputProfile
+from automations.seperate2Img.pdf_to_image import convert_pdfs_to_images
+
+
+def text_like(size=(240, 160), color=None) -> Image.Image:
+    """흰 바탕 검은 글자 흉내 (안티앨리어싱 회색 포함), color면 색 도형 추가"""
+    image = Image.new("RGB", size, "white")
+    draw = ImageDraw.Draw(image)
+    for row in range(20, size[1] - 20, 24):
+        draw.line((15, row, size[0] - 15, row + 6), fill="black", width=3)
+    if color:
+        draw.ellipse((60, 40, 180, 120), fill=color)
+    return image.filter(ImageFilter.GaussianBlur(1))
+
+
+def make_pdf(path: Path) -> str:
+    text_like((200, 280)).save(path, "PDF", resolution=72)
+    return str(path)
+
+
+def test_default_encoder_matches_previous_save():
+    """기본 PNG/JPEG 설정은 PIL 기본 저장과 같은 바이트"""
+    image = text_like()
+    for encoder, reference in (
+        (default_encoder("png"), {"format": "PNG"}),
+        (default_encoder("jpg", 80), {"format": "JPEG", "quality": 80}),
+    ):
+        ours, theirs = io.BytesIO(), io.BytesIO()
+        encoder.encode(image, ours)
+        image.save(theirs, **reference)
+        assert ours.getvalue() == theirs.getvalue()
+
+
+def test_gray_palette_only_for_monochrome():
+    """흑백 페이지는 4비트 회색 팔레트(오차 ≤ 단계 절반), 색 그림은 그대로"""
+    mono, colored = text_like(), text_like(color="red")
+    assert is_mostly_monochrome(mono) and not is_mostly_monochrome(colored)
+
+    encoder = resolve_encoder("png-gray16")
+    assert encoder.prepare(colored) is colored
+
+    buffer = io.BytesIO()
+    encoder.encode(mono, buffer)
+    buffer.seek(0)
+    decoded = Image.open(buffer)
+    assert decoded.mode == "P" and buffer.getvalue()[24] == 4  # IHDR 비트 깊이
+    error = np.abs(
+        np.asarray(decoded.convert("L"), np.int16) - np.asarray(mono.convert("L"), np.int16)
+    )
+    assert error.max() <= 9
+    # 흰색/검정은 그대로
+    assert gray_palette(Image.new("L", (2, 1), 255), 16).convert("L").getpixel((0, 0)) == 255
+
+    plain = io.BytesIO()
+    resolve_encoder("png").encode(mono, plain)
+    assert buffer.getbuffer().nbytes < plain.getbuffer().nbytes
+
+
+def test_encoder_and_profile_validation():
+    with pytest.raises(ValueError):
+        resolve_encoder("png-turbo")
+    with pytest.raises(ValueError):
+        ImageEncoder("jpg", palette_colors=16)
+    with pytest.raises(ValueError):
+        ImageEncoder("png", compress_level=10)
+    with pytest.raises(ValueError):
+        OutputProfile("web", format="jpg", encoder="webp")
+
+    profile = OutputProfile("web", encoder={"format": "webp", "quality": 70})
+    assert profile.format == "webp" and profile.image_encoder.quality == 70
+    assert OutputProfile("full").format == "png"
+    assert profile.to_dict()["encoder"]["format"] == "webp"
+
+
+def test_benchmark_reports_each_setting():
+    images = [text_like(), text_like(color="blue")]
+    results = {
+        result.name: result
+        for result in benchmark_encoders(
+            images,
+            {"png": "png", "fast": "png-fast", "lossless": "webp-lossless", "jpg": "jpg"},
+        )
+    }
+    assert set(results) == {"png", "fast", "lossless", "jpg"}
+    assert all(
+        result.images == 2 and result.bytes_per_image > 0 and result.encode_ms > 0
+        for result in results.values()
+    )
+    assert results["png"].mean_error == 0 and results["lossless"].mean_error == 0
+    assert results["jpg"].mean_error > 0
+
+
+def test_convert_with_encoder_uses_its_format():
+    """인코더만 지정하면 형식/확장자는 인코더를 따름"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        pdf_file = make_pdf(temp / "q01.pdf")
+        results = convert_pdfs_to_images(
+            [pdf_file], str(temp / "out"), dpi=72, encoder="webp-lossless"
+        )
+        assert [(ok, Path(path).name) for ok, path, _ in results] == [(True, "q01.webp")]
+        assert Image.open(results[0][1]).format == "WEBP"
+
+
+if __name__ == "__main__":
+    test_default_encoder_matches_previous_save()
+    test_gray_palette_only_for_monochrome()
+    test_encoder_and_profile_validation()
+    test_benchmark_reports_each_setting()
+    test_convert_with_encoder_uses_its_format()
+    print("✅ 인코더 테스트 통과!")
@@ -0,0 +1,144 @@
+"""
+출력 프로필 테스트
+
+automations/seperate2Img/output_profiles.py - 페이지당 렌더링 1회, 프로필별 크기/형식/폴더,
+직렬/병렬 경로 동일, 프로필 검증
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import pypdfium2 as pdfium
+import pytest
+from PIL import Image, ImageChops, ImageDraw
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from automations.seperate2Img.output_profiles import (
+    OutputProfile,
+    parse_output_profiles,
+    save_page_profiles,
+    scaled_size,
+)
+from automations.seperate2Img.pdf_to_image import convert_pdfs_to_images
+
+PROFILES = [
+    {"name": "full", "format": "png", "dpi": 150, "trim": True},
+    {"name": "web", "format": "jpg", "max_width": 120, "quality": 80, "trim": True},
+    {"name": "thumb", "format": "png", "dpi": 36},
+]
+
+
+def make_pdf(path: Path, n_pages: int) -> str:
+    """200×280pt 페이지마다 사각형 하나"""
+    pages = []
+    for index in range(n_pages):
+        image = Image.new("RGB", (200, 280), "white")
+        ImageDraw.Draw(image).rectangle((20, 30 + index * 10, 150, 200), fill="black")
+        pages.append(image)
+    pages[0].save(path, "PDF", resolution=72, save_all=True, append_images=pages[1:])
+    return str(path)
+
+
+class CountingPage:
+    """page.render 호출 수 세기"""
+
+    def __init__(self, page):
+        self.page = page
+        self.renders = 0
+
+    def render(self, **kwargs):
+        self.renders += 1
+        return self.page.render(**kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.page, name)
+
+
+def test_profiles_render_once_and_match_single_output():
+    """프로필 3개를 렌더링 1회로 저장, 최고 해상도 프로필은 단독 변환과 같은 이미지"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        pdf_path = make_pdf(temp / "q01.pdf", 1)
+        profiles = parse_output_profiles(PROFILES)
+        targets = [(profile, temp / f"{profile.name}.{profile.format}") for profile in profiles]
+
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            page = CountingPage(pdf[0])
+            assert save_page_profiles(page, targets) is None
+            assert page.renders == 1
+        finally:
+            pdf.close()
+
+        single = convert_pdfs_to_images(
+            [pdf_path], str(temp / "single"), dpi=150, trim_whitespace=True
+        )
+        with Image.open(temp / "full.png") as full, Image.open(single[0][1]) as expected:
+            assert full.size == expected.size
+            assert (
+                ImageChops.difference(full.convert("RGB"), expected.convert("RGB")).getbbox()
+                is None
+            )
+            full_size = full.size
+        with Image.open(temp / "web.jpg") as web:
+            assert web.format == "JPEG" and web.size == scaled_size(full_size, 1.0, 120)
+        with Image.open(temp / "thumb.png") as thumb:
+            # 200×280pt 페이지 전체(여백 포함)를 36 DPI로
+            assert thumb.size == (100, 140)
+
+
+def test_profiles_serial_and_parallel_paths():
+    """프로필별 폴더에 같은 파일 이름, 결과는 페이지 순 → 프로필 순 (직렬 = 병렬)"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        pdf_files = [make_pdf(temp / "q01.pdf", 2), make_pdf(temp / "q02.pdf", 1)]
+        profiles = parse_output_profiles(PROFILES)
+
+        serial = convert_pdfs_to_images(pdf_files, str(temp / "serial"), profiles=profiles)
+        parallel = convert_pdfs_to_images(
+            pdf_files, str(temp / "parallel"), profiles=profiles, max_workers=2
+        )
+
+        relative = lambda results, root: [
+            str(Path(path).relative_to(temp / root)) for ok, path, _ in results if ok
+        ]
+        expected = [
+            str(Path(folder) / name)
+            for name_stem in ("q01_1", "q01_2", "q02")
+            for folder, name in (
+                ("full", f"{name_stem}.png"),
+                ("web", f"{name_stem}.jpg"),
+                ("thumb", f"{name_stem}.png"),
+            )
+        ]
+        assert relative(serial, "serial") == relative(parallel, "parallel") == expected
+
+
+def test_profile_validation():
+    """형식/크기/이름 검증, 이름 중복 불가"""
+    with pytest.raises(ValueError):
+        OutputProfile("web", format="gif")
+    with pytest.raises(ValueError):
+        OutputProfile("web", max_width=0)
+    with pytest.raises(ValueError):
+        OutputProfile("../web")
+    with pytest.raises(ValueError):
+        parse_output_profiles([{"name": "a"}, {"name": "a", "format": "jpg"}])
+    with pytest.raises(ValueError):
+        parse_output_profiles([])
+
+    # 축소만 (확대하지 않음)
+    assert scaled_size((1000, 500), 0.5, None) == (500, 250)
+    assert scaled_size((1000, 500), 1.0, 200) == (200, 100)
+    assert scaled_size((100, 50), 1.0, 200) == (100, 50)
+
+
+if __name__ == "__main__":
+    test_profiles_render_once_and_match_single_output()
+    test_profiles_serial_and_parallel_paths()
+    test_profile_validation()
+    print("✅ 출력 프로필 테스트 통과!")
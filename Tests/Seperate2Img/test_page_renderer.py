@@ -0,0 +1,124 @@
+"""
+PDF → Image 병렬 렌더링 테스트
+
+automations/seperate2Img/page_renderer.py - 직렬 경로와 같은 파일 이름/순서/실패 처리,
+워커 문서 캐시
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+from PIL import Image, ImageChops, ImageDraw
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from automations.seperate2Img import page_renderer
+from automations.seperate2Img.pdf_to_image import convert_pdfs_to_images
+
+
+def make_pdf(path: Path, n_pages: int) -> str:
+    """페이지마다 다른 위치에 사각형이 있는 PDF"""
+    pages = []
+    for index in range(n_pages):
+        image = Image.new("RGB", (200, 280), "white")
+        ImageDraw.Draw(image).rectangle((20 + index * 10, 30, 120, 90 + index * 20), fill="black")
+        pages.append(image)
+    pages[0].save(path, "PDF", resolution=72, save_all=True, append_images=pages[1:])
+    return str(path)
+
+
+def test_parallel_matches_serial():
+    """병렬 결과가 직렬 경로와 같은 이름/순서/픽셀, 실패 PDF 오류도 동일"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        pdf_files = [
+            make_pdf(temp / "q01.pdf", 3),
+            str(temp / "missing.pdf"),
+            make_pdf(temp / "q02.pdf", 1),
+            make_pdf(temp / "q03.pdf", 2),
+        ]
+
+        serial = convert_pdfs_to_images(
+            pdf_files, str(temp / "serial"), dpi=100, trim_whitespace=True
+        )
+        received = []
+        parallel = convert_pdfs_to_images(
+            pdf_files,
+            str(temp / "parallel"),
+            dpi=100,
+            trim_whitespace=True,
+            on_result=lambda source, outcome: received.append(Path(source).name),
+            max_workers=2,
+        )
+
+        names = lambda results: [(ok, Path(path).name if path else None) for ok, path, _ in results]
+        assert (
+            names(parallel)
+            == names(serial)
+            == [
+                (True, "q01_1.png"),
+                (True, "q01_2.png"),
+                (True, "q01_3.png"),
+                (False, None),
+                (True, "q02.png"),
+                (True, "q03_1.png"),
+                (True, "q03_2.png"),
+            ]
+        )
+        assert parallel[3][2] == serial[3][2]
+        # on_result는 완료 순이지만 이미지(실패 시 PDF)마다 한 번씩
+        assert sorted(received) == sorted(
+            ["q01.pdf"] * 3 + ["missing.pdf", "q02.pdf"] + ["q03.pdf"] * 2
+        )
+
+        for (_, serial_path, _), (_, parallel_path, _) in zip(serial, parallel):
+            if serial_path:
+                with Image.open(serial_path) as a, Image.open(parallel_path) as b:
+                    assert a.size == b.size
+                    assert (
+                        ImageChops.difference(a.convert("RGB"), b.convert("RGB")).getbbox() is None
+                    )
+
+
+def test_worker_reuses_open_documents():
+    """같은 워커에서 같은 PDF의 페이지는 열린 문서 재사용, 캐시 크기 제한"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        pdf_files = [
+            make_pdf(temp / f"p{index}.pdf", 2)
+            for index in range(page_renderer.DOCUMENT_CACHE_SIZE + 1)
+        ]
+        try:
+            (path,), error, _ = page_renderer.render_page_task(
+                pdf_files[0], 0, 2, temp_dir, 72, "png", False
+            )
+            document = page_renderer._documents[pdf_files[0]]
+            (path2,), _, _ = page_renderer.render_page_task(
+                pdf_files[0], 1, 2, temp_dir, 72, "png", False
+            )
+            assert (
+                error is None and Path(path).name == "p0_1.png" and Path(path2).name == "p0_2.png"
+            )
+            assert page_renderer._documents[pdf_files[0]] is document
+
+            for pdf_file in pdf_files[1:]:
+                page_renderer.render_page_task(pdf_file, 0, 2, temp_dir, 72, "png", False)
+            assert len(page_renderer._documents) == page_renderer.DOCUMENT_CACHE_SIZE
+            assert pdf_files[0] not in page_renderer._documents
+
+            _, error, _ = page_renderer.render_page_task(
+                pdf_files[1], 5, 2, temp_dir, 72, "png", False
+            )
+            assert error.startswith("페이지 6 변환 실패")
+        finally:
+            while page_renderer._documents:
+                page_renderer._documents.popitem()[1].close()
+
+
+if __name__ == "__main__":
+    test_parallel_matches_serial()
+    test_worker_reuses_open_documents()
+    print("✅ PDF 병렬 렌더링 테스트 통과!")
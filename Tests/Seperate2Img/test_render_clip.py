@@ -0,0 +1,93 @@
+"""
+렌더링 전 여백 제거 테스트
+
+automations/seperate2Img/trim.py - render_trimmed (페이지 객체 경계 영역만 렌더링)
+- 전체 렌더링 + trim_bitmap과 같은 크기/위치, 픽셀은 안티앨리어싱 차이 이내
+- 보장할 수 없는 페이지(빈 페이지, 회전)는 None → 전체 렌더링으로 대체
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pypdfium2 as pdfium
+from PIL import Image, ImageDraw
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from automations.seperate2Img.pdf_to_image import save_page_image
+from automations.seperate2Img.trim import content_bounds, render_trimmed, trim_bitmap
+
+SAMPLE_PDF = sorted((project_root / "Tests" / "hwp2pdf").glob("*.pdf"))[0]
+
+
+def assert_close_image(clipped: Image.Image, expected: Image.Image, max_diff: int = 2):
+    assert clipped.size == expected.size
+    diff = np.abs(np.asarray(clipped, dtype=np.int16) - np.asarray(expected, dtype=np.int16))
+    assert diff.max() <= max_diff
+
+
+def test_clip_render_matches_bitmap_trim():
+    """문제 PDF 페이지: 객체 경계 영역만 렌더링해도 결과 영역이 같음"""
+    pdf = pdfium.PdfDocument(str(SAMPLE_PDF))
+    try:
+        for index in range(4):
+            page = pdf[index]
+            left, bottom, right, top = content_bounds(page)
+            assert 0 <= left < right <= page.get_width() and 0 <= bottom < top <= page.get_height()
+
+            for dpi in (150, 300):
+                scale = dpi / 72
+                clipped = render_trimmed(page, scale, padding=10)
+                assert clipped is not None
+                expected = trim_bitmap(page.render(scale=scale, rev_byteorder=True), padding=10)
+                assert_close_image(clipped, expected)
+    finally:
+        pdf.close()
+
+
+def test_unsupported_pages_fall_back():
+    """내용 없는 페이지, 회전 페이지는 None, save_page_image는 전체 렌더링으로 같은 결과"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        blank_path = Path(temp_dir) / "blank.pdf"
+        Image.new("RGB", (200, 300), "white").save(blank_path, "PDF", resolution=72)
+        drawn_path = Path(temp_dir) / "drawn.pdf"
+        image = Image.new("RGB", (200, 300), "white")
+        ImageDraw.Draw(image).rectangle((40, 60, 120, 90), fill="black")
+        image.save(drawn_path, "PDF", resolution=72)
+
+        blank = pdfium.PdfDocument(str(blank_path))
+        drawn = pdfium.PdfDocument(str(drawn_path))
+        try:
+            # 이미지 객체는 있지만 전부 배경색
+            assert content_bounds(blank[0]) is not None
+            assert render_trimmed(blank[0], 1.0) is None
+
+            page = drawn[0]
+            page.set_rotation(90)
+            assert render_trimmed(page, 1.0) is None
+
+            outputs = {}
+            for mode in ("clip", "bitmap"):
+                outputs[mode] = Path(temp_dir) / f"{mode}.png"
+                assert (
+                    save_page_image(
+                        page, outputs[mode], dpi=72, trim_whitespace=True, trim_mode=mode
+                    )
+                    is None
+                )
+            with Image.open(outputs["clip"]) as clipped, Image.open(outputs["bitmap"]) as expected:
+                assert clipped.size == (51, 101)  # 회전된 31×81 사각형 + 패딩
+                assert_close_image(clipped, expected, max_diff=0)
+        finally:
+            blank.close()
+            drawn.close()
+
+
+if __name__ == "__main__":
+    test_clip_render_matches_bitmap_trim()
+    test_unsupported_pages_fall_back()
+    print("✅ 렌더링 전 여백 제거 테스트 통과!")
@@ -0,0 +1,151 @@
+"""
+Seperate2Img 단계 캐시 테스트
+
+automations/seperate2Img/stage_cache.py - PDF 메타데이터를 뺀 내용 해시, 이미지 단계 적중/복원,
+HWP→PDF 적중 시 COM 변환 생략, LRU 정리
+"""
+
+import os
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from automations.seperate2Img.stage_cache import (
+    StageCache,
+    convert_hwp_to_pdf_cached,
+    convert_pdfs_to_images_cached,
+    file_digest,
+    pdf_digest,
+    stage_key,
+)
+
+
+def make_pdf(path: Path, n_pages: int, offset: int = 0) -> str:
+    pages = []
+    for index in range(n_pages):
+        image = Image.new("RGB", (200, 280), "white")
+        ImageDraw.Draw(image).rectangle((20 + offset, 30 + index * 10, 150, 200), fill="black")
+        pages.append(image)
+    pages[0].save(path, "PDF", resolution=72, save_all=True, append_images=pages[1:])
+    return str(path)
+
+
+def restamp(path: Path, date: bytes):
+    """저장 시각만 다른 PDF 흉내 (같은 길이 날짜로 교체)"""
+    data = re.sub(rb"/(CreationDate|ModDate)\s*\(D:\d{14}", rb"/\1(D:" + date, path.read_bytes())
+    path.write_bytes(data)
+
+
+def test_pdf_digest_ignores_save_metadata():
+    """생성/수정 시각, 제목(파일 이름)만 다르면 같은 해시, 내용이 다르면 다른 해시"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        first, second = temp / "q1.pdf", temp / "problem_12.pdf"
+        make_pdf(first, 1)
+        make_pdf(second, 1)
+        restamp(first, b"20260101000000")
+        restamp(second, b"20261231235959")
+
+        assert file_digest(str(first)) != file_digest(str(second))
+        assert pdf_digest(str(first)) == pdf_digest(str(second))
+        assert pdf_digest(str(first)) != pdf_digest(make_pdf(temp / "c.pdf", 1, offset=5))
+        assert stage_key("image", "x", {"dpi": 300}) != stage_key("image", "x", {"dpi": 150})
+
+
+def test_image_stage_hits_and_restores_with_current_names():
+    """두 번째 실행은 렌더링 없이 복원 (현재 PDF 이름으로), 설정이 바뀌면 다시 렌더링"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        cache = StageCache(temp / "cache", max_bytes=1 << 30)
+        first = [make_pdf(temp / "q01.pdf", 2), make_pdf(temp / "q02.pdf", 1, offset=5)]
+
+        results = convert_pdfs_to_images_cached(
+            cache, first, str(temp / "run1"), dpi=72, trim_whitespace=True
+        )
+        assert [Path(path).name for _, path, _ in results] == ["q01_1.png", "q01_2.png", "q02.png"]
+        assert cache.report()["image"] == {"hits": 0, "misses": 2, "stored": 2}
+
+        # 다음 실행: 문제 번호가 바뀐 같은 내용 + 새 문제
+        rerun_dir = temp / "rerun"
+        rerun_dir.mkdir()
+        renamed = make_pdf(rerun_dir / "q05.pdf", 2)
+        added = make_pdf(rerun_dir / "q06.pdf", 1, offset=9)
+        cache.stats.clear()
+        received = []
+        results = convert_pdfs_to_images_cached(
+            cache,
+            [renamed, added],
+            str(temp / "run2"),
+            dpi=72,
+            trim_whitespace=True,
+            on_result=lambda source, outcome: received.append(Path(outcome[1]).name),
+        )
+        assert [Path(path).name for _, path, _ in results] == ["q05_1.png", "q05_2.png", "q06.png"]
+        assert sorted(received) == ["q05_1.png", "q05_2.png", "q06.png"]
+        assert cache.report()["image"] == {"hits": 1, "misses": 1, "stored": 1}
+        assert (temp / "run2" / "q05_2.png").read_bytes() == (
+            temp / "run1" / "q01_2.png"
+        ).read_bytes()
+
+        cache.stats.clear()
+        convert_pdfs_to_images_cached(
+            cache, [renamed], str(temp / "run3"), dpi=100, trim_whitespace=True
+        )
+        assert cache.report()["image"]["hits"] == 0
+
+
+def test_pdf_stage_hit_skips_conversion():
+    """HWP 내용이 캐시에 있으면 COM 변환 없이 HWP 옆에 PDF 복원"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        cache = StageCache(temp / "cache")
+        pdf_path = Path(make_pdf(temp / "old_q03.pdf", 1))
+        hwp_path = temp / "run" / "q07.hwp"
+        hwp_path.parent.mkdir()
+        hwp_path.write_bytes(b"HWP Document File" + bytes(64))
+        assert cache.put(
+            "pdf",
+            stage_key("pdf", file_digest(str(hwp_path))),
+            [(pdf_path.name, pdf_path)],
+            stem=pdf_path.stem,
+        )
+
+        results = convert_hwp_to_pdf_cached(cache, [str(hwp_path)])
+        assert results == [(True, str(hwp_path.with_suffix(".pdf")), None)]
+        assert hwp_path.with_suffix(".pdf").read_bytes() == pdf_path.read_bytes()
+        assert cache.report()["pdf"] == {"hits": 1, "misses": 0, "stored": 1}
+
+
+def test_lru_eviction_keeps_recently_used():
+    """크기 제한을 넘으면 가장 오래 안 쓴 항목부터 삭제 (적중하면 최근 사용으로)"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        payload = temp / "payload.bin"
+        payload.write_bytes(bytes(1000))
+        cache = StageCache(temp / "cache", max_bytes=2500)
+
+        keys = [stage_key("pdf", str(index)) for index in range(3)]
+        for age, key in zip((300, 200, 100), keys):
+            assert cache.put("pdf", key, [("payload.bin", payload)])
+            manifest = cache._entry_dir(key) / "entry.json"
+            os.utime(manifest, (manifest.stat().st_atime, manifest.stat().st_mtime - age))
+
+        assert cache.get("pdf", keys[0]) is not None  # 가장 오래된 항목을 다시 사용
+        assert cache.evict() == 1
+        assert cache.get("pdf", keys[1]) is None
+        assert cache.get("pdf", keys[0]) is not None and cache.get("pdf", keys[2]) is not None
+
+
+if __name__ == "__main__":
+    test_pdf_digest_ignores_save_metadata()
+    test_image_stage_hits_and_restores_with_current_names()
+    test_pdf_stage_hit_skips_conversion()
+    test_lru_eviction_keeps_recently_used()
+    print("✅ 단계 캐시 테스트 통과!")
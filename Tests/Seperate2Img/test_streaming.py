@@ -0,0 +1,85 @@
+"""
+Seperate2Img 스트리밍 단계 테스트
+
+automations/seperate2Img/streaming.py - 단계별 워커 수(COM 상한), image 단계 렌더링과 캐시 우회
+(preprocess/pdf 단계는 한글 COM이 필요해 제외)
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+from PIL import Image, ImageDraw
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from automations.seperate2Img.stage_cache import StageCache
+from automations.seperate2Img.streaming import COM_WORKER_LIMIT, build_stages, resolve_stage_workers
+from core.pipeline import StreamingPipeline
+
+
+def make_pdf(path: Path, n_pages: int, offset: int = 0) -> str:
+    pages = []
+    for index in range(n_pages):
+        image = Image.new("RGB", (200, 280), "white")
+        ImageDraw.Draw(image).rectangle((20 + offset, 30 + index * 10, 150, 200), fill="black")
+        pages.append(image)
+    pages[0].save(path, "PDF", resolution=72, save_all=True, append_images=pages[1:])
+    return str(path)
+
+
+def test_stage_workers_cap_com_stages():
+    """지정값 반영, COM 단계는 상한, 잘못된 단계/값은 ValueError"""
+    workers = resolve_stage_workers({"pdf": 50, "image": 3})
+    assert workers["pdf"] == COM_WORKER_LIMIT
+    assert workers["image"] == 3
+    assert workers["preprocess"] == COM_WORKER_LIMIT
+    with pytest.raises(ValueError):
+        resolve_stage_workers({"merge": 2})
+    with pytest.raises(ValueError):
+        resolve_stage_workers({"image": 0})
+
+
+def test_image_stage_renders_and_hits_cache():
+    """image 단계만 흘려보내기: 첫 실행은 렌더링 후 저장, 두 번째는 워커 없이 복원"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp = Path(temp_dir)
+        cache = StageCache(temp / "cache")
+        pdf_files = [make_pdf(temp / "q01.pdf", 2), make_pdf(temp / "q02.pdf", 1, offset=5)]
+
+        def run(output_name):
+            stages = build_stages(
+                [],
+                temp / "pre",
+                temp / output_name,
+                dpi=72,
+                trim_whitespace=True,
+                cache=cache,
+                stage_workers={"image": 2},
+            )
+            pipeline = StreamingPipeline(stages[2:])
+            return pipeline.run(pdf_files), pipeline.report()["stages"]["image"]
+
+        outcomes, metrics = run("run1")
+        assert [[Path(path).name for path in outcome.result[1]] for outcome in outcomes] == [
+            ["q01_1.png", "q01_2.png"],
+            ["q02.png"],
+        ]
+        assert (metrics["processed"], metrics["bypassed"]) == (2, 0)
+        assert cache.report()["image"] == {"hits": 0, "misses": 2, "stored": 2}
+
+        outcomes, metrics = run("run2")
+        assert all(outcome.ok for outcome in outcomes)
+        assert (metrics["processed"], metrics["bypassed"]) == (2, 2)
+        assert (temp / "run2" / "q01_2.png").read_bytes() == (
+            temp / "run1" / "q01_2.png"
+        ).read_bytes()
+
+
+if __name__ == "__main__":
+    test_stage_workers_cap_com_stages()
+    test_image_stage_renders_and_hits_cache()
+    print("✅ 스트리밍 단계 테스트 통과!")
@@ -0,0 +1,81 @@
+"""
+NumPy 여백 제거 테스트
+
+automations/seperate2Img/trim.py - trim_image_whitespace(PIL)와 같은 결과, 경계값, 빈 페이지
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pypdfium2 as pdfium
+import pytest
+from PIL import Image, ImageChops, ImageDraw
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from automations.seperate2Img.pdf_to_image import trim_image_whitespace
+from automations.seperate2Img.trim import TRIM_TOLERANCE, content_bbox, trim_bitmap, trim_pixels
+
+
+def assert_same_image(a: Image.Image, b: Image.Image):
+    assert a.size == b.size
+    assert ImageChops.difference(a.convert("RGB"), b.convert("RGB")).getbbox() is None
+
+
+def test_matches_pil_trimmer_at_tolerance_boundary():
+    """배경과 정확히 tolerance만큼 다른 픽셀은 배경, 1 더 다르면 내용"""
+    pixels = np.full((120, 90, 3), 250, dtype=np.uint8)
+    pixels[5, 7] = (250 - TRIM_TOLERANCE, 250, 250)  # 경계값 → 배경
+    pixels[40:44, 30] = (250, 250 - TRIM_TOLERANCE - 1, 250)  # 내용
+    pixels[80, 60:70] = (0, 0, 0)  # 내용
+
+    assert content_bbox(pixels) == (30, 40, 70, 81)
+    assert_same_image(trim_pixels(pixels), trim_image_whitespace(Image.fromarray(pixels)))
+
+    # 유채색 배경 (채널별 판정 경로)
+    tinted = np.empty((60, 50, 3), dtype=np.uint8)
+    tinted[:] = (250, 230, 200)
+    tinted[20:25, 10:15] = (250, 230, 90)
+    assert content_bbox(tinted) == (10, 20, 15, 25)
+    assert_same_image(trim_pixels(tinted), trim_image_whitespace(Image.fromarray(tinted)))
+
+    # 흑백(2차원)과 내용 없는 페이지
+    gray = np.full((50, 40), 255, dtype=np.uint8)
+    assert content_bbox(gray) is None
+    assert trim_pixels(gray).size == (40, 50)
+    gray[10:12, 20:25] = 0
+    assert trim_pixels(gray, padding=2).size == (9, 6)
+
+
+def test_bitmap_trim_matches_pil_path():
+    """pdfium 비트맵에서 바로 자른 결과가 to_pil() + trim_image_whitespace와 동일"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pdf_path = Path(temp_dir) / "page.pdf"
+        image = Image.new("RGB", (300, 420), "white")
+        draw = ImageDraw.Draw(image)
+        draw.rectangle((40, 60, 180, 120), fill="black")
+        draw.line((50, 300, 260, 310), fill=(90, 90, 90), width=3)
+        image.save(pdf_path, "PDF", resolution=72)
+
+        pdf = pdfium.PdfDocument(str(pdf_path))
+        try:
+            page = pdf[0]
+            for scale in (1.0, 150 / 72):
+                expected = trim_image_whitespace(page.render(scale=scale).to_pil(), padding=10)
+                bitmap = page.render(scale=scale, rev_byteorder=True)
+                assert_same_image(trim_bitmap(bitmap, padding=10), expected)
+
+            with pytest.raises(ValueError):
+                trim_bitmap(page.render(scale=1.0))
+        finally:
+            pdf.close()
+
+
+if __name__ == "__main__":
+    test_matches_pil_trimmer_at_tolerance_boundary()
+    test_bitmap_trim_matches_pil_path()
+    print("✅ NumPy 여백 제거 테스트 통과!")
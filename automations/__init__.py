@@ -5,11 +5,13 @@ HwpAutomation Plugins
 """
 
 from .base import AutomationBase, PluginMetadata
+from .manifest import PluginManifest
 from .registry import PluginRegistry, get_registry, register_plugin
 
 __all__ = [
     "AutomationBase",
     "PluginMetadata",
+    "PluginManifest",
     "PluginRegistry",
     "get_registry",
     "register_plugin",
@@ -21,6 +21,7 @@ import string
 
 from automations.base import AutomationBase, PluginMetadata
 from automations.registry import register_plugin
+from automations.manifest import CONSOLIDATOR_METADATA
 
 from core.folder_consolidator import consolidate_parallel
 
@@ -53,13 +54,7 @@ class ConsolidatorPlugin(AutomationBase):
 
     def get_metadata(self) -> PluginMetadata:
         """플러그인 메타데이터"""
-        return PluginMetadata(
-            id="consolidator",
-            name="폴더 통합기 (Consolidator)",
-            description="여러 폴더의 파일을 하나의 폴더로 통합합니다 (병렬 처리 지원)",
-            version="1.0.0",
-            author="Claude"
-        )
+        return CONSOLIDATOR_METADATA
 
     def has_ui(self) -> bool:
         """UI 지원"""
@@ -544,7 +539,8 @@ class ConsolidatorPlugin(AutomationBase):
                 target_name=self.target_name,
                 mode=self.mode,
                 max_workers=5,
-                verbose=True
+                verbose=True,
+                dedupe=True,
             )
         except Exception as e:
             self.stats = (0, 0, 0)
@@ -639,6 +635,9 @@ class ConsolidatorPlugin(AutomationBase):
         target_name = kwargs.get('target_name', '통합폴더')
         mode = kwargs.get('mode', 'copy')
         max_workers = kwargs.get('max_workers', 5)
+        engine = kwargs.get("engine", "thread")
+        link_mode = kwargs.get("link_mode")
+        dedupe = kwargs.get("dedupe", True)
 
         if not sources or not target_parent:
             return {"success": False, "error": "소스 또는 대상이 지정되지 않았습니다"}
@@ -649,7 +648,10 @@ class ConsolidatorPlugin(AutomationBase):
             target_name=target_name,
             mode=mode,
             max_workers=max_workers,
-            verbose=True
+            verbose=True,
+            engine=engine,
+            link_mode=link_mode,
+            dedupe=dedupe,
         )
 
         return {
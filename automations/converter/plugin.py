@@ -15,9 +15,10 @@ from enum import Enum
 
 from automations.base import AutomationBase, PluginMetadata
 from automations.registry import register_plugin
+from automations.manifest import CONVERTER_METADATA
 
 from core.hwp_to_pdf import convert_hwp_to_pdf_parallel
-
+from core.progress import progress_bus
 
 # Idris2 명세: UIState
 class UIState(Enum):
@@ -43,13 +44,7 @@ class ConverterPlugin(AutomationBase):
 
     def get_metadata(self) -> PluginMetadata:
         """플러그인 메타데이터"""
-        return PluginMetadata(
-            id="hwp2pdf",
-            name="HWP → PDF 변환기 (hwp2pdf)",
-            description="HWP/HWPX 파일을 PDF로 변환합니다 (병렬 처리 지원)",
-            version="1.0.0",
-            author="Claude"
-        )
+        return CONVERTER_METADATA
 
     def has_ui(self) -> bool:
         """UI 지원"""
@@ -169,13 +164,13 @@ class ConverterPlugin(AutomationBase):
         )
         status_label.pack(pady=30)
 
-        progress_label = tk.Label(
+        self.progress_label = tk.Label(
             self.progress_dialog,
             text=f"{file_count}개 파일 처리 중 (병렬)",
             font=("맑은 고딕", 10),
-            fg="gray"
+            fg="gray",
         )
-        progress_label.pack(pady=10)
+        self.progress_label.pack(pady=10)
 
         # 화면 갱신
         self.progress_dialog.update()
@@ -186,15 +181,23 @@ class ConverterPlugin(AutomationBase):
         Idris2 명세: ExecuteConversion : (files : List String) -> (maxWorkers : Nat) -> UIWorkflow Converting
         """
         try:
-            # Idris2: convert_hwp_to_pdf_parallel
-            self.results = convert_hwp_to_pdf_parallel(
-                hwp_files=self.selected_files,
-                max_workers=5,
-                verbose=True
-            )
+            # Idris2: convert_hwp_to_pdf_parallel (파일별 진행은 core.progress 이벤트로 표시)
+            with progress_bus.subscribed(
+                self._on_progress_event, min_interval=0.1, same_thread=True
+            ):
+                self.results = convert_hwp_to_pdf_parallel(
+                    hwp_files=self.selected_files, max_workers=5, verbose=True
+                )
         except Exception as e:
             self.results = [(False, None, str(e))]
 
+    def _on_progress_event(self, event):
+        """진행 다이얼로그 갱신 (메인 스레드에서 호출)"""
+        if self.progress_dialog is None:
+            return
+        self.progress_label.config(text=f"{event.completed}/{event.total}개 완료  {event.item}")
+        self.progress_dialog.update()
+
     def _close_progress(self):
         """5단계: 진행 상황 다이얼로그 닫기
 
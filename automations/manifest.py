@@ -0,0 +1,100 @@
+"""
+Plugin Manifest
+
+내장 플러그인의 메타데이터와 위치("모듈:클래스")를 정적으로 선언합니다.
+
+런처는 이 목록만으로 플러그인 목록을 그리고, 플러그인 모듈(win32com, tkinter,
+pypdfium2, PIL 등을 끌어오는)은 처음 get_plugin()할 때 import합니다.
+각 플러그인의 get_metadata()도 여기 상수를 그대로 반환합니다.
+"""
+
+from dataclasses import dataclass
+from typing import Tuple
+
+from .base import PluginMetadata
+
+
+@dataclass(frozen=True)
+class PluginManifest:
+    """플러그인 선언 (import 없이 읽을 수 있는 정보만)"""
+
+    metadata: PluginMetadata
+    target: str  # "패키지.모듈:클래스"
+
+    @property
+    def id(self) -> str:
+        return self.metadata.id
+
+    @property
+    def module(self) -> str:
+        return self.target.partition(":")[0]
+
+    @property
+    def class_name(self) -> str:
+        return self.target.partition(":")[2]
+
+
+# ============================================================================
+# 내장 플러그인 메타데이터
+# ============================================================================
+
+MERGER_METADATA = PluginMetadata(
+    id="merger",
+    name="문제 파일 병합",
+    description="HWP 문제 파일들을 2단 편집 양식으로 병합",
+    version="1.0.0",
+    author="HwpAutomation Team",
+    icon="icons/merger.png",
+)
+
+MCP_METADATA = PluginMetadata(
+    id="mcp",
+    name="MCP 서버",
+    description="Claude Desktop 통합을 위한 MCP 서버",
+    version="1.0.0",
+    author="HwpAutomation Team",
+    icon="icons/mcp.png",
+)
+
+SEPARATOR_METADATA = PluginMetadata(
+    id="separator",
+    name="문제 분리기 (Separator)",
+    description="HWP/HWPX 파일에서 EndNote 기반으로 문제를 분리합니다 (병렬 처리 지원)",
+    version="2.0.0",
+    author="Claude",
+)
+
+CONVERTER_METADATA = PluginMetadata(
+    id="hwp2pdf",
+    name="HWP → PDF 변환기 (hwp2pdf)",
+    description="HWP/HWPX 파일을 PDF로 변환합니다 (병렬 처리 지원)",
+    version="1.0.0",
+    author="Claude",
+)
+
+CONSOLIDATOR_METADATA = PluginMetadata(
+    id="consolidator",
+    name="폴더 통합기 (Consolidator)",
+    description="여러 폴더의 파일을 하나의 폴더로 통합합니다 (병렬 처리 지원)",
+    version="1.0.0",
+    author="Claude",
+)
+
+SEPERATE2IMG_METADATA = PluginMetadata(
+    id="seperate2img",
+    name="이미지 분리 (Seperate2Img)",
+    description="HWP 파일의 문제를 분리하고 각각을 이미지(PNG)로 변환합니다.",
+    version="1.0.0",
+    author="User",
+)
+
+
+# 런처 표시 순서
+BUILTIN_PLUGINS: Tuple[PluginManifest, ...] = (
+    PluginManifest(MERGER_METADATA, "automations.merger.plugin:MergerPlugin"),
+    PluginManifest(MCP_METADATA, "automations.mcp.plugin:MCPPlugin"),
+    PluginManifest(SEPARATOR_METADATA, "automations.separator.plugin:SeparatorPlugin"),
+    PluginManifest(CONVERTER_METADATA, "automations.converter.plugin:ConverterPlugin"),
+    PluginManifest(CONSOLIDATOR_METADATA, "automations.consolidator.plugin:ConsolidatorPlugin"),
+    PluginManifest(SEPERATE2IMG_METADATA, "automations.seperate2Img.plugin:Seperate2ImgPlugin"),
+)
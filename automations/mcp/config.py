@@ -2,7 +2,13 @@
 MCP Configuration
 """
 
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.environ.get(name, "").strip()
+    return float(value) if value else default
 
 
 @dataclass
@@ -11,3 +17,12 @@ class MCPConfig:
     transport: str = "stdio"
     log_level: str = "INFO"
     claude_config_path: str = "%APPDATA%\\Claude\\claude_desktop_config.json"
+    # 도구 호출 1회 제한 시간 (초, HWP_MCP_TOOL_TIMEOUT, 0이면 무제한)
+    tool_timeout: float = field(default_factory=lambda: _env_float("HWP_MCP_TOOL_TIMEOUT", 300.0))
+    # 세션 풀 (세션마다 한글 워커 프로세스 1개)
+    max_sessions: int = field(default_factory=lambda: int(_env_float("HWP_MCP_MAX_SESSIONS", 2)))
+    session_idle_timeout: float = 600.0
+    session_max_calls: int = 0  # 0이면 무제한
+    session_max_busy_seconds: float = 0.0
+    # 백그라운드 작업 동시 실행 수 (파이프라인마다 자체 프로세스 풀 사용)
+    max_jobs: int = 1
@@ -0,0 +1,226 @@
+"""
+COM 전용 스레드 실행기
+
+MCP 서버의 handle_call_tool은 async이지만 한글 COM 호출은 동기이고 오래 걸릴 수
+있습니다(합병, PDF 변환). 이벤트 루프에서 바로 부르면 list_tools를 포함한 모든 요청이
+멈추므로, 모든 COM 호출을 COM 초기화(STA)된 전용 스레드 1개로 보냅니다.
+
+- submit(): 작업을 스레드 큐에 넣고 concurrent.futures.Future 반환
+- run(): asyncio에서 await (timeout, 취소 지원)
+    - 아직 큐에서 기다리는 작업을 취소하면 실행되지 않음
+    - 이미 실행 중인 COM 호출은 중단할 수 없으므로 결과만 버림
+      (스레드는 그 호출이 끝날 때까지 다음 작업을 처리하지 못함)
+- shutdown(): 정리 함수(cleanup)를 같은 스레드에서 실행한 뒤 종료
+
+COM 객체는 만든 스레드(아파트)에서만 써야 하므로, 핸들러 생성/정리도 run()으로
+같은 스레드에서 실행해야 합니다.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from core.com_backend import co_initialize, co_uninitialize
+
+
+class ComTimeoutError(TimeoutError):
+    """COM 작업 시간 초과 (작업 자체는 스레드에서 계속 실행될 수 있음)"""
+
+    def __init__(self, name: str, timeout: float):
+        super().__init__(f"{name} timed out after {timeout:.1f}s")
+        self.name = name
+        self.timeout = timeout
+
+
+@dataclass
+class _WorkItem:
+    fn: Callable[..., Any]
+    args: tuple
+    kwargs: dict
+    future: Future
+    name: str
+    queued_at: float
+
+
+@dataclass
+class ExecutorStats:
+    """실행기 상태"""
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    timed_out: int = 0
+    busy_time: float = 0.0
+
+
+class ComExecutor:
+    """COM 호출을 전용 스레드 1개에서 순서대로 실행
+
+    Args:
+        name: 스레드 이름
+        initialize: True이면 스레드 시작 시 CoInitialize (STA)
+    """
+
+    def __init__(self, name: str = "hwp-com", initialize: bool = True):
+        self.name = name
+        self.stats = ExecutorStats()
+        self._initialize = initialize
+        self._queue: "queue.SimpleQueue[Optional[_WorkItem]]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+        self._current: Optional[_WorkItem] = None
+        self._current_started = 0.0
+
+    # ------------------------------------------------------------------
+    # 스레드
+    # ------------------------------------------------------------------
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"{self.name} executor is shut down")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._worker, name=self.name, daemon=True)
+                self._thread.start()
+
+    def _worker(self):
+        initialized = False
+        if self._initialize:
+            try:
+                co_initialize()
+                initialized = True
+            except Exception:
+                pass  # pywin32 없음 - 주입된 백엔드 또는 COM 없는 작업
+
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                if not item.future.set_running_or_notify_cancel():
+                    self.stats.cancelled += 1
+                    continue
+
+                self._current = item
+                self._current_started = time.perf_counter()
+                error = None
+                try:
+                    result = item.fn(*item.args, **item.kwargs)
+                except BaseException as e:
+                    error = e
+                # 결과를 넘기기 전에 비움 - 기다리던 쪽이 깨어났을 때 current()는 이미 None
+                self.stats.busy_time += time.perf_counter() - self._current_started
+                self._current = None
+                if error is not None:
+                    self.stats.failed += 1
+                    item.future.set_exception(error)
+                else:
+                    self.stats.completed += 1
+                    item.future.set_result(result)
+        finally:
+            if initialized:
+                try:
+                    co_uninitialize()
+                except Exception:
+                    pass
+
+    @property
+    def thread_id(self) -> Optional[int]:
+        return self._thread.ident if self._thread else None
+
+    def in_executor_thread(self) -> bool:
+        return self._thread is not None and threading.get_ident() == self._thread.ident
+
+    def current(self) -> Optional[tuple]:
+        """실행 중인 작업 (이름, 경과 초) 또는 None"""
+        item = self._current
+        if item is None:
+            return None
+        return item.name, time.perf_counter() - self._current_started
+
+    # ------------------------------------------------------------------
+    # 작업 제출
+    # ------------------------------------------------------------------
+
+    def submit(self, fn: Callable[..., Any], *args, name: Optional[str] = None, **kwargs) -> Future:
+        """작업 예약 → Future (실행 스레드 안에서 부르면 바로 실행)"""
+        future: Future = Future()
+        if self.in_executor_thread():
+            # 실행 중인 작업이 다시 submit하면 큐에서 자기 자신을 기다리며 교착되므로 바로 실행
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+            return future
+
+        self._ensure_started()
+        item = _WorkItem(
+            fn, args, kwargs, future, name or getattr(fn, "__name__", "call"), time.perf_counter()
+        )
+        self.stats.submitted += 1
+        self._queue.put(item)
+        return future
+
+    def call(self, fn: Callable[..., Any], *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """동기 호출 (다른 스레드에서 COM 작업 실행 후 결과 대기)"""
+        return self.submit(fn, *args, **kwargs).result(timeout)
+
+    async def run(
+        self,
+        fn: Callable[..., Any],
+        *args,
+        timeout: Optional[float] = None,
+        name: Optional[str] = None,
+        **kwargs,
+    ) -> Any:
+        """asyncio에서 COM 작업 실행
+
+        Raises:
+            ComTimeoutError: timeout 초과
+            asyncio.CancelledError: 호출한 작업이 취소됨 (대기 중이던 COM 작업은 실행되지 않음)
+        """
+        label = name or getattr(fn, "__name__", "call")
+        future = self.submit(fn, *args, name=label, **kwargs)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            self.stats.timed_out += 1
+            raise ComTimeoutError(label, timeout) from None
+
+    # ------------------------------------------------------------------
+    # 종료
+    # ------------------------------------------------------------------
+
+    def shutdown(
+        self,
+        cleanup: Optional[Callable[[], Any]] = None,
+        wait: bool = True,
+        timeout: Optional[float] = None,
+    ):
+        """정리 함수를 전용 스레드에서 실행한 뒤 스레드 종료"""
+        with self._lock:
+            if self._closed:
+                return
+            thread = self._thread
+
+        if cleanup is not None:
+            future = self.submit(cleanup, name="cleanup")
+            if wait:
+                try:
+                    future.result(timeout)
+                except Exception:
+                    pass
+
+        with self._lock:
+            self._closed = True
+        if thread is not None:
+            self._queue.put(None)
+            if wait:
+                thread.join(timeout)
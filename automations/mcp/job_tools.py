@@ -0,0 +1,209 @@
+"""MCP tools for background batch jobs (separate, merge, convert, seperate2img).
+
+Each hwp_job_<kind> tool starts a JobManager job and returns its job_id at once.
+hwp_job_status long-polls: it returns per-file results after `since` as soon as
+they appear (or when the job ends / wait_seconds passes) together with the
+`next` cursor, and sends notifications/progress while it waits.
+"""
+
+import json
+from typing import Any, Awaitable, Callable, Optional
+
+from mcp.types import TextContent, Tool
+
+from .jobs import Job, JobManager
+
+ProgressSender = Callable[[float, Optional[float], str], Awaitable[None]]
+
+_PATH = {"type": "string"}
+_PATHS = {"type": "array", "items": {"type": "string"}}
+_WORKERS = {"type": "integer", "minimum": 1}
+# Seperate2Img image encoder: preset name (png, png-fast, png-small, png-gray16, jpg,
+# webp, webp-lossless) or explicit settings
+_ENCODER = {
+    "oneOf": [
+        {"type": "string"},
+        {
+            "type": "object",
+            "properties": {
+                "format": {"type": "string", "enum": ["png", "jpg", "webp"]},
+                "compress_level": {"type": "integer", "minimum": 0, "maximum": 9},
+                "optimize": {"type": "boolean"},
+                "palette_colors": {"type": "integer", "minimum": 2, "maximum": 256},
+                "quality": {"type": "integer", "minimum": 1, "maximum": 100},
+                "lossless": {"type": "boolean"},
+                "method": {"type": "integer", "minimum": 0, "maximum": 6},
+            },
+        },
+    ],
+}
+# Seperate2Img color mode: gray renders 1-channel bitmaps, bilevel thresholds them to 1 bit
+_COLOR_MODE = {"type": "string", "enum": ["rgb", "gray", "bilevel"]}
+# Seperate2Img trimming: bitmap (default) crops the full render, clip renders only the content box
+# (faster, but edge pixels may differ by up to ±2)
+_TRIM_MODE = {"type": "string", "enum": ["bitmap", "clip"]}
+# Seperate2Img output profiles: every page is rendered once and saved per profile
+_PROFILES = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "format": {"type": "string", "enum": ["png", "jpg", "webp"]},
+            "dpi": {"type": "integer", "minimum": 1},
+            "max_width": {"type": "integer", "minimum": 1},
+            "quality": {"type": "integer", "minimum": 1, "maximum": 100},
+            "trim": {"type": "boolean"},
+            "encoder": _ENCODER,
+            "color_mode": _COLOR_MODE,
+            "threshold": {"type": "integer", "minimum": 0, "maximum": 255},
+        },
+        "required": ["name"],
+    },
+}
+# Seperate2Img streaming pipeline: workers per stage (COM stages are capped at 5)
+_STAGE_WORKERS = {
+    "type": "object",
+    "properties": {"preprocess": _WORKERS, "pdf": _WORKERS, "image": _WORKERS},
+    "additionalProperties": False,
+}
+
+
+def _schema(properties: dict, required: list) -> dict:
+    return {"type": "object", "properties": properties, "required": required}
+
+
+JOB_TOOLS = [
+    Tool(
+        name="hwp_job_separate",
+        description=(
+            "Background job: split an HWP/HWPX exam file into one file per problem "
+            "(Separator.run)"
+        ),
+        inputSchema=_schema(
+            {
+                "input_path": _PATH,
+                "output_dir": _PATH,
+                "output_format": {"type": "string", "enum": ["hwp", "hwpx", "md"]},
+                "use_parallel": {"type": "boolean"},
+                "max_workers": _WORKERS,
+            },
+            ["input_path", "output_dir"],
+        ),
+    ),
+    Tool(
+        name="hwp_job_merge",
+        description=(
+            "Background job: preprocess problem files in parallel and merge them into a template "
+            "(IntegratedMerger)"
+        ),
+        inputSchema=_schema(
+            {
+                "problem_files": _PATHS,
+                "template_path": _PATH,
+                "output_path": _PATH,
+                "max_workers": _WORKERS,
+            },
+            ["problem_files", "template_path", "output_path"],
+        ),
+    ),
+    Tool(
+        name="hwp_job_convert_pdf",
+        description=(
+            "Background job: convert HWP files to PDF in parallel (convert_hwp_to_pdf_parallel)"
+        ),
+        inputSchema=_schema({"hwp_files": _PATHS, "max_workers": _WORKERS}, ["hwp_files"]),
+    ),
+    Tool(
+        name="hwp_job_seperate2img",
+        description=(
+            "Background job: separate problems and render each to images "
+            "(Seperate2ImgWorkflow.run)"
+        ),
+        inputSchema=_schema(
+            {
+                "input_path": _PATH,
+                "output_dir": _PATH,
+                "dpi": {"type": "integer"},
+                "format": {"type": "string", "enum": ["png", "jpg", "webp"]},
+                "trim_whitespace": {"type": "boolean"},
+                "cleanup_temp": {"type": "boolean"},
+                "output_profiles": _PROFILES,
+                "use_cache": {"type": "boolean"},
+                "stage_workers": _STAGE_WORKERS,
+                "encoder": _ENCODER,
+                "color_mode": _COLOR_MODE,
+                "trim_mode": _TRIM_MODE,
+            },
+            ["input_path", "output_dir"],
+        ),
+    ),
+    Tool(
+        name="hwp_job_status",
+        description=(
+            "Job state and per-file results after index `since`; pass the returned `next` "
+            "as `since` to stream the rest. wait_seconds > 0 waits for new results."
+        ),
+        inputSchema=_schema(
+            {
+                "job_id": {"type": "string"},
+                "since": {"type": "integer", "minimum": 0},
+                "wait_seconds": {"type": "number", "minimum": 0},
+            },
+            ["job_id"],
+        ),
+    ),
+    Tool(
+        name="hwp_job_cancel",
+        description="Cancel a queued job, or stop a running one at its next progress step",
+        inputSchema=_schema({"job_id": {"type": "string"}}, ["job_id"]),
+    ),
+    Tool(
+        name="hwp_job_list",
+        description="List background jobs",
+        inputSchema=_schema({}, []),
+    ),
+]
+
+MAX_WAIT_SECONDS = 60.0
+
+
+def _json(value: Any) -> list[TextContent]:
+    return [TextContent(type="text", text=json.dumps(value, ensure_ascii=False, default=str))]
+
+
+async def handle_job_tool(
+    jobs: JobManager,
+    name: str,
+    arguments: dict[str, Any],
+    send_progress: Optional[ProgressSender] = None,
+) -> list[TextContent]:
+    """Dispatch hwp_job_* tool calls."""
+    try:
+        if name == "hwp_job_status":
+
+            async def on_change(job: Job):
+                if send_progress is not None:
+                    await send_progress(job.done, job.total, job.message)
+
+            snapshot = await jobs.wait(
+                arguments["job_id"],
+                since=int(arguments.get("since", 0)),
+                timeout=min(float(arguments.get("wait_seconds", 0)), MAX_WAIT_SECONDS),
+                on_change=on_change,
+            )
+            return _json(snapshot)
+
+        if name == "hwp_job_cancel":
+            return _json(
+                {"job_id": arguments["job_id"], "cancelled": jobs.cancel(arguments["job_id"])}
+            )
+
+        if name == "hwp_job_list":
+            return _json(jobs.list_jobs())
+
+        job = jobs.submit(name[len("hwp_job_") :], arguments)
+        return _json({"job_id": job.job_id, "kind": job.kind, "state": job.state})
+
+    except (KeyError, ValueError, TypeError) as e:
+        return [TextContent(type="text", text=f"❌ {name} failed: {e}")]
@@ -0,0 +1,459 @@
+"""
+MCP 백그라운드 작업 (분리, 합병, PDF 변환, 이미지 분리)
+
+40문항 합병을 hwp_action_* 호출로 하나씩 보내면 LLM 왕복이 수백 번 필요합니다.
+기존 파이프라인(Separator.run, IntegratedMerger, convert_hwp_to_pdf_parallel,
+Seperate2ImgWorkflow.run)을 작업(job) 하나로 실행하고 작업 ID를 돌려줍니다.
+
+- JobManager.submit(): 작업 스레드(CoInitialize)에서 실행, 바로 job_id 반환
+- 진행률: 작업 스레드에서 발행된 core.progress 이벤트를 구독해 기록 (빈도 제한)
+- JobReporter: 파일별 결과(result) 기록
+    - 취소 요청 후 다음 진행 이벤트/보고 시점에 JobCancelled로 중단 (협조적 취소)
+- JobManager.wait(): 새 결과가 생기거나 작업이 끝날 때까지 대기 (long-poll)
+    - since 이후 결과만 돌려주므로 클라이언트는 파일별 결과를 순서대로 받아 감
+    - on_change로 MCP notifications/progress 전송
+"""
+
+import asyncio
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from core.com_backend import co_initialize
+from core.progress import ProgressAbort, ProgressEvent, progress_bus
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = (SUCCEEDED, FAILED, CANCELLED)
+
+
+# MCP 진행 알림 간격 (초)
+PROGRESS_INTERVAL = 0.2
+
+
+class JobCancelled(ProgressAbort):
+    """취소 요청된 작업이 다음 보고 시점에 중단"""
+
+
+@dataclass
+class Job:
+    """백그라운드 작업 상태"""
+
+    job_id: str
+    kind: str
+    arguments: Dict[str, Any]
+    state: str = QUEUED
+    done: int = 0
+    total: Optional[int] = None
+    message: str = ""
+    results: List[Dict[str, Any]] = field(default_factory=list)
+    summary: Any = None
+    error: Optional[str] = None
+    created: float = field(default_factory=time.time)
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    version: int = 0
+    cancel_requested: bool = False
+
+    def snapshot(self, since: int = 0) -> Dict[str, Any]:
+        """since번째 이후 결과만 포함한 상태"""
+        end = time.time() if self.finished is None else self.finished
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "state": self.state,
+            "progress": {"done": self.done, "total": self.total, "message": self.message},
+            "results": self.results[since:],
+            "next": len(self.results),
+            "summary": self.summary,
+            "error": self.error,
+            "elapsed": round(end - (self.started or end), 3),
+        }
+
+
+class JobReporter:
+    """작업 함수에 넘기는 보고 객체 (작업 스레드에서 호출)"""
+
+    def __init__(self, job: Job, changed: Callable[[Job], None]):
+        self.job = job
+        self._changed = changed
+
+    def _check(self):
+        if self.job.cancel_requested:
+            raise JobCancelled(self.job.job_id)
+
+    def progress(self, done: Optional[int] = None, total: Optional[int] = None, message: str = ""):
+        self._check()
+        if done is not None:
+            self.job.done = done
+        if total is not None:
+            self.job.total = total
+        if message:
+            self.job.message = message
+        self._changed(self.job)
+
+    def result(self, **item):
+        """파일 하나의 결과 (완료 개수는 진행 이벤트가 갱신)"""
+        self._check()
+        self.job.results.append(item)
+        self._changed(self.job)
+
+    def on_event(self, event: ProgressEvent):
+        """core.progress 구독자 - 진행률 갱신"""
+        self._check()
+        self.job.done = event.completed
+        self.job.total = event.total
+        self.job.message = event.describe()
+        self._changed(self.job)
+
+
+# ============================================================================
+# 파이프라인 실행 함수 (reporter, **arguments) -> summary
+# ============================================================================
+
+
+def run_separate(
+    reporter: JobReporter,
+    input_path: str,
+    output_dir: str,
+    output_format: str = "hwp",
+    use_parallel: bool = False,
+    max_workers: int = 5,
+) -> Dict[str, Any]:
+    """Separator.run - 문제 분리 (파일마다 "separate" 진행 이벤트로 결과 보고)"""
+    from automations.separator.separator import Separator
+    from automations.separator.types import OutputFormat, SeparatorConfig
+
+    config = SeparatorConfig.for_hwpx(input_path, output_dir)
+    config.output_format = OutputFormat(output_format)
+    config.naming_rule.file_extension = f".{config.output_format.value}"  # for_hwpx는 .hwp 고정
+    config.use_parallel = use_parallel
+    config.max_workers = max_workers
+    config.verbose = False
+
+    def on_event(event: ProgressEvent):
+        if event.item:
+            file = str(Path(output_dir) / event.item) if event.ok else event.item
+            reporter.result(file=file, success=event.ok, message=event.message)
+
+    reporter.progress(message=f"분리 중: {Path(input_path).name}")
+    with progress_bus.subscribed(on_event, same_thread=True, stages=("separate",)):
+        result = Separator(config).run()
+    return {
+        "total_problems": result.total_problems,
+        "success_count": result.success_count,
+        "failed_count": result.failed_count,
+        "skipped_count": result.skipped_count,
+    }
+
+
+def run_merge(
+    reporter: JobReporter,
+    problem_files: List[str],
+    template_path: str,
+    output_path: str,
+    max_workers: int = 20,
+) -> Dict[str, Any]:
+    """IntegratedMerger - 병렬 전처리 + 순차 합병"""
+    from automations.merger.integrated_merger import IntegratedMerger
+    from automations.merger.types import MergeConfig, ProblemFile
+
+    paths = [Path(p) for p in problem_files]
+    config = MergeConfig(
+        template_path=Path(template_path),
+        problem_files=[ProblemFile(path=p, name=p.stem, index=i) for i, p in enumerate(paths, 1)],
+        output_path=Path(output_path),
+        use_template=True,
+    )
+
+    def on_event(event: ProgressEvent):
+        if event.item:
+            reporter.result(
+                stage=event.stage, file=event.item, success=event.ok, message=event.message
+            )
+
+    with progress_bus.subscribed(on_event, same_thread=True, stages=("preprocess", "merge")):
+        success, page_count = IntegratedMerger().merge_with_parallel_preprocessing(
+            config, max_workers=max_workers
+        )
+    if not success:
+        raise RuntimeError("합병 실패")
+    return {"output_path": output_path, "page_count": page_count}
+
+
+def run_convert_pdf(
+    reporter: JobReporter, hwp_files: List[str], max_workers: int = 5
+) -> Dict[str, Any]:
+    """convert_hwp_to_pdf_parallel - HWP → PDF"""
+    from core.hwp_to_pdf import convert_hwp_to_pdf_parallel
+
+    def on_result(hwp_file, outcome):
+        success, output_path, error = outcome
+        reporter.result(file=hwp_file, success=success, output=output_path, error=error)
+
+    results = convert_hwp_to_pdf_parallel(hwp_files, max_workers=max_workers, on_result=on_result)
+    success_count = sum(1 for success, _, _ in results if success)
+    return {"success_count": success_count, "fail_count": len(results) - success_count}
+
+
+def run_seperate2img(
+    reporter: JobReporter,
+    input_path: str,
+    output_dir: str,
+    dpi: int = 300,
+    format: str = "png",
+    trim_whitespace: bool = False,
+    cleanup_temp: bool = False,
+    output_profiles: Optional[List[Dict[str, Any]]] = None,
+    use_cache: bool = True,
+    stage_workers: Optional[Dict[str, int]] = None,
+    encoder: Optional[Union[str, Dict[str, Any]]] = None,
+    color_mode: str = "rgb",
+    trim_mode: str = "bitmap",
+) -> Dict[str, Any]:
+    """Seperate2ImgWorkflow.run - 분리 → 전처리 → PDF → 이미지"""
+    from automations.seperate2Img.workflow import Seperate2ImgWorkflow
+
+    def on_result(stage, source, outcome):
+        success, output_path, error = outcome
+        reporter.result(stage=stage, file=source, success=success, output=output_path, error=error)
+
+    workflow = Seperate2ImgWorkflow(
+        progress_callback=lambda message: reporter.progress(message=message),
+        result_callback=on_result,
+    )
+    result = workflow.run(
+        input_path,
+        output_dir,
+        dpi=dpi,
+        format=format,
+        trim_whitespace=trim_whitespace,
+        cleanup_temp=cleanup_temp,
+        output_profiles=output_profiles,
+        use_cache=use_cache,
+        stage_workers=stage_workers,
+        encoder=encoder,
+        color_mode=color_mode,
+        trim_mode=trim_mode,
+    )
+    if not result.get("success"):
+        raise RuntimeError(result.get("message", "이미지 분리 실패"))
+    summary = {
+        key: value for key, value in result.items() if key not in ("image_files", "profile_files")
+    }
+    if "profile_files" in result:
+        summary["profile_counts"] = {
+            name: len(files) for name, files in result["profile_files"].items()
+        }
+    return summary
+
+
+JOB_RUNNERS: Dict[str, Callable[..., Any]] = {
+    "separate": run_separate,
+    "merge": run_merge,
+    "convert_pdf": run_convert_pdf,
+    "seperate2img": run_seperate2img,
+}
+
+
+# ============================================================================
+# 작업 관리
+# ============================================================================
+
+
+def _init_job_thread():
+    try:
+        co_initialize()
+    except Exception:
+        pass  # pywin32 없음 - COM을 쓰지 않는 작업만 가능
+
+
+class JobManager:
+    """백그라운드 작업 실행/조회
+
+    Args:
+        max_concurrent: 동시에 실행할 작업 수 (파이프라인마다 자체 프로세스 풀을 씀)
+        keep_finished: 끝난 작업을 보관할 개수
+        runners: 작업 종류 → 실행 함수
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 1,
+        keep_finished: int = 50,
+        runners: Optional[Dict[str, Callable[..., Any]]] = None,
+    ):
+        self.runners = dict(JOB_RUNNERS if runners is None else runners)
+        self.keep_finished = keep_finished
+        self.jobs: Dict[str, Job] = {}
+        self._futures: Dict[str, Future] = {}
+        self._waiters: Dict[str, List[asyncio.Future]] = {}
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_concurrent, thread_name_prefix="hwp-job", initializer=_init_job_thread
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # 제출/취소
+    # ------------------------------------------------------------------
+
+    def submit(self, kind: str, arguments: Optional[Dict[str, Any]] = None) -> Job:
+        """작업 예약 (이벤트 루프에서 호출)"""
+        runner = self.runners.get(kind)
+        if runner is None:
+            raise ValueError(f"알 수 없는 작업 종류: {kind}")
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+
+        job = Job(uuid.uuid4().hex[:12], kind, dict(arguments or {}))
+        with self._lock:
+            self.jobs[job.job_id] = job
+            self._prune()
+        self._futures[job.job_id] = self._pool.submit(self._execute, job, runner)
+        return job
+
+    def _execute(self, job: Job, runner: Callable[..., Any]):
+        if job.cancel_requested:
+            self._finish(job, CANCELLED)
+            return
+        job.state = RUNNING
+        job.started = time.time()
+        self._changed(job)
+        reporter = JobReporter(job, self._changed)
+        try:
+            with progress_bus.subscribed(
+                reporter.on_event, min_interval=PROGRESS_INTERVAL, same_thread=True
+            ):
+                job.summary = runner(reporter, **job.arguments)
+        except JobCancelled:
+            self._finish(job, CANCELLED)
+        except Exception as e:
+            job.error = f"{type(e).__name__}: {e}"
+            self._finish(job, FAILED)
+        else:
+            self._finish(job, SUCCEEDED)
+
+    def _finish(self, job: Job, state: str):
+        job.state = state
+        job.finished = time.time()
+        self._changed(job)
+
+    def cancel(self, job_id: str) -> bool:
+        """대기 중이면 바로 취소, 실행 중이면 다음 진행 보고 때 중단"""
+        job = self.get(job_id)
+        if job.state in FINISHED_STATES:
+            return False
+        job.cancel_requested = True
+        future = self._futures.get(job_id)
+        if future is not None and future.cancel():
+            self._finish(job, CANCELLED)
+        return True
+
+    def get(self, job_id: str) -> Job:
+        job = self.jobs.get(job_id)
+        if job is None:
+            raise KeyError(f"알 수 없는 작업: {job_id}")
+        return job
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "job_id": job.job_id,
+                "kind": job.kind,
+                "state": job.state,
+                "done": job.done,
+                "total": job.total,
+                "results": len(job.results),
+            }
+            for job in self.jobs.values()
+        ]
+
+    def _prune(self):
+        finished = [job for job in self.jobs.values() if job.state in FINISHED_STATES]
+        for job in finished[: max(0, len(finished) - self.keep_finished)]:
+            del self.jobs[job.job_id]
+            self._futures.pop(job.job_id, None)
+
+    # ------------------------------------------------------------------
+    # 변경 알림
+    # ------------------------------------------------------------------
+
+    def _changed(self, job: Job):
+        """작업 스레드 → 이벤트 루프로 변경 알림"""
+        job.version += 1
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(self._wake, job.job_id)
+            except RuntimeError:
+                pass  # 루프 종료 중
+
+    def _wake(self, job_id: str):
+        for waiter in self._waiters.pop(job_id, []):
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def _discard_waiter(self, job_id: str, waiter: asyncio.Future):
+        """timeout/취소로 끝난 대기 제거 (알림 없는 작업에 쌓이지 않게)"""
+        waiters = self._waiters.get(job_id)
+        if waiters and waiter in waiters:
+            waiters.remove(waiter)
+            if not waiters:
+                del self._waiters[job_id]
+
+    async def wait(
+        self,
+        job_id: str,
+        since: int = 0,
+        timeout: float = 0.0,
+        on_change: Optional[Callable[[Job], Awaitable[None]]] = None,
+    ) -> Dict[str, Any]:
+        """since 이후 새 결과가 생기거나 작업이 끝날 때까지 최대 timeout초 대기
+
+        Returns:
+            Job.snapshot(since)
+        """
+        job = self.get(job_id)
+        self._loop = asyncio.get_running_loop()
+        deadline = time.monotonic() + timeout
+        seen = -1
+
+        while True:
+            if job.version != seen:
+                seen = job.version
+                if on_change is not None:
+                    await on_change(job)
+            if len(job.results) > since or job.state in FINISHED_STATES:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            waiter = self._loop.create_future()
+            self._waiters.setdefault(job_id, []).append(waiter)
+            try:
+                if job.version != seen:  # 등록 직전에 바뀐 경우
+                    continue
+                await asyncio.wait_for(waiter, remaining)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                self._discard_waiter(job_id, waiter)
+
+        return job.snapshot(since)
+
+    def shutdown(self, wait: bool = False):
+        for job in list(self.jobs.values()):
+            if job.state not in FINISHED_STATES:
+                self.cancel(job.job_id)
+        self._pool.shutdown(wait=wait, cancel_futures=True)
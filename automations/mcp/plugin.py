@@ -5,6 +5,7 @@ Claude Desktop 연동을 위한 MCP 서버
 """
 
 from automations import AutomationBase, PluginMetadata, register_plugin
+from automations.manifest import MCP_METADATA
 from typing import Dict, Any
 import asyncio
 
@@ -14,14 +15,7 @@ class MCPPlugin(AutomationBase):
     """MCP 서버 플러그인"""
 
     def get_metadata(self) -> PluginMetadata:
-        return PluginMetadata(
-            id="mcp",
-            name="MCP 서버",
-            description="Claude Desktop 통합을 위한 MCP 서버",
-            version="1.0.0",
-            author="HwpAutomation Team",
-            icon="icons/mcp.png"
-        )
+        return MCP_METADATA
 
     def run(self, **kwargs) -> Dict[str, Any]:
         """
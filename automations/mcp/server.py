@@ -1,23 +1,130 @@
 """MCP server for HWP automation."""
 
 import asyncio
+import io
+import json
+import os
+import sys
+
+# Start-up profiling (HWP_STARTUP_PROFILE) must begin before the mcp/pydantic imports
+from core.startup import start_from_env, startup_profiler
+
+start_from_env("mcp_server")
+
+import anyio
 import mcp.server.stdio
 import mcp.types as types
 from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 
-from .tools import ALL_TOOLS, UnifiedToolHandler
-
+from .config import MCPConfig
+from .executor import ComTimeoutError
+from .job_tools import JOB_TOOLS, handle_job_tool
+from .jobs import JobManager
+from .sessions import SESSION_ARG, SessionError, SessionPool, SessionQuota, split_session_argument
+from .tools import ALL_TOOLS
 
 # Create server instance
 app = Server("hwp-mcp-server")
-tool_handler = UnifiedToolHandler()
+config = MCPConfig()
+
+# 세션마다 별도 한글 워커 프로세스 (COM 호출은 이벤트 루프 밖에서 실행)
+session_pool = SessionPool(
+    max_workers=config.max_sessions,
+    idle_timeout=config.session_idle_timeout,
+    quota=SessionQuota(
+        max_calls=config.session_max_calls,
+        max_busy_seconds=config.session_max_busy_seconds,
+    ),
+    call_timeout=config.tool_timeout or None,
+)
+
+# 분리/합병/변환 파이프라인은 백그라운드 작업으로 실행
+job_manager = JobManager(max_concurrent=config.max_jobs)
+
+
+SESSION_TOOLS = [
+    types.Tool(
+        name="hwp_session_open",
+        description="Open an isolated HWP session (own Hangul instance) and return its session_id",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    types.Tool(
+        name="hwp_session_close",
+        description="Close an HWP session and release its Hangul instance",
+        inputSchema={
+            "type": "object",
+            "properties": {SESSION_ARG: {"type": "string"}},
+            "required": [SESSION_ARG],
+        },
+    ),
+    types.Tool(
+        name="hwp_session_list",
+        description="List open HWP sessions with call counts and idle time",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+]
+
+
+def _with_session_argument(tool: types.Tool) -> types.Tool:
+    """도구 입력 스키마에 session_id 인자 추가"""
+    data = tool.model_dump(by_alias=True, exclude_none=True)
+    schema = dict(data.get("inputSchema") or {"type": "object"})
+    schema["properties"] = {
+        **schema.get("properties", {}),
+        SESSION_ARG: {
+            "type": "string",
+            "description": "HWP session (from hwp_session_open); omitted = shared default session",
+        },
+    }
+    data["inputSchema"] = schema
+    return types.Tool.model_validate(data)
+
+
+def _text(text: str) -> list[types.TextContent]:
+    return [types.TextContent(type="text", text=text)]
+
+
+async def _handle_session_tool(name: str, arguments: dict) -> list[types.TextContent]:
+    if name == "hwp_session_open":
+        session = await session_pool.open()
+        return _text(json.dumps({SESSION_ARG: session.session_id}))
+    if name == "hwp_session_close":
+        closed = await session_pool.close(arguments.get(SESSION_ARG, ""))
+        return _text("✅ session closed" if closed else "❌ Unknown session")
+    return _text(json.dumps(session_pool.list_sessions(), ensure_ascii=False))
+
+
+def _progress_sender():
+    """요청에 progressToken이 있으면 notifications/progress 전송 함수"""
+    context = app.request_context
+    token = context.meta.progressToken if context.meta else None
+    if token is None:
+        return None
+
+    async def send(progress, total, message):
+        await context.session.send_progress_notification(token, progress, total, message)
+
+    return send
+
+
+def _protocol_stdout():
+    """프로토콜 전용 stdout 확보
+
+    파이프라인과 하위 프로세스(변환 워커)의 print가 JSON-RPC 스트림에 섞이지 않도록
+    원래 stdout은 복제해 프로토콜에만 쓰고, fd 1은 stderr로 돌립니다.
+    """
+    sys.stdout.flush()
+    protocol = os.fdopen(os.dup(sys.stdout.fileno()), "wb", buffering=0)
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    sys.stdout = sys.stderr
+    return anyio.wrap_file(io.TextIOWrapper(protocol, encoding="utf-8", write_through=True))
 
 
 @app.list_tools()
 async def handle_list_tools() -> list[types.Tool]:
     """List available HWP automation tools."""
-    return ALL_TOOLS
+    return SESSION_TOOLS + JOB_TOOLS + [_with_session_argument(tool) for tool in ALL_TOOLS]
 
 
 @app.call_tool()
@@ -25,12 +132,24 @@ async def handle_call_tool(
     name: str, arguments: dict
 ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
     """Handle tool execution requests."""
-    return tool_handler.handle_call(name, arguments)
+    if name.startswith("hwp_session_"):
+        return await _handle_session_tool(name, arguments or {})
+    if name.startswith("hwp_job_"):
+        return await handle_job_tool(job_manager, name, arguments or {}, _progress_sender())
+
+    session_id, arguments = split_session_argument(arguments)
+    try:
+        return await session_pool.call(session_id, name, arguments)
+    except ComTimeoutError as e:
+        return _text(f"❌ {name} timed out after {e.timeout:.0f}s (session {session_id} was reset)")
+    except SessionError as e:
+        return _text(f"❌ {name} failed: {e}")
 
 
 async def main():
     """Run the MCP server using stdio transport."""
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+    stdout = _protocol_stdout()
+    async with mcp.server.stdio.stdio_server(stdout=stdout) as (read_stream, write_stream):
         initialization_options = InitializationOptions(
             server_name="hwp-mcp-server",
             server_version="0.1.0",
@@ -40,11 +159,20 @@ async def main():
             ),
         )
 
-        await app.run(
-            read_stream,
-            write_stream,
-            initialization_options,
-        )
+        # 요청 대기 직전 (시작 프로파일 기록, HWP_STARTUP_EXIT면 바로 종료)
+        if startup_profiler.finish("ready"):
+            return
+
+        session_pool.start_reaper()
+        try:
+            await app.run(
+                read_stream,
+                write_stream,
+                initialization_options,
+            )
+        finally:
+            job_manager.shutdown()
+            await session_pool.shutdown()
 
 
 def run_server():
@@ -53,8 +181,6 @@ def run_server():
         asyncio.run(main())
     except KeyboardInterrupt:
         print("\n서버를 종료합니다...")
-    finally:
-        tool_handler.cleanup()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,475 @@
+"""
+MCP 세션 풀 - 세션마다 독립된 한글 인스턴스
+
+UnifiedToolHandler 하나를 모든 클라이언트가 공유하면 문서 상태가 섞이고 요청이 한 줄로
+직렬화됩니다. 세션 풀은 한글 워커 프로세스를 최대 max_workers개까지 띄우고, 세션 ID마다
+워커 하나를 배정합니다. 서로 다른 세션은 병렬로 실행되고, 같은 세션의 호출은 순서대로
+실행됩니다.
+
+- 세션 ID: 도구 인자의 "session_id" (없으면 "default", 처음 쓰면 자동 생성)
+- 워커 프로세스: 자기 메인 스레드에서 CoInitialize 후 핸들러(한글 인스턴스) 생성
+    - 세션이 끝나면 핸들러만 정리(reset)하고 프로세스는 다음 세션에 재사용
+    - 호출이 timeout을 넘기면 프로세스를 종료 (COM 호출은 중단할 수 없으므로)
+    - 종료(join)는 이벤트 루프 밖 스레드에서, 워커는 실행 스레드가 빈 뒤 새 프로세스를 띄우고 반환
+- 부모 쪽: 워커마다 ComExecutor 스레드 1개가 파이프 송수신을 맡아 이벤트 루프를 막지 않음
+- 세션 할당량(SessionQuota): 호출 수, 대기 호출 수, 누적 실행 시간
+- 유휴 회수: idle_timeout 동안 호출이 없으면 세션을 닫고 워커 반환
+"""
+
+import asyncio
+import multiprocessing
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from core.com_backend import co_initialize, co_uninitialize
+
+from .executor import ComExecutor, ComTimeoutError
+
+SESSION_ARG = "session_id"
+DEFAULT_SESSION = "default"
+
+# 죽인 워커의 실행 스레드가 비고 새 프로세스가 뜰 때까지 기다리는 시간
+RECYCLE_TIMEOUT = 30.0
+
+
+class SessionError(RuntimeError):
+    """세션 풀 오류 (도구 호출 결과로 클라이언트에게 전달)"""
+
+
+class SessionLimitError(SessionError):
+    """빈 워커 없음"""
+
+
+class QuotaExceededError(SessionError):
+    """세션 할당량 초과"""
+
+
+class WorkerCrashedError(SessionError):
+    """워커 프로세스가 비정상 종료 (세션 문서 상태 소실)"""
+
+
+# ============================================================================
+# 워커 프로세스
+# ============================================================================
+
+
+def _default_handler():
+    from .tools import UnifiedToolHandler
+
+    return UnifiedToolHandler()
+
+
+def _cleanup_handler(handler) -> None:
+    try:
+        handler.cleanup()
+    except Exception:
+        pass
+
+
+def _worker_main(conn, handler_factory: Callable[[], Any]) -> None:
+    """워커 프로세스 본체: ("call", name, args) / ("reset",) / ("stop",) 처리"""
+    try:
+        co_initialize()
+        initialized = True
+    except Exception:
+        initialized = False
+
+    handler = None
+    try:
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                break
+
+            command = message[0]
+            if command == "call":
+                _, name, arguments = message
+                try:
+                    if handler is None:
+                        handler = handler_factory()
+                    conn.send(("ok", handler.handle_call(name, arguments)))
+                except Exception as e:
+                    conn.send(("error", f"{type(e).__name__}: {e}"))
+            elif command == "reset":
+                if handler is not None:
+                    _cleanup_handler(handler)
+                    handler = None
+                conn.send(("ok", None))
+            elif command == "stop":
+                break
+    finally:
+        if handler is not None:
+            _cleanup_handler(handler)
+        if initialized:
+            try:
+                co_uninitialize()
+            except Exception:
+                pass
+
+
+class HangulWorker:
+    """워커 프로세스 1개 (부모 쪽 핸들)
+
+    request()는 블로킹이므로 항상 self.executor 스레드에서 실행합니다.
+    kill()은 어느 스레드에서 불러도 되고 여러 번 불러도 됩니다 (process/conn 교체는 _lock 안에서).
+    """
+
+    def __init__(self, index: int, handler_factory: Callable[[], Any]):
+        self.index = index
+        self.handler_factory = handler_factory
+        self.executor = ComExecutor(name=f"hwp-session-{index}", initialize=False)
+        self.process = None
+        self.conn = None
+        self.starts = 0
+        self.recycling = False  # SessionPool._recycle 진행 중 (이벤트 루프에서만 읽고 씀)
+        self._lock = threading.Lock()
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid if self.process is not None else None
+
+    def is_alive(self) -> bool:
+        process = self.process
+        return process is not None and process.is_alive()
+
+    def _ensure_started(self):
+        if self.is_alive():
+            return
+        if self.process is not None:
+            self.kill()  # 죽은 프로세스의 파이프 정리
+        context = multiprocessing.get_context("spawn")
+        parent_conn, child_conn = context.Pipe()
+        process = context.Process(
+            target=_worker_main,
+            args=(child_conn, self.handler_factory),
+            name=f"hwp-worker-{self.index}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        with self._lock:
+            self.process = process
+            self.conn = parent_conn
+            self.starts += 1
+
+    def start(self) -> None:
+        """프로세스 시작 (살아 있으면 그대로, executor 스레드 전용)"""
+        self._ensure_started()
+
+    def request(self, *message) -> Any:
+        """명령 전송 후 응답 대기 (executor 스레드 전용)"""
+        self._ensure_started()
+        conn = self.conn
+        try:
+            if conn is None:
+                raise EOFError  # 다른 스레드가 방금 kill
+            conn.send(message)
+            status, payload = conn.recv()
+        except (EOFError, OSError):
+            self.kill()
+            raise WorkerCrashedError(f"hwp-worker-{self.index} exited") from None
+        if status == "error":
+            raise SessionError(payload)
+        return payload
+
+    def call(self, name: str, arguments: dict) -> Any:
+        return self.request("call", name, arguments)
+
+    def reset(self) -> None:
+        if self.is_alive():
+            self.request("reset")
+
+    def kill(self) -> None:
+        """응답 없는 워커 강제 종료 (다음 요청 때 새로 시작)
+
+        join이 최대 5초 걸리므로 이벤트 루프에서는 asyncio.to_thread로 부릅니다.
+        """
+        with self._lock:
+            process, conn = self.process, self.conn
+            self.process = None
+            self.conn = None
+        if process is not None and process.is_alive():
+            process.kill()
+            process.join(5)
+        if conn is not None:
+            try:
+                conn.close()
+            except OSError:
+                pass
+
+    def stop(self, timeout: float = 10.0) -> None:
+        def _stop():
+            process, conn = self.process, self.conn
+            if process is not None and conn is not None and process.is_alive():
+                try:
+                    conn.send(("stop",))
+                except OSError:
+                    pass
+                process.join(timeout)
+            self.kill()
+
+        self.executor.shutdown(cleanup=_stop, timeout=timeout + 5)
+
+
+# ============================================================================
+# 세션
+# ============================================================================
+
+
+@dataclass
+class SessionQuota:
+    """세션별 제한 (0이면 무제한)"""
+
+    max_calls: int = 0
+    max_pending: int = 4
+    max_busy_seconds: float = 0.0
+
+
+@dataclass
+class Session:
+    session_id: str
+    worker: HangulWorker
+    created: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    calls: int = 0
+    pending: int = 0
+    busy_time: float = 0.0
+    closed: bool = False  # 닫혔거나 timeout으로 버려짐 - 대기 중인 호출은 실행하지 않음
+
+    def info(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "session_id": self.session_id,
+            "worker": self.worker.index,
+            "pid": self.worker.pid,
+            "calls": self.calls,
+            "pending": self.pending,
+            "busy_seconds": round(self.busy_time, 3),
+            "idle_seconds": round(now - self.last_used, 3),
+        }
+
+
+class SessionPool:
+    """세션 ID → 한글 워커 프로세스 배정
+
+    Args:
+        max_workers: 동시에 살아 있는 세션(워커 프로세스) 수 상한
+        idle_timeout: 이 시간(초) 동안 호출이 없는 세션은 회수 (0이면 회수 안 함)
+        quota: 세션별 제한
+        handler_factory: 워커 프로세스에서 핸들러 생성 (pickle 가능해야 함)
+        call_timeout: 호출 1회 기본 제한 시간 (None이면 무제한)
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        idle_timeout: float = 600.0,
+        quota: Optional[SessionQuota] = None,
+        handler_factory: Callable[[], Any] = _default_handler,
+        call_timeout: Optional[float] = None,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self.idle_timeout = idle_timeout
+        self.quota = quota or SessionQuota()
+        self.handler_factory = handler_factory
+        self.call_timeout = call_timeout
+        self.sessions: Dict[str, Session] = {}
+        self._workers: List[HangulWorker] = []
+        self._free: List[HangulWorker] = []
+        self._next_index = 0
+        self._reaper: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    # ------------------------------------------------------------------
+    # 세션 관리
+    # ------------------------------------------------------------------
+
+    def new_session_id(self) -> str:
+        return uuid.uuid4().hex[:12]
+
+    async def open(self, session_id: Optional[str] = None) -> Session:
+        """세션 생성 (이미 있으면 그대로 반환)"""
+        session_id = session_id or self.new_session_id()
+        async with self._lock:
+            session = self.sessions.get(session_id)
+            if session is None:
+                session = Session(session_id, await self._take_worker())
+                self.sessions[session_id] = session
+            return session
+
+    async def _take_worker(self) -> HangulWorker:
+        if not self._free and len(self._workers) >= self.max_workers:
+            await self.evict_idle()
+        if self._free:
+            return self._free.pop()
+        if len(self._workers) < self.max_workers:
+            worker = HangulWorker(self._next_index, self.handler_factory)
+            self._next_index += 1
+            self._workers.append(worker)
+            return worker
+        raise SessionLimitError(
+            f"all {self.max_workers} HWP sessions are busy; close one with hwp_session_close"
+        )
+
+    async def close(self, session_id: str) -> bool:
+        """세션 종료 - 문서 상태를 정리하고 워커 반환"""
+        session = self.sessions.pop(session_id, None)
+        if session is None:
+            return False
+        session.closed = True
+        worker = session.worker
+        try:
+            await worker.executor.run(worker.reset, timeout=self.call_timeout, name="reset")
+        except (ComTimeoutError, SessionError):
+            await self._recycle(worker)
+        else:
+            self._release(worker)
+        return True
+
+    def _release(self, worker: HangulWorker) -> None:
+        """워커를 _free에 반환 (이미 있거나 다른 세션이 쓰고 있으면 넣지 않음)"""
+        if worker in self._free or worker not in self._workers:
+            return
+        if any(session.worker is worker for session in self.sessions.values()):
+            return
+        self._free.append(worker)
+
+    async def _recycle(self, worker: HangulWorker) -> None:
+        """응답 없는 워커 교체 후 반환
+
+        프로세스 종료(join)는 이벤트 루프 밖 스레드에서 하고, 실행 스레드가 멈춘 호출을 끝낼 때까지
+        기다렸다가 그 스레드에서 새 프로세스를 띄운 뒤 _free에 넣습니다.
+        그래도 안 되면 워커를 버리고 자리를 비웁니다 (다음 세션이 새 워커를 만듦).
+        같은 워커의 호출 여러 개가 함께 timeout되어도 교체는 한 번만 합니다.
+        """
+        if worker.recycling:
+            return
+        worker.recycling = True
+        try:
+            await asyncio.to_thread(worker.kill)
+            try:
+                await worker.executor.run(worker.start, timeout=RECYCLE_TIMEOUT, name="restart")
+            except Exception:
+                if worker in self._workers:
+                    self._workers.remove(worker)
+                await asyncio.to_thread(worker.stop, 1.0)
+                return
+        finally:
+            worker.recycling = False
+        self._release(worker)
+
+    async def evict_idle(self, now: Optional[float] = None) -> List[str]:
+        """idle_timeout을 넘긴 유휴 세션 회수"""
+        if not self.idle_timeout:
+            return []
+        now = time.monotonic() if now is None else now
+        expired = [
+            session.session_id
+            for session in self.sessions.values()
+            if session.pending == 0 and now - session.last_used >= self.idle_timeout
+        ]
+        for session_id in expired:
+            await self.close(session_id)
+        return expired
+
+    def start_reaper(self, interval: float = 30.0) -> asyncio.Task:
+        """주기적으로 유휴 세션을 회수하는 태스크 시작"""
+
+        async def _reap():
+            while True:
+                await asyncio.sleep(interval)
+                await self.evict_idle()
+
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(_reap())
+        return self._reaper
+
+    def list_sessions(self) -> List[Dict[str, Any]]:
+        return [session.info() for session in self.sessions.values()]
+
+    # ------------------------------------------------------------------
+    # 호출
+    # ------------------------------------------------------------------
+
+    def _check_quota(self, session: Session):
+        quota = self.quota
+        if quota.max_calls and session.calls >= quota.max_calls:
+            raise QuotaExceededError(
+                f"session {session.session_id}: call limit {quota.max_calls} reached"
+            )
+        if quota.max_pending and session.pending >= quota.max_pending:
+            raise QuotaExceededError(
+                f"session {session.session_id}: {session.pending} calls already pending"
+            )
+        if quota.max_busy_seconds and session.busy_time >= quota.max_busy_seconds:
+            raise QuotaExceededError(
+                f"session {session.session_id}: {quota.max_busy_seconds:.0f}s of HWP time used"
+            )
+
+    async def call(
+        self,
+        session_id: Optional[str],
+        name: str,
+        arguments: dict,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """세션의 워커에서 도구 실행
+
+        Raises:
+            SessionLimitError, QuotaExceededError, WorkerCrashedError, SessionError
+            ComTimeoutError: 제한 시간 초과 (워커 종료, 세션 닫힘)
+        """
+        session = await self.open(session_id or DEFAULT_SESSION)
+        self._check_quota(session)
+
+        worker = session.worker
+        session.calls += 1
+        session.pending += 1
+        started = time.monotonic()
+        try:
+            return await worker.executor.run(
+                self._call_open,
+                session,
+                name,
+                arguments,
+                timeout=timeout if timeout is not None else self.call_timeout,
+                name=name,
+            )
+        except (ComTimeoutError, WorkerCrashedError):
+            session.closed = True
+            if self.sessions.get(session.session_id) is session:
+                del self.sessions[session.session_id]
+            await self._recycle(worker)
+            raise
+        finally:
+            session.pending -= 1
+            session.busy_time += time.monotonic() - started
+            session.last_used = time.monotonic()
+
+    @staticmethod
+    def _call_open(session: Session, name: str, arguments: dict) -> Any:
+        """executor 스레드에서 실행 - 세션이 그새 닫혔으면 (timeout, close) 실행하지 않음"""
+        if session.closed:
+            raise SessionError(f"session {session.session_id} was closed before {name} ran")
+        return session.worker.call(name, arguments)
+
+    async def shutdown(self):
+        """모든 세션 종료, 워커 프로세스 정지"""
+        if self._reaper is not None:
+            self._reaper.cancel()
+        self.sessions.clear()
+        await asyncio.gather(*(asyncio.to_thread(worker.stop) for worker in self._workers))
+        self._workers.clear()
+        self._free.clear()
+
+
+def split_session_argument(arguments: Optional[dict]) -> tuple:
+    """도구 인자에서 session_id 분리 → (session_id, 나머지 인자)"""
+    arguments = dict(arguments or {})
+    return arguments.pop(SESSION_ARG, None) or DEFAULT_SESSION, arguments
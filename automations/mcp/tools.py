@@ -14,7 +14,7 @@ from mcp.types import Tool, TextContent
 
 from .action_table import ACTION_TABLE_TOOLS, ActionTableToolHandler
 from .automation import AUTOMATION_TOOLS, AutomationToolHandler
-
+from .validation import rejection_message, validate_action_call
 
 # Unified tool registry
 ALL_TOOLS = ACTION_TABLE_TOOLS + AUTOMATION_TOOLS
@@ -32,6 +32,9 @@ class UnifiedToolHandler:
         """Route tool call to appropriate handler based on name prefix."""
         # ActionTable tools: hwp_action_*
         if name.startswith("hwp_action_"):
+            validation = validate_action_call(name, arguments)
+            if validation is not None and not validation.success:
+                return [TextContent(type="text", text=rejection_message(name, validation))]
             return self.action_table_handler.handle_call(name, arguments)
 
         # Automation tools: hwp_auto_*
@@ -0,0 +1,35 @@
+"""Parameter checks for hwp_action_* tool calls before they reach HWP.
+
+The arguments of an action tool become the tool's HParameterSet items
+(Specs/ActionTableMCP.idr: paramBuilder), so they are checked against
+core.param_index before dispatch. Type and range errors reject the call;
+unknown parameters and enum values are only warnings because the PDF-extracted
+parameter table is incomplete.
+"""
+
+from typing import Any, Mapping, Optional
+
+from core.param_index import ValidationResult, validate
+
+# Tool name -> HWP action ID (Specs/ActionTableMCP.idr: mcpTools)
+ACTION_TOOL_ACTIONS = {
+    "hwp_action_create_document": "FileNew",
+    "hwp_action_open_document": "FileOpen",
+    "hwp_action_save_document": "FileSave",
+    "hwp_action_insert_text": "InsertText",
+    "hwp_action_create_table": "TableCreate",
+}
+
+
+def validate_action_call(name: str, arguments: Mapping[str, Any]) -> Optional[ValidationResult]:
+    """Validate an action tool's arguments; None for tools without an action ID."""
+    action = ACTION_TOOL_ACTIONS.get(name)
+    if action is None:
+        return None
+    return validate(action, arguments)
+
+
+def rejection_message(name: str, result: ValidationResult) -> str:
+    """Error text for a call rejected by validate_action_call()."""
+    details = "; ".join(error.message for error in result.errors)
+    return f"❌ {name} rejected: invalid parameters for {result.action}: {details}"
@@ -8,18 +8,24 @@ HWP 문항 파일들을 2단 편집 양식으로 병합
 from .plugin import MergerPlugin
 from .types import ProblemFile, ParaInfo, ProcessResult, MergeConfig
 
-# ProblemMerger는 lazy import (실제 사용 시에만 import)
+# ProblemMerger / HwpxMerger는 lazy import (실제 사용 시에만 import)
 def __getattr__(name):
     if name == 'ProblemMerger':
         from .merger import ProblemMerger
         return ProblemMerger
+    if name in ("HwpxMerger", "merge_hwpx_files"):
+        from . import hwpx_merger
+
+        return getattr(hwpx_merger, name)
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
-    'MergerPlugin',
-    'ProblemFile',
-    'ParaInfo',
-    'ProcessResult',
-    'MergeConfig',
-    'ProblemMerger',
+    "MergerPlugin",
+    "ProblemFile",
+    "ParaInfo",
+    "ProcessResult",
+    "MergeConfig",
+    "ProblemMerger",
+    "HwpxMerger",
+    "merge_hwpx_files",
 ]
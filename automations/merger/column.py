@@ -5,6 +5,9 @@
 """
 
 import time
+
+from core.param_cache import parameter_cache
+
 from .page_setup import mili_to_hwp_unit
 
 
@@ -16,14 +19,12 @@ def convert_to_single_column(hwp) -> bool:
     문제 파일만 1단으로 변환
     """
     try:
-        hwp.HAction.GetDefault("MultiColumn", hwp.HParameterSet.HColDef.HSet)
-
-        col_def = hwp.HParameterSet.HColDef
-        col_def.Count = 1  # 1단으로 설정
-        col_def.HSet.SetItem("ApplyClass", 832)
-        col_def.HSet.SetItem("ApplyTo", 6)
-
-        result = hwp.HAction.Execute("MultiColumn", col_def.HSet)
+        result = parameter_cache(hwp).execute(
+            "MultiColumn",
+            "HColDef",
+            items={"ApplyClass": 832, "ApplyTo": 6},
+            Count=1,  # 1단으로 설정
+        )
         time.sleep(0.1)
         return result
 
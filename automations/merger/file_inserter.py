@@ -10,6 +10,7 @@ from tempfile import mkdtemp
 import shutil
 
 from core.automation_client import AutomationClient
+from core.param_cache import parameter_cache
 from core.sync import wait_for_hwp_ready
 from .types import ProblemFile
 from .column import convert_to_single_column
@@ -84,13 +85,16 @@ def insert_file_and_break_column(hwp, file_path: Path, is_last: bool, keep_secti
     """
     try:
         # 1. InsertFile 실행
-        hwp.HAction.GetDefault("InsertFile", hwp.HParameterSet.HInsertFile.HSet)
-        insert_params = hwp.HParameterSet.HInsertFile
-        insert_params.HSet.SetItem("FileName", str(file_path.absolute()))
-        insert_params.HSet.SetItem("FileFormat", "HWP")
-        insert_params.HSet.SetItem("KeepSection", keep_section)  # HwpIdris ParameterSet 명세
-
-        if not hwp.HAction.Execute("InsertFile", insert_params.HSet):
+        inserted = parameter_cache(hwp).execute(
+            "InsertFile",
+            "HInsertFile",
+            items={
+                "FileName": str(file_path.absolute()),
+                "FileFormat": "HWP",
+                "KeepSection": keep_section,  # HwpIdris ParameterSet 명세
+            },
+        )
+        if not inserted:
             return False
 
         # 2. InsertFile 완료 대기
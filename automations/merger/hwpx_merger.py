@@ -0,0 +1,778 @@
+"""
+HWPX 기반 문항 합병 엔진 (COM 없음)
+
+Idris2 명세: Specs/AppV1/MergeProblemFiles.idr (mergeProblemFiles)
+
+merge_with_insertfile은 문항마다 한글을 열어 InsertFile → MoveDocEnd →
+BreakColumn을 실행하고, 호출 사이마다 대기합니다. 이 모듈은 같은 합병을
+HWPX XML 수준에서 수행합니다:
+
+1. 양식 HWPX의 header.xml / section*.xml / content.hpf 로드
+2. 문항 HWPX마다
+   - header 참조 테이블(글꼴, 테두리/배경, 글자/문단 모양, 탭, 번호, 스타일)을
+     양식 header에 병합하고 ID 재매핑 (동일한 정의는 한 번만 추가)
+   - BinData 재번호 (imageN) 및 binaryItemIDRef 갱신
+   - 본문 문단을 양식 섹션에 삽입 (문항 사이 단 나누기)
+3. 결과 HWPX 저장
+
+COM은 최종 HWPX → HWP 변환(선택)에만 사용합니다.
+
+사용 예:
+    result = merge_hwpx_files(
+        Path("template.hwpx"),
+        [Path("001.hwpx"), Path("002.hwpx")],
+        Path("merged.hwpx"),
+    )
+"""
+
+import copy
+import time
+import zipfile
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from core.hwpx_package import (
+    HwpxPackage,
+    open_package,
+    copy_member,
+    write_member,
+    MIMETYPE_PATH,
+    HEADER_PATH,
+    CONTENT_HPF_PATH,
+    BINDATA_PREFIX,
+)
+from core.hwpx_xml import (
+    NS_HEAD,
+    HP_P,
+    HP_RUN,
+    HP_CTRL,
+    HP_SEC_PR,
+    HP_COL_PR,
+    HP_LINESEG_ARRAY,
+    qname,
+    local_name,
+    parse_xml,
+    serialize_xml,
+    is_empty_paragraph,
+)
+from .types import ProblemFile
+from .style_interner import StyleInterner, IdMap, header_digest
+
+# ============================================================================
+# header 참조 테이블
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class RefTable:
+    """header.xml refList의 ID 테이블"""
+
+    kind: str  # ID 매핑 키
+    container: str  # hh:refList 하위 컨테이너 태그
+    item: str  # 항목 태그
+    first_id: int  # 빈 테이블의 첫 ID
+
+
+# 병합 순서 = 의존 순서 (뒤 테이블이 앞 테이블을 참조)
+REF_TABLES = (
+    RefTable("borderFill", "borderFills", "borderFill", 1),
+    RefTable("charPr", "charProperties", "charPr", 0),
+    RefTable("tabPr", "tabProperties", "tabPr", 0),
+    RefTable("numbering", "numberings", "numbering", 1),
+    RefTable("bullet", "bullets", "bullet", 1),
+    RefTable("paraPr", "paraProperties", "paraPr", 0),
+    RefTable("style", "styles", "style", 0),
+    RefTable("memoPr", "memoProperties", "memoPr", 1),
+)
+
+# refList 하위 컨테이너의 스키마 순서 (없는 컨테이너 생성 시 위치 결정)
+REF_LIST_ORDER = (
+    "fontfaces",
+    "borderFills",
+    "charProperties",
+    "tabProperties",
+    "numberings",
+    "bullets",
+    "paraProperties",
+    "styles",
+    "memoProperties",
+    "trackChanges",
+    "trackChangeAuthors",
+)
+
+# ID 참조 속성 → 테이블
+ID_REF_ATTRS = {
+    "borderFillIDRef": "borderFill",
+    "charPrIDRef": "charPr",
+    "tabPrIDRef": "tabPr",
+    "paraPrIDRef": "paraPr",
+    "styleIDRef": "style",
+    "nextStyleIDRef": "style",
+    "memoShapeIDRef": "memoPr",
+    "binaryItemIDRef": "binData",
+}
+
+# hh:fontRef 속성 → hh:fontface lang
+FONT_REF_LANGS = {
+    "hangul": "HANGUL",
+    "latin": "LATIN",
+    "hanja": "HANJA",
+    "japanese": "JAPANESE",
+    "other": "OTHER",
+    "symbol": "SYMBOL",
+    "user": "USER",
+}
+
+# hh:heading type → 참조 테이블
+HEADING_TABLES = {
+    "NUMBER": "numbering",
+    "OUTLINE": "numbering",
+    "BULLET": "bullet",
+}
+
+HH_REF_LIST = qname(NS_HEAD, "refList")
+HH_FONTFACES = qname(NS_HEAD, "fontfaces")
+HH_FONTFACE = qname(NS_HEAD, "fontface")
+HH_FONT = qname(NS_HEAD, "font")
+HH_FONT_REF = qname(NS_HEAD, "fontRef")
+HH_HEADING = qname(NS_HEAD, "heading")
+
+
+def remap_refs(element: ET.Element, id_maps: IdMap):
+    """요소 트리의 모든 ID 참조를 재매핑 (매핑에 없는 값은 유지)"""
+    for elem in element.iter():
+        if elem.tag == HH_FONT_REF:
+            for attr, value in elem.attrib.items():
+                lang = FONT_REF_LANGS.get(attr)
+                if lang:
+                    new_id = id_maps.get(f"font:{lang}", {}).get(value)
+                    if new_id is not None:
+                        elem.set(attr, new_id)
+            continue
+
+        if elem.tag == HH_HEADING:
+            kind = HEADING_TABLES.get(elem.get("type", ""))
+            value = elem.get("idRef")
+            if kind and value is not None:
+                new_id = id_maps.get(kind, {}).get(value)
+                if new_id is not None:
+                    elem.set("idRef", new_id)
+            continue
+
+        for attr, value in elem.attrib.items():
+            kind = ID_REF_ATTRS.get(attr)
+            if kind:
+                new_id = id_maps.get(kind, {}).get(value)
+                if new_id is not None:
+                    elem.set(attr, new_id)
+
+
+class HeaderMerger:
+    """양식 header.xml에 문항 header의 참조 테이블을 병합
+
+    - 글꼴: 언어별 (face, type)이 같으면 기존 글꼴 사용
+    - 스타일: 이름이 같으면 양식 스타일 사용 (한글 붙여넣기와 동일)
+    - 나머지: 참조를 재매핑한 정의가 같으면 기존 항목 사용, 아니면 새 ID로 추가
+      (StyleInterner 해시 테이블)
+
+    문항 header 트리는 병합 후 버리므로, 새로 추가되는 정의는 복사하지 않고
+    문항 트리에서 그대로 옮겨 옵니다.
+    """
+
+    def __init__(self, header_root: ET.Element, interner: Optional[StyleInterner] = None):
+        self.root = header_root
+        self.interner = interner or StyleInterner()
+        self.ref_list = header_root.find(HH_REF_LIST)
+        if self.ref_list is None:
+            raise ValueError("header.xml에 hh:refList가 없습니다")
+
+        self.added: Dict[str, int] = {}
+        self._fontfaces: Dict[str, ET.Element] = {}
+        self._font_keys: Dict[str, Dict[Tuple[str, str], str]] = {}
+        self._style_names: Dict[str, str] = {}
+        self._next_id: Dict[str, int] = {}
+
+        fontfaces = self.ref_list.find(HH_FONTFACES)
+        if fontfaces is not None:
+            for fontface in fontfaces.findall(HH_FONTFACE):
+                self._index_fontface(fontface)
+
+        for table in REF_TABLES:
+            container = self.ref_list.find(qname(NS_HEAD, table.container))
+            items = [] if container is None else container.findall(qname(NS_HEAD, table.item))
+            self._next_id[table.kind] = max(
+                [int(item.get("id", -1)) + 1 for item in items] + [table.first_id]
+            )
+            if table.kind == "style":
+                self._style_names = {item.get("name", ""): item.get("id") for item in items}
+            else:
+                for item in items:
+                    self.interner.seed(table.kind, item)
+
+    # ------------------------------------------------------------------
+    # 글꼴
+    # ------------------------------------------------------------------
+
+    def _index_fontface(self, fontface: ET.Element):
+        lang = fontface.get("lang", "")
+        self._fontfaces[lang] = fontface
+        self._font_keys[lang] = {
+            (font.get("face", ""), font.get("type", "")): font.get("id")
+            for font in fontface.findall(HH_FONT)
+        }
+
+    def _merge_fonts(self, ref_list: ET.Element, id_maps: IdMap):
+        fontfaces = ref_list.find(HH_FONTFACES)
+        if fontfaces is None:
+            return
+
+        for fontface in fontfaces.findall(HH_FONTFACE):
+            lang = fontface.get("lang", "")
+            target = self._fontfaces.get(lang)
+            if target is None:
+                target = copy.deepcopy(fontface)
+                for font in target.findall(HH_FONT):
+                    target.remove(font)
+                self._container("fontfaces").append(target)
+                self._index_fontface(target)
+
+            mapping = id_maps.setdefault(f"font:{lang}", {})
+            keys = self._font_keys[lang]
+            for font in fontface.findall(HH_FONT):
+                key = (font.get("face", ""), font.get("type", ""))
+                old_id = font.get("id")
+                if key not in keys:
+                    font.set("id", str(len(target.findall(HH_FONT))))
+                    target.append(font)
+                    keys[key] = font.get("id")
+                    self.added["font"] = self.added.get("font", 0) + 1
+                mapping[old_id] = keys[key]
+
+    # ------------------------------------------------------------------
+    # 참조 테이블
+    # ------------------------------------------------------------------
+
+    def _container(self, name: str) -> ET.Element:
+        """refList 하위 컨테이너 (없으면 스키마 순서 위치에 생성)"""
+        tag = qname(NS_HEAD, name)
+        container = self.ref_list.find(tag)
+        if container is not None:
+            return container
+
+        container = ET.Element(tag)
+        if name != "fontfaces":
+            container.set("itemCnt", "0")
+        order = REF_LIST_ORDER.index(name) if name in REF_LIST_ORDER else len(REF_LIST_ORDER)
+        position = len(self.ref_list)
+        for index, sibling in enumerate(self.ref_list):
+            sibling_name = local_name(sibling.tag)
+            if sibling_name in REF_LIST_ORDER and REF_LIST_ORDER.index(sibling_name) > order:
+                position = index
+                break
+        self.ref_list.insert(position, container)
+        return container
+
+    def _allocate(self, kind: str) -> str:
+        new_id = self._next_id[kind]
+        self._next_id[kind] = new_id + 1
+        self.added[kind] = self.added.get(kind, 0) + 1
+        return str(new_id)
+
+    def _merge_table(self, table: RefTable, ref_list: ET.Element, id_maps: IdMap):
+        container = ref_list.find(qname(NS_HEAD, table.container))
+        if container is None:
+            return
+
+        items = container.findall(qname(NS_HEAD, table.item))
+        mapping = id_maps.setdefault(table.kind, {})
+
+        if table.kind == "style":
+            # 1차: 이름으로 ID 결정 (nextStyleIDRef가 뒤쪽 스타일을 참조할 수 있음)
+            new_styles = []
+            for item in items:
+                name = item.get("name", "")
+                if name in self._style_names:
+                    mapping[item.get("id")] = self._style_names[name]
+                else:
+                    new_id = self._allocate("style")
+                    self._style_names[name] = new_id
+                    mapping[item.get("id")] = new_id
+                    new_styles.append(item)
+
+            target = self._container(table.container)
+            for item in new_styles:
+                new_id = mapping[item.get("id")]
+                remap_refs(item, id_maps)
+                item.set("id", new_id)
+                target.append(item)
+            return
+
+        target = None
+        for item in items:
+            old_id = item.get("id")
+            remap_refs(item, id_maps)
+
+            existing = self.interner.lookup(table.kind, item)
+            if existing is None:
+                item.set("id", self._allocate(table.kind))
+                existing = self.interner.intern(table.kind, item)
+                if target is None:
+                    target = self._container(table.container)
+                target.append(item)
+            mapping[old_id] = existing
+
+    def merge(self, header_root: ET.Element) -> IdMap:
+        """문항 header 병합
+
+        Returns:
+            ID 매핑 (section 문단 재매핑에 사용)
+        """
+        ref_list = header_root.find(HH_REF_LIST)
+        id_maps: IdMap = {}
+        if ref_list is None:
+            return id_maps
+
+        self._merge_fonts(ref_list, id_maps)
+        for table in REF_TABLES:
+            self._merge_table(table, ref_list, id_maps)
+        return id_maps
+
+    def update_counts(self):
+        """컨테이너의 itemCnt / fontCnt 갱신"""
+        fontfaces = self.ref_list.find(HH_FONTFACES)
+        if fontfaces is not None:
+            faces = fontfaces.findall(HH_FONTFACE)
+            if "itemCnt" in fontfaces.attrib:
+                fontfaces.set("itemCnt", str(len(faces)))
+            for fontface in faces:
+                fontface.set("fontCnt", str(len(fontface.findall(HH_FONT))))
+
+        for table in REF_TABLES:
+            container = self.ref_list.find(qname(NS_HEAD, table.container))
+            if container is not None:
+                count = len(container.findall(qname(NS_HEAD, table.item)))
+                container.set("itemCnt", str(count))
+
+
+# ============================================================================
+# BinData / manifest
+# ============================================================================
+
+
+def _find_local(root: ET.Element, name: str) -> Optional[ET.Element]:
+    for elem in root.iter():
+        if local_name(elem.tag) == name:
+            return elem
+    return None
+
+
+class BinDataAllocator:
+    """BinData 재번호 (imageN) 및 content.hpf manifest 갱신"""
+
+    def __init__(self, manifest: Optional[ET.Element]):
+        self.manifest = manifest
+        self.used_ids = set()
+        self.used_names = set()
+        self.copies: List[Tuple[HwpxPackage, str, str]] = []  # (원본 패키지, 원본 경로, 새 경로)
+        self._next = 1
+
+        if manifest is not None:
+            for item in manifest:
+                if local_name(item.tag) == "item":
+                    self.used_ids.add(item.get("id"))
+                    self.used_names.add(item.get("href", ""))
+
+    def _new_id(self) -> str:
+        while f"image{self._next}" in self.used_ids:
+            self._next += 1
+        new_id = f"image{self._next}"
+        self.used_ids.add(new_id)
+        return new_id
+
+    def add_package(self, package: HwpxPackage, manifest: Optional[ET.Element]) -> Dict[str, str]:
+        """문항 패키지의 BinData 등록
+
+        Returns:
+            {원본 binaryItemIDRef: 새 ID}
+        """
+        items = {}
+        if manifest is not None:
+            for item in manifest:
+                if local_name(item.tag) == "item" and item.get("href", "").startswith(
+                    BINDATA_PREFIX
+                ):
+                    items[item.get("href")] = item
+
+        mapping = {}
+        for name in package.bindata_names():
+            source_item = items.get(name)
+            old_id = source_item.get("id") if source_item is not None else Path(name).stem
+            new_id = self._new_id()
+            new_name = f"{BINDATA_PREFIX}{new_id}{Path(name).suffix}"
+
+            if self.manifest is not None:
+                if source_item is not None:
+                    new_item = copy.deepcopy(source_item)
+                else:
+                    new_item = ET.Element(qname(self._manifest_namespace(), "item"))
+                new_item.set("id", new_id)
+                new_item.set("href", new_name)
+                self.manifest.append(new_item)
+
+            self.used_names.add(new_name)
+            self.copies.append((package, name, new_name))
+            mapping[old_id] = new_id
+
+        return mapping
+
+    def _manifest_namespace(self) -> str:
+        tag = self.manifest.tag
+        return tag[1:].split("}")[0] if tag.startswith("{") else ""
+
+
+# ============================================================================
+# 본문 문단
+# ============================================================================
+
+
+def _is_section_run(run: ET.Element) -> bool:
+    """구역 정의(secPr) 또는 단 정의(colPr)를 담은 run"""
+    for child in run:
+        if child.tag == HP_SEC_PR:
+            return True
+        if child.tag == HP_CTRL and child.find(HP_COL_PR) is not None:
+            return True
+    return False
+
+
+def strip_section_runs(paragraph: ET.Element) -> List[ET.Element]:
+    """문단에서 secPr / colPr 항목 제거
+
+    run 안에 다른 내용이 함께 있으면 해당 요소만 제거합니다.
+
+    Returns:
+        제거된 run 목록 (다른 문단으로 옮길 때 사용)
+    """
+    removed = []
+    for run in list(paragraph.findall(HP_RUN)):
+        if not _is_section_run(run):
+            continue
+
+        section_children = [
+            child
+            for child in run
+            if child.tag == HP_SEC_PR
+            or (child.tag == HP_CTRL and child.find(HP_COL_PR) is not None)
+        ]
+        if len(section_children) == len(run):
+            paragraph.remove(run)
+            removed.append(run)
+        else:
+            moved = ET.Element(run.tag, run.attrib)
+            for child in section_children:
+                run.remove(child)
+                moved.append(child)
+            removed.append(moved)
+    return removed
+
+
+def prepare_paragraphs(section_roots: List[ET.Element], id_maps: IdMap) -> List[ET.Element]:
+    """문항 섹션의 본문 문단 → 양식에 삽입할 문단 목록
+
+    - 구역/단 정의 제거 (양식 정의 사용)
+    - 줄 배치 캐시(linesegarray) 제거 (한글이 다시 계산)
+    - header / BinData ID 재매핑
+    """
+    paragraphs = []
+    for root in section_roots:
+        for paragraph in root.findall(HP_P):
+            strip_section_runs(paragraph)
+            for lineseg in paragraph.findall(HP_LINESEG_ARRAY):
+                paragraph.remove(lineseg)
+            remap_refs(paragraph, id_maps)
+            paragraphs.append(paragraph)
+
+    # 끝쪽 빈 문단 제거 (remove_empty_paras와 같은 효과)
+    while len(paragraphs) > 1 and is_empty_paragraph(paragraphs[-1]):
+        paragraphs.pop()
+
+    return paragraphs
+
+
+# ============================================================================
+# 합병
+# ============================================================================
+
+
+@dataclass
+class HwpxMergeResult:
+    """HWPX 합병 결과"""
+
+    success: bool
+    output_path: Optional[Path]
+    inserted_count: int
+    failed: List[Tuple[Path, str]] = field(default_factory=list)
+    paragraph_count: int = 0
+    bindata_count: int = 0
+    added_definitions: Dict[str, int] = field(default_factory=dict)
+    reused_definitions: int = 0
+    header_cache_hits: int = 0
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+
+class HwpxMerger:
+    """양식 HWPX에 문항 HWPX 본문을 삽입
+
+    양식과 문항 패키지는 저장할 때까지 열어 두고(BinData 복사),
+    save() 또는 close()에서 해제합니다.
+    """
+
+    def __init__(self, template_path: Union[str, Path]):
+        self.template_path = Path(template_path)
+        self.template = open_package(self.template_path)
+        self._problem_packages: List[HwpxPackage] = []
+
+        try:
+            sections = self.template.section_names()
+            if not sections:
+                raise ValueError(f"양식에 section0.xml이 없습니다: {self.template_path}")
+            self.section_name = sections[0]
+
+            self.header_root, self.header_ns = parse_xml(self.template.read(HEADER_PATH))
+            self.section_root, self.section_ns = parse_xml(self.template.read(self.section_name))
+
+            self.content_root = None
+            self.content_ns = []
+            manifest = None
+            if CONTENT_HPF_PATH in self.template:
+                self.content_root, self.content_ns = parse_xml(self.template.read(CONTENT_HPF_PATH))
+                manifest = _find_local(self.content_root, "manifest")
+
+            self.interner = StyleInterner()
+            self.headers = HeaderMerger(self.header_root, self.interner)
+            self.bindata = BinDataAllocator(manifest)
+        except Exception:
+            self.template.close()
+            raise
+
+        self.inserted_count = 0
+        self.paragraph_count = 0
+        self._problem_paragraphs: List[List[ET.Element]] = []
+
+    def add_problem(self, problem_path: Union[str, Path]):
+        """문항 HWPX 하나를 병합 대기열에 추가
+
+        Raises:
+            FileNotFoundError, ValueError, KeyError: 문항 패키지 오류
+        """
+        package = open_package(problem_path)
+        try:
+            # 읽기/파싱/검증을 모두 마친 뒤에 양식을 고침
+            # - 잘못된 문항이 양식 header에 정의를 남기지 않게
+            header_bytes = package.read(HEADER_PATH)
+            section_roots = [parse_xml(package.read(name))[0] for name in package.section_names()]
+            if not section_roots:
+                raise ValueError(f"section0.xml이 없습니다: {problem_path}")
+
+            manifest = None
+            if CONTENT_HPF_PATH in package:
+                manifest = _find_local(parse_xml(package.read(CONTENT_HPF_PATH))[0], "manifest")
+
+            digest = header_digest(header_bytes)
+            id_maps = self.interner.cached_map(digest)
+            if id_maps is None:
+                header_root = parse_xml(header_bytes)[0]
+                id_maps = self.headers.merge(header_root)
+                self.interner.store_map(digest, id_maps)
+
+            id_maps["binData"] = self.bindata.add_package(package, manifest)
+            paragraphs = prepare_paragraphs(section_roots, id_maps)
+        except Exception:
+            package.close()
+            raise
+
+        self._problem_packages.append(package)
+        self._problem_paragraphs.append(paragraphs)
+        self.inserted_count += 1
+        self.paragraph_count += len(paragraphs)
+
+    def _splice(self):
+        """양식 섹션 시작 위치에 문항 문단 삽입 (문항 사이 단 나누기)"""
+        template_paragraphs = self.section_root.findall(HP_P)
+        if not template_paragraphs or not self._problem_paragraphs:
+            return
+
+        first = template_paragraphs[0]
+        section_runs = strip_section_runs(first)
+        insert_at = list(self.section_root).index(first)
+        if is_empty_paragraph(first):
+            self.section_root.remove(first)
+        else:
+            first.set("pageBreak", "0")
+
+        new_paragraphs = []
+        for index, paragraphs in enumerate(self._problem_paragraphs):
+            if not paragraphs:
+                continue
+            head = paragraphs[0]
+            head.set("columnBreak", "1" if new_paragraphs else "0")
+            head.set("pageBreak", "0")
+            new_paragraphs.extend(paragraphs)
+
+        # 양식의 구역/단 정의는 문서 첫 문단 맨 앞에 있어야 함
+        for offset, run in enumerate(section_runs):
+            new_paragraphs[0].insert(offset, run)
+
+        for offset, paragraph in enumerate(new_paragraphs):
+            self.section_root.insert(insert_at + offset, paragraph)
+
+    def save(self, output_path: Union[str, Path]) -> Path:
+        """합병 결과를 HWPX로 저장"""
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._splice()
+        self.headers.update_counts()
+
+        replaced = {
+            HEADER_PATH: serialize_xml(self.header_root, self.header_ns),
+            self.section_name: serialize_xml(self.section_root, self.section_ns),
+        }
+        if self.content_root is not None:
+            replaced[CONTENT_HPF_PATH] = serialize_xml(self.content_root, self.content_ns)
+
+        date_time = time.localtime()[:6]
+        names = self.template.names()
+        if MIMETYPE_PATH in names:
+            # mimetype은 항상 첫 멤버 (STORED)
+            names.remove(MIMETYPE_PATH)
+            names.insert(0, MIMETYPE_PATH)
+
+        with zipfile.ZipFile(output_path, "w") as zout:
+            for name in names:
+                if name in replaced:
+                    write_member(zout, name, replaced[name], date_time=date_time)
+                else:
+                    copy_member(zout, self.template, name, date_time=date_time)
+
+            for package, name, new_name in self.bindata.copies:
+                copy_member(zout, package, name, new_name, date_time=date_time)
+
+        return output_path
+
+    def close(self):
+        for package in self._problem_packages:
+            package.close()
+        self._problem_packages = []
+        if self.template is not None:
+            self.template.close()
+            self.template = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def merge_hwpx_files(
+    template_path: Path,
+    problem_paths: List[Union[ProblemFile, Path]],
+    output_path: Path,
+    verbose: bool = True,
+) -> HwpxMergeResult:
+    """
+    양식 HWPX + 문항 HWPX들 → 합병 문서
+
+    Args:
+        template_path: 양식 HWPX (2단 편집 양식)
+        problem_paths: 문항 HWPX 경로 또는 ProblemFile 목록 (합병 순서)
+        output_path: 결과 경로 (.hwpx, 또는 .hwp이면 마지막에 COM으로 한 번 변환)
+        verbose: 진행 상황 출력
+
+    Returns:
+        HwpxMergeResult
+    """
+    start_time = time.time()
+    output_path = Path(output_path)
+    problems = [p.path if isinstance(p, ProblemFile) else Path(p) for p in problem_paths]
+    failed: List[Tuple[Path, str]] = []
+
+    if verbose:
+        print("=" * 70)
+        print("HWPX 문항 합병")
+        print("=" * 70)
+        print(f"양식: {Path(template_path).name}")
+        print(f"문항 수: {len(problems)}개")
+
+    try:
+        merger = HwpxMerger(template_path)
+    except (FileNotFoundError, ValueError, KeyError) as e:
+        if verbose:
+            print(f"❌ 양식 열기 실패: {e}")
+        return HwpxMergeResult(False, None, 0, error=str(e), elapsed=time.time() - start_time)
+
+    with merger:
+        for i, problem in enumerate(problems, 1):
+            try:
+                merger.add_problem(problem)
+                if verbose:
+                    print(f"  [{i:2d}/{len(problems)}] {problem.name[:40]} ✅")
+            except (FileNotFoundError, ValueError, KeyError, ET.ParseError) as e:
+                failed.append((problem, str(e)))
+                if verbose:
+                    print(f"  [{i:2d}/{len(problems)}] {problem.name[:40]} ❌ {str(e)[:30]}")
+
+        if merger.inserted_count == 0:
+            return HwpxMergeResult(
+                False,
+                None,
+                0,
+                failed,
+                error="삽입된 문항이 없습니다",
+                elapsed=time.time() - start_time,
+            )
+
+        hwpx_path = (
+            output_path
+            if output_path.suffix.lower() == ".hwpx"
+            else output_path.with_suffix(".hwpx")
+        )
+        merger.save(hwpx_path)
+
+    result = HwpxMergeResult(
+        success=True,
+        output_path=hwpx_path,
+        inserted_count=merger.inserted_count,
+        failed=failed,
+        paragraph_count=merger.paragraph_count,
+        bindata_count=len(merger.bindata.copies),
+        added_definitions=dict(merger.headers.added),
+        reused_definitions=merger.interner.stats.reused,
+        header_cache_hits=merger.interner.stats.header_cache_hits,
+    )
+
+    if output_path.suffix.lower() == ".hwp":
+        # 최종 변환만 COM 사용
+        from core.hwpx_converter import convert_hwpx_to_hwp
+
+        success, hwp_path, error = convert_hwpx_to_hwp(str(hwpx_path), str(output_path))
+        if success:
+            result.output_path = Path(hwp_path)
+        else:
+            result.success = False
+            result.error = error
+
+    result.elapsed = time.time() - start_time
+
+    if verbose:
+        print("-" * 70)
+        print(f"✅ 삽입: {result.inserted_count}개, 실패: {len(failed)}개")
+        print(f"   문단: {result.paragraph_count}개, BinData: {result.bindata_count}개")
+        print(f"   파일: {result.output_path}")
+        print(f"   소요 시간: {result.elapsed:.2f}초")
+
+    return result
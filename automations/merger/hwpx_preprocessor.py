@@ -0,0 +1,239 @@
+"""
+HWPX 전처리 모듈 (COM 없음)
+
+Idris2 명세: Specs/HwpIdris/AppV1/ParallelPreprocessor.idr (preprocessSingleFile)
+
+preprocess_single_file은 파일마다 한글 인스턴스를 띄워
+convert_to_single_column + remove_empty_paras를 실행합니다
+(빈 문단 하나당 COM 호출 6번). 이 모듈은 같은 전처리를 HWPX XML 변환으로
+수행합니다:
+
+1. 모든 hp:colPr의 colCount → 1 (단 너비 hp:colSz 제거)
+2. 마지막 섹션 끝의 빈 hp:p 제거 (공백만 있는 문단은 유지)
+
+deterministic=True이면 같은 입력에 대해 바이트 단위로 같은 파일을 씁니다
+(고정 타임스탬프, 원본 멤버 순서).
+"""
+
+import os
+import time
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from core.hwpx_package import HwpxPackage, copy_member, write_member, MIMETYPE_PATH
+from core.hwpx_xml import (
+    HP_P,
+    HP_COL_PR,
+    HP_LINESEG_ARRAY,
+    qname,
+    NS_PARAGRAPH,
+    parse_xml,
+    serialize_xml,
+    is_empty_paragraph,
+)
+from .types import PreprocessResult
+
+HP_COL_SZ = qname(NS_PARAGRAPH, "colSz")
+
+# deterministic 모드의 고정 ZIP 타임스탬프 (ZIP 최소값)
+FIXED_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def set_single_column(section_root: ET.Element) -> bool:
+    """섹션의 모든 단 정의를 1단으로 변경
+
+    Returns:
+        변경 여부
+    """
+    changed = False
+    for col_pr in section_root.iter(HP_COL_PR):
+        if col_pr.get("colCount", "1") != "1":
+            col_pr.set("colCount", "1")
+            changed = True
+        for col_sz in col_pr.findall(HP_COL_SZ):
+            col_pr.remove(col_sz)
+            changed = True
+    return changed
+
+
+def drop_layout_cache(section_root: ET.Element):
+    """줄 배치 캐시(linesegarray) 제거 - 단 폭이 바뀌면 한글이 다시 계산"""
+    for paragraph in section_root.iter(HP_P):
+        for lineseg in paragraph.findall(HP_LINESEG_ARRAY):
+            paragraph.remove(lineseg)
+
+
+def strip_trailing_empty_paragraphs(section_root: ET.Element) -> int:
+    """섹션 끝의 빈 문단 제거 (remove_empty_paras와 같은 기준)
+
+    첫 문단은 남깁니다 (문서에는 문단이 최소 하나 있어야 함).
+
+    Returns:
+        제거된 문단 수
+    """
+    paragraphs = section_root.findall(HP_P)
+    removed = 0
+    while len(paragraphs) > 1 and is_empty_paragraph(paragraphs[-1]):
+        section_root.remove(paragraphs.pop())
+        removed += 1
+    return removed
+
+
+def output_name(file_path: Path, file_index: int) -> str:
+    """preprocess_single_file과 같은 출력 파일명 규칙 (확장자만 .hwpx)"""
+    base_name = file_path.stem
+    if base_name.endswith("_1"):
+        base_name = base_name[:-2]
+    return f"preprocessed_{file_index:03d}_{base_name}.hwpx"
+
+
+def preprocess_hwpx(
+    file_path: Union[str, Path],
+    output_dir: Union[str, Path],
+    file_index: int,
+    deterministic: bool = False,
+) -> PreprocessResult:
+    """
+    단일 HWPX 전처리 (별도 프로세스에서 실행 가능)
+
+    Args:
+        file_path: 원본 HWPX 경로
+        output_dir: 출력 디렉토리
+        file_index: 파일 인덱스 (출력 파일명)
+        deterministic: 바이트 단위로 재현 가능한 출력
+
+    Returns:
+        PreprocessResult
+    """
+    start_time = time.time()
+    file_path = Path(file_path)
+    para_count = 0
+
+    try:
+        # 전처리는 파일마다 한 번만 읽으므로 공유 레지스트리를 거치지 않음
+        with HwpxPackage(file_path) as package:
+            sections = package.section_names()
+            if not sections:
+                raise ValueError(f"section0.xml이 없습니다: {file_path}")
+
+            replaced = {}
+            removed = 0
+            for index, name in enumerate(sections):
+                root, namespaces = parse_xml(package.read(name))
+                if set_single_column(root):
+                    drop_layout_cache(root)
+                if index == len(sections) - 1:
+                    removed = strip_trailing_empty_paragraphs(root)
+                para_count += len(root.findall(HP_P))
+                replaced[name] = serialize_xml(root, namespaces)
+
+            output_path = Path(output_dir)
+            output_path.mkdir(parents=True, exist_ok=True)
+            output_file = output_path / output_name(file_path, file_index)
+
+            date_time = FIXED_DATE_TIME if deterministic else time.localtime()[:6]
+            names = package.names()
+            if MIMETYPE_PATH in names:
+                names.remove(MIMETYPE_PATH)
+                names.insert(0, MIMETYPE_PATH)
+
+            # 임시 파일에 쓰고 교체 (중간에 실패해도 이전 결과 유지)
+            temp_file = output_file.with_name(output_file.name + ".tmp")
+            try:
+                with zipfile.ZipFile(temp_file, "w") as zout:
+                    for name in names:
+                        if name in replaced:
+                            write_member(zout, name, replaced[name], date_time=date_time)
+                        else:
+                            copy_member(zout, package, name, date_time=date_time)
+                os.replace(temp_file, output_file)
+            except BaseException:
+                temp_file.unlink(missing_ok=True)
+                raise
+
+        return PreprocessResult(
+            success=True,
+            original_path=str(file_path),
+            preprocessed_path=str(output_file),
+            para_count=para_count,
+            removed_count=removed,
+            processing_time=time.time() - start_time,
+        )
+
+    except (OSError, ValueError, KeyError, ET.ParseError) as e:
+        return PreprocessResult(
+            success=False,
+            original_path=str(file_path),
+            preprocessed_path=None,
+            para_count=para_count,
+            removed_count=0,
+            processing_time=time.time() - start_time,
+            error_message=str(e),
+        )
+
+
+def _preprocess_task(args: Tuple[str, str, int, bool]) -> PreprocessResult:
+    return preprocess_hwpx(*args)
+
+
+def preprocess_hwpx_folder(
+    input_dir: Union[str, Path],
+    output_dir: Union[str, Path],
+    max_workers: Optional[int] = None,
+    deterministic: bool = False,
+    pattern: str = "*.hwpx",
+    verbose: bool = True,
+) -> Tuple[List[PreprocessResult], List[PreprocessResult]]:
+    """
+    폴더의 HWPX 일괄 전처리 (프로세스 풀)
+
+    파일은 이름순으로 번호를 매기므로 출력 파일명은 실행마다 같습니다.
+
+    Args:
+        input_dir: 입력 폴더
+        output_dir: 출력 폴더
+        max_workers: 프로세스 수 (None이면 CPU 수)
+        deterministic: 바이트 단위로 재현 가능한 출력
+        pattern: 입력 파일 패턴
+        verbose: 진행 상황 출력
+
+    Returns:
+        (성공 결과 리스트, 실패 결과 리스트) - 입력 순서
+    """
+    files = sorted(Path(input_dir).glob(pattern))
+    tasks = [
+        (str(path), str(output_dir), index, deterministic) for index, path in enumerate(files, 1)
+    ]
+
+    start_time = time.time()
+    if verbose:
+        print(f"\nHWPX 전처리 시작 (파일: {len(tasks)}개, 워커: {max_workers or os.cpu_count()}개)")
+        print("-" * 70)
+
+    results: List[PreprocessResult] = []
+    if len(tasks) <= 1 or max_workers == 1:
+        results = [_preprocess_task(task) for task in tasks]
+    elif tasks:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # 파일당 작업이 짧으므로 묶어서 전달 (IPC 왕복 감소)
+            workers = max_workers or os.cpu_count() or 1
+            chunksize = max(1, len(tasks) // (workers * 4))
+            results = list(executor.map(_preprocess_task, tasks, chunksize=chunksize))
+
+    success_results = [r for r in results if r.success]
+    failure_results = [r for r in results if not r.success]
+
+    if verbose:
+        for result in failure_results:
+            print(f"  ❌ {Path(result.original_path).name[:40]} | {result.error_message[:50]}")
+        elapsed = time.time() - start_time
+        print(
+            f"✅ 전처리 완료: {len(success_results)}개 성공, "
+            f"{len(failure_results)}개 실패 ({elapsed:.2f}초)"
+        )
+        print(f"   제거된 빈 문단: {sum(r.removed_count for r in success_results)}개")
+
+    return success_results, failure_results
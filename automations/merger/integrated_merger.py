@@ -16,6 +16,7 @@ from typing import List, Tuple, Optional
 # UTF-8 설정 (모듈 import 시에는 하지 않음 - 메인 스크립트에서만)
 
 from core.automation_client import AutomationClient
+from core.progress import progress_bus
 
 from .types import ProblemFile, MergeConfig
 from .parallel_preprocessor import (
@@ -153,28 +154,28 @@ class IntegratedMerger:
             target_hwp.Run("MoveParaBegin")
             time.sleep(0.05)
 
-            # 2. 전처리된 파일들을 순차적으로 Copy/Paste
-            print(f'\n[문항 삽입] 시작...')
-            print('-' * 70)
+            # 2. 전처리된 파일들을 순차적으로 Copy/Paste (진행: "merge" 단계 이벤트)
+            print(f"\n[문항 삽입] {len(preprocessed_results)}개...")
 
             start_time = time.time()
             inserted = 0
+            stage = progress_bus.stage("merge", len(preprocessed_results))
+            stage.start()
 
             for i, result in enumerate(preprocessed_results, 1):
                 if not result.preprocessed_path:
-                    print(f'[{i:2d}/{len(preprocessed_results)}] ❌ 스킵 (전처리 실패)')
+                    stage.advance(
+                        Path(result.original_path).name, ok=False, message="스킵 (전처리 실패)"
+                    )
                     continue
 
                 preprocessed_file = Path(result.preprocessed_path)
-                progress = (i / len(preprocessed_results)) * 100
-
-                print(f'[{i:2d}/{len(preprocessed_results)}] ({progress:5.1f}%) {preprocessed_file.name[:50]:50s}', end='')
 
                 try:
                     # 전처리된 파일 열기
                     open_result = source_client.open_document(str(preprocessed_file.absolute()))
                     if not open_result.success:
-                        print(f' ❌ 열기 실패')
+                        stage.advance(preprocessed_file.name, ok=False, message="열기 실패")
                         continue
 
                     time.sleep(0.1)
@@ -194,21 +195,15 @@ class IntegratedMerger:
                     time.sleep(0.1)
 
                     inserted += 1
-                    print(f' ✅')
 
                     # BreakColumn (마지막 문항 제외)
                     if i < len(preprocessed_results):
                         break_column(target_hwp)
 
+                    stage.advance(preprocessed_file.name)
+
                 except Exception as e:
-                    print(f' ❌ {str(e)[:30]}')
-
-                # 10개마다 진행 상황
-                if i % 10 == 0:
-                    elapsed = time.time() - start_time
-                    avg_time = elapsed / i
-                    remaining = avg_time * (len(preprocessed_results) - i)
-                    print(f'  --- 진행: {i}/{len(preprocessed_results)} ({elapsed:.1f}초 경과, 예상 남은 시간: {remaining:.1f}초)')
+                    stage.advance(preprocessed_file.name, ok=False, message=str(e)[:80])
 
             elapsed_total = time.time() - start_time
 
@@ -107,9 +107,8 @@ class ProblemMerger:
             removed = remove_empty_paras(source_hwp, paras)
 
             # Step 5: 복사
-            source_hwp.Run("MoveDocBegin")
-            source_hwp.Run("SelectAll")
-            source_hwp.Run("Copy")
+            with self.source_client.batch() as batch:
+                batch.run("MoveDocBegin", "SelectAll", "Copy")
             time.sleep(0.15)
 
             # 소스 파일 닫기 (CRITICAL: 붙여넣기 전에 닫기!)
@@ -172,9 +171,8 @@ class ProblemMerger:
                 return (False, 0)
 
             # 본문 시작 위치로 이동 (v3에서 학습)
-            target_hwp.Run("MoveDocBegin")
-            time.sleep(0.05)
-            target_hwp.Run("MoveParaBegin")
+            with self.target_client.batch() as batch:
+                batch.run("MoveDocBegin", "MoveParaBegin")
             time.sleep(0.05)
 
             # 2. 각 문항 파일 처리
@@ -4,8 +4,10 @@ Para 스캔 및 제거 모듈
 test_merge_40_problems_clean.py의 MoveSelDown 방식 사용 (가장 깔끔한 결과)
 """
 
-import time
 from typing import List
+
+from core.action_batch import ActionBatch
+
 from .types import ParaInfo
 
 
@@ -17,21 +19,25 @@ def scan_paras(hwp) -> List[ParaInfo]:
     - MoveDocBegin: 문서 시작으로 이동
     - MoveParaEnd: Para 끝으로 이동
     - MoveNextParaBegin: 다음 Para 시작으로 이동
+
+    Para 1개당 GetPos → MoveParaEnd → GetPos → MoveNextParaBegin → GetPos를
+    ActionBatch 한 번으로 실행
     """
     paras = []
+    batch = ActionBatch(hwp)
 
-    hwp.Run("MoveDocBegin")
-    time.sleep(0.05)
+    batch.run("MoveDocBegin")
+    start_pos = batch.get_pos()
+    batch.flush()
+    start_pos = start_pos.value
 
     para_num = 0
 
     while True:
-        start_pos = hwp.GetPos()
-
-        hwp.Run("MoveParaEnd")
-        time.sleep(0.02)
-
-        end_pos = hwp.GetPos()
+        end_pos = batch.run("MoveParaEnd").get_pos()
+        after_pos = batch.run("MoveNextParaBegin").get_pos()
+        batch.flush()
+        end_pos, after_pos = end_pos.value, after_pos.value
 
         # 빈 Para 판단: end_pos의 pos 값이 0이면 빈 Para
         is_empty = (end_pos[2] == 0)
@@ -43,17 +49,11 @@ def scan_paras(hwp) -> List[ParaInfo]:
             is_empty=is_empty,
         ))
 
-        # 다음 Para로 이동
-        before_pos = hwp.GetPos()
-        hwp.Run("MoveNextParaBegin")
-        time.sleep(0.02)
-
-        after_pos = hwp.GetPos()
-
-        # 위치가 변하지 않으면 마지막 Para
-        if after_pos == before_pos:
+        # 위치가 변하지 않으면 마지막 Para (이동 직전 위치 = end_pos)
+        if after_pos == end_pos:
             break
 
+        start_pos = after_pos
         para_num += 1
 
         # 안전 장치
@@ -81,38 +81,21 @@ def remove_empty_paras(hwp, paras: List[ParaInfo]) -> int:
 
     removed = 0
     max_iterations = 100  # 안전 장치
+    batch = ActionBatch(hwp)
 
     for i in range(max_iterations):
         try:
-            # 문서 끝으로 이동
-            hwp.Run("MoveDocEnd")
-            time.sleep(0.02)
-
-            # Para 시작으로 이동
-            hwp.Run("MoveParaBegin")
-            time.sleep(0.02)
-
-            # Para 끝으로 이동
-            hwp.Run("MoveParaEnd")
-            time.sleep(0.02)
-
-            # Para 끝 위치 확인
-            end_pos = hwp.GetPos()
+            # 문서 끝 → Para 시작 → Para 끝 위치 확인
+            end_pos = batch.run("MoveDocEnd", "MoveParaBegin", "MoveParaEnd").get_pos()
+            batch.flush()
 
             # 빈 Para 판단: end_pos[2] == 0 (완전히 빈 Para만)
-            is_empty = (end_pos[2] == 0)
+            is_empty = end_pos.value[2] == 0
 
             if is_empty:
                 # 빈 Para - 삭제
-                hwp.Run("MoveDocEnd")
-                time.sleep(0.02)
-
-                hwp.Run("Select")
-                time.sleep(0.01)
-                hwp.Run("MoveLeft")
-                time.sleep(0.01)
-                hwp.Run("Delete")
-                time.sleep(0.02)
+                batch.run("MoveDocEnd", "Select", "MoveLeft", "Delete")
+                batch.flush()
 
                 removed += 1
             else:
@@ -128,6 +111,5 @@ def remove_empty_paras(hwp, paras: List[ParaInfo]) -> int:
 
     # 최종 위치를 문서 시작으로 (Copy 준비)
     hwp.Run("MoveDocBegin")
-    time.sleep(0.02)
 
     return removed
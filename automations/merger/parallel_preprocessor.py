@@ -6,53 +6,21 @@ HwpIdris/AppV1/ParallelPreprocessor.idr 명세 구현
 multiprocessing.ProcessPoolExecutor 기반
 """
 
+import inspect
 import sys
 import time
+import warnings
+from contextlib import nullcontext
 from pathlib import Path
 from typing import List, Tuple, Optional
-from dataclasses import dataclass
 from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # UTF-8 설정 (모듈 import 시에는 하지 않음 - 메인 스크립트에서만)
 
-from core.automation_client import AutomationClient
+from core.progress import ProgressAbort, ProgressEvent, progress_bus
 from .column import convert_to_single_column
 from .para_scanner import scan_paras, remove_empty_paras
-
-
-@dataclass
-class PreprocessResult:
-    """
-    전처리 작업 결과
-
-    HwpIdris PreprocessResult 구현
-    Specs/HwpIdris/AppV1/EnhancedPreprocessor.idr 확장
-    """
-    success: bool
-    original_path: str
-    preprocessed_path: Optional[str]
-    para_count: int
-    removed_count: int
-    processing_time: float
-    error_message: Optional[str] = None
-    # Enhanced fields (EnhancedPreprocessor.idr)
-    initial_page_count: int = 0
-    final_page_count: int = 0
-    page_deleted: bool = False
-
-
-@dataclass
-class PreprocessConfig:
-    """
-    전처리 설정
-
-    HwpIdris PreprocessConfig 구현
-    """
-    max_workers: int = 20
-    output_dir: str = "Tests/AppV1/Preprocessed"
-    keep_original: bool = True
-    timeout: Optional[float] = 30.0
-
+from .types import PreprocessResult, PreprocessConfig
 
 def preprocess_single_file(
     file_path: str,
@@ -89,6 +57,9 @@ def preprocess_single_file(
     try:
         # 1. 클라이언트 초기화
         try:
+            # 워커 프로세스에서만 필요 (core.types → pydantic import를 부모에서 피함)
+            from core.automation_client import AutomationClient
+
             client = AutomationClient()
             hwp = client.hwp
         except Exception as e:
@@ -294,6 +265,34 @@ def preprocess_single_file(
                 pass
 
 
+def _legacy_progress(progress_callback: callable):
+    """버스 이벤트 → 이전 progress_callback 형식
+
+    인자 수는 시그니처로 한 번만 판단 (4인자를 받으면 4인자, 아니면 (completed, total)).
+    콜백 안에서 난 예외는 그대로 전파됩니다.
+    """
+    try:
+        inspect.signature(progress_callback).bind("preprocess", 0, 0, "")
+        four_args = True
+    except TypeError:
+        four_args = False
+    except ValueError:
+        four_args = True  # 시그니처를 알 수 없는 내장 함수 - 기본 형식
+
+    def on_event(event: ProgressEvent):
+        if not event.item:
+            return
+        if four_args:
+            status = "✅" if event.ok else "❌"
+            progress_callback(
+                "preprocess", event.completed, event.total, f"{status} {event.item[:30]}"
+            )
+        else:
+            progress_callback(event.completed, event.total)
+
+    return on_event
+
+
 class ParallelPreprocessor:
     """
     병렬 전처리기
@@ -320,23 +319,37 @@ class ParallelPreprocessor:
 
         HwpIdris preprocessParallel 구현
 
+        파일별 진행은 core.progress 버스에 "preprocess" 단계로 발행합니다.
+
         Args:
             file_paths: 전처리할 파일 경로 리스트
-            progress_callback: 진행률 콜백 함수 (completed, total)
+            progress_callback: (사용 중단) 진행률 콜백 (stage, completed, total, message)
+                또는 (completed, total) - 버스 이벤트를 이 형식으로 전달. progress_bus 구독 권장
 
         Returns:
             (성공 결과 리스트, 실패 결과 리스트)
         """
         total = len(file_paths)
         results = []
+        stage = progress_bus.stage("preprocess", total)
+
+        legacy = nullcontext()
+        if progress_callback is not None:
+            warnings.warn(
+                "progress_callback은 사용 중단 - "
+                'core.progress.progress_bus의 "preprocess" 단계를 구독하세요',
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            legacy = progress_bus.subscribed(
+                _legacy_progress(progress_callback), same_thread=True, stages=("preprocess",)
+            )
 
         submit_start = time.time()
-        print(f'\n병렬 전처리 시작 (워커: {self.config.max_workers}개)')
-        print(f'파일 수: {total}개')
-        print('-' * 70)
+        print(f"\n병렬 전처리 시작 (워커: {self.config.max_workers}개, 파일: {total}개)")
 
         # ProcessPoolExecutor 사용
-        with ProcessPoolExecutor(max_workers=self.config.max_workers) as executor:
+        with legacy, ProcessPoolExecutor(max_workers=self.config.max_workers) as executor:
             # 모든 작업 submit
             future_to_index = {}
             for i, file_path in enumerate(file_paths, 1):
@@ -347,70 +360,14 @@ class ParallelPreprocessor:
                     i
                 )
                 future_to_index[future] = (i, file_path)
+            stage.start(f"{total}개 제출 ({time.time() - submit_start:.2f}초)")
 
-            submit_time = time.time() - submit_start
-            print(f'✓ {total}개 작업을 병렬로 제출 완료 ({submit_time:.2f}초)')
-            print(f'  → 최대 {self.config.max_workers}개 파일이 동시에 처리됩니다')
-            print('-' * 70)
-
-            # 완료된 작업부터 수집
-            completed = 0
-            for future in as_completed(future_to_index.keys()):
-                index, file_path = future_to_index[future]
-
-                try:
-                    result = future.result(timeout=self.config.timeout)
-                    results.append(result)
-
-                    completed += 1
-                    progress = (completed / total) * 100
-
-                    # 진행률 출력 (EnhancedPreprocessor.idr: 페이지 삭제 정보 포함)
-                    status = '✅' if result.success else '❌'
-                    file_name = Path(file_path).name[:40]
-
-                    # 페이지 정보 표시
-                    page_info = ''
-                    if result.page_deleted:
-                        page_info = f'Pg:{result.initial_page_count}→{result.final_page_count} '
-
-                    # 오류 메시지 표시 (실패 시)
-                    error_msg = ''
-                    if not result.success and result.error_message:
-                        error_msg = f' | {result.error_message[:50]}'
-
-                    print(f'[{completed:2d}/{total}] ({progress:5.1f}%) {status} {file_name:40s} '
-                          f'{page_info}'
-                          f'Para:{result.para_count:3d} Rm:{result.removed_count:2d} '
-                          f'{result.processing_time:.2f}s{error_msg}')
-
-                    # UI 진행률 콜백 호출
-                    if progress_callback:
-                        try:
-                             # 4 args format
-                            progress_callback(
-                                'preprocess',
-                                completed,
-                                total,
-                                f"{status} {file_name[:30]}"
-                            )
-                        except TypeError:
-                            # 2 args format fallback
-                            progress_callback(completed, total)
-
-                except Exception as e:
-                    # 타임아웃 또는 에러
-                    result = PreprocessResult(
-                        success=False,
-                        original_path=file_path,
-                        preprocessed_path=None,
-                        para_count=0,
-                        removed_count=0,
-                        processing_time=0.0,
-                        error_message=f"Future error: {e}"
-                    )
-                    results.append(result)
-                    completed += 1
+            # 완료된 작업부터 수집 (구독자가 취소하면 남은 작업 취소)
+            try:
+                self._collect(future_to_index, results, stage)
+            except ProgressAbort:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
 
         print('-' * 70)
 
@@ -434,6 +391,39 @@ class ParallelPreprocessor:
 
         return success_results, failure_results
 
+    def _collect(self, future_to_index: dict, results: List[PreprocessResult], stage) -> None:
+        """완료 순서대로 결과 수집 + 진행 이벤트 발행"""
+        for future in as_completed(future_to_index.keys()):
+            index, file_path = future_to_index[future]
+
+            try:
+                result = future.result(timeout=self.config.timeout)
+            except Exception as e:
+                # 타임아웃 또는 에러
+                result = PreprocessResult(
+                    success=False,
+                    original_path=file_path,
+                    preprocessed_path=None,
+                    para_count=0,
+                    removed_count=0,
+                    processing_time=0.0,
+                    error_message=f"Future error: {e}",
+                )
+            results.append(result)
+
+            # EnhancedPreprocessor.idr: 페이지 삭제 정보 포함
+            detail = f"Para:{result.para_count} Rm:{result.removed_count}"
+            if result.page_deleted:
+                detail = f"Pg:{result.initial_page_count}→{result.final_page_count} " + detail
+            stage.advance(
+                Path(file_path).name,
+                latency=result.processing_time,
+                ok=result.success,
+                message=(
+                    result.error_message if not result.success and result.error_message else detail
+                ),
+            )
+
     def summarize(
         self,
         success_results: List[PreprocessResult],
@@ -15,6 +15,7 @@ from langgraph.graph import StateGraph, END, START, Send
 from typing_extensions import TypedDict
 
 from core.automation_client import AutomationClient
+from core.param_cache import parameter_cache
 from .types import ProblemFile
 from .column import convert_to_single_column
 from .para_scanner import scan_paras, remove_empty_paras
@@ -196,13 +197,15 @@ def merge_with_insertfile(state: WorkflowState) -> dict:
         for i, proc_file in enumerate(processed_files, 1):
             try:
                 # InsertFile
-                target_hwp.HAction.GetDefault("InsertFile", target_hwp.HParameterSet.HInsertFile.HSet)
-                insert_params = target_hwp.HParameterSet.HInsertFile
-                insert_params.HSet.SetItem("FileName", proc_file["processed_path"])
-                insert_params.HSet.SetItem("FileFormat", "HWP")
-                insert_params.HSet.SetItem("KeepSection", 0)
-
-                if target_hwp.HAction.Execute("InsertFile", insert_params.HSet):
+                if parameter_cache(target_hwp).execute(
+                    "InsertFile",
+                    "HInsertFile",
+                    items={
+                        "FileName": proc_file["processed_path"],
+                        "FileFormat": "HWP",
+                        "KeepSection": 0,
+                    },
+                ):
                     inserted += 1
 
                 # BreakColumn (마지막 제외)
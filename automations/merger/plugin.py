@@ -5,6 +5,7 @@ Merger Plugin
 """
 
 from automations import AutomationBase, PluginMetadata, register_plugin
+from automations.manifest import MERGER_METADATA
 from typing import Dict, Any
 
 
@@ -13,14 +14,7 @@ class MergerPlugin(AutomationBase):
     """문제 파일 병합 플러그인"""
 
     def get_metadata(self) -> PluginMetadata:
-        return PluginMetadata(
-            id="merger",
-            name="문제 파일 병합",
-            description="HWP 문제 파일들을 2단 편집 양식으로 병합",
-            version="1.0.0",
-            author="HwpAutomation Team",
-            icon="icons/merger.png"
-        )
+        return MERGER_METADATA
 
     def run(self, **kwargs) -> Dict[str, Any]:
         """
@@ -0,0 +1,114 @@
+"""
+header 정의 인터닝 및 ID 재매핑 캐시
+
+같은 교재 시리즈에서 나온 문항 수백 개를 합병하면 같은 charPr / paraPr /
+borderFill 정의가 파일마다 반복됩니다. StyleInterner는 합병 전체에서
+
+- 정의 해시 → 결과 ID 테이블 (각 정의는 결과 header에 한 번만)
+- 원본 header.xml 해시 → ID 매핑 캐시 (같은 header는 다시 파싱/병합하지 않음)
+
+를 유지하여, 이미 본 header를 가진 문항은 본문 참조 재매핑(O(참조 수))만
+수행하도록 합니다.
+"""
+
+import hashlib
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from typing import Dict, Optional, Union
+
+IdMap = Dict[str, Dict[str, str]]  # kind → {원본 ID: 새 ID}
+
+DIGEST_SIZE = 16
+
+
+def _feed(digest, element: ET.Element, skip_id: bool):
+    """태그, 속성(이름순), 공백이 아닌 텍스트만 해시에 넣음 (들여쓰기/tail 무시)"""
+    digest.update(b"<" + element.tag.encode("utf-8") + b"\x00")
+    for name, value in sorted(element.attrib.items()):
+        if skip_id and name == "id":
+            continue
+        digest.update(name.encode("utf-8") + b"=" + value.encode("utf-8") + b"\x00")
+    if element.text and element.text.strip():
+        digest.update(b"\x01" + element.text.encode("utf-8") + b"\x00")
+    for child in element:
+        _feed(digest, child, False)
+        if child.tail and child.tail.strip():
+            digest.update(b"\x01" + child.tail.encode("utf-8") + b"\x00")
+    digest.update(b">")
+
+
+def definition_digest(element: ET.Element) -> bytes:
+    """ID를 제외한 정의 내용의 해시
+
+    요소를 복사하거나 직렬화하지 않고 트리를 따라가며 해시합니다.
+    정의 자신의 tail과 공백뿐인 텍스트(들여쓰기)는 제외하므로
+    들여쓰기만 다른 header의 같은 정의는 같은 해시가 됩니다.
+    """
+    digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    _feed(digest, element, True)
+    return digest.digest()
+
+
+def header_digest(data: Union[bytes, memoryview]) -> bytes:
+    """원본 header.xml 바이트의 해시"""
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).digest()
+
+
+@dataclass
+class InternStats:
+    """인터닝 통계"""
+
+    interned: int = 0  # 결과 header에 추가된 정의
+    reused: int = 0  # 기존 정의로 대체된 정의
+    header_cache_hits: int = 0  # ID 매핑 캐시로 처리한 문항
+    header_cache_misses: int = 0
+
+
+class StyleInterner:
+    """정의 해시 테이블 + header ID 매핑 캐시 (합병 1회 단위)
+
+    캐시된 ID 매핑은 결과 header에 정의가 추가되기만 하고 바뀌지 않으므로
+    합병이 끝날 때까지 유효합니다.
+    """
+
+    def __init__(self):
+        self._tables: Dict[str, Dict[bytes, str]] = {}
+        self._header_maps: Dict[bytes, IdMap] = {}
+        self.stats = InternStats()
+
+    # ------------------------------------------------------------------
+    # 정의 테이블
+    # ------------------------------------------------------------------
+
+    def seed(self, kind: str, element: ET.Element):
+        """양식의 기존 정의 등록 (같은 정의가 여럿이면 첫 ID 사용)"""
+        self._tables.setdefault(kind, {}).setdefault(definition_digest(element), element.get("id"))
+
+    def lookup(self, kind: str, element: ET.Element) -> Optional[str]:
+        """같은 정의의 결과 ID (없으면 None)"""
+        found = self._tables.get(kind, {}).get(definition_digest(element))
+        if found is not None:
+            self.stats.reused += 1
+        return found
+
+    def intern(self, kind: str, element: ET.Element) -> str:
+        """새 정의 등록 (element의 id는 이미 결과 ID여야 함)"""
+        self._tables.setdefault(kind, {})[definition_digest(element)] = element.get("id")
+        self.stats.interned += 1
+        return element.get("id")
+
+    # ------------------------------------------------------------------
+    # header ID 매핑 캐시
+    # ------------------------------------------------------------------
+
+    def cached_map(self, digest: bytes) -> Optional[IdMap]:
+        """같은 header를 가진 문항의 ID 매핑 (복사본)"""
+        id_maps = self._header_maps.get(digest)
+        if id_maps is None:
+            self.stats.header_cache_misses += 1
+            return None
+        self.stats.header_cache_hits += 1
+        return dict(id_maps)
+
+    def store_map(self, digest: bytes, id_maps: IdMap):
+        self._header_maps[digest] = dict(id_maps)
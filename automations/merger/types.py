@@ -44,6 +44,42 @@ class MergeConfig:
     use_template: bool  # True: 양식 사용, False: 새 문서 생성
 
 
+@dataclass
+class PreprocessResult:
+    """
+    전처리 작업 결과
+
+    HwpIdris PreprocessResult 구현
+    Specs/HwpIdris/AppV1/EnhancedPreprocessor.idr 확장
+    """
+
+    success: bool
+    original_path: str
+    preprocessed_path: Optional[str]
+    para_count: int
+    removed_count: int
+    processing_time: float
+    error_message: Optional[str] = None
+    # Enhanced fields (EnhancedPreprocessor.idr)
+    initial_page_count: int = 0
+    final_page_count: int = 0
+    page_deleted: bool = False
+
+
+@dataclass
+class PreprocessConfig:
+    """
+    전처리 설정
+
+    HwpIdris PreprocessConfig 구현
+    """
+
+    max_workers: int = 20
+    output_dir: str = "Tests/AppV1/Preprocessed"
+    keep_original: bool = True
+    timeout: Optional[float] = 30.0
+
+
 def expected_page_count(problem_count: int) -> int:
     """
     예상 페이지 수 계산
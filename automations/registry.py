@@ -2,19 +2,38 @@
 Plugin Registry
 
 플러그인 등록 및 관리
+
+- declare(): 매니페스트(메타데이터 + "모듈:클래스")만 등록, import는 첫 get_plugin() 때
+- register(): 클래스 직접 등록 (@register_plugin, 매니페스트에 없는 플러그인)
 """
 
-from typing import Dict, List, Optional, Type
+import importlib
+import sys
+from typing import Dict, Iterable, List, Optional, Type
+
 from .base import AutomationBase, PluginMetadata
+from .manifest import BUILTIN_PLUGINS, PluginManifest
 
 
 class PluginRegistry:
     """플러그인 레지스트리"""
 
     def __init__(self):
+        self._manifests: Dict[str, PluginManifest] = {}
+        self._metadata: Dict[str, PluginMetadata] = {}
         self._plugins: Dict[str, Type[AutomationBase]] = {}
         self._instances: Dict[str, AutomationBase] = {}
 
+    def declare(self, manifest: PluginManifest):
+        """
+        매니페스트로 플러그인 선언 (모듈은 import하지 않음)
+
+        Args:
+            manifest: 메타데이터와 "모듈:클래스" 위치
+        """
+        self._manifests[manifest.id] = manifest
+        self._metadata.setdefault(manifest.id, manifest.metadata)
+
     def register(self, plugin_class: Type[AutomationBase]):
         """
         플러그인 등록
@@ -22,12 +41,40 @@ class PluginRegistry:
         Args:
             plugin_class: AutomationBase를 상속한 플러그인 클래스
         """
-        # 임시 인스턴스로 메타데이터 가져오기
-        temp_instance = plugin_class()
-        metadata = temp_instance.get_metadata()
+        plugin_id = self._declared_id(plugin_class)
+        if plugin_id is None:
+            # 매니페스트에 없으면 임시 인스턴스로 메타데이터 가져오기
+            metadata = plugin_class().get_metadata()
+            plugin_id = metadata.id
+            self._metadata[plugin_id] = metadata
+
+        self._plugins[plugin_id] = plugin_class
+
+    def _declared_id(self, plugin_class: Type[AutomationBase]) -> Optional[str]:
+        target = f"{plugin_class.__module__}:{plugin_class.__qualname__}"
+        for manifest in self._manifests.values():
+            if manifest.target == target:
+                return manifest.id
+        return None
+
+    def _load_class(self, plugin_id: str) -> Optional[Type[AutomationBase]]:
+        """선언된 플러그인 모듈 import (처음 한 번)"""
+        if plugin_id in self._plugins:
+            return self._plugins[plugin_id]
+
+        manifest = self._manifests.get(plugin_id)
+        if manifest is None:
+            return None
+
+        try:
+            module = importlib.import_module(manifest.module)
+            plugin_class = getattr(module, manifest.class_name)
+        except (ImportError, AttributeError) as e:
+            print(f"[WARN] Failed to load {manifest.target}: {e}", file=sys.stderr)
+            return None
 
-        self._plugins[metadata.id] = plugin_class
-        print(f"Registered plugin: {metadata.name} (v{metadata.version})")
+        self._plugins[plugin_id] = plugin_class
+        return plugin_class
 
     def get_plugin(self, plugin_id: str) -> Optional[AutomationBase]:
         """
@@ -37,32 +84,40 @@ class PluginRegistry:
             plugin_id: 플러그인 ID
 
         Returns:
-            플러그인 인스턴스 또는 None
+            플러그인 인스턴스 또는 None (없는 ID, import 실패)
         """
-        if plugin_id not in self._plugins:
-            return None
-
         # 싱글톤 패턴
         if plugin_id not in self._instances:
-            self._instances[plugin_id] = self._plugins[plugin_id]()
+            plugin_class = self._load_class(plugin_id)
+            if plugin_class is None:
+                return None
+            self._instances[plugin_id] = plugin_class()
 
         return self._instances[plugin_id]
 
-    def get_all_metadata(self) -> List[PluginMetadata]:
-        """등록된 모든 플러그인의 메타데이터 반환"""
-        metadata_list = []
-        for plugin_class in self._plugins.values():
-            temp_instance = plugin_class()
-            metadata_list.append(temp_instance.get_metadata())
-        return metadata_list
+    def get_metadata(self, plugin_id: str) -> Optional[PluginMetadata]:
+        return self._metadata.get(plugin_id)
+
+    def get_all_metadata(self, exclude: Iterable[str] = ()) -> List[PluginMetadata]:
+        """등록된 모든 플러그인의 메타데이터 반환 (플러그인 모듈 import 없음)"""
+        excluded = set(exclude)
+        return [
+            metadata for plugin_id, metadata in self._metadata.items() if plugin_id not in excluded
+        ]
+
+    def is_loaded(self, plugin_id: str) -> bool:
+        """플러그인 클래스가 import되었는지 여부"""
+        return plugin_id in self._plugins
 
     def list_plugins(self) -> List[str]:
         """등록된 플러그인 ID 목록"""
-        return list(self._plugins.keys())
+        return list(self._metadata.keys())
 
 
-# 전역 레지스트리
+# 전역 레지스트리 (내장 플러그인은 매니페스트로 선언)
 _global_registry = PluginRegistry()
+for _manifest in BUILTIN_PLUGINS:
+    _global_registry.declare(_manifest)
 
 
 def get_registry() -> PluginRegistry:
@@ -6,6 +6,8 @@ Idris2 명세: Specs/Separator/Separator/FileWriter.idr
 
 from pathlib import Path
 from typing import List, TYPE_CHECKING, Union
+
+from core.progress import progress_bus
 from .types import (
     GroupInfo, NamingRule, OutputFormat,
     WriteResult, BatchWriteResult, ProblemInfo
@@ -59,6 +61,9 @@ class FileWriter:
         # 문제 번호로 인덱싱
         problem_dict = {p.number.value: p for p in problems}
 
+        stage = progress_bus.stage("separate", len(groups))
+        stage.start(str(self.output_dir))
+
         for group in groups:
             filename = naming_rule.generate_group_filename(group)
             filepath = self.output_dir / filename
@@ -78,9 +83,11 @@ class FileWriter:
                 success_count += 1
                 output_files.append(str(filepath))
                 self.log(f"[OK] {filename}")
+                stage.advance(filename)
             else:
                 failed_count += 1
                 self.log(f"[FAIL] {filename}: {result.error}")
+                stage.advance(filename, ok=False, message=str(result.error or ""))
 
         self.log(f"저장 완료: {success_count}개 성공, {failed_count}개 실패")
 
@@ -21,7 +21,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from core.hwp_extractor import open_hwp, iter_note_blocks
 from core.hwp_extractor_copypaste import extract_block_copypaste
 from core.hwp_extractor_parallel import extract_blocks_parallel
-
+from core.progress import progress_bus
 
 class HwpHwpExtractor:
     """HWP → HWP 블록 추출기
@@ -139,6 +139,8 @@ class HwpHwpExtractor:
         self.log("\n3단계: 순차 추출 시작\n")
 
         results = []
+        stage = progress_bus.stage("separate", len(groups))
+        stage.start(Path(self.config.input_path).name)
 
         with open_hwp(self.config.input_path) as hwp:
             for group_idx, group in enumerate(groups, 1):
@@ -148,18 +150,21 @@ class HwpHwpExtractor:
                     last_block = all_blocks[group[-1]]
 
                     if not first_block or not last_block:
-                        self.log(f"[ERROR] 그룹 {group_idx}: 블록 정보 없음")
                         results.append((False, None))
+                        self.log(f"[ERROR] 그룹 {group_idx}: 블록 정보 없음")
+                        stage.advance(f"그룹 {group_idx}", ok=False, message="블록 정보 없음")
                         continue
 
                     merged_block = (first_block[0], last_block[1])
                 except IndexError as e:
-                    self.log(f"[ERROR] 그룹 {group_idx}: 인덱스 오류 - {e}")
                     results.append((False, None))
+                    self.log(f"[ERROR] 그룹 {group_idx}: 인덱스 오류 - {e}")
+                    stage.advance(f"그룹 {group_idx}", ok=False, message=f"인덱스 오류 - {e}")
                     continue
                 except Exception as e:
-                    self.log(f"[ERROR] 그룹 {group_idx}: 블록 병합 실패 - {e}")
                     results.append((False, None))
+                    self.log(f"[ERROR] 그룹 {group_idx}: 블록 병합 실패 - {e}")
+                    stage.advance(f"그룹 {group_idx}", ok=False, message=f"블록 병합 실패 - {e}")
                     continue
 
                 # 출력 파일명 (NamingRule 사용)
@@ -179,12 +184,12 @@ class HwpHwpExtractor:
                 )
 
                 if success and output_file.exists():
-                    file_size = output_file.stat().st_size
-                    self.log(f"[OK] 그룹 {group_idx}: {file_size:,} bytes")
                     results.append((True, output_file))
+                    stage.advance(filename, message=f"{output_file.stat().st_size:,} bytes")
                 else:
-                    self.log(f"[FAIL] 그룹 {group_idx}: 실패")
                     results.append((False, None))
+                    self.log(f"[FAIL] 그룹 {group_idx}: 실패")
+                    stage.advance(filename, ok=False)
 
         # 결과 변환
         success_count = sum(1 for ok, _ in results if ok)
@@ -6,9 +6,8 @@ Idris2 명세: Specs/Separator/Separator/HwpParser.idr
 """
 
 import contextlib
-import pythoncom
-import win32com.client as win32
 from typing import List, Tuple, Generator
+from core.com_backend import dispatch_hwp, co_initialize, co_uninitialize
 from .types import EndNoteInfo, EndNoteNumber, ElementPosition
 
 # list, para, pos
@@ -32,11 +31,11 @@ class HwpParser:
     @contextlib.contextmanager
     def _open_hwp(self):
         """HWP 파일 열기 (컨텍스트 매니저)"""
-        pythoncom.CoInitialize()
+        co_initialize()
         hwp = None
 
         try:
-            hwp = win32.DispatchEx("HwpFrame.HwpObject")
+            hwp = dispatch_hwp()
             hwp.RegisterModule("FilePathCheckDLL", "FilePathCheckerModule")
 
             # 읽기 전용 + 편집 락 해제 + 대화상자 생략
@@ -52,7 +51,7 @@ class HwpParser:
                     hwp.XHwpDocuments.Active_XHwpDocument.Close(False)
                     hwp.Quit()
                 finally:
-                    pythoncom.CoUninitialize()
+                    co_uninitialize()
 
     def parse(self) -> List[EndNoteInfo]:
         """HWP 파일에서 EndNote 위치 추출 (iter_note_blocks 패턴)
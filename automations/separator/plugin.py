@@ -11,6 +11,7 @@ from typing import Dict, Any
 
 from automations.base import AutomationBase, PluginMetadata
 from automations.registry import register_plugin
+from automations.manifest import SEPARATOR_METADATA
 
 from .separator import separate_problems
 from .types import SeparatorConfig, OnePerFile, GroupByCount, InputFormat, OutputFormat
@@ -22,13 +23,7 @@ class SeparatorPlugin(AutomationBase):
 
     def get_metadata(self) -> PluginMetadata:
         """플러그인 메타데이터"""
-        return PluginMetadata(
-            id="separator",
-            name="문제 분리기 (Separator)",
-            description="HWP/HWPX 파일에서 EndNote 기반으로 문제를 분리합니다 (병렬 처리 지원)",
-            version="2.0.0",
-            author="Claude"
-        )
+        return SEPARATOR_METADATA
 
     def has_ui(self) -> bool:
         """UI 지원"""
@@ -66,6 +66,15 @@ class Separator:
             self.log(f"ERROR: 지원하지 않는 파일 형식: {file_ext}")
             return BatchWriteResult(0, 0, 0, 0, [])
 
+        try:
+            return self._run_parsed(parser)
+        finally:
+            # HWPX: 공유 매핑 해제 (HWP 파서는 COM 세션을 스스로 정리)
+            if isinstance(parser, HwpxParser):
+                parser.close()
+
+    def _run_parsed(self, parser) -> BatchWriteResult:
+        """파싱 이후 단계 (Extract → Write → Complete)"""
         endnotes = parser.parse()
 
         if not endnotes:
@@ -4,10 +4,11 @@ XML Parser - HWPX 파일 파싱
 Idris2 명세: Specs/Separator/Separator/XmlParser.idr
 """
 
-import zipfile
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import List, Optional, Tuple
+
+from core.hwpx_package import HwpxPackage, open_package, SECTION_PATH_FORMAT
 from .types import (
     EndNoteInfo, EndNoteNumber, ElementPosition,
     InputFormat, ParaType
@@ -18,7 +19,7 @@ class HwpxParser:
     """HWPX 파서
 
     Idris2 ParseStep 구현:
-    - OpenZip: ZIP 파일 열기
+    - OpenZip: ZIP 파일 열기 (core.hwpx_package 공유 매핑)
     - ReadSection: section0.xml 읽기
     - ParseXml: XML 파싱
     - FindEndNotes: EndNote 요소 찾기
@@ -31,6 +32,7 @@ class HwpxParser:
         self.tree: Optional[ET.ElementTree] = None
         self.root: Optional[ET.Element] = None
         self.endnotes: List[EndNoteInfo] = []
+        self.package: Optional[HwpxPackage] = None
 
     def log(self, message: str):
         """로그 출력"""
@@ -72,20 +74,39 @@ class HwpxParser:
         return self.endnotes
 
     def _open_zip(self) -> bool:
-        """ZIP 파일 열기 (Idris2: OpenZip)"""
-        return self.hwpx_path.exists() and zipfile.is_zipfile(self.hwpx_path)
+        """ZIP 파일 열기 (Idris2: OpenZip)
+
+        파일을 한 번만 mmap 하고, 같은 파일을 여는 다른 모듈과 매핑을 공유합니다.
+        """
+        if self.package is not None and not self.package.closed:
+            return True
+        try:
+            self.package = open_package(self.hwpx_path)
+            return True
+        except (FileNotFoundError, ValueError) as e:
+            self.log(f"ZIP 열기 실패: {e}")
+            return False
 
     def _read_section(self) -> Optional[str]:
         """section0.xml 읽기 (Idris2: ReadSection)"""
         try:
-            with zipfile.ZipFile(self.hwpx_path, 'r') as zf:
-                # Contents/section0.xml 읽기
-                with zf.open('Contents/section0.xml') as f:
-                    return f.read().decode('utf-8')
+            return self.package.read_text(SECTION_PATH_FORMAT.format(0))
         except Exception as e:
             self.log(f"섹션 읽기 실패: {e}")
             return None
 
+    def close(self):
+        """패키지 매핑 해제"""
+        if self.package is not None:
+            self.package.close()
+            self.package = None
+
+    def __enter__(self) -> "HwpxParser":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def _parse_xml(self, xml_content: str):
         """XML 파싱 (Idris2: ParseXml)"""
         self.tree = ET.ElementTree(ET.fromstring(xml_content))
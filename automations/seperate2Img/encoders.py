@@ -0,0 +1,227 @@
+"""
+이미지 인코더 - 형식/압축 설정을 골라 저장
+
+문제 이미지 수천 장을 저장할 때 인코딩(PNG zlib, JPEG)이 CPU 시간의 큰 몫입니다.
+PIL 기본값(PNG compress_level 6, JPEG quality 95)은 배포마다 맞지 않을 수 있어
+설정을 ImageEncoder 하나로 묶고, 자주 쓰는 조합을 프리셋으로 둡니다.
+
+- png-fast: zlib 1단계 (기본 6보다 인코딩이 빠르고 파일은 조금 큼)
+- png-small: zlib 9단계 + optimize (느리지만 가장 작은 무손실 PNG)
+- png-gray16: 거의 흑백인 페이지는 16단계 회색 팔레트(4비트 PNG)로 - 글자 안티앨리어싱은 유지
+    색이 있는 그림(채널 차이가 큰 픽셀이 일정 비율 이상)은 팔레트 없이 저장
+- webp / webp-lossless: WebP 손실(품질 90) / 무손실
+- png, jpg: 기존 동작 (PIL 기본 PNG, JPEG quality)
+
+benchmark_encoders: 같은 이미지들을 설정별로 메모리에 인코딩해 이미지당 바이트, 인코딩 ms,
+원본과의 평균 오차를 잰다 (Tests/Benchmarks/bench_encoders.py)
+"""
+
+import io
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+from PIL import Image
+
+ENCODER_FORMATS = ("png", "jpg", "webp")
+_PIL_FORMATS = {"png": "PNG", "jpg": "JPEG", "webp": "WEBP"}
+
+# 흑백 판정: 1/4로 줄인 이미지에서 채널 최대-최소 차이가 MONO_TOLERANCE를 넘는 픽셀이
+# MONO_MAX_COLOR_FRACTION 이하이면 거의 흑백 (빨간 채점 표시 몇 개 정도는 허용)
+MONO_TOLERANCE = 24
+MONO_MAX_COLOR_FRACTION = 0.002
+
+
+@dataclass(frozen=True)
+class ImageEncoder:
+    """
+    인코딩 설정
+
+    Attributes:
+        format: png, jpg, webp
+        compress_level: PNG zlib 단계 0~9 (PIL 기본 6)
+        optimize: PNG 필터/zlib 설정 탐색, JPEG 허프만 테이블 최적화
+        palette_colors: PNG만, 0보다 크면 거의 흑백인 이미지를 이 수의 회색 단계 팔레트로 (2~256)
+        quality: JPEG/WebP 품질 (WebP 무손실이면 압축 노력)
+        lossless: WebP 무손실
+        method: WebP 속도/크기 (0 빠름 ~ 6 작음)
+    """
+
+    format: str = "png"
+    compress_level: int = 6
+    optimize: bool = False
+    palette_colors: int = 0
+    quality: int = 95
+    lossless: bool = False
+    method: int = 4
+
+    def __post_init__(self):
+        if self.format not in ENCODER_FORMATS:
+            raise ValueError(f"지원하지 않는 형식: {self.format} ({', '.join(ENCODER_FORMATS)})")
+        if not 0 <= self.compress_level <= 9:
+            raise ValueError(f"compress_level은 0~9: {self.compress_level}")
+        if self.palette_colors and (self.format != "png" or not 2 <= self.palette_colors <= 256):
+            raise ValueError(f"palette_colors는 PNG에서 2~256: {self.palette_colors}")
+        if not 1 <= self.quality <= 100:
+            raise ValueError(f"quality는 1~100: {self.quality}")
+        if not 0 <= self.method <= 6:
+            raise ValueError(f"method는 0~6: {self.method}")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def save_options(self) -> Dict[str, Any]:
+        """PIL Image.save 인자"""
+        if self.format == "png":
+            return {"compress_level": self.compress_level, "optimize": self.optimize}
+        if self.format == "jpg":
+            return {"quality": self.quality, "optimize": self.optimize}
+        return {"quality": self.quality, "lossless": self.lossless, "method": self.method}
+
+    def prepare(self, image: Image.Image) -> Image.Image:
+        """형식에 맞게 변환
+
+        JPEG는 알파 제거/1비트→회색조, 팔레트 설정이면 흑백 페이지를 회색 팔레트로
+        """
+        if self.format == "jpg" and image.mode in ("RGBA", "LA", "P"):
+            return image.convert("RGB")
+        if image.mode == "1":
+            return image.convert("L") if self.format == "jpg" else image  # PNG는 1비트 그대로
+        if self.palette_colors and is_mostly_monochrome(image):
+            return gray_palette(image, self.palette_colors)
+        return image
+
+    def encode(self, image: Image.Image, target: Union[Path, io.BytesIO]):
+        self.prepare(image).save(target, _PIL_FORMATS[self.format], **self.save_options())
+
+
+EncoderSpec = Union[ImageEncoder, str, Dict[str, Any]]
+
+ENCODER_PRESETS: Dict[str, ImageEncoder] = {
+    "png": ImageEncoder("png"),
+    "png-fast": ImageEncoder("png", compress_level=1),
+    "png-small": ImageEncoder("png", compress_level=9, optimize=True),
+    "png-gray16": ImageEncoder("png", palette_colors=16),
+    "jpg": ImageEncoder("jpg"),
+    "webp": ImageEncoder("webp", quality=90),
+    "webp-lossless": ImageEncoder("webp", quality=50, lossless=True, method=2),
+}
+
+
+def resolve_encoder(spec: EncoderSpec) -> ImageEncoder:
+    """프리셋 이름, dict(JSON) 또는 ImageEncoder → ImageEncoder"""
+    if isinstance(spec, ImageEncoder):
+        return spec
+    if isinstance(spec, str):
+        if spec not in ENCODER_PRESETS:
+            raise ValueError(f"알 수 없는 인코더 프리셋: {spec} ({', '.join(ENCODER_PRESETS)})")
+        return ENCODER_PRESETS[spec]
+    return ImageEncoder(**spec)
+
+
+def default_encoder(format: str = "png", quality: int = 95) -> ImageEncoder:
+    """기존 save_image 동작 (PIL 기본 PNG, JPEG quality)"""
+    format = format.lower()
+    if format == "jpg":
+        return ImageEncoder("jpg", quality=quality)
+    if format == "webp":
+        return ImageEncoder("webp", quality=quality)
+    return ENCODER_PRESETS["png"]
+
+
+# ============================================================================
+# 회색 팔레트
+# ============================================================================
+
+
+def is_mostly_monochrome(image: Image.Image) -> bool:
+    """색이 거의 없는 이미지인지 (회색조 모드는 항상 True)"""
+    if image.mode in ("1", "L", "LA"):
+        return True
+    if image.mode not in ("RGB", "RGBA"):
+        return False
+    pixels = np.asarray(image.convert("RGB").reduce(4) if image.mode == "RGBA" else image.reduce(4))
+    spread = pixels.max(axis=2).astype(np.int16) - pixels.min(axis=2)
+    return np.count_nonzero(spread > MONO_TOLERANCE) <= MONO_MAX_COLOR_FRACTION * spread.size
+
+
+def gray_palette(image: Image.Image, colors: int) -> Image.Image:
+    """
+    회색 colors단계 팔레트 이미지 (균등 분할, 흰색/검정은 그대로)
+
+    PNG 저장 시 팔레트 크기에 따라 1/2/4/8비트로 기록됩니다.
+    """
+    gray = image if image.mode == "L" else image.convert("L")
+    step = 255 / (colors - 1)
+    indexed = gray.point([int(value / step + 0.5) for value in range(256)])
+    palette_image = Image.frombytes("P", gray.size, indexed.tobytes())
+    levels = [int(index * step + 0.5) for index in range(colors)]
+    palette_image.putpalette([level for level in levels for _ in range(3)])
+    return palette_image
+
+
+# ============================================================================
+# 벤치마크
+# ============================================================================
+
+
+@dataclass
+class EncoderBenchmark:
+    """설정 1개의 측정 결과"""
+
+    name: str
+    images: int
+    bytes_per_image: float
+    encode_ms: float
+    mean_error: float  # 원본과의 평균 절대 오차 (0~255, 회색조 기준)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def benchmark_encoders(
+    images: Sequence[Image.Image],
+    encoders: Optional[Mapping[str, EncoderSpec]] = None,
+    repeat: int = 1,
+) -> List[EncoderBenchmark]:
+    """
+    설정별 인코딩 측정 (메모리 버퍼에 저장 - 디스크 시간 제외)
+
+    Args:
+        images: 측정할 이미지 (실제 배포의 문제 이미지)
+        encoders: {이름: 설정} (None이면 ENCODER_PRESETS 전부)
+        repeat: 반복 횟수 (가장 빠른 회차 기준)
+    """
+    encoders = encoders or ENCODER_PRESETS
+    references = [np.asarray(image.convert("L"), dtype=np.int16) for image in images]
+    results = []
+    for name, spec in encoders.items():
+        encoder = resolve_encoder(spec)
+        best = float("inf")
+        for _ in range(max(1, repeat)):
+            buffers = []
+            start = time.perf_counter()
+            for image in images:
+                buffer = io.BytesIO()
+                encoder.encode(image, buffer)
+                buffers.append(buffer)
+            best = min(best, time.perf_counter() - start)
+
+        errors = []
+        for buffer, reference in zip(buffers, references):
+            buffer.seek(0)
+            decoded = np.asarray(Image.open(buffer).convert("L"), dtype=np.int16)
+            errors.append(float(np.abs(decoded - reference).mean()))
+        count = max(1, len(images))
+        results.append(
+            EncoderBenchmark(
+                name=name,
+                images=len(images),
+                bytes_per_image=sum(buffer.getbuffer().nbytes for buffer in buffers) / count,
+                encode_ms=best * 1000 / count,
+                mean_error=sum(errors) / count,
+            )
+        )
+    return results
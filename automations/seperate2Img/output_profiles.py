@@ -0,0 +1,278 @@
+"""
+출력 프로필 - 한 번 렌더링해서 여러 크기/형식으로 저장
+
+문제마다 원본 PNG, 웹용 JPEG, 썸네일이 필요할 때 convert_pdfs_to_images를 DPI별로
+여러 번 돌리면 같은 페이지를 여러 번 래스터화합니다. 여기서는:
+
+- 페이지를 프로필 중 가장 높은 DPI로 한 번만 렌더링 (마스터)
+    - 여백 제거 여부가 섞여 있으면 같은 비트맵에서 전체/잘린 마스터를 둘 다 만듦
+- 나머지 크기는 마스터를 축소 (BOX = 면적 평균, Pillow 축소 필터 중 가장 빠름)
+- 축소 + 인코딩(PNG zlib / JPEG / WebP)은 스레드 풀에서 (PIL이 GIL을 놓는 구간)
+- 프로필마다 인코더 설정 (encoders.py 프리셋 이름 또는 dict, 예: 원본은 png-gray16, 웹은 webp)
+- 프로필마다 색 모드 (rgb/gray/bilevel): 모든 프로필이 회색조면 마스터도 pdfium 회색조로 렌더링,
+    bilevel 임계값은 축소한 뒤에 적용 (작은 크기에서도 글자 획이 끊기지 않게)
+
+프로필별 출력 폴더: output_dir/<name>/ (name이 ""이면 output_dir), 파일 이름 규칙은 page_image_path
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from PIL import Image
+
+from .encoders import ENCODER_FORMATS, EncoderSpec, ImageEncoder, default_encoder, resolve_encoder
+from .pdf_to_image import (
+    BILEVEL_THRESHOLD,
+    COLOR_MODES,
+    apply_color_mode,
+    page_image_path,
+    render_page_image,
+    save_image,
+    save_page_image,
+)
+from .trim import DEFAULT_TRIM_MODE, TRIM_PADDING, trim_bitmap
+
+# dpi 없이 max_width만 있는 프로필들의 마스터 해상도
+DEFAULT_PROFILE_DPI = 300
+
+# 축소 필터: 2125→1200px 기준 BOX 17ms, BILINEAR 27ms, LANCZOS 57ms
+# (텍스트 페이지는 pdfium 안티앨리어싱이 이미 면적 평균이라 BOX로 충분)
+DOWNSCALE_RESAMPLE = Image.Resampling.BOX
+
+# 프로세스별 인코더 스레드 수
+ENCODER_THREADS = 4
+
+PROFILE_FORMATS = ENCODER_FORMATS
+
+
+@dataclass(frozen=True)
+class OutputProfile:
+    """
+    출력 프로필 1개
+
+    Attributes:
+        name: 출력 하위 폴더 이름 ("": output_dir 바로 아래)
+        format: png, jpg, webp ("" 이면 인코더 형식, 인코더도 없으면 png)
+        dpi: 해상도 (None이면 마스터 해상도)
+        max_width: 최대 폭(픽셀) - 넘으면 비율 유지 축소 (dpi와 함께 쓰면 둘 다 적용)
+        quality: JPEG/WebP 품질 (인코더가 없을 때)
+        trim: 여백 제거
+        encoder: 인코딩 설정 (encoders.ENCODER_PRESETS 이름, dict 또는 ImageEncoder)
+        color_mode: rgb, gray, bilevel (pdf_to_image.COLOR_MODES)
+        threshold: bilevel 임계값 (이보다 밝으면 흰색)
+    """
+
+    name: str
+    format: str = ""
+    dpi: Optional[int] = None
+    max_width: Optional[int] = None
+    quality: int = 95
+    trim: bool = False
+    encoder: Optional[EncoderSpec] = None
+    color_mode: str = "rgb"
+    threshold: int = BILEVEL_THRESHOLD
+
+    def __post_init__(self):
+        if self.encoder is not None:
+            object.__setattr__(self, "encoder", resolve_encoder(self.encoder))
+            if self.format and self.format.lower() != self.encoder.format:
+                raise ValueError(
+                    f"형식({self.format})과 인코더 형식({self.encoder.format})이 다릅니다"
+                )
+        object.__setattr__(
+            self,
+            "format",
+            (self.format or (self.encoder.format if self.encoder else "png")).lower(),
+        )
+        if self.format not in PROFILE_FORMATS:
+            raise ValueError(f"지원하지 않는 형식: {self.format} ({', '.join(PROFILE_FORMATS)})")
+        if self.color_mode not in COLOR_MODES:
+            raise ValueError(f"지원하지 않는 색 모드: {self.color_mode} ({', '.join(COLOR_MODES)})")
+        if not 0 <= self.threshold <= 255:
+            raise ValueError(f"threshold는 0~255: {self.threshold}")
+        if self.dpi is not None and self.dpi <= 0:
+            raise ValueError(f"dpi는 양수여야 합니다: {self.dpi}")
+        if self.max_width is not None and self.max_width <= 0:
+            raise ValueError(f"max_width는 양수여야 합니다: {self.max_width}")
+        if not 1 <= self.quality <= 100:
+            raise ValueError(f"quality는 1~100: {self.quality}")
+        if Path(self.name).name != self.name or self.name in (".", ".."):
+            raise ValueError(f"프로필 이름은 폴더 이름 하나여야 합니다: {self.name!r}")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @property
+    def image_encoder(self) -> ImageEncoder:
+        return self.encoder or default_encoder(self.format, self.quality)
+
+
+ProfileSpec = Union[OutputProfile, Dict[str, Any]]
+
+
+def parse_output_profiles(specs: Sequence[ProfileSpec]) -> List[OutputProfile]:
+    """OutputProfile 또는 dict(JSON) 목록 → OutputProfile 목록 (이름 중복 불가)"""
+    profiles = [
+        spec if isinstance(spec, OutputProfile) else OutputProfile(**spec) for spec in specs
+    ]
+    if not profiles:
+        raise ValueError("출력 프로필이 비어 있습니다")
+    names = [profile.name for profile in profiles]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"프로필 이름 중복: {duplicates}")
+    return profiles
+
+
+def single_profile(
+    dpi: int,
+    format: str,
+    trim_whitespace: bool,
+    encoder: Optional[EncoderSpec] = None,
+    color_mode: str = "rgb",
+) -> List[OutputProfile]:
+    """기존 (dpi, format, trim_whitespace) 인자 = output_dir에 저장하는 프로필 1개
+
+    인코더가 있으면 형식은 인코더를 따름
+    """
+    if encoder is not None:
+        return [
+            OutputProfile("", dpi=dpi, trim=trim_whitespace, encoder=encoder, color_mode=color_mode)
+        ]
+    return [
+        OutputProfile(
+            "", format=format.lower(), dpi=dpi, trim=trim_whitespace, color_mode=color_mode
+        )
+    ]
+
+
+def master_dpi(profiles: Sequence[OutputProfile]) -> int:
+    """마스터 렌더링 해상도 = 프로필 중 가장 높은 DPI"""
+    return max((profile.dpi for profile in profiles if profile.dpi), default=DEFAULT_PROFILE_DPI)
+
+
+def profile_dir(output_dir: Path, profile: OutputProfile) -> Path:
+    return output_dir / profile.name if profile.name else output_dir
+
+
+def profile_image_path(
+    output_dir: Path, profile: OutputProfile, output_stem: str, index: int, n_pages: int
+) -> Path:
+    return page_image_path(
+        profile_dir(output_dir, profile), output_stem, index, n_pages, profile.format
+    )
+
+
+def prepare_profile_dirs(output_dir: Path, profiles: Sequence[OutputProfile]):
+    for profile in profiles:
+        profile_dir(output_dir, profile).mkdir(parents=True, exist_ok=True)
+
+
+def scaled_size(size: Tuple[int, int], ratio: float, max_width: Optional[int]) -> Tuple[int, int]:
+    """마스터 크기 × ratio, max_width를 넘으면 폭에 맞춤 (최소 1픽셀)"""
+    width, height = size
+    if max_width and width * ratio > max_width:
+        ratio = max_width / width
+    if ratio >= 1.0:
+        return size
+    return max(1, round(width * ratio)), max(1, round(height * ratio))
+
+
+def scale_image(master: Image.Image, size: Tuple[int, int]) -> Image.Image:
+    if size == master.size:
+        return master
+    return master.resize(size, DOWNSCALE_RESAMPLE)
+
+
+# ============================================================================
+# 인코더 스레드 풀 (프로세스별)
+# ============================================================================
+
+_encoders: Optional[Tuple[int, ThreadPoolExecutor]] = None
+_encoders_lock = threading.Lock()
+
+
+def _encoder_pool() -> ThreadPoolExecutor:
+    """프로세스별 인코더 풀 - fork된 렌더 워커는 부모의 (스레드 없는) 풀을 쓰지 않음"""
+    global _encoders
+    with _encoders_lock:
+        if _encoders is None or _encoders[0] != os.getpid():
+            _encoders = (
+                os.getpid(),
+                ThreadPoolExecutor(max_workers=ENCODER_THREADS, thread_name_prefix="encoder"),
+            )
+        return _encoders[1]
+
+
+# ============================================================================
+# 페이지 저장
+# ============================================================================
+
+
+def render_masters(
+    page,
+    dpi: int,
+    trims: Sequence[bool],
+    trim_mode: str = DEFAULT_TRIM_MODE,
+    grayscale: bool = False,
+) -> Dict[bool, Image.Image]:
+    """마스터 이미지 {여백 제거 여부: 이미지} - 렌더링은 한 번 (grayscale: pdfium 회색조)"""
+    scale = dpi / 72.0
+    if set(trims) != {False, True}:
+        trim = bool(trims and trims[0])
+        return {trim: render_page_image(page, scale, trim, trim_mode, grayscale)}
+
+    # 둘 다 필요: 전체 비트맵 하나에서 전체/잘린 이미지
+    bitmap = page.render(scale=scale, rev_byteorder=True, grayscale=grayscale)
+    return {False: bitmap.to_pil(), True: trim_bitmap(bitmap, padding=TRIM_PADDING)}
+
+
+def save_page_profiles(
+    page, targets: Sequence[Tuple[OutputProfile, Path]], trim_mode: str = DEFAULT_TRIM_MODE
+) -> Optional[str]:
+    """
+    페이지 1장을 프로필별로 저장 (렌더링 1회)
+
+    Args:
+        targets: (프로필, 출력 경로) 목록
+        trim_mode: 여백 제거 방식 (render_page_image 참고)
+
+    Returns:
+        실패 시 (프로필 순으로) 첫 에러 메시지, 성공 시 None
+    """
+    if len(targets) == 1 and targets[0][0].max_width is None:
+        # 프로필 1개: 축소 없이 그 해상도로 렌더링
+        profile, path = targets[0]
+        return save_page_image(
+            page,
+            path,
+            profile.dpi or DEFAULT_PROFILE_DPI,
+            profile.format,
+            profile.trim,
+            trim_mode,
+            profile.quality,
+            profile.image_encoder,
+            profile.color_mode,
+            profile.threshold,
+        )
+
+    dpi = master_dpi([profile for profile, _ in targets])
+    grayscale = all(profile.color_mode != "rgb" for profile, _ in targets)
+    masters = render_masters(
+        page, dpi, sorted({profile.trim for profile, _ in targets}), trim_mode, grayscale
+    )
+
+    def encode(profile: OutputProfile, path: Path) -> Optional[str]:
+        master = masters[profile.trim]
+        size = scaled_size(master.size, (profile.dpi or dpi) / dpi, profile.max_width)
+        image = apply_color_mode(scale_image(master, size), profile.color_mode, profile.threshold)
+        return save_image(image, path, profile.format, profile.quality, profile.image_encoder)
+
+    pool = _encoder_pool()
+    futures = [pool.submit(encode, profile, path) for profile, path in targets]
+    errors = [future.result() for future in futures]
+    return next((error for error in errors if error), None)
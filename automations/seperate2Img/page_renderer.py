@@ -0,0 +1,252 @@
+"""
+PDF → Image 병렬 렌더링 (페이지 단위)
+
+convert_pdfs_to_images의 직렬 루프는 PDF 하나씩, 페이지 하나씩 한 코어에서 렌더링합니다.
+여기서는 (pdf, page) 작업을 ProcessPoolExecutor 워커들에 나눠 줍니다.
+
+- 부모: 페이지 수만 세고 작업 목록 생성 (PDF 순서 → 페이지 순서)
+- 워커: 열린 PdfDocument를 최근 DOCUMENT_CACHE_SIZE개까지 재사용, 이미지를 직접 저장
+- 파일 이름/결과 순서/실패 처리는 convert_pdf_to_image와 동일
+    - PDF의 페이지가 하나라도 실패하면 그 PDF는 (False, None, 첫 실패 페이지 오류)
+- 진행: "image" 단계, PDF의 모든 페이지가 끝날 때마다 advance
+- 출력 프로필: 작업 단위는 그대로 페이지, 워커가 한 번 렌더링해 프로필별로 저장
+"""
+
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import pypdfium2 as pdfium
+
+from core.progress import ProgressAbort, progress_bus
+from .output_profiles import (
+    OutputProfile,
+    prepare_profile_dirs,
+    profile_image_path,
+    save_page_profiles,
+    single_profile,
+)
+from .trim import DEFAULT_TRIM_MODE
+
+# 워커 프로세스별 열린 문서 캐시 크기
+DOCUMENT_CACHE_SIZE = 4
+
+ImageResult = Tuple[bool, Optional[str], Optional[str]]
+
+
+# ============================================================================
+# 워커 프로세스
+# ============================================================================
+
+_documents: "OrderedDict[str, pdfium.PdfDocument]" = OrderedDict()
+
+
+def _open_document(pdf_path: str) -> "pdfium.PdfDocument":
+    """워커 안에서 PdfDocument 재사용 (LRU, 밀려난 문서는 닫음)"""
+    pdf = _documents.get(pdf_path)
+    if pdf is not None:
+        _documents.move_to_end(pdf_path)
+        return pdf
+
+    pdf = pdfium.PdfDocument(pdf_path)
+    _documents[pdf_path] = pdf
+    while len(_documents) > DOCUMENT_CACHE_SIZE:
+        _, evicted = _documents.popitem(last=False)
+        evicted.close()
+    return pdf
+
+
+def render_page_task(
+    pdf_path: str,
+    page_index: int,
+    n_pages: int,
+    output_dir: str,
+    dpi: int,
+    format: str,
+    trim_whitespace: bool,
+    trim_mode: str = DEFAULT_TRIM_MODE,
+    profiles: Optional[Sequence[OutputProfile]] = None,
+) -> Tuple[Optional[List[str]], Optional[str], float]:
+    """
+    워커 함수: PDF 한 페이지 렌더링 후 저장
+
+    Args:
+        profiles: 출력 프로필 목록 (None이면 dpi/format/trim_whitespace 프로필 1개)
+
+    Returns:
+        (출력 경로 목록 - 프로필 순, 에러 메시지, 처리 시간)
+    """
+    start = time.perf_counter()
+    targets = [
+        (
+            profile,
+            profile_image_path(Path(output_dir), profile, Path(pdf_path).stem, page_index, n_pages),
+        )
+        for profile in profiles or single_profile(dpi, format, trim_whitespace)
+    ]
+    try:
+        pdf = _open_document(pdf_path)
+        page = pdf[page_index]
+        try:
+            error = save_page_profiles(page, targets, trim_mode)
+        finally:
+            page.close()
+    except Exception as e:
+        error = f"페이지 {page_index + 1} 변환 실패: {str(e)}"
+    elapsed = time.perf_counter() - start
+    return (None, error, elapsed) if error else ([str(path) for _, path in targets], None, elapsed)
+
+
+# ============================================================================
+# 부모 프로세스
+# ============================================================================
+
+
+def _count_pages(pdf_path: str) -> Tuple[int, Optional[str]]:
+    """(페이지 수, 에러) - 직렬 경로와 같은 에러 메시지"""
+    if not Path(pdf_path).exists():
+        return 0, f"파일 없음: {pdf_path}"
+    try:
+        pdf = pdfium.PdfDocument(pdf_path)
+    except Exception as e:
+        return 0, f"PDF 파일 열기 실패: {str(e)}"
+    try:
+        n_pages = len(pdf)
+    finally:
+        pdf.close()
+    if n_pages == 0:
+        return 0, f"빈 PDF 파일: {pdf_path}"
+    return n_pages, None
+
+
+def default_render_workers(n_pages: int) -> int:
+    return max(1, min(os.cpu_count() or 1, n_pages))
+
+
+def render_pdfs_parallel(
+    pdf_files: List[str],
+    output_dir: str,
+    dpi: int = 300,
+    format: str = "png",
+    trim_whitespace: bool = False,
+    max_workers: Optional[int] = None,
+    verbose: bool = False,
+    on_result: Optional[Callable[[str, ImageResult], None]] = None,
+    trim_mode: str = DEFAULT_TRIM_MODE,
+    profiles: Optional[Sequence[OutputProfile]] = None,
+) -> List[ImageResult]:
+    """
+    여러 PDF를 페이지 단위로 병렬 렌더링
+
+    Args:
+        max_workers: 워커 프로세스 수 (None이면 CPU 수와 전체 페이지 수 중 작은 값)
+        on_result: PDF 하나가 끝날 때마다 이미지별 (pdf_file, 결과 튜플)로 호출 (완료 순)
+        trim_mode: 여백 제거 방식 ("clip" 또는 "bitmap", save_page_image 참고)
+        profiles: 출력 프로필 목록 (pdf_to_image.convert_pdf_to_image 참고)
+
+    Returns:
+        convert_pdfs_to_images와 같은 형식/순서
+        (성공 PDF는 이미지마다 (True, path, None), 실패 PDF는 (False, None, error))
+    """
+    if not pdf_files:
+        return []
+
+    profiles = list(profiles or single_profile(dpi, format, trim_whitespace))
+    prepare_profile_dirs(Path(output_dir), profiles)
+
+    # PDF별 페이지 수 (열 수 없는 PDF는 바로 실패)
+    page_counts: List[int] = []
+    errors: Dict[int, str] = {}
+    for index, pdf_file in enumerate(pdf_files):
+        n_pages, error = _count_pages(pdf_file)
+        page_counts.append(n_pages)
+        if error:
+            errors[index] = error
+
+    total_pages = sum(page_counts)
+    workers = max_workers or default_render_workers(total_pages)
+
+    if verbose:
+        print(
+            f"[PDF→IMG 병렬 변환 시작] {len(pdf_files)}개 파일, {total_pages}페이지, "
+            f"{dpi} DPI (워커: {workers}개)"
+        )
+
+    pages: List[List[Optional[List[str]]]] = [[None] * n for n in page_counts]
+    remaining = list(page_counts)
+    page_errors: Dict[int, Dict[int, str]] = {}
+    outcomes: List[Optional[List[ImageResult]]] = [None] * len(pdf_files)
+    stage = progress_bus.stage("image", len(pdf_files))
+    stage.start()
+
+    def _finish(index: int):
+        pdf_file = pdf_files[index]
+        if index in errors:
+            outcomes[index] = [(False, None, errors[index])]
+        elif index in page_errors:
+            # 직렬 경로처럼 가장 앞 페이지의 오류 보고
+            outcomes[index] = [(False, None, page_errors[index][min(page_errors[index])])]
+        else:
+            outcomes[index] = [(True, path, None) for paths in pages[index] for path in paths]
+
+        ok = outcomes[index][0][0]
+        if verbose:
+            status = f"{len(outcomes[index])}장" if ok else f"실패: {outcomes[index][0][2]}"
+            print(f"  - {Path(pdf_file).name}: {status}")
+        if on_result:
+            for outcome in outcomes[index]:
+                on_result(pdf_file, outcome)
+        stage.advance(
+            Path(pdf_file).name,
+            ok=ok,
+            message=f"{len(outcomes[index])}장" if ok else (outcomes[index][0][2] or ""),
+        )
+
+    for index in errors:
+        _finish(index)
+
+    if total_pages:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    render_page_task,
+                    pdf_files[index],
+                    page_index,
+                    n_pages,
+                    output_dir,
+                    dpi,
+                    format,
+                    trim_whitespace,
+                    trim_mode,
+                    profiles,
+                ): (index, page_index)
+                for index, n_pages in enumerate(page_counts)
+                if index not in errors
+                for page_index in range(n_pages)
+            }
+            try:
+                for future in as_completed(futures):
+                    index, page_index = futures[future]
+                    try:
+                        paths, error, _ = future.result()
+                    except Exception as e:  # 워커 비정상 종료 등
+                        paths, error = None, f"페이지 {page_index + 1} 변환 실패: {str(e)}"
+                    if error:
+                        page_errors.setdefault(index, {})[page_index] = error
+                    pages[index][page_index] = paths
+                    remaining[index] -= 1
+                    if remaining[index] == 0:
+                        _finish(index)
+            except ProgressAbort:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+    results = [outcome for per_pdf in outcomes for outcome in per_pdf]
+
+    if verbose:
+        print(f"\n[PDF→IMG 완료] 생성된 이미지: {sum(1 for s, _, _ in results if s)}개")
+
+    return results
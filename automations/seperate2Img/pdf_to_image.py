@@ -4,16 +4,34 @@ PDF to Image 변환 - pypdfium2 사용
 Idris2 명세: Specs/Seperate2Img/Workflow.idr - convertToImage
 
 주요 기능:
-- PDF → PNG/JPG 변환
+- PDF → PNG/JPG/WebP 변환
 - DPI 설정 (기본 300)
 - 다중 페이지 지원 (모든 페이지 변환)
+- 색 모드: rgb, gray (pdfium 회색조 렌더링, 비트맵 1/3), bilevel (회색조 → 임계값 1비트)
 """
 
+import numpy as np
+
 import pypdfium2 as pdfium
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence, Tuple
 from PIL import Image, ImageChops
 
+from core.progress import progress_bus
+from .encoders import EncoderSpec, ImageEncoder, default_encoder
+from .trim import DEFAULT_TRIM_MODE, TRIM_PADDING, render_trimmed, trim_bitmap
+
+if TYPE_CHECKING:
+    from .output_profiles import OutputProfile
+
+
+# 색 모드: 문제 페이지는 대부분 흰 바탕 검은 글자라 회색조/1비트로 충분
+# (pdfium 회색조 비트맵은 글자 안티앨리어싱이 RGB→L 변환과 조금 달라 픽셀 단위로 같지는 않음,
+#  여백 제거 경계도 1px 다를 수 있음 - Tests/Seperate2Img/test_color_mode.py 시각 비교)
+COLOR_MODES = ("rgb", "gray", "bilevel")
+# bilevel: 이 값보다 밝은 픽셀은 흰색 (안티앨리어싱 가장자리의 절반쯤에서 자름)
+BILEVEL_THRESHOLD = 160
+
 
 def trim_image_whitespace(im: Image.Image, padding: int = 10) -> Image.Image:
     """
@@ -21,6 +39,9 @@ def trim_image_whitespace(im: Image.Image, padding: int = 10) -> Image.Image:
 
     Idris2 명세: Workflow.idr - convertToImage 참조
 
+    렌더링 경로는 trim.trim_bitmap(NumPy, 비트맵 버퍼 직접)을 씁니다.
+    이 함수는 이미 PIL 이미지인 경우용입니다.
+
     Args:
         im: PIL 이미지 객체
         padding: 여백에 추가할 패딩 (픽셀)
@@ -51,13 +72,133 @@ def trim_image_whitespace(im: Image.Image, padding: int = 10) -> Image.Image:
     return im
 
 
+def page_image_path(
+    output_dir: Path, output_stem: str, index: int, n_pages: int, format: str
+) -> Path:
+    """페이지 이미지 파일 경로
+
+    1페이지짜리: 원본이름.png
+    다중 페이지: 원본이름_1.png, 원본이름_2.png ...
+    """
+    if n_pages > 1:
+        return output_dir / f"{output_stem}_{index + 1}.{format.lower()}"
+    return output_dir / f"{output_stem}.{format.lower()}"
+
+
+def apply_color_mode(
+    image: Image.Image, color_mode: str = "rgb", threshold: int = BILEVEL_THRESHOLD
+) -> Image.Image:
+    """색 모드 적용 (gray: L, bilevel: threshold보다 밝으면 흰색인 1비트)"""
+    if color_mode == "rgb" or image.mode == "1":
+        return image
+    gray = image if image.mode == "L" else image.convert("L")
+    if color_mode == "gray":
+        return gray
+    return Image.fromarray(np.asarray(gray) > threshold)
+
+
+def render_page_image(
+    page,
+    scale: float,
+    trim_whitespace: bool = False,
+    trim_mode: str = DEFAULT_TRIM_MODE,
+    grayscale: bool = False,
+) -> Image.Image:
+    """페이지 1장 렌더링 (여백 제거 옵션)
+
+    Args:
+        trim_mode: 여백 제거 방식 (trim.TRIM_MODES)
+            "bitmap" (기본): 전체 렌더링 후 비트맵에서 자르기
+            "clip": 페이지 객체 경계 영역만 렌더링 (안 되는 페이지는 "bitmap"으로, 가장자리 픽셀 ±2)
+        grayscale: pdfium 회색조 렌더링 (L 이미지, 픽셀당 1바이트)
+    """
+    # 여백 제거 + clip: 내용 영역만 렌더링 (여백은 래스터화하지 않음)
+    if trim_whitespace and trim_mode == "clip":
+        pil_image = render_trimmed(page, scale, padding=TRIM_PADDING, grayscale=grayscale)
+        if pil_image is not None:
+            return pil_image
+
+    # 비트맵 렌더링 (RGB 순서 → NumPy 뷰를 그대로 PIL 배열로 사용 가능)
+    bitmap = page.render(scale=scale, rev_byteorder=True, grayscale=grayscale)
+
+    # 여백 제거 (옵션): 비트맵 버퍼에서 바로 잘라 잘린 영역만 PIL Image로 변환
+    if trim_whitespace:
+        return trim_bitmap(bitmap, padding=TRIM_PADDING)
+    return bitmap.to_pil()
+
+
+def save_image(
+    pil_image: Image.Image,
+    output_path: Path,
+    format: str = "png",
+    quality: int = 95,
+    encoder: Optional[ImageEncoder] = None,
+) -> Optional[str]:
+    """이미지 저장 + 결과 파일 확인
+
+    Args:
+        encoder: 인코딩 설정 (None이면 format/quality 기본 설정, encoders.default_encoder)
+
+    Returns:
+        실패 시 에러 메시지, 성공 시 None
+    """
+    (encoder or default_encoder(format, quality)).encode(pil_image, output_path)
+
+    # 파일 생성 확인
+    if not output_path.exists():
+        return f"이미지 파일 생성 실패: {output_path}"
+
+    # 0바이트 체크
+    if output_path.stat().st_size == 0:
+        return f"이미지 변환 실패 (0 바이트): {output_path}"
+
+    return None
+
+
+def save_page_image(
+    page,
+    output_path: Path,
+    dpi: int = 300,
+    format: str = "png",
+    trim_whitespace: bool = False,
+    trim_mode: str = DEFAULT_TRIM_MODE,
+    quality: int = 95,
+    encoder: Optional[ImageEncoder] = None,
+    color_mode: str = "rgb",
+    threshold: int = BILEVEL_THRESHOLD,
+) -> Optional[str]:
+    """페이지 1장 렌더링 후 저장 (직렬/병렬 렌더러 공용)
+
+    Args:
+        trim_mode: 여백 제거 방식 (render_page_image 참고)
+        quality: JPEG 품질
+        encoder: 인코딩 설정 (save_image 참고)
+        color_mode: 색 모드 (COLOR_MODES, gray/bilevel은 회색조로 렌더링)
+        threshold: bilevel 임계값
+
+    Returns:
+        실패 시 에러 메시지, 성공 시 None
+    """
+    # DPI 계산: scale = dpi / 72
+    pil_image = render_page_image(
+        page, dpi / 72.0, trim_whitespace, trim_mode, grayscale=color_mode != "rgb"
+    )
+    return save_image(
+        apply_color_mode(pil_image, color_mode, threshold), output_path, format, quality, encoder
+    )
+
+
 def convert_pdf_to_image(
     pdf_path: str,
     output_path_base: str,
     dpi: int = 300,
     format: str = "png",
     trim_whitespace: bool = False,
-    verbose: bool = False
+    verbose: bool = False,
+    trim_mode: str = DEFAULT_TRIM_MODE,
+    profiles: Optional[Sequence["OutputProfile"]] = None,
+    encoder: Optional[EncoderSpec] = None,
+    color_mode: str = "rgb",
 ) -> Tuple[bool, List[str], Optional[str]]:
     """
     단일 PDF 파일을 이미지(들)로 변환 (모든 페이지)
@@ -72,12 +213,28 @@ def convert_pdf_to_image(
         format: 이미지 포맷 (png, jpg)
         trim_whitespace: 이미지 여백 제거 여부 (기본 False)
         verbose: 상세 로그 출력
+        trim_mode: 여백 제거 방식 ("clip" 또는 "bitmap", save_page_image 참고)
+        profiles: 출력 프로필 목록 (output_profiles.OutputProfile,
+            주어지면 dpi/format/trim_whitespace 대신)
+            페이지마다 한 번 렌더링해 프로필별 폴더에 저장
+        encoder: 인코딩 설정 (encoders.ENCODER_PRESETS 이름, dict 또는 ImageEncoder,
+            프로필이 없을 때) 형식은 인코더를 따름 (format 대신)
+        color_mode: 색 모드 (rgb, gray, bilevel - 프로필이 없을 때, save_page_image 참고)
 
     Returns:
         (success, generated_files_list, error_message)
+        * generated_files_list: 페이지 순, 페이지 안에서는 프로필 순
     """
+    from .output_profiles import (
+        prepare_profile_dirs,
+        profile_image_path,
+        save_page_profiles,
+        single_profile,
+    )
+
     generated_files = []
-    
+    profiles = profiles or single_profile(dpi, format, trim_whitespace, encoder, color_mode)
+
     try:
         pdf_path_obj = Path(pdf_path)
         if not pdf_path_obj.exists():
@@ -102,55 +259,27 @@ def convert_pdf_to_image(
             if n_pages == 0:
                 return False, [], f"빈 PDF 파일: {pdf_path}"
 
+            prepare_profile_dirs(output_dir, profiles)
+
             # 모든 페이지 순회
             for i, page in enumerate(pdf):
                 try:
-                    # 파일명 결정
-                    # 1페이지짜리: 원본이름.png
-                    # 다중 페이지: 원본이름_1.png, 원본이름_2.png ...
-                    if n_pages > 1:
-                        current_output_filename = f"{output_stem}_{i+1}.{format.lower()}"
-                    else:
-                        current_output_filename = f"{output_stem}.{format.lower()}"
-                    
-                    current_output_path = output_dir / current_output_filename
-
-                    # DPI 계산: scale = dpi / 72
-                    scale = dpi / 72.0
-
-                    # 비트맵 렌더링
-                    bitmap = page.render(scale=scale)
-
-                    # PIL Image로 변환
-                    pil_image = bitmap.to_pil()
-
-                    # 여백 제거 (옵션)
-                    if trim_whitespace:
-                        pil_image = trim_image_whitespace(pil_image, padding=10)
-
-                    # 이미지 저장
-                    if format.lower() == "jpg":
-                        if pil_image.mode == "RGBA":
-                            pil_image = pil_image.convert("RGB")
-                        pil_image.save(current_output_path, "JPEG", quality=95)
-                    else:
-                        pil_image.save(current_output_path, "PNG")
-                    
-                    # 파일 생성 확인
-                    if not current_output_path.exists():
-                        # 실패 시 지금까지 생성된 파일 반환할지, 전체 실패 처리할지 결정
-                        # 여기서는 계속 진행하지 않고 중단
-                        return False, generated_files, f"이미지 파일 생성 실패: {current_output_path}"
-                    
-                    # 0바이트 체크
-                    if current_output_path.stat().st_size == 0:
-                         return False, generated_files, f"이미지 변환 실패 (0 바이트): {current_output_path}"
-
-                    generated_files.append(str(current_output_path))
-                    
-                    if verbose:
-                        img_size = current_output_path.stat().st_size / 1024
-                        print(f"  - 생성: {current_output_path.name} ({img_size:.1f} KB)")
+                    targets = [
+                        (profile, profile_image_path(output_dir, profile, output_stem, i, n_pages))
+                        for profile in profiles
+                    ]
+
+                    error = save_page_profiles(page, targets, trim_mode)
+                    if error:
+                        # 실패 시 계속 진행하지 않고 중단
+                        return False, generated_files, error
+
+                    for _, current_output_path in targets:
+                        generated_files.append(str(current_output_path))
+
+                        if verbose:
+                            img_size = current_output_path.stat().st_size / 1024
+                            print(f"  - 생성: {current_output_path.name} ({img_size:.1f} KB)")
 
                 except Exception as e:
                     return False, generated_files, f"페이지 {i+1} 변환 실패: {str(e)}"
@@ -172,13 +301,26 @@ def convert_pdfs_to_images(
     dpi: int = 300,
     format: str = "png",
     trim_whitespace: bool = False,
-    verbose: bool = False
+    verbose: bool = False,
+    on_result: Optional[Callable[[str, Tuple[bool, Optional[str], Optional[str]]], None]] = None,
+    max_workers: Optional[int] = 1,
+    trim_mode: str = DEFAULT_TRIM_MODE,
+    profiles: Optional[Sequence["OutputProfile"]] = None,
+    encoder: Optional[EncoderSpec] = None,
+    color_mode: str = "rgb",
 ) -> List[Tuple[bool, Optional[str], Optional[str]]]:
     """
     여러 PDF 파일을 이미지로 변환 (다중 페이지 지원)
 
     Args:
         trim_whitespace: 이미지 여백 제거 여부 (기본 False)
+        on_result: 이미지(실패 시 PDF) 하나마다 (pdf_file, 결과 튜플)로 호출
+        max_workers: 1이면 직렬, 그 밖에는 페이지 단위 프로세스 풀
+            (None이면 CPU 수, page_renderer.render_pdfs_parallel)
+        trim_mode: 여백 제거 방식 ("clip" 또는 "bitmap", save_page_image 참고)
+        profiles: 출력 프로필 목록 (convert_pdf_to_image 참고)
+        encoder: 인코딩 설정 (convert_pdf_to_image 참고)
+        color_mode: 색 모드 (convert_pdf_to_image 참고)
 
     Returns:
         List of (success, output_path_representative, error_message)
@@ -187,6 +329,28 @@ def convert_pdfs_to_images(
     if not pdf_files:
         return []
 
+    if (encoder or color_mode != "rgb") and not profiles:
+        from .output_profiles import single_profile
+
+        profiles = single_profile(dpi, format, trim_whitespace, encoder, color_mode)
+        format = profiles[0].format
+
+    if max_workers != 1:
+        from .page_renderer import render_pdfs_parallel
+
+        return render_pdfs_parallel(
+            pdf_files,
+            output_dir,
+            dpi=dpi,
+            format=format,
+            trim_whitespace=trim_whitespace,
+            max_workers=max_workers,
+            verbose=verbose,
+            on_result=on_result,
+            trim_mode=trim_mode,
+            profiles=profiles,
+        )
+
     output_dir_obj = Path(output_dir)
     output_dir_obj.mkdir(parents=True, exist_ok=True)
 
@@ -194,10 +358,12 @@ def convert_pdfs_to_images(
         print(f"[PDF→IMG 변환 시작] {len(pdf_files)}개 파일, {dpi} DPI")
 
     results = []
+    stage = progress_bus.stage("image", len(pdf_files))
+    stage.start()
 
     for pdf_file in pdf_files:
         pdf_path = Path(pdf_file)
-        
+
         # 기본 출력 경로 (단일 페이지일 경우 사용될 경로)
         output_filename = pdf_path.stem + f".{format.lower()}"
         output_path_base = output_dir_obj / output_filename
@@ -208,7 +374,9 @@ def convert_pdfs_to_images(
             dpi=dpi,
             format=format,
             trim_whitespace=trim_whitespace,
-            verbose=verbose
+            verbose=verbose,
+            trim_mode=trim_mode,
+            profiles=profiles,
         )
 
         if success:
@@ -216,20 +384,30 @@ def convert_pdfs_to_images(
             # 여기서는 기존 인터페이스 호환성을 위해 첫 번째 파일만 대표로 반환하되,
             # 실제로는 generated_files에 모든 파일이 있음.
             # plugin.py에서 이를 활용하려면 results 구조를 바꾸는 게 좋음.
-            
+
             # 하지만 plugin.py는 image_files 리스트만 필요로 함.
             # 따라서 여기서는 (True, "첫번째파일", None) 을 반환하고,
             # plugin.py 에서는 이 리스트를 받아 처리... 가 아니라
             # plugin.py 가 사용하는 convert_to_image는 "image_files = [path for ...]" 를 함.
             # 즉, 1:N 관계가 되면 plugin.py도 수정 필요함.
-            
+
             # 수정 최소화를 위해:
             # convert_pdfs_to_images가 (True, path, None) 튜플을 
             # 생성된 파일 개수만큼 flat하게 반환하도록 변경.
             for gen_file in generated_files:
                 results.append((True, gen_file, None))
+                if on_result:
+                    on_result(pdf_file, results[-1])
         else:
             results.append((False, None, error))
+            if on_result:
+                on_result(pdf_file, results[-1])
+
+        stage.advance(
+            pdf_path.name,
+            ok=success,
+            message=f"{len(generated_files)}장" if success else (error or ""),
+        )
 
     # 통계
     success_count = sum(1 for s, _, _ in results if s)
@@ -10,7 +10,8 @@ from typing import Dict, Any
 
 from automations.base import AutomationBase, PluginMetadata
 from automations.registry import register_plugin
-from .workflow import Seperate2ImgWorkflow
+from automations.manifest import SEPERATE2IMG_METADATA
+from core.progress import progress_bus
 from .ui import Seperate2ImgUI
 
 
@@ -20,13 +21,7 @@ class Seperate2ImgPlugin(AutomationBase):
 
     def get_metadata(self) -> PluginMetadata:
         """플러그인 메타데이터"""
-        return PluginMetadata(
-            id="seperate2img",
-            name="이미지 분리 (Seperate2Img)",
-            description="HWP 파일의 문제를 분리하고 각각을 이미지(PNG)로 변환합니다.",
-            version="1.0.0",
-            author="User",
-        )
+        return SEPERATE2IMG_METADATA
 
     def has_ui(self) -> bool:
         """UI 지원 여부"""
@@ -37,7 +32,7 @@ class Seperate2ImgPlugin(AutomationBase):
         if kwargs.get('ui', False):
             self.run_ui()
             return {"success": True}
-        
+
         return self.run_cli(kwargs)
 
     def run_ui(self):
@@ -59,18 +54,24 @@ class Seperate2ImgPlugin(AutomationBase):
 
         # 4. 워크플로우 실행
         ui.show_progress_dialog()
-        
+
+        # 워크플로우(분리/전처리/pdfium)는 실행할 때 import (런처 시작 시간)
+        from .workflow import Seperate2ImgWorkflow
+
         workflow = Seperate2ImgWorkflow(progress_callback=ui.update_progress)
 
         try:
-            result = workflow.run(
-                input_path,
-                output_dir,
-                dpi=options['dpi'],
-                format=options['format'],
-                trim_whitespace=options['trim_whitespace'],
-                cleanup_temp=options['cleanup_temp']
-            )
+            # 파일별 진행 (Tk는 메인 스레드 전용 → 같은 스레드 이벤트만,
+            # 다이얼로그 갱신은 0.1초 간격)
+            with progress_bus.subscribed(ui.on_progress_event, min_interval=0.1, same_thread=True):
+                result = workflow.run(
+                    input_path,
+                    output_dir,
+                    dpi=options["dpi"],
+                    format=options["format"],
+                    trim_whitespace=options["trim_whitespace"],
+                    cleanup_temp=options["cleanup_temp"],
+                )
 
             ui.close_progress_dialog()
 
@@ -94,10 +95,12 @@ class Seperate2ImgPlugin(AutomationBase):
         input_path = kwargs.get('input_path')
         if not input_path:
             return {"success": False, "message": "Input path required"}
-            
+
         output_dir = kwargs.get('output_dir')
         if not output_dir:
             output_dir = str(Path(input_path).parent / f"{Path(input_path).stem}_images")
 
+        from .workflow import Seperate2ImgWorkflow
+
         workflow = Seperate2ImgWorkflow()
         return workflow.run(input_path, output_dir)
@@ -0,0 +1,448 @@
+"""
+Seperate2Img 단계 캐시 - 입력 내용 해시 + 단계 설정 → 이전 출력 재사용
+
+시험지를 조금 고쳐 워크플로우를 다시 돌리면 바뀌지 않은 문제도 HWP→PDF(COM),
+PDF→이미지를 전부 다시 합니다. 단계 경계마다 캐시를 둡니다.
+
+- "pdf":   전처리된 HWP 파일 내용 해시 → PDF
+- "image": PDF 내용 해시 + (dpi, format, trim, trim_mode, 출력 프로필) → 이미지들
+    PDF 해시는 페이지 내용이 아닌 메타데이터(/Title - 파일 이름에서 옴, /CreationDate, /ModDate,
+    trailer /ID, XMP 날짜/UUID)와 그 길이에 따라 바뀌는 xref 오프셋을 가리고 계산
+    → 같은 HWP에서 다시 만든 PDF, 번호가 바뀐 같은 문제도 적중
+- 저장소: root/<키 앞 2자>/<키>/ (출력 파일 복사본 + entry.json), 임시 폴더에 쓰고 rename
+- LRU: 적중 시 entry.json 수정 시각 갱신, 저장 후 전체 크기가 max_bytes를 넘으면 오래된 것부터 삭제
+- 조회/저장은 워크플로우 프로세스에서만 (워커는 캐시를 모름)
+
+캐시 위치: HWP_STAGE_CACHE_DIR 환경 변수,
+          없으면 %LOCALAPPDATA% 또는 ~/.cache 아래 HwpAutomation/stage_cache
+크기 제한: HWP_STAGE_CACHE_MB 환경 변수 (기본 2048MB)
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from core.hwp_to_pdf import convert_hwp_to_pdf_parallel
+from .output_profiles import OutputProfile
+from .pdf_to_image import convert_pdfs_to_images
+from .trim import DEFAULT_TRIM_MODE
+
+CACHE_DIR_ENV = "HWP_STAGE_CACHE_DIR"
+CACHE_MB_ENV = "HWP_STAGE_CACHE_MB"
+DEFAULT_CACHE_MB = 2048
+
+# 캐시 형식이 바뀌면 올림 (이전 항목은 키가 달라져 자연히 LRU로 밀려남)
+CACHE_VERSION = 1
+
+DIGEST_SIZE = 16
+CHUNK_SIZE = 1 << 20
+
+ENTRY_FILE = "entry.json"
+STAGING_DIR = "tmp"  # 쓰는 중인 항목 (완성되면 rename)
+
+Result = Tuple[bool, Optional[str], Optional[str]]
+
+# XMP 메타데이터 중 저장 시각/문서 ID 항목 (그룹 1)
+_XMP_VOLATILE_FIELD = (
+    rb"(xmp:(?:CreateDate|ModifyDate|MetadataDate)|xmpMM:(?:DocumentID|InstanceID))"
+)
+
+# 페이지 내용과 무관하게 저장할 때마다(또는 파일 이름에 따라) 바뀌는 값
+_PDF_VOLATILE = [
+    (
+        re.compile(rb"/(Title|CreationDate|ModDate)\s*(?:\((?:[^()\\]|\\.)*\)|<[0-9A-Fa-f\s]*>)"),
+        rb"/\1()",
+    ),
+    (re.compile(rb"/ID\s*\[\s*<[0-9A-Fa-f]*>\s*<[0-9A-Fa-f]*>\s*\]"), rb"/ID[]"),
+    (re.compile(rb"<" + _XMP_VOLATILE_FIELD + rb">[^<]*</\1>"), rb"<\1/>"),
+    (re.compile(_XMP_VOLATILE_FIELD + rb'="[^"]*"'), rb'\1=""'),
+    (re.compile(rb"<dc:title>.*?</dc:title>", re.DOTALL), rb"<dc:title/>"),
+    # 위 값들의 길이에 따라 밀리는 오프셋
+    (re.compile(rb"\bxref\s+(?:\d+\s+\d+\s+(?:\d{10}\s+\d{5}\s+[fn]\s*)+)+"), rb"xref "),
+    (re.compile(rb"\bstartxref\s+\d+"), rb"startxref"),
+]
+
+
+# ============================================================================
+# 내용 해시
+# ============================================================================
+
+
+def file_digest(path: str) -> str:
+    """파일 내용 해시 (청크 단위로 읽음)"""
+    digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def pdf_digest(path: str) -> str:
+    """PDF 내용 해시 - 제목, 생성/수정 시각, 문서 ID, xref 오프셋 제외 (_PDF_VOLATILE)"""
+    data = Path(path).read_bytes()
+    for pattern, replacement in _PDF_VOLATILE:
+        data = pattern.sub(replacement, data)
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).hexdigest()
+
+
+def stage_key(stage: str, content_digest: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """단계 이름 + 입력 해시 + 단계 설정 → 캐시 키"""
+    payload = json.dumps(
+        {"version": CACHE_VERSION, "stage": stage, "input": content_digest, "params": params or {}},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=DIGEST_SIZE).hexdigest()
+
+
+# ============================================================================
+# 캐시 저장소
+# ============================================================================
+
+
+@dataclass
+class StageStats:
+    """단계별 적중/실패 수"""
+
+    hits: int = 0
+    misses: int = 0
+    stored: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "stored": self.stored}
+
+
+@dataclass
+class CacheEntry:
+    """캐시 항목 = 출력 파일들 (entry 폴더 안 상대 경로) + 원래 파일 이름의 stem"""
+
+    key: str
+    path: Path
+    files: List[str]
+    stem: str = ""
+
+
+def default_cache_dir() -> Path:
+    configured = os.environ.get(CACHE_DIR_ENV)
+    if configured:
+        return Path(configured)
+    base = os.environ.get("LOCALAPPDATA") or (Path.home() / ".cache")
+    return Path(base) / "HwpAutomation" / "stage_cache"
+
+
+class StageCache:
+    """단계 출력 캐시 (내용 주소, LRU)"""
+
+    def __init__(self, root: Optional[Path] = None, max_bytes: Optional[int] = None):
+        self.root = Path(root) if root else default_cache_dir()
+        if max_bytes is None:
+            max_bytes = int(os.environ.get(CACHE_MB_ENV, DEFAULT_CACHE_MB)) * 1024 * 1024
+        self.max_bytes = max_bytes
+        self.stats: Dict[str, StageStats] = {}
+
+    def stage_stats(self, stage: str) -> StageStats:
+        return self.stats.setdefault(stage, StageStats())
+
+    def report(self) -> Dict[str, Dict[str, int]]:
+        return {stage: stats.to_dict() for stage, stats in self.stats.items()}
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    # ------------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------------
+
+    def get(self, stage: str, key: str) -> Optional[CacheEntry]:
+        """적중하면 항목 (LRU 시각 갱신), 없거나 깨졌으면 None"""
+        entry_dir = self._entry_dir(key)
+        try:
+            meta = json.loads((entry_dir / ENTRY_FILE).read_text(encoding="utf-8"))
+            if not all((entry_dir / name).is_file() for name in meta["files"]):
+                raise FileNotFoundError(key)
+            os.utime(entry_dir / ENTRY_FILE)
+        except (OSError, ValueError, KeyError):
+            self.stage_stats(stage).misses += 1
+            return None
+        self.stage_stats(stage).hits += 1
+        return CacheEntry(key, entry_dir, meta["files"], meta.get("stem", ""))
+
+    def put(self, stage: str, key: str, files: Sequence[Tuple[str, Path]], stem: str = "") -> bool:
+        """
+        출력 파일 저장 (복사)
+
+        Args:
+            files: (항목 안 상대 경로, 원본 파일) 목록
+            stem: 파일 이름 앞부분 (복원할 때 새 stem으로 바꿈)
+        """
+        entry_dir = self._entry_dir(key)
+        staging = self.root / STAGING_DIR / f"{key}.{uuid.uuid4().hex}"
+        try:
+            for name, source in files:
+                target = staging / name
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(source, target)
+            meta = {
+                "stage": stage,
+                "files": [name for name, _ in files],
+                "stem": stem,
+                "created": time.time(),
+            }
+            (staging / ENTRY_FILE).write_text(
+                json.dumps(meta, ensure_ascii=False), encoding="utf-8"
+            )
+
+            entry_dir.parent.mkdir(parents=True, exist_ok=True)
+            if entry_dir.exists():
+                shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(staging, entry_dir)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+            return False
+        self.stage_stats(stage).stored += 1
+        return True
+
+    @staticmethod
+    def restore(entry: CacheEntry, target_dir: Path, stem: str = "") -> List[Path]:
+        """항목 파일들을 target_dir로 복사 (파일 이름의 옛 stem → stem), 복원된 경로 목록"""
+        restored = []
+        for name in entry.files:
+            relative = Path(name)
+            if entry.stem and stem and relative.name.startswith(entry.stem):
+                relative = relative.with_name(stem + relative.name[len(entry.stem) :])
+            target = target_dir / relative
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(entry.path / name, target)
+            restored.append(target)
+        return restored
+
+    # ------------------------------------------------------------------
+    # LRU 정리
+    # ------------------------------------------------------------------
+
+    def entries(self) -> List[Tuple[float, int, Path]]:
+        """(마지막 사용 시각, 크기, 항목 폴더) 목록"""
+        found = []
+        if not self.root.exists():
+            return found
+        for manifest in self.root.glob(f"*/*/{ENTRY_FILE}"):
+            entry_dir = manifest.parent
+            if entry_dir.parent.name == STAGING_DIR:
+                continue
+            try:
+                size = sum(path.stat().st_size for path in entry_dir.rglob("*") if path.is_file())
+                found.append((manifest.stat().st_mtime, size, entry_dir))
+            except OSError:
+                continue
+        return found
+
+    def evict(self) -> int:
+        """전체 크기가 max_bytes 이하가 될 때까지 오래 안 쓴 항목 삭제, 삭제 수"""
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, entry_dir in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total -= size
+            evicted += 1
+        return evicted
+
+
+# ============================================================================
+# 캐시를 거치는 단계 실행
+# ============================================================================
+
+
+def _ordered(sources: Sequence[str], per_source: Dict[str, List[Result]]) -> List[Result]:
+    return [result for source in sources for result in per_source.get(source, [])]
+
+
+# ----------------------------------------------------------------------------
+# 파일 1개 단위 조회/저장 (일괄 실행과 스트리밍 파이프라인이 같이 씀)
+# ----------------------------------------------------------------------------
+
+
+def lookup_pdf(cache: StageCache, hwp_file: str) -> Tuple[Optional[str], Optional[Result]]:
+    """
+    "pdf" 단계 조회 - 적중하면 PDF를 워커와 같은 위치(HWP 옆 .pdf)에 복원
+
+    Returns:
+        (키, 적중 결과) - 읽을 수 없는 파일은 (None, None) → 변환기가 오류를 보고
+    """
+    try:
+        key = stage_key("pdf", file_digest(hwp_file))
+    except OSError:
+        return None, None
+    entry = cache.get("pdf", key)
+    if entry is None:
+        return key, None
+    pdf_path = Path(hwp_file).with_suffix(".pdf")
+    cache.restore(entry, pdf_path.parent, pdf_path.stem)
+    return key, (True, str(pdf_path), None)
+
+
+def store_pdf(cache: StageCache, key: str, outcome: Result) -> bool:
+    success, pdf_path, _ = outcome
+    if not (success and pdf_path):
+        return False
+    return cache.put("pdf", key, [(Path(pdf_path).name, Path(pdf_path))], stem=Path(pdf_path).stem)
+
+
+def lookup_images(
+    cache: StageCache, pdf_file: str, output_root: Path, params: Dict[str, Any]
+) -> Tuple[Optional[str], Optional[List[Result]]]:
+    """ "image" 단계 조회 - 적중하면 이미지들을 output_root에 복원 (파일 이름은 현재 PDF stem)"""
+    try:
+        key = stage_key("image", pdf_digest(pdf_file), params)
+    except OSError:
+        return None, None
+    entry = cache.get("image", key)
+    if entry is None:
+        return key, None
+    restored = cache.restore(entry, output_root, Path(pdf_file).stem)
+    return key, [(True, str(path), None) for path in restored]
+
+
+def store_images(
+    cache: StageCache, key: str, pdf_file: str, output_root: Path, outcomes: Sequence[Result]
+) -> bool:
+    """PDF 1개의 모든 페이지가 성공했을 때만 저장"""
+    if not outcomes or not all(success for success, _, _ in outcomes):
+        return False
+    files = [
+        (Path(path).relative_to(output_root).as_posix(), Path(path)) for _, path, _ in outcomes
+    ]
+    return cache.put("image", key, files, stem=Path(pdf_file).stem)
+
+
+def convert_hwp_to_pdf_cached(
+    cache: StageCache,
+    hwp_files: List[str],
+    max_workers: int = 5,
+    verbose: bool = False,
+    on_result: Optional[Callable[[str, Result], None]] = None,
+) -> List[Result]:
+    """
+    convert_hwp_to_pdf_parallel + "pdf" 단계 캐시
+
+    적중한 파일은 PDF를 워커와 같은 위치(HWP 옆 .pdf)에 복원하고, 나머지만 COM으로 변환.
+    결과는 입력 순서.
+    """
+    per_source: Dict[str, List[Result]] = {}
+    keys: Dict[str, str] = {}
+    misses = []
+    for hwp_file in hwp_files:
+        key, hit = lookup_pdf(cache, hwp_file)
+        if hit is None:
+            if key:
+                keys[hwp_file] = key
+            misses.append(hwp_file)
+            continue
+        per_source[hwp_file] = [hit]
+        if on_result:
+            on_result(hwp_file, hit)
+
+    if verbose and len(misses) < len(hwp_files):
+        print(f"[PDF 캐시] 적중 {len(hwp_files) - len(misses)}개, 변환 {len(misses)}개")
+
+    def collect(hwp_file: str, outcome: Result):
+        per_source[hwp_file] = [outcome]
+        if hwp_file in keys:
+            store_pdf(cache, keys[hwp_file], outcome)
+        if on_result:
+            on_result(hwp_file, outcome)
+
+    if misses:
+        convert_hwp_to_pdf_parallel(
+            misses, max_workers=max_workers, verbose=verbose, on_result=collect
+        )
+        cache.evict()
+    return _ordered(hwp_files, per_source)
+
+
+def image_params(
+    dpi: int,
+    format: str,
+    trim_whitespace: bool,
+    trim_mode: str,
+    profiles: Optional[Sequence[OutputProfile]],
+) -> Dict[str, Any]:
+    """ "image" 단계 설정 (키에 들어감)"""
+    if profiles:
+        return {"profiles": [profile.to_dict() for profile in profiles], "trim_mode": trim_mode}
+    return {"dpi": dpi, "format": format.lower(), "trim": trim_whitespace, "trim_mode": trim_mode}
+
+
+def convert_pdfs_to_images_cached(
+    cache: StageCache,
+    pdf_files: List[str],
+    output_dir: str,
+    dpi: int = 300,
+    format: str = "png",
+    trim_whitespace: bool = False,
+    verbose: bool = False,
+    on_result: Optional[Callable[[str, Result], None]] = None,
+    max_workers: Optional[int] = 1,
+    trim_mode: str = DEFAULT_TRIM_MODE,
+    profiles: Optional[Sequence[OutputProfile]] = None,
+) -> List[Result]:
+    """
+    convert_pdfs_to_images + "image" 단계 캐시
+
+    적중한 PDF는 이미지들을 output_dir에 복원 (프로필 폴더 구조, 파일 이름은 현재 PDF stem),
+    나머지만 렌더링. 결과 형식/순서는 convert_pdfs_to_images와 같음.
+    """
+    params = image_params(dpi, format, trim_whitespace, trim_mode, profiles)
+    output_root = Path(output_dir)
+    per_source: Dict[str, List[Result]] = {}
+    keys: Dict[str, str] = {}
+    misses = []
+    for pdf_file in pdf_files:
+        key, hits = lookup_images(cache, pdf_file, output_root, params)
+        if hits is None:
+            if key:
+                keys[pdf_file] = key
+            misses.append(pdf_file)
+            continue
+        per_source[pdf_file] = hits
+        if on_result:
+            for outcome in hits:
+                on_result(pdf_file, outcome)
+
+    if verbose and len(misses) < len(pdf_files):
+        print(f"[이미지 캐시] 적중 {len(pdf_files) - len(misses)}개, 렌더링 {len(misses)}개")
+
+    def collect(pdf_file: str, outcome: Result):
+        per_source.setdefault(pdf_file, []).append(outcome)
+        if on_result:
+            on_result(pdf_file, outcome)
+
+    if misses:
+        convert_pdfs_to_images(
+            misses,
+            output_dir,
+            dpi=dpi,
+            format=format,
+            trim_whitespace=trim_whitespace,
+            verbose=verbose,
+            on_result=collect,
+            max_workers=max_workers,
+            trim_mode=trim_mode,
+            profiles=profiles,
+        )
+        for pdf_file in misses:
+            if pdf_file in keys:
+                store_images(
+                    cache, keys[pdf_file], pdf_file, output_root, per_source.get(pdf_file, [])
+                )
+        cache.evict()
+    return _ordered(pdf_files, per_source)
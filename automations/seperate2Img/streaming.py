@@ -0,0 +1,200 @@
+"""
+Seperate2Img 스트리밍 단계 - 분리된 문제 1개씩 전처리 → PDF → 이미지
+
+단계별 일괄 실행은 전처리가 전부 끝나야 PDF 변환을, PDF가 전부 끝나야 렌더링을 시작합니다.
+여기서는 core/pipeline.py로 세 단계를 겹쳐 돌립니다 (문제 1번 렌더링 중에 2번 PDF 변환,
+3번 전처리).
+
+- preprocess, pdf: HWP COM 단계 → 프로세스당 한글 인스턴스 1개, COM_WORKER_LIMIT로 제한
+- image: pdfium 렌더링 (CPU) → 기본 코어 수만큼
+- pdf, image 단계 캐시는 부모에서 조회(적중 시 워커 생략)/저장 (stage_cache.py)
+"""
+
+import os
+from functools import partial
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence
+
+from core.pipeline import PipelineStage, StageResult
+from .output_profiles import OutputProfile
+from .stage_cache import (
+    StageCache,
+    image_params,
+    lookup_images,
+    lookup_pdf,
+    store_images,
+    store_pdf,
+)
+from .trim import DEFAULT_TRIM_MODE
+
+STAGE_NAMES = ("preprocess", "pdf", "image")
+COM_STAGES = ("preprocess", "pdf")
+
+# 한 번에 띄울 한글 인스턴스 수 상한 (기존 PDF 변환 max_workers=5)
+COM_WORKER_LIMIT = 5
+
+
+def default_stage_workers() -> Dict[str, int]:
+    return {"preprocess": COM_WORKER_LIMIT, "pdf": COM_WORKER_LIMIT, "image": os.cpu_count() or 1}
+
+
+def resolve_stage_workers(overrides: Optional[Mapping[str, int]] = None) -> Dict[str, int]:
+    """
+    단계별 워커 수 (기본값 + 지정값, COM 단계는 COM_WORKER_LIMIT로 제한)
+
+    Raises:
+        ValueError: 모르는 단계 이름, 1 미만의 워커 수
+    """
+    workers = default_stage_workers()
+    for name, count in (overrides or {}).items():
+        if name not in STAGE_NAMES:
+            raise ValueError(f"알 수 없는 단계: {name} ({', '.join(STAGE_NAMES)})")
+        if int(count) < 1:
+            raise ValueError(f"{name} 워커 수는 1 이상: {count}")
+        workers[name] = int(count)
+    for name in COM_STAGES:
+        workers[name] = min(workers[name], COM_WORKER_LIMIT)
+    return workers
+
+
+# ============================================================================
+# 워커 함수 (프로세스에서 실행 - 최상위 함수)
+# ============================================================================
+
+
+def preprocess_task(hwp_file: str, output_dir: str, indices: Mapping[str, int]) -> StageResult:
+    """분리된 HWP 1개 전처리 → 전처리된 HWP 경로"""
+    from automations.merger.parallel_preprocessor import preprocess_single_file
+
+    result = preprocess_single_file(hwp_file, output_dir, indices[hwp_file])
+    if result.success and result.preprocessed_path:
+        return True, result.preprocessed_path, None
+    return False, None, result.error_message or "전처리 실패"
+
+
+def pdf_task(hwp_file: str) -> StageResult:
+    """HWP 1개 → PDF (HWP 옆에 저장)"""
+    from core.hwp_to_pdf import worker_convert_to_pdf
+
+    return worker_convert_to_pdf(hwp_file, False)
+
+
+def render_task(
+    pdf_file: str,
+    output_dir: str,
+    dpi: int,
+    format: str,
+    trim_whitespace: bool,
+    trim_mode: str,
+    profiles: Optional[Sequence[OutputProfile]],
+) -> StageResult:
+    """PDF 1개 → 이미지 경로 목록 (convert_pdfs_to_images와 같은 파일 이름)"""
+    from .pdf_to_image import convert_pdf_to_image
+
+    output_base = Path(output_dir) / f"{Path(pdf_file).stem}.{format}"
+    return convert_pdf_to_image(
+        pdf_file,
+        str(output_base),
+        dpi=dpi,
+        format=format,
+        trim_whitespace=trim_whitespace,
+        trim_mode=trim_mode,
+        profiles=profiles,
+    )
+
+
+# ============================================================================
+# 단계 구성
+# ============================================================================
+
+
+def build_stages(
+    hwp_files: Sequence[str],
+    preprocess_dir: Path,
+    output_dir: Path,
+    dpi: int = 300,
+    format: str = "png",
+    trim_whitespace: bool = False,
+    profiles: Optional[Sequence[OutputProfile]] = None,
+    cache: Optional[StageCache] = None,
+    stage_workers: Optional[Mapping[str, int]] = None,
+    trim_mode: str = DEFAULT_TRIM_MODE,
+) -> List[PipelineStage]:
+    """
+    preprocess → pdf → image 단계
+
+    Args:
+        hwp_files: 분리된 HWP 파일 (순서 = 전처리 파일 번호)
+        preprocess_dir: 전처리 출력 폴더
+        output_dir: 이미지 출력 폴더
+        cache: 단계 캐시 (None이면 캐시 없음)
+        stage_workers: 단계별 워커 수 ({"preprocess": 3, "image": 8} 등, resolve_stage_workers 참고)
+    """
+    preprocess_dir.mkdir(parents=True, exist_ok=True)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    workers = resolve_stage_workers(stage_workers)
+    indices = {hwp_file: index for index, hwp_file in enumerate(hwp_files)}
+
+    pdf_stage = PipelineStage("pdf", pdf_task, workers=workers["pdf"])
+    image_stage = PipelineStage(
+        "image",
+        partial(
+            render_task,
+            output_dir=str(output_dir),
+            dpi=dpi,
+            format=format,
+            trim_whitespace=trim_whitespace,
+            trim_mode=trim_mode,
+            profiles=profiles,
+        ),
+        workers=workers["image"],
+    )
+
+    if cache:
+        pdf_keys: Dict[str, str] = {}
+        image_keys: Dict[str, str] = {}
+        params = image_params(dpi, format, trim_whitespace, trim_mode, profiles)
+
+        def pdf_lookup(hwp_file: str) -> Optional[StageResult]:
+            key, hit = lookup_pdf(cache, hwp_file)
+            if hit is None and key:
+                pdf_keys[hwp_file] = key
+            return hit
+
+        def pdf_store(hwp_file: str, result: StageResult) -> StageResult:
+            if hwp_file in pdf_keys:
+                store_pdf(cache, pdf_keys.pop(hwp_file), result)
+            return result
+
+        def image_lookup(pdf_file: str) -> Optional[StageResult]:
+            key, hits = lookup_images(cache, pdf_file, output_dir, params)
+            if hits is None:
+                if key:
+                    image_keys[pdf_file] = key
+                return None
+            return True, [path for _, path, _ in hits], None
+
+        def image_store(pdf_file: str, result: StageResult) -> StageResult:
+            success, files, error = result
+            if success and pdf_file in image_keys:
+                store_images(
+                    cache,
+                    image_keys.pop(pdf_file),
+                    pdf_file,
+                    output_dir,
+                    [(True, path, None) for path in files],
+                )
+            return result
+
+        pdf_stage.bypass, pdf_stage.complete = pdf_lookup, pdf_store
+        image_stage.bypass, image_stage.complete = image_lookup, image_store
+
+    return [
+        PipelineStage(
+            "preprocess",
+            partial(preprocess_task, output_dir=str(preprocess_dir), indices=indices),
+            workers=workers["preprocess"],
+        ),
+        pdf_stage,
+        image_stage,
+    ]
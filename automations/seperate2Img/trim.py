@@ -0,0 +1,250 @@
+"""
+여백 제거 - pdfium 비트맵 버퍼에서 NumPy로 직접
+
+trim_image_whitespace(PIL)는 BGR→RGB 변환, 배경 이미지, ImageChops 두 번으로 페이지마다
+전체 크기 사본을 여러 장 만듭니다. 여기서는 bitmap.to_numpy() 뷰(복사 없음)에서
+행/열 최솟값·최댓값만 구해 내용 영역을 찾고, 잘라낸 영역만 한 번 복사해 PIL 이미지로 만듭니다.
+
+- 추가 메모리: 행 방향 (H) + 열 방향 (W×C) 축약 결과 + 잘라낸 이미지
+- 행 축약은 (H, W*C) 뷰의 연속 축에서 (3차원 가운데 축 축약보다 100배 이상 빠름)
+- 판정 기준: trim_image_whitespace와 같음
+    배경(좌상단 픽셀)과 어느 채널이든 tolerance보다 크게 다른 픽셀이 있으면 내용
+
+render_trimmed는 렌더링 전에 자릅니다. 페이지 객체 경계(텍스트/패스/이미지/폼)에서
+내용 영역을 구해 그 영역(+여유)만 렌더링하므로, 여백이 대부분인 문제 페이지에서
+래스터 작업과 비트맵 메모리가 내용 면적만큼으로 줄어듭니다. 잘리는 영역은 전체 렌더링 후
+trim_bitmap과 같고(픽셀 값은 pdfium 안티앨리어싱 차이로 가장자리 몇 픽셀이 ±2 이내),
+같다고 확인할 수 없으면 None을 돌려줘 호출자가 전체 렌더링으로 대체합니다.
+"""
+
+import math
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+
+# ImageChops.add(diff, diff, 2.0, -100) 과 같은 기준 (채널 차이 > 100)
+TRIM_TOLERANCE = 100
+TRIM_PADDING = 10
+
+# 객체 경계 밖으로 번지는 잉크(선 두께, 글리프, 안티앨리어싱)용 여유 (포인트)
+CLIP_MARGIN_POINTS = 2.0
+
+# 렌더링 방식: clip = 객체 경계 영역만 렌더링, bitmap = 전체 렌더링 후 비트맵에서 자르기
+TRIM_MODES = ("clip", "bitmap")
+# 기본은 기존 출력과 같은 bitmap - clip은 가장자리 픽셀이 조금 달라 선택 사항 (trim_mode="clip")
+DEFAULT_TRIM_MODE = "bitmap"
+
+BBox = Tuple[int, int, int, int]  # (left, upper, right, lower) - PIL crop 형식
+
+
+def _outside(mins: np.ndarray, maxs: np.ndarray, low: np.ndarray, high: np.ndarray) -> np.ndarray:
+    """축약된 최솟값/최댓값 중 어느 채널이든 [low, high] 밖이면 True"""
+    return ((mins < low) | (maxs > high)).any(axis=-1)
+
+
+def content_bbox(
+    pixels: np.ndarray, background: Optional[Sequence[int]] = None, tolerance: int = TRIM_TOLERANCE
+) -> Optional[BBox]:
+    """
+    내용 영역 바운딩 박스
+
+    Args:
+        pixels: (H, W) 또는 (H, W, C) uint8 배열 (비트맵 뷰 그대로)
+        background: 배경색 (None이면 좌상단 픽셀)
+        tolerance: 배경과 이 값까지 다른 픽셀은 배경으로 봄
+
+    Returns:
+        (left, upper, right, lower), 내용이 없으면 None
+    """
+    if pixels.ndim == 2:
+        pixels = pixels[:, :, np.newaxis]
+
+    if background is None:
+        background = pixels[0, 0]
+    background = np.asarray(background, dtype=np.int16).reshape(-1)
+    low = background - tolerance
+    high = background + tolerance
+
+    # 행: 각 행의 최솟값/최댓값
+    if (low == low[0]).all() and (high == high[0]).all():
+        # 무채색 배경(흰색 등): (H, W*C) 뷰에서 연속 축으로 축약 (채널 구분 불필요, 빠름)
+        flat = pixels.reshape(pixels.shape[0], -1)
+        rows = (flat.min(axis=1) < low[0]) | (flat.max(axis=1) > high[0])
+    else:
+        # 유채색 배경: 채널별 (H×C)
+        rows = _outside(pixels.min(axis=1), pixels.max(axis=1), low, high)
+    if not rows.any():
+        return None
+    upper = int(rows.argmax())
+    lower = len(rows) - int(rows[::-1].argmax())
+
+    # 열: 내용이 있는 행 구간만 (W×C)
+    band = pixels[upper:lower]
+    columns = _outside(band.min(axis=0), band.max(axis=0), low, high)
+    left = int(columns.argmax())
+    right = len(columns) - int(columns[::-1].argmax())
+
+    return left, upper, right, lower
+
+
+def pad_bbox(bbox: BBox, size: Tuple[int, int], padding: int = TRIM_PADDING) -> BBox:
+    """패딩 추가 (이미지 범위 안으로 제한), size = (width, height)"""
+    left, upper, right, lower = bbox
+    return (
+        max(0, left - padding),
+        max(0, upper - padding),
+        min(size[0], right + padding),
+        min(size[1], lower + padding),
+    )
+
+
+def trim_pixels(
+    pixels: np.ndarray, padding: int = TRIM_PADDING, tolerance: int = TRIM_TOLERANCE
+) -> Image.Image:
+    """배열에서 내용 영역만 잘라 PIL 이미지로 (잘라낸 영역만 복사)"""
+    bbox = content_bbox(pixels, tolerance=tolerance)
+    if bbox is not None:
+        left, upper, right, lower = pad_bbox(bbox, (pixels.shape[1], pixels.shape[0]), padding)
+        pixels = pixels[upper:lower, left:right]
+    # 비트맵 버퍼는 페이지/비트맵이 닫히면 해제되므로 항상 복사본으로 만듦
+    return Image.fromarray(np.array(pixels, copy=True))
+
+
+def trim_bitmap(
+    bitmap, padding: int = TRIM_PADDING, tolerance: int = TRIM_TOLERANCE
+) -> Image.Image:
+    """
+    pdfium 비트맵 여백 제거
+
+    bitmap은 page.render(..., rev_byteorder=True)로 만든 RGB/RGBA/L 비트맵이어야 합니다
+    (기본 BGR 순서는 PIL이 배열에서 바로 만들 수 없음).
+    """
+    if bitmap.n_channels > 1 and not bitmap.rev_byteorder:
+        raise ValueError("trim_bitmap needs an RGB-ordered bitmap (render with rev_byteorder=True)")
+    return trim_pixels(bitmap.to_numpy(), padding, tolerance)
+
+
+# ============================================================================
+# 렌더링 전 자르기 (페이지 객체 경계)
+# ============================================================================
+
+
+def content_bounds(page) -> Optional[Tuple[float, float, float, float]]:
+    """
+    페이지 객체 경계의 합집합
+
+    Returns:
+        PDF 좌표 (left, bottom, right, top), 객체가 없으면 None
+    """
+    bounds = None
+    for obj in page.get_objects(max_depth=1):  # 폼 객체 경계는 하위 객체를 포함
+        left, bottom, right, top = obj.get_bounds()
+        if bounds is None:
+            bounds = [left, bottom, right, top]
+        else:
+            bounds = [
+                min(bounds[0], left),
+                min(bounds[1], bottom),
+                max(bounds[2], right),
+                max(bounds[3], top),
+            ]
+    return tuple(bounds) if bounds else None
+
+
+def _render_region(page, scale: float, box: BBox, size: Tuple[int, int], grayscale: bool = False):
+    """전체 렌더링(size)의 box 영역만 렌더링 - 전체 렌더링의 같은 위치 픽셀과 대응
+
+    pypdfium2는 crop을 ceil(c * scale) 픽셀로 바꾸므로, 부동소수점 오차로
+    한 픽셀 밀리지 않게 0.25픽셀 안쪽 값을 넘깁니다.
+    """
+    left, upper, right, lower = box
+    crop = (left, size[1] - lower, size[0] - right, upper)
+    return page.render(
+        scale=scale,
+        crop=tuple(max(0.0, (c - 0.25) / scale) for c in crop),
+        rev_byteorder=True,
+        grayscale=grayscale,
+    )
+
+
+def render_trimmed(
+    page,
+    scale: float,
+    padding: int = TRIM_PADDING,
+    tolerance: int = TRIM_TOLERANCE,
+    grayscale: bool = False,
+) -> Optional[Image.Image]:
+    """
+    내용 영역만 렌더링해 여백 제거
+
+    1. 페이지 객체 경계 → 전체 렌더링 픽셀 좌표, 여유(CLIP_MARGIN_POINTS)와 패딩만큼 확장
+    2. 그 영역만 렌더링, 배경은 전체 렌더링의 좌상단 픽셀(1×1 렌더링)
+    3. 영역 안에서 content_bbox + pad_bbox (trim_bitmap과 같은 판정)
+
+    Args:
+        grayscale: pdfium 회색조(1채널) 렌더링
+
+    Returns:
+        trim_bitmap(page.render(scale, rev_byteorder=True, grayscale=grayscale))과
+        같은 크기/위치의 이미지.
+        같다고 보장할 수 없으면 None (회전 페이지, 주석, 객체 없음,
+        잉크가 렌더링 영역 가장자리에 닿음 - 객체 경계가 실제보다 작았음)
+    """
+    import pypdfium2.raw as pdfium_c
+
+    if page.get_rotation() or pdfium_c.FPDFPage_GetAnnotCount(page):
+        return None
+    bounds = content_bounds(page)
+    if bounds is None:
+        return None
+
+    size = (math.ceil(page.get_width() * scale), math.ceil(page.get_height() * scale))
+    page_left, _, _, page_top = page.get_bbox()
+    left, bottom, right, top = bounds
+    margin = math.ceil(CLIP_MARGIN_POINTS * scale) + padding
+    clip = (
+        max(0, math.floor((left - page_left) * scale) - margin),
+        max(0, math.floor((page_top - top) * scale) - margin),
+        min(size[0], math.ceil((right - page_left) * scale) + margin),
+        min(size[1], math.ceil((page_top - bottom) * scale) + margin),
+    )
+    if clip[0] >= clip[2] or clip[1] >= clip[3]:
+        return None
+
+    bitmap = _render_region(page, scale, clip, size, grayscale)
+    pixels = bitmap.to_numpy()
+    if pixels.ndim == 2:
+        pixels = pixels[:, :, np.newaxis]
+
+    if clip[:2] == (0, 0):
+        background = pixels[0, 0]
+    else:
+        background = (
+            _render_region(page, scale, (0, 0, 1, 1), size, grayscale).to_numpy().reshape(-1)
+        )
+
+    bbox = content_bbox(pixels, background, tolerance)
+    if bbox is None:
+        return None
+
+    # 렌더링 영역 가장자리(페이지 가장자리가 아닌 곳)에 닿은 내용은 잘렸을 수 있음
+    height, width = pixels.shape[:2]
+    if (
+        (bbox[0] == 0 and clip[0] > 0)
+        or (bbox[1] == 0 and clip[1] > 0)
+        or (bbox[2] == width and clip[2] < size[0])
+        or (bbox[3] == height and clip[3] < size[1])
+    ):
+        return None
+
+    # 페이지 좌표에서 패딩 (전체 렌더링과 같은 위치에서 잘리도록)
+    bbox = (bbox[0] + clip[0], bbox[1] + clip[1], bbox[2] + clip[0], bbox[3] + clip[1])
+    crop_left, crop_upper, crop_right, crop_lower = pad_bbox(bbox, size, padding)
+    if crop_left < clip[0] or crop_upper < clip[1] or crop_right > clip[2] or crop_lower > clip[3]:
+        return None
+
+    crop = bitmap.to_numpy()[
+        crop_upper - clip[1] : crop_lower - clip[1], crop_left - clip[0] : crop_right - clip[0]
+    ]
+    return Image.fromarray(np.array(crop, copy=True))
@@ -117,7 +117,7 @@ class Seperate2ImgUI:
         self.progress_dialog.resizable(False, False)
         self.progress_dialog.transient()
         self.progress_dialog.grab_set()
-        
+
         self.status_label = tk.Label(
             self.progress_dialog,
             text="준비 중...",
@@ -131,7 +131,13 @@ class Seperate2ImgUI:
         if self.progress_dialog and self.status_label:
             self.status_label.config(text=message)
             self.progress_dialog.update()
-            
+
+    def on_progress_event(self, event):
+        """core.progress 구독자 - 단계/개수/현재 파일 표시 (메인 스레드 전용)"""
+        percent = f" ({event.percent}%)" if event.percent is not None else ""
+        item = f"\n{event.item}" if event.item else ""
+        self.update_progress(f"{event.stage} {event.completed}/{event.total or '?'}{percent}{item}")
+
     def close_progress_dialog(self):
         """진행 상황 다이얼로그 닫기"""
         if self.progress_dialog:
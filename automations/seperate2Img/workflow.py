@@ -9,33 +9,102 @@ Idris2 명세: Specs/Seperate2Img/Workflow.idr
 import shutil
 import time
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Mapping, Optional, Callable, Sequence, Tuple
 
 from automations.separator.separator import separate_problems
 from automations.separator.types import SeparatorConfig, OutputFormat
 from automations.merger.parallel_preprocessor import ParallelPreprocessor, PreprocessConfig
 from core.hwp_to_pdf import convert_hwp_to_pdf_parallel
 from core.hwpx_converter import ensure_hwp_format
+from core.pipeline import StreamingPipeline
+from .encoders import EncoderSpec
+from .output_profiles import (
+    OutputProfile,
+    ProfileSpec,
+    parse_output_profiles,
+    profile_dir,
+    single_profile,
+)
 from .pdf_to_image import convert_pdfs_to_images
-
+from .stage_cache import StageCache, convert_hwp_to_pdf_cached, convert_pdfs_to_images_cached
+from .streaming import build_stages
+from .trim import DEFAULT_TRIM_MODE, TRIM_MODES
 
 class Seperate2ImgWorkflow:
     """Seperate2Img 워크플로우 로직"""
 
-    def __init__(self, progress_callback: Optional[Callable[[str], None]] = None):
+    def __init__(
+        self,
+        progress_callback: Optional[Callable[[str], None]] = None,
+        result_callback: Optional[
+            Callable[[str, str, Tuple[bool, Optional[str], Optional[str]]], None]
+        ] = None,
+        stage_cache: Optional[StageCache] = None,
+    ):
         self.progress_callback = progress_callback
+        # 파일별 결과 (단계 "preprocess"/"pdf"/"image", 입력 파일, (성공, 출력, 오류))
+        self.result_callback = result_callback
+        # 단계 캐시 (None이면 run에서 기본 위치의 StageCache)
+        self.stage_cache = stage_cache
 
     def update_progress(self, message: str):
         """진행 상황 업데이트"""
         if self.progress_callback:
             self.progress_callback(message)
 
-    def run(self, input_path: str, output_dir: str, dpi: int = 300, format: str = "png", trim_whitespace: bool = False, cleanup_temp: bool = False) -> Dict[str, Any]:
+    def run(
+        self,
+        input_path: str,
+        output_dir: str,
+        dpi: int = 300,
+        format: str = "png",
+        trim_whitespace: bool = False,
+        cleanup_temp: bool = False,
+        output_profiles: Optional[Sequence[ProfileSpec]] = None,
+        use_cache: bool = True,
+        streaming: bool = True,
+        stage_workers: Optional[Mapping[str, int]] = None,
+        encoder: Optional[EncoderSpec] = None,
+        color_mode: str = "rgb",
+        trim_mode: str = DEFAULT_TRIM_MODE,
+    ) -> Dict[str, Any]:
         """전체 워크플로우 실행
 
         Idris2 명세: runWorkflowWithSeparateFirst (Specs/Seperate2Img/SeparateAndPreprocess.idr)
         워크플로우: ensureHwpFormat -> separateProblems -> preprocessSeparatedFiles (병렬) -> convertToPdf -> convertToImage
+
+        output_profiles: 출력 프로필 목록 (OutputProfile 또는 dict,
+            주어지면 dpi/format/trim_whitespace 대신)
+            예) [{"name": "full", "format": "png", "dpi": 300, "trim": True},
+                 {"name": "web", "format": "jpg", "max_width": 1200, "quality": 85, "trim": True},
+                 {"name": "thumb", "format": "jpg", "max_width": 240, "quality": 80, "trim": True}]
+            페이지마다 가장 높은 DPI로 한 번만 렌더링하고 나머지는 축소 (결과에 profile_files 추가)
+        use_cache: HWP→PDF, PDF→이미지 단계 캐시 사용
+            (stage_cache.py, 결과에 단계별 적중 수 "cache")
+        streaming: 분리된 문제마다 전처리 → PDF → 이미지를 바로 이어서 실행
+            (streaming.py, 결과에 단계별 점유율 "pipeline"), False면 단계별 일괄 실행
+        stage_workers: 스트리밍 단계별 워커 수 (예: {"preprocess": 3, "pdf": 5, "image": 8},
+            COM 단계는 최대 COM_WORKER_LIMIT, image 기본값은 CPU 수)
+        encoder: 인코딩 설정 (encoders.py 프리셋 이름 "png-fast", "png-gray16", "webp" 등 또는 dict,
+            출력 프로필이 없을 때 format 대신 - 프로필별 설정은 프로필의 encoder)
+        color_mode: "rgb", "gray" (pdfium 회색조 렌더링), "bilevel" (회색조 → 1비트)
+            - 출력 프로필이 없을 때 (프로필별 설정은 프로필의 color_mode/threshold)
+        trim_mode: 여백 제거 방식 - "bitmap" (기본, 전체 렌더링 후 자르기) 또는
+            "clip" (내용 영역만 렌더링, 더 빠르지만 가장자리 픽셀이 ±2 다를 수 있음 - trim.py)
         """
+        if trim_mode not in TRIM_MODES:
+            raise ValueError(f"trim_mode must be one of {TRIM_MODES}: {trim_mode!r}")
+        # 프로필/인코더 검증은 COM 작업 전에
+        profiles = parse_output_profiles(output_profiles) if output_profiles else None
+        # 이미지 단계가 쓰는 프로필 (인코더/색 모드만 지정하면 output_dir에 저장하는 프로필 1개)
+        image_profiles = profiles
+        if not profiles and (encoder or color_mode != "rgb"):
+            image_profiles = single_profile(dpi, format, trim_whitespace, encoder, color_mode)
+
+        cache = None
+        if use_cache:
+            cache = self.stage_cache or StageCache()
+            cache.stats.clear()
 
         # 임시 폴더 (전처리, HWP 분리, PDF 변환용)
         temp_dir = Path(output_dir) / "temp"
@@ -63,29 +132,71 @@ class Seperate2ImgWorkflow:
         if not hwp_files:
             return {"success": False, "message": "분리된 파일이 없습니다.", "success_count": 0, "fail_count": 0}
 
-        # 1b. 분리된 파일들에 병렬 전처리 적용
-        self.update_progress(f"1b/4단계: 분리된 파일 전처리 중 ({len(hwp_files)}개)...")
-        preprocessed_files = self._preprocess_separated_files(hwp_files, str(temp_dir))
-
-        if not preprocessed_files:
-            return {
-                "success": False,
-                "message": f"전처리 실패 (분리: {len(hwp_files)}개, 전처리 성공: 0개)",
-                "success_count": 0,
-                "fail_count": len(hwp_files)
-            }
-
-        # 2. PDF 변환
-        self.update_progress(f"2/4단계: PDF 변환 중 ({len(preprocessed_files)}개 파일)...")
-        pdf_files = self._convert_to_pdf(preprocessed_files)
-
-        if not pdf_files:
-            return {"success": False, "message": "PDF 변환 실패", "success_count": 0, "fail_count": len(hwp_files)}
-
-        # 3. 이미지 변환
-        self.update_progress(f"3/4단계: 이미지 변환 중 ({len(pdf_files)}개 파일)...")
-        img_results = self._convert_to_image(pdf_files, final_dir, dpi, format, trim_whitespace)
-        image_files = [path for success, path, _ in img_results if success and path]
+        pipeline_report = None
+        if streaming:
+            # 2~3. 전처리 → PDF → 이미지 (문제 단위로 겹쳐 실행)
+            self.update_progress(
+                f"2/4단계: 전처리 → PDF → 이미지 변환 중 ({len(hwp_files)}개 파일)..."
+            )
+            image_files, failures, pipeline_report = self._run_streaming(
+                hwp_files,
+                temp_dir,
+                final_dir,
+                dpi,
+                format,
+                trim_whitespace,
+                image_profiles,
+                cache,
+                stage_workers,
+                trim_mode,
+            )
+            if failures["preprocess"] == len(hwp_files):
+                return {
+                    "success": False,
+                    "message": f"전처리 실패 (분리: {len(hwp_files)}개, 전처리 성공: 0개)",
+                    "success_count": 0,
+                    "fail_count": len(hwp_files),
+                    "pipeline": pipeline_report,
+                }
+            if failures["preprocess"] + failures["pdf"] == len(hwp_files):
+                return {
+                    "success": False,
+                    "message": "PDF 변환 실패",
+                    "success_count": 0,
+                    "fail_count": len(hwp_files),
+                    "pipeline": pipeline_report,
+                }
+        else:
+            # 1b. 분리된 파일들에 병렬 전처리 적용
+            self.update_progress(f"1b/4단계: 분리된 파일 전처리 중 ({len(hwp_files)}개)...")
+            preprocessed_files = self._preprocess_separated_files(hwp_files, str(temp_dir))
+
+            if not preprocessed_files:
+                return {
+                    "success": False,
+                    "message": f"전처리 실패 (분리: {len(hwp_files)}개, 전처리 성공: 0개)",
+                    "success_count": 0,
+                    "fail_count": len(hwp_files),
+                }
+
+            # 2. PDF 변환
+            self.update_progress(f"2/4단계: PDF 변환 중 ({len(preprocessed_files)}개 파일)...")
+            pdf_files = self._convert_to_pdf(preprocessed_files, cache)
+
+            if not pdf_files:
+                return {
+                    "success": False,
+                    "message": "PDF 변환 실패",
+                    "success_count": 0,
+                    "fail_count": len(hwp_files),
+                }
+
+            # 3. 이미지 변환
+            self.update_progress(f"3/4단계: 이미지 변환 중 ({len(pdf_files)}개 파일)...")
+            img_results = self._convert_to_image(
+                pdf_files, final_dir, dpi, format, trim_whitespace, image_profiles, cache, trim_mode
+            )
+            image_files = [path for success, path, _ in img_results if success and path]
 
         # 4. 정리 (CleaningUp)
         if cleanup_temp:
@@ -95,12 +206,94 @@ class Seperate2ImgWorkflow:
         success_count = len(image_files)
         fail_count = max(0, len(hwp_files) - success_count)
 
-        return {
+        result = {
             "success": True,
             "success_count": success_count,
             "fail_count": fail_count,
-            "image_files": image_files
+            "image_files": image_files,
         }
+        if profiles:
+            # 프로필이 여러 개면 이미지 수 = 문제 수 × 프로필 수 → 실패 수는 첫 프로필 기준
+            result["profile_files"] = self._group_by_profile(image_files, final_dir, profiles)
+            result["fail_count"] = max(
+                0, len(hwp_files) - len(result["profile_files"][profiles[0].name])
+            )
+        if cache:
+            result["cache"] = cache.report()
+        if pipeline_report:
+            result["pipeline"] = pipeline_report
+        return result
+
+    def _run_streaming(
+        self,
+        hwp_files: List[str],
+        temp_dir: Path,
+        output_dir: Path,
+        dpi: int,
+        format: str,
+        trim_whitespace: bool,
+        profiles: Optional[List[OutputProfile]],
+        cache: Optional[StageCache],
+        stage_workers: Optional[Mapping[str, int]],
+        trim_mode: str = DEFAULT_TRIM_MODE,
+    ) -> Tuple[List[str], Dict[str, int], Dict[str, Any]]:
+        """2~3단계 스트리밍 실행
+
+        Returns:
+            (이미지 경로 - 문제 순/페이지 순, 단계별 실패 수, 단계별 지표)
+        """
+        stages = build_stages(
+            hwp_files,
+            temp_dir / "preprocessed",
+            output_dir,
+            dpi=dpi,
+            format=format,
+            trim_whitespace=trim_whitespace,
+            profiles=profiles,
+            cache=cache,
+            stage_workers=stage_workers,
+            trim_mode=trim_mode,
+        )
+        print(
+            f"\n[스트리밍] {len(hwp_files)}개 파일 (워커: "
+            + ", ".join(f"{stage.name} {stage.workers}" for stage in stages)
+            + ")"
+        )
+
+        pipeline = StreamingPipeline(
+            stages, on_result=self._pipeline_callback if self.result_callback else None
+        )
+        outcomes = pipeline.run(hwp_files)
+        if cache:
+            cache.evict()
+
+        image_files: List[str] = []
+        failures = {stage.name: 0 for stage in stages}
+        for outcome in outcomes:
+            if not outcome.ok:
+                failures[outcome.stage] += 1
+            if outcome.stage == "image":
+                # 렌더링 도중 실패한 PDF도 저장된 페이지는 포함 (일괄 실행과 같음)
+                image_files.extend(outcome.result[1] or [])
+
+        report = pipeline.report()
+        for name, metrics in report["stages"].items():
+            print(
+                f"[스트리밍] {name}: 처리 {metrics['processed']}, 실패 {metrics['failed']}, "
+                f"캐시 {metrics['bypassed']}, 점유율 {metrics['occupancy']:.0%}"
+            )
+        return image_files, failures, report
+
+    def _pipeline_callback(self, stage: str, source: str, outcome: Tuple[bool, Any, Optional[str]]):
+        """파이프라인 결과 → result_callback (image 단계는 이미지 파일마다)"""
+        if stage != "image":
+            self.result_callback(stage, source, outcome)
+            return
+        success, files, error = outcome
+        for path in files or []:
+            self.result_callback(stage, source, (True, path, None))
+        if not success:
+            self.result_callback(stage, source, (False, None, error))
 
     def _preprocess_separated_files(self, hwp_files: List[str], temp_dir: str) -> List[str]:
         """분리된 파일들에 병렬 전처리 적용
@@ -152,26 +345,82 @@ class Seperate2ImgWorkflow:
         sep_result = separate_problems(sep_config)
         return sep_result.output_files
 
-    def _convert_to_pdf(self, hwp_files: List[str]) -> List[str]:
-        """2단계: HWP → PDF 변환"""
-        pdf_results = convert_hwp_to_pdf_parallel(
-            hwp_files=hwp_files,
-            max_workers=5,
-            verbose=True
-        )
+    def _convert_to_pdf(
+        self, hwp_files: List[str], cache: Optional[StageCache] = None
+    ) -> List[str]:
+        """2단계: HWP → PDF 변환 (캐시 적중 파일은 COM 변환 생략)"""
+        if cache:
+            pdf_results = convert_hwp_to_pdf_cached(
+                cache,
+                hwp_files,
+                max_workers=5,
+                verbose=True,
+                on_result=self._stage_callback("pdf"),
+            )
+        else:
+            pdf_results = convert_hwp_to_pdf_parallel(
+                hwp_files=hwp_files,
+                max_workers=5,
+                verbose=True,
+                on_result=self._stage_callback("pdf"),
+            )
         return [path for success, path, _ in pdf_results if success and path]
 
-    def _convert_to_image(self, pdf_files: List[str], output_dir: Path, dpi: int, format: str, trim_whitespace: bool) -> List:
-        """3단계: PDF → Image 변환"""
+    def _convert_to_image(
+        self,
+        pdf_files: List[str],
+        output_dir: Path,
+        dpi: int,
+        format: str,
+        trim_whitespace: bool,
+        profiles: Optional[List[OutputProfile]] = None,
+        cache: Optional[StageCache] = None,
+        trim_mode: str = DEFAULT_TRIM_MODE,
+    ) -> List:
+        """3단계: PDF → Image 변환 (캐시 적중 PDF는 렌더링 생략)"""
+        if cache:
+            return convert_pdfs_to_images_cached(
+                cache,
+                pdf_files,
+                str(output_dir),
+                dpi=dpi,
+                format=format,
+                trim_whitespace=trim_whitespace,
+                verbose=True,
+                on_result=self._stage_callback("image"),
+                max_workers=None,
+                profiles=profiles,
+                trim_mode=trim_mode,
+            )
         return convert_pdfs_to_images(
             pdf_files=pdf_files,
             output_dir=str(output_dir),
             dpi=dpi,
             format=format,
             trim_whitespace=trim_whitespace,
-            verbose=True
+            verbose=True,
+            on_result=self._stage_callback("image"),
+            max_workers=None,  # 페이지 단위 병렬 렌더링 (CPU 수만큼)
+            profiles=profiles,
+            trim_mode=trim_mode,
         )
 
+    @staticmethod
+    def _group_by_profile(
+        image_files: List[str], output_dir: Path, profiles: List[OutputProfile]
+    ) -> Dict[str, List[str]]:
+        """이미지 경로 → {프로필 이름: 경로 목록} (프로필마다 출력 폴더가 다름)"""
+        folders = {profile_dir(output_dir, profile): profile.name for profile in profiles}
+        grouped: Dict[str, List[str]] = {profile.name: [] for profile in profiles}
+        for path in image_files:
+            grouped[folders[Path(path).parent]].append(path)
+        return grouped
+
+    def _stage_callback(self, stage: str):
+        if not self.result_callback:
+            return None
+        return lambda source, outcome: self.result_callback(stage, source, outcome)
+
     def _cleanup_temp(self, temp_dir: Path):
         """임시 파일 정리"""
         self.update_progress("임시 파일 정리 중...")
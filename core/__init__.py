@@ -5,10 +5,29 @@ HwpAutomation Core Module
 모든 플러그인이 이 모듈을 사용하여 HWP를 제어합니다.
 """
 
-from .hwp_client import HwpClient
-from .automation_client import AutomationClient
-from .types import DocumentState
-from .sync import wait_for_hwp_ready
+
+# 하위 모듈은 lazy import
+# - COM 클라이언트: pywin32가 없는 환경에서도 core 하위 모듈 사용 가능
+# - DocumentState: core.types가 pydantic을 끌어와 (~120ms) core.progress/core.startup까지 느려짐
+def __getattr__(name):
+    if name == "DocumentState":
+        from .types import DocumentState
+
+        return DocumentState
+    if name == "wait_for_hwp_ready":
+        from .sync import wait_for_hwp_ready
+
+        return wait_for_hwp_ready
+    if name == "HwpClient":
+        from .hwp_client import HwpClient
+
+        return HwpClient
+    if name == "AutomationClient":
+        from .automation_client import AutomationClient
+
+        return AutomationClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "HwpClient",
@@ -0,0 +1,216 @@
+"""
+HWP 액션 일괄 실행
+
+hwp.Run("...")을 한 번씩 부를 때마다 프로세스 간 COM 왕복이 생기고, 호출 사이마다
+time.sleep을 넣는 관행 때문에 짧은 액션 연쇄(MoveDocBegin → SelectAll → Copy 등)가
+실제 작업보다 오래 걸립니다. ActionBatch는 액션 ID와 파라미터 셋 변경을 모아 두었다가
+flush() 시점에 한 번에 실행합니다.
+
+실행 방식:
+- 한글 COM에는 임의 스크립트 문자열을 실행하는 진입점이 없어(RunScriptMacro는 문서에
+  등록된 매크로만 호출) 매크로 한 번으로 보낼 수 없습니다. 대신 Run/HAction/
+  HParameterSet 디스패치를 flush마다 한 번만 조회하고, 큐에 쌓인 호출을 중간 sleep
+  없이 연속(pipelined)으로 보냅니다.
+- 결과가 필요한 호출(GetPos 등)은 Pending을 돌려주며 flush 후 .value로 읽습니다.
+
+사용 예:
+    with client.batch() as batch:
+        batch.run("MoveDocBegin", "SelectAll", "Copy")
+    print(batch.stats.elapsed)
+
+    batch = ActionBatch(hwp)
+    pos = batch.run("MoveParaEnd").get_pos()
+    batch.flush()
+    print(pos.value)
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Tuple
+
+from .param_cache import DOCUMENT_ACTIONS, invalidate_document
+
+
+@dataclass
+class BatchStats:
+    """일괄 실행 통계 (flush 누적)"""
+
+    flushes: int = 0
+    actions: int = 0  # Run
+    executes: int = 0  # HAction.Execute (GetDefault + 필드 설정 포함)
+    queries: int = 0  # GetPos 등 결과 조회
+    elapsed: float = 0.0
+    last_elapsed: float = 0.0
+
+    @property
+    def operations(self) -> int:
+        return self.actions + self.executes + self.queries
+
+
+class Pending:
+    """flush 후 채워지는 결과"""
+
+    __slots__ = ("value", "done")
+
+    def __init__(self):
+        self.value: Any = None
+        self.done = False
+
+    def __repr__(self) -> str:
+        return f"Pending({self.value!r})" if self.done else "Pending(<queued>)"
+
+
+class BatchError(RuntimeError):
+    """일괄 실행 중 실패 (index: 실패한 작업 순번, 이전 작업은 이미 실행됨)"""
+
+    def __init__(self, index: int, operation: str, error: Exception):
+        super().__init__(f"batch operation #{index} ({operation}) failed: {error}")
+        self.index = index
+        self.operation = operation
+        self.error = error
+
+
+_RUN = "run"
+_EXECUTE = "execute"
+_CALL = "call"
+
+
+class ActionBatch:
+    """액션/파라미터 셋 변경 큐
+
+    Args:
+        hwp: 한글 객체 (IHwpObject 또는 FakeHwp)
+        on_flush: flush 마다 해당 flush 한 번의 BatchStats로 호출
+            (누적값이 아님, AutomationClient 타이밍 기록용)
+    """
+
+    def __init__(self, hwp: Any, on_flush: Optional[Callable[["BatchStats"], None]] = None):
+        self.hwp = hwp
+        self.stats = BatchStats()
+        self._queue: List[Tuple[str, tuple, Optional[Pending]]] = []
+        self._on_flush = on_flush
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    # ------------------------------------------------------------------
+    # 큐
+    # ------------------------------------------------------------------
+
+    def run(self, *actions: str) -> "ActionBatch":
+        """hwp.Run(action) 예약 (여러 개 가능)"""
+        for action in actions:
+            self._queue.append((_RUN, (action,), None))
+        return self
+
+    def execute(self, action: str, set_name: str, **fields: Any) -> Pending:
+        """HAction.GetDefault → 필드 설정 → HAction.Execute 예약
+
+        Args:
+            action: 액션 ID (예: "MultiColumn")
+            set_name: HParameterSet 이름 (예: "HColDef")
+            fields: 설정할 항목 (이름=값, SetItem으로 설정)
+
+        Returns:
+            Execute 결과 Pending
+        """
+        pending = Pending()
+        self._queue.append((_EXECUTE, (action, set_name, fields), pending))
+        return pending
+
+    def call(self, method: str, *args: Any) -> Pending:
+        """hwp.<method>(*args) 예약 (SetPos, GetText 등)"""
+        pending = Pending()
+        self._queue.append((_CALL, (method, args), pending))
+        return pending
+
+    def get_pos(self) -> Pending:
+        """hwp.GetPos() 예약 → (list, para, pos)"""
+        return self.call("GetPos")
+
+    # ------------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------------
+
+    def flush(self) -> List[Any]:
+        """큐 실행 → 작업별 결과 목록
+
+        Raises:
+            BatchError: 작업 실패 시 (남은 작업은 버려짐)
+        """
+        queue, self._queue = self._queue, []
+        if not queue:
+            return []
+
+        hwp = self.hwp
+        run = hwp.Run
+        haction = None
+        parameter_sets = None
+        results: List[Any] = []
+        stats = self.stats
+        before = (stats.actions, stats.executes, stats.queries)
+        switched_document = False
+
+        start = time.perf_counter()
+        try:
+            for index, (kind, args, pending) in enumerate(queue):
+                try:
+                    if kind == _RUN:
+                        switched_document = switched_document or args[0] in DOCUMENT_ACTIONS
+                        value = run(args[0])
+                        stats.actions += 1
+                    elif kind == _EXECUTE:
+                        if haction is None:
+                            haction = hwp.HAction
+                            parameter_sets = hwp.HParameterSet
+                        action, set_name, fields = args
+                        parameter_set = getattr(parameter_sets, set_name).HSet
+                        haction.GetDefault(action, parameter_set)
+                        for name, field_value in fields.items():
+                            parameter_set.SetItem(name, field_value)
+                        value = haction.Execute(action, parameter_set)
+                        stats.executes += 1
+                    else:
+                        method, call_args = args
+                        value = getattr(hwp, method)(*call_args)
+                        stats.queries += 1
+                except Exception as e:
+                    raise BatchError(index, f"{kind}:{args[0]}", e) from e
+
+                if pending is not None:
+                    pending.value = value
+                    pending.done = True
+                results.append(value)
+        finally:
+            if switched_document:
+                invalidate_document(hwp)
+            stats.last_elapsed = time.perf_counter() - start
+            stats.elapsed += stats.last_elapsed
+            stats.flushes += 1
+            if self._on_flush is not None:
+                self._on_flush(
+                    BatchStats(
+                        flushes=1,
+                        actions=stats.actions - before[0],
+                        executes=stats.executes - before[1],
+                        queries=stats.queries - before[2],
+                        elapsed=stats.last_elapsed,
+                        last_elapsed=stats.last_elapsed,
+                    )
+                )
+
+        return results
+
+    def discard(self):
+        """실행하지 않고 큐 비우기"""
+        self._queue.clear()
+
+    def __enter__(self) -> "ActionBatch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+        else:
+            self.discard()
+        return False
@@ -7,18 +7,13 @@ Uses OLE Automation approach (properties/methods on objects)
 rather than ActionTable approach (action IDs with parameter sets).
 """
 
+from collections import deque
 from typing import Optional, Any, Union
 from pathlib import Path
 
-try:
-    import win32com.client as win32
-    import pythoncom
-except ImportError:
-    raise ImportError(
-        "pywin32 is required for HWP automation. "
-        "Install it with: uv pip install pywin32"
-    )
-
+from .action_batch import ActionBatch, BatchStats
+from .com_backend import dispatch_hwp, co_initialize, co_uninitialize
+from .param_cache import invalidate_document, parameter_cache
 from .types import HwpResult
 
 
@@ -37,14 +32,20 @@ class AutomationClient:
     - IXHwpWindow (individual window)
     """
 
+    # Number of recent batch flushes kept in batch_timings
+    BATCH_HISTORY = 256
+
     def __init__(self):
         """Initialize HWP Automation client."""
         self._hwp: Optional[Any] = None
+        self.batch_timings: deque = deque(maxlen=self.BATCH_HISTORY)
 
     def _ensure_com_initialized(self) -> None:
         """Ensure COM is initialized for the current thread."""
         try:
-            pythoncom.CoInitialize()
+            co_initialize()
+        except ImportError:
+            raise
         except Exception:
             pass  # Already initialized
 
@@ -54,8 +55,10 @@ class AutomationClient:
         try:
             # Use DispatchEx for late binding (like working scripts)
             # This avoids issues with gencache type library binding
-            hwp = win32.DispatchEx("HWPFrame.HwpObject")
+            hwp = dispatch_hwp()
             return hwp
+        except ImportError:
+            raise
         except Exception as e:
             raise RuntimeError(f"Failed to create HWP instance: {e}")
 
@@ -66,6 +69,26 @@ class AutomationClient:
             self._hwp = self._create_hwp_instance()
         return self._hwp
 
+    def batch(self) -> ActionBatch:
+        """
+        Create an action batch bound to this client's IHwpObject.
+
+        Queued Run actions and parameter-set executions are sent back to
+        back when the batch is flushed (on leaving the ``with`` block).
+
+        Returns:
+            ActionBatch; each flush appends the BatchStats of that
+            single flush (not a running total) to ``batch_timings``
+
+        Example:
+            with client.batch() as batch:
+                batch.run("MoveDocBegin", "SelectAll", "Copy")
+        """
+        return ActionBatch(self.hwp, on_flush=self._record_batch)
+
+    def _record_batch(self, stats: BatchStats) -> None:
+        self.batch_timings.append(stats)
+
     def register_security_module(self, module_path: str) -> HwpResult:
         """
         Register security module to bypass file access approval messages.
@@ -135,6 +158,7 @@ class AutomationClient:
         try:
             # Use IHwpObject.Open() method (not XHwpDocuments.Open)
             result = self.hwp.Open(str(file_path.absolute()), format, options)
+            invalidate_document(self.hwp)  # 파라미터 셋 기본값이 새 문서 기준으로 바뀜
 
             if not result:
                 return HwpResult.fail(f"Failed to open document: {path}")
@@ -298,12 +322,13 @@ class AutomationClient:
                 return HwpResult.fail("No active document to save")
 
             # Use HAction FileSaveAs_S approach
-            self.hwp.HAction.GetDefault("FileSaveAs_S", self.hwp.HParameterSet.HFileOpenSave.HSet)
-            self.hwp.HParameterSet.HFileOpenSave.filename = str(Path(path).absolute())
-            self.hwp.HParameterSet.HFileOpenSave.Format = format
-            self.hwp.HParameterSet.HFileOpenSave.Attributes = 1
-
-            result = self.hwp.HAction.Execute("FileSaveAs_S", self.hwp.HParameterSet.HFileOpenSave.HSet)
+            result = parameter_cache(self.hwp).execute(
+                "FileSaveAs_S",
+                "HFileOpenSave",
+                filename=str(Path(path).absolute()),
+                Format=format,
+                Attributes=1,
+            )
 
             if result:
                 return HwpResult.ok({
@@ -337,6 +362,7 @@ class AutomationClient:
                 doc = active_result.value["document"]
 
             result = doc.Close(save_changes)
+            invalidate_document(self.hwp)
             return HwpResult.ok({"closed": result})
         except Exception as e:
             return HwpResult.fail(f"Failed to close document: {e}")
@@ -579,4 +605,4 @@ class AutomationClient:
                 pass
             finally:
                 self._hwp = None
-                pythoncom.CoUninitialize()
+                co_uninitialize()
@@ -0,0 +1,140 @@
+"""
+HWP COM 백엔드 선택
+
+한글 인스턴스 생성과 COM 초기화는 모두 이 모듈을 거칩니다.
+
+- 기본: pywin32 DispatchEx("HWPFrame.HwpObject") (pywin32는 처음 사용할 때 import)
+- set_hwp_factory() / use_hwp_factory(): 다른 백엔드 주입 (core.fake_hwp.FakeHwp 등)
+- 환경 변수 HWP_BACKEND=fake: ProcessPoolExecutor 워커처럼 주입 코드가 실행되지
+  않는 하위 프로세스에서도 FakeHwp 사용 (HWP_FAKE_LATENCY=호출당 지연 초)
+
+주입된 백엔드를 쓰는 동안 CoInitialize/CoUninitialize는 아무 일도 하지 않습니다.
+
+추적(core.com_trace.tracing() 또는 HWP_TRACE 환경 변수)이 켜져 있으면 생성한
+인스턴스를 추적 프록시로 감싸 반환합니다.
+
+사용 예:
+    from core.fake_hwp import FakeBackend
+
+    backend = FakeBackend(latency=0.002)
+    with use_hwp_factory(backend):
+        with open_hwp("problem.hwp") as hwp:
+            ...
+    print(backend.stats.total_calls)
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+HWP_PROG_ID = "HWPFrame.HwpObject"
+
+BACKEND_ENV = "HWP_BACKEND"
+LATENCY_ENV = "HWP_FAKE_LATENCY"
+
+HwpFactory = Callable[[], Any]
+
+_factory: Optional[HwpFactory] = None
+_factory_lock = threading.Lock()
+
+
+def _win32():
+    try:
+        import win32com.client
+        import pythoncom
+    except ImportError:
+        raise ImportError(
+            "pywin32 is required for HWP automation. " "Install it with: uv pip install pywin32"
+        )
+    return win32com.client, pythoncom
+
+
+def _env_factory() -> Optional[HwpFactory]:
+    """HWP_BACKEND 환경 변수로 지정된 백엔드"""
+    backend = os.environ.get(BACKEND_ENV, "").strip().lower()
+    if backend in ("", "com"):
+        return None
+    if backend == "fake":
+        from .fake_hwp import FakeBackend
+
+        return FakeBackend(latency=float(os.environ.get(LATENCY_ENV, "0") or 0))
+    raise ValueError(f"알 수 없는 {BACKEND_ENV} 값: {backend}")
+
+
+def set_hwp_factory(factory: Optional[HwpFactory]) -> Optional[HwpFactory]:
+    """한글 인스턴스 생성 함수 교체 (None이면 COM 기본값)
+
+    Returns:
+        이전 factory
+    """
+    global _factory
+    with _factory_lock:
+        previous = _factory
+        _factory = factory
+    return previous
+
+
+def get_hwp_factory() -> Optional[HwpFactory]:
+    """현재 주입된 factory (환경 변수 포함, 없으면 None)"""
+    global _factory
+    with _factory_lock:
+        if _factory is None:
+            _factory = _env_factory()
+        return _factory
+
+
+@contextmanager
+def use_hwp_factory(factory: HwpFactory) -> Iterator[HwpFactory]:
+    """블록 안에서만 factory 교체"""
+    previous = set_hwp_factory(factory)
+    try:
+        yield factory
+    finally:
+        set_hwp_factory(previous)
+
+
+def is_com_backend() -> bool:
+    """실제 COM(pywin32) 백엔드 사용 여부"""
+    return get_hwp_factory() is None
+
+
+def dispatch_hwp(early_binding: bool = False) -> Any:
+    """한글 인스턴스 생성 (IHwpObject)
+
+    Args:
+        early_binding: True이면 gencache.EnsureDispatch (HwpClient 방식),
+                       False이면 DispatchEx (late binding, 작업 스크립트 방식)
+    """
+    factory = get_hwp_factory()
+    if factory is not None:
+        hwp = factory()
+    else:
+        client, _ = _win32()
+        if early_binding:
+            hwp = client.gencache.EnsureDispatch(HWP_PROG_ID)
+        else:
+            hwp = client.DispatchEx(HWP_PROG_ID)
+
+    from .com_trace import active_recorder
+
+    recorder = active_recorder()
+    if recorder is not None:
+        return recorder.attach(hwp)
+    return hwp
+
+
+def co_initialize() -> None:
+    """현재 스레드 COM 초기화 (주입된 백엔드에서는 생략)"""
+    if get_hwp_factory() is not None:
+        return
+    _, pythoncom = _win32()
+    pythoncom.CoInitialize()
+
+
+def co_uninitialize() -> None:
+    """현재 스레드 COM 해제 (주입된 백엔드에서는 생략)"""
+    if get_hwp_factory() is not None:
+        return
+    _, pythoncom = _win32()
+    pythoncom.CoUninitialize()
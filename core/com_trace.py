@@ -0,0 +1,676 @@
+"""
+COM 호출 추적 / 재생
+
+dispatch_hwp()가 만든 한글 객체(AutomationClient.hwp, open_hwp 등)를 투명
+프록시로 감싸 모든 속성 읽기/쓰기와 메서드 호출(Run, HAction.Execute ...)을
+시각, 소요 시간, 인자와 함께 바이너리 추적 파일에 기록합니다.
+Windows에서 기록한 추적을 Linux에서 분석(report)하거나 FakeHwp로 다시
+실행(replay)할 수 있습니다.
+
+켜는 방법:
+- 코드: with tracing("merge.hwptrace"): ...
+- 환경 변수: HWP_TRACE=merge.hwptrace (디렉토리면 프로세스별 trace_<pid>.hwptrace)
+
+추적 파일 형식 (little endian):
+    MAGIC
+    레코드*:
+      STRING  : u8 tag=1, u32 len, utf-8 bytes          (문자열 테이블, 등장 순서가 ID)
+      EVENT   : u8 tag=2, u8 kind, u32 handle, u32 name, f64 start, f64 duration,
+                u8 argc, value*argc, value(result)
+    value     : u8 type + payload
+                N/T/F (None/True/False), i (i64), d (f64), s (u32 문자열 ID),
+                h (u32 객체 핸들), t (u8 count + value*), r (u32 repr 문자열 ID)
+
+객체 핸들: 0번부터 한글 인스턴스(NEW)와 COM 객체 반환값마다 새 번호를 붙입니다.
+
+CLI:
+    python -m core.com_trace report merge.hwptrace --top 20
+    python -m core.com_trace replay merge.hwptrace --latency 0.002
+"""
+
+import argparse
+import atexit
+import inspect
+import os
+import struct
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+TRACE_ENV = "HWP_TRACE"
+TRACE_MAGIC = b"HWPTRC01"
+TRACE_SUFFIX = ".hwptrace"
+
+TAG_STRING = 1
+TAG_EVENT = 2
+
+KIND_NEW = 1  # 한글 인스턴스 생성
+KIND_GET = 2  # 속성 읽기
+KIND_SET = 3  # 속성 쓰기
+KIND_CALL = 4  # 메서드 호출
+KIND_ERROR = 0x80  # 예외 발생 플래그
+
+KIND_NAMES = {KIND_NEW: "NEW", KIND_GET: "GET", KIND_SET: "SET", KIND_CALL: "CALL"}
+
+_STRING = struct.Struct("<BI")
+_EVENT = struct.Struct("<BBIIdd")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+
+_PRIMITIVES = (str, int, float, bool, bytes, type(None))
+
+# 액션 ID를 첫 인자로 받는 메서드 (report에서 액션별 집계)
+ACTION_METHODS = {"Run", "Execute", "GetDefault", "CreateAction"}
+
+
+@dataclass(frozen=True)
+class ObjectRef:
+    """추적 파일의 COM 객체 참조 (핸들)"""
+
+    handle: int
+
+
+@dataclass
+class TraceEvent:
+    """추적 이벤트 1건"""
+
+    kind: int
+    handle: int
+    name: str
+    start: float
+    duration: float
+    args: Tuple[Any, ...] = ()
+    result: Any = None
+
+    @property
+    def failed(self) -> bool:
+        return bool(self.kind & KIND_ERROR)
+
+    @property
+    def base_kind(self) -> int:
+        return self.kind & ~KIND_ERROR
+
+
+# ============================================================================
+# 기록
+# ============================================================================
+
+
+class TraceRecorder:
+    """추적 파일 기록기 (스레드 안전, 버퍼링)"""
+
+    FLUSH_SIZE = 64 * 1024
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "wb")
+        self._file.write(TRACE_MAGIC)
+        self._buffer = bytearray()
+        self._strings: Dict[str, int] = {}
+        self._next_handle = 0
+        self._lock = threading.RLock()
+        self._origin = time.perf_counter()
+        self.event_count = 0
+
+    # ------------------------------------------------------------------
+    # 인코딩
+    # ------------------------------------------------------------------
+
+    def _string_id(self, text: str) -> int:
+        string_id = self._strings.get(text)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._strings[text] = string_id
+            data = text.encode("utf-8", "surrogatepass")
+            self._buffer += _STRING.pack(TAG_STRING, len(data)) + data
+        return string_id
+
+    def _encode(self, out: bytearray, value: Any):
+        """값 인코딩 (새 문자열 레코드는 이벤트보다 먼저 버퍼에 기록됨)"""
+        if value is None:
+            out += b"N"
+        elif value is True:
+            out += b"T"
+        elif value is False:
+            out += b"F"
+        elif isinstance(value, ObjectRef):
+            out += b"h" + _U32.pack(value.handle)
+        elif isinstance(value, int) and -(2**63) <= value < 2**63:
+            out += b"i" + _I64.pack(value)
+        elif isinstance(value, float):
+            out += b"d" + _F64.pack(value)
+        elif isinstance(value, str):
+            out += b"s" + _U32.pack(self._string_id(value))
+        elif isinstance(value, (tuple, list)) and len(value) < 256:
+            out += b"t" + bytes([len(value)])
+            for item in value:
+                self._encode(out, item)
+        else:
+            out += b"r" + _U32.pack(self._string_id(repr(value)))
+
+    def new_handle(self) -> int:
+        with self._lock:
+            handle = self._next_handle
+            self._next_handle += 1
+            return handle
+
+    def record(
+        self,
+        kind: int,
+        handle: int,
+        name: str,
+        start: float,
+        duration: float,
+        args: Tuple[Any, ...] = (),
+        result: Any = None,
+    ):
+        with self._lock:
+            if self._file is None:
+                return
+            name_id = self._string_id(name)
+            event = bytearray(
+                _EVENT.pack(TAG_EVENT, kind, handle, name_id, start - self._origin, duration)
+            )
+            event.append(min(len(args), 255))
+            for arg in args[:255]:
+                self._encode(event, arg)
+            self._encode(event, result)
+            self._buffer += event
+            self.event_count += 1
+            if len(self._buffer) >= self.FLUSH_SIZE:
+                self._flush()
+
+    def _flush(self):
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._flush()
+                self._file.close()
+                self._file = None
+
+    # ------------------------------------------------------------------
+    # 프록시
+    # ------------------------------------------------------------------
+
+    def attach(self, hwp: Any) -> "TraceProxy":
+        """한글 인스턴스를 추적 프록시로 감쌈 (NEW 이벤트 기록)"""
+        handle = self.new_handle()
+        now = time.perf_counter()
+        self.record(KIND_NEW, handle, type(hwp).__name__, now, 0.0)
+        return TraceProxy(hwp, self, handle)
+
+    def wrap(self, value: Any) -> Tuple[Any, Any]:
+        """반환값 → (호출자에게 줄 값, 기록할 값)"""
+        if isinstance(value, _PRIMITIVES):
+            return value, value
+        if isinstance(value, tuple) and all(isinstance(v, _PRIMITIVES) for v in value):
+            return value, value
+        handle = self.new_handle()
+        return TraceProxy(value, self, handle), ObjectRef(handle)
+
+
+def _unwrap(value: Any) -> Any:
+    return object.__getattribute__(value, "_target") if isinstance(value, TraceProxy) else value
+
+
+def _describe(value: Any) -> Any:
+    """인자 → 기록할 값"""
+    if isinstance(value, TraceProxy):
+        return ObjectRef(object.__getattribute__(value, "_handle"))
+    return value
+
+
+class _TracedMethod:
+    """프록시 객체의 메서드 (호출 시 기록)"""
+
+    __slots__ = ("_proxy", "_name", "_method")
+
+    def __init__(self, proxy: "TraceProxy", name: str, method: Callable):
+        self._proxy = proxy
+        self._name = name
+        self._method = method
+
+    def __call__(self, *args):
+        recorder = object.__getattribute__(self._proxy, "_recorder")
+        handle = object.__getattribute__(self._proxy, "_handle")
+        described = tuple(_describe(a) for a in args)
+        start = time.perf_counter()
+        try:
+            value = self._method(*(_unwrap(a) for a in args))
+        except Exception as e:
+            recorder.record(
+                KIND_CALL | KIND_ERROR,
+                handle,
+                self._name,
+                start,
+                time.perf_counter() - start,
+                described,
+                repr(e),
+            )
+            raise
+        duration = time.perf_counter() - start
+        wrapped, recorded = recorder.wrap(value)
+        recorder.record(KIND_CALL, handle, self._name, start, duration, described, recorded)
+        return wrapped
+
+
+class TraceProxy:
+    """COM 객체 투명 프록시 - 속성/메서드 접근을 TraceRecorder에 기록"""
+
+    __slots__ = ("_target", "_recorder", "_handle", "__weakref__")
+
+    def __init__(self, target: Any, recorder: TraceRecorder, handle: int):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_recorder", recorder)
+        object.__setattr__(self, "_handle", handle)
+
+    def __getattr__(self, name: str) -> Any:
+        target = object.__getattribute__(self, "_target")
+        if name.startswith("_"):
+            return getattr(target, name)
+
+        recorder = object.__getattribute__(self, "_recorder")
+        handle = object.__getattribute__(self, "_handle")
+        start = time.perf_counter()
+        try:
+            value = getattr(target, name)
+        except Exception as e:
+            recorder.record(
+                KIND_GET | KIND_ERROR, handle, name, start, time.perf_counter() - start, (), repr(e)
+            )
+            raise
+        duration = time.perf_counter() - start
+
+        if inspect.ismethod(value) or inspect.isfunction(value) or inspect.isbuiltin(value):
+            # 메서드 조회 자체는 기록하지 않고 호출만 기록
+            return _TracedMethod(self, name, value)
+
+        wrapped, recorded = recorder.wrap(value)
+        recorder.record(KIND_GET, handle, name, start, duration, (), recorded)
+        return wrapped
+
+    def __setattr__(self, name: str, value: Any):
+        target = object.__getattribute__(self, "_target")
+        recorder = object.__getattribute__(self, "_recorder")
+        handle = object.__getattribute__(self, "_handle")
+        start = time.perf_counter()
+        try:
+            setattr(target, name, _unwrap(value))
+        except Exception as e:
+            recorder.record(
+                KIND_SET | KIND_ERROR,
+                handle,
+                name,
+                start,
+                time.perf_counter() - start,
+                (_describe(value),),
+                repr(e),
+            )
+            raise
+        recorder.record(
+            KIND_SET, handle, name, start, time.perf_counter() - start, (_describe(value),)
+        )
+
+    def __call__(self, *args):
+        return _TracedMethod(self, "__call__", object.__getattribute__(self, "_target"))(*args)
+
+    def __bool__(self) -> bool:
+        return bool(object.__getattribute__(self, "_target"))
+
+    def __eq__(self, other) -> bool:
+        return object.__getattribute__(self, "_target") == _unwrap(other)
+
+    def __hash__(self) -> int:
+        return hash(object.__getattribute__(self, "_target"))
+
+    def __repr__(self) -> str:
+        return f"<TraceProxy {object.__getattribute__(self, '_target')!r}>"
+
+
+# ============================================================================
+# 전역 추적 상태
+# ============================================================================
+
+_recorder: Optional[TraceRecorder] = None
+_recorder_lock = threading.Lock()
+_env_checked = False
+_atexit_registered = False
+
+
+def start_tracing(path: Union[str, Path]) -> TraceRecorder:
+    """이후 생성되는 한글 인스턴스를 추적
+
+    종료 시 stop_tracing을 부르도록 등록 (HWP_TRACE처럼 닫는 코드가 없어도 버퍼가 기록됨)
+    """
+    global _recorder, _atexit_registered
+    with _recorder_lock:
+        if _recorder is not None:
+            _recorder.close()
+        _recorder = TraceRecorder(path)
+        if not _atexit_registered:
+            atexit.register(stop_tracing)
+            _atexit_registered = True
+        return _recorder
+
+
+def stop_tracing() -> Optional[Path]:
+    """추적 종료 → 추적 파일 경로"""
+    global _recorder
+    with _recorder_lock:
+        recorder, _recorder = _recorder, None
+    if recorder is None:
+        return None
+    recorder.close()
+    return recorder.path
+
+
+@contextmanager
+def tracing(path: Union[str, Path]) -> Iterator[TraceRecorder]:
+    recorder = start_tracing(path)
+    try:
+        yield recorder
+    finally:
+        stop_tracing()
+
+
+def active_recorder() -> Optional[TraceRecorder]:
+    """현재 추적기 (HWP_TRACE 환경 변수는 처음 호출 시 적용)"""
+    global _env_checked
+    if _recorder is None and not _env_checked:
+        _env_checked = True
+        target = os.environ.get(TRACE_ENV, "").strip()
+        if target:
+            path = Path(target)
+            if path.is_dir() or not path.suffix:
+                path = path / f"trace_{os.getpid()}{TRACE_SUFFIX}"
+            start_tracing(path)
+    return _recorder
+
+
+# ============================================================================
+# 읽기
+# ============================================================================
+
+
+class _Reader:
+    def __init__(self, data: bytes):
+        self.data = data
+        self.offset = len(TRACE_MAGIC)
+        self.strings: List[str] = []
+
+    def _take(self, size: int) -> bytes:
+        chunk = self.data[self.offset : self.offset + size]
+        if len(chunk) < size:
+            raise ValueError("추적 파일이 잘렸습니다")
+        self.offset += size
+        return chunk
+
+    def value(self) -> Any:
+        kind = self._take(1)
+        if kind == b"N":
+            return None
+        if kind == b"T":
+            return True
+        if kind == b"F":
+            return False
+        if kind == b"i":
+            return _I64.unpack(self._take(8))[0]
+        if kind == b"d":
+            return _F64.unpack(self._take(8))[0]
+        if kind == b"s":
+            return self.strings[_U32.unpack(self._take(4))[0]]
+        if kind == b"h":
+            return ObjectRef(_U32.unpack(self._take(4))[0])
+        if kind == b"t":
+            return tuple(self.value() for _ in range(self._take(1)[0]))
+        if kind == b"r":
+            return self.strings[_U32.unpack(self._take(4))[0]]
+        raise ValueError(f"알 수 없는 값 형식: {kind!r}")
+
+    def events(self) -> Iterator[TraceEvent]:
+        while self.offset < len(self.data):
+            tag = self.data[self.offset]
+            if tag == TAG_STRING:
+                _, length = _STRING.unpack(self._take(_STRING.size))
+                self.strings.append(self._take(length).decode("utf-8", "surrogatepass"))
+            elif tag == TAG_EVENT:
+                _, kind, handle, name_id, start, duration = _EVENT.unpack(self._take(_EVENT.size))
+                argc = self._take(1)[0]
+                args = tuple(self.value() for _ in range(argc))
+                result = self.value()
+                yield TraceEvent(kind, handle, self.strings[name_id], start, duration, args, result)
+            else:
+                raise ValueError(f"알 수 없는 레코드: {tag}")
+
+
+def read_trace(path: Union[str, Path]) -> Iterator[TraceEvent]:
+    """추적 파일 이벤트 순회"""
+    data = Path(path).read_bytes()
+    if not data.startswith(TRACE_MAGIC):
+        raise ValueError(f"추적 파일이 아닙니다: {path}")
+    return _Reader(data).events()
+
+
+# ============================================================================
+# 재생
+# ============================================================================
+
+
+@dataclass
+class ReplayResult:
+    """재생 결과"""
+
+    events: int = 0
+    instances: int = 0
+    mismatches: List[Tuple[int, str, Any, Any]] = field(
+        default_factory=list
+    )  # (순번, 이름, 기록값, 재생값)
+    errors: List[Tuple[int, str, str]] = field(default_factory=list)
+    elapsed: float = 0.0
+
+
+def replay_trace(
+    path: Union[str, Path], factory: Optional[Callable[[], Any]] = None, honor_timing: bool = False
+) -> ReplayResult:
+    """추적 파일을 백엔드(기본: FakeHwp)에 다시 실행
+
+    Args:
+        path: 추적 파일
+        factory: NEW 이벤트마다 호출할 한글 인스턴스 생성 함수
+        honor_timing: True이면 원래 호출 간격대로 대기
+
+    Returns:
+        ReplayResult (기본값 결과가 다른 호출은 mismatches에 기록)
+    """
+    if factory is None:
+        from .fake_hwp import FakeBackend
+
+        factory = FakeBackend()
+
+    result = ReplayResult()
+    objects: Dict[int, Any] = {}
+    begin = time.perf_counter()
+
+    def resolve(value):
+        if isinstance(value, ObjectRef):
+            return objects.get(value.handle)
+        if isinstance(value, tuple):
+            return tuple(resolve(v) for v in value)
+        return value
+
+    for index, event in enumerate(read_trace(path)):
+        result.events += 1
+        if honor_timing:
+            delay = event.start - (time.perf_counter() - begin)
+            if delay > 0:
+                time.sleep(delay)
+
+        kind = event.base_kind
+        try:
+            if kind == KIND_NEW:
+                objects[event.handle] = factory()
+                result.instances += 1
+                continue
+
+            target = objects.get(event.handle)
+            if target is None:
+                raise LookupError(f"핸들 {event.handle} 없음")
+
+            if kind == KIND_GET:
+                value = getattr(target, event.name)
+            elif kind == KIND_SET:
+                setattr(target, event.name, resolve(event.args[0]))
+                continue
+            else:
+                method = target if event.name == "__call__" else getattr(target, event.name)
+                value = method(*(resolve(a) for a in event.args))
+        except Exception as e:
+            if not event.failed:
+                result.errors.append((index, event.name, repr(e)))
+            continue
+
+        if isinstance(event.result, ObjectRef):
+            objects[event.result.handle] = value
+        elif (
+            not event.failed
+            and value != event.result
+            and not (isinstance(value, tuple) and tuple(value) == event.result)
+        ):
+            result.mismatches.append((index, event.name, event.result, value))
+
+    result.elapsed = time.perf_counter() - begin
+    return result
+
+
+# ============================================================================
+# 보고서
+# ============================================================================
+
+
+@dataclass
+class HotspotStats:
+    """호출 지점별 집계"""
+
+    key: str
+    count: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    errors: int = 0
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.count if self.count else 0.0
+
+
+def summarize_trace(path: Union[str, Path]) -> Tuple[List[HotspotStats], float]:
+    """액션 ID / 호출 지점별 집계
+
+    Run("MoveDocBegin") → "Run:MoveDocBegin",
+    HAction.Execute("FileSaveAs_S", ...) → "HAction.Execute:FileSaveAs_S",
+    hwp.HParameterSet.HFileOpenSave.filename = ... → "HParameterSet.HFileOpenSave.filename="
+
+    Returns:
+        (총 시간 내림차순 목록, 전체 COM 시간)
+    """
+    labels: Dict[int, str] = {}
+    stats: Dict[str, HotspotStats] = {}
+    total = 0.0
+
+    for event in read_trace(path):
+        kind = event.base_kind
+        if kind == KIND_NEW:
+            labels[event.handle] = ""
+            continue
+
+        owner = labels.get(event.handle, "?")
+        qualified = f"{owner}.{event.name}" if owner else event.name
+        if kind == KIND_GET:
+            key = f"get:{qualified}"
+        elif kind == KIND_SET:
+            key = f"{qualified}="
+        elif event.name in ACTION_METHODS and event.args and isinstance(event.args[0], str):
+            key = f"{qualified}:{event.args[0]}"
+        else:
+            key = qualified
+
+        if isinstance(event.result, ObjectRef):
+            labels[event.result.handle] = qualified if kind == KIND_GET else f"{qualified}()"
+
+        entry = stats.setdefault(key, HotspotStats(key))
+        entry.count += 1
+        entry.total_time += event.duration
+        entry.max_time = max(entry.max_time, event.duration)
+        entry.errors += int(event.failed)
+        total += event.duration
+
+    return sorted(stats.values(), key=lambda s: s.total_time, reverse=True), total
+
+
+def print_report(path: Union[str, Path], top: int = 20):
+    hotspots, total = summarize_trace(path)
+    calls = sum(h.count for h in hotspots)
+
+    print("=" * 88)
+    print(f"COM 추적 보고서: {path}")
+    print(f"호출 {calls:,}회, COM 시간 합계 {total:.3f}초")
+    print("-" * 88)
+    print(
+        f'{"호출 지점":44s} {"횟수":>7s} {"합계(s)":>9s} '
+        f'{"평균(ms)":>9s} {"최대(ms)":>9s} {"비율":>6s}'
+    )
+    print("-" * 88)
+    for h in hotspots[:top]:
+        share = (h.total_time / total * 100) if total else 0.0
+        print(
+            f"{h.key[:44]:44s} {h.count:7,d} {h.total_time:9.3f} {h.mean_time * 1000:9.2f} "
+            f"{h.max_time * 1000:9.2f} {share:5.1f}%"
+        )
+    print("=" * 88)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HWP COM 추적 분석/재생")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    report = sub.add_parser("report", help="액션별 핫스팟 집계")
+    report.add_argument("trace", type=Path)
+    report.add_argument("--top", type=int, default=20)
+
+    replay = sub.add_parser("replay", help="FakeHwp로 재생")
+    replay.add_argument("trace", type=Path)
+    replay.add_argument("--latency", type=float, default=0.0, help="FakeHwp 호출당 지연 (초)")
+    replay.add_argument("--timing", action="store_true", help="원래 호출 간격 유지")
+
+    args = parser.parse_args(argv)
+    if args.command == "report":
+        print_report(args.trace, args.top)
+    else:
+        from .fake_hwp import FakeBackend
+
+        backend = FakeBackend(latency=args.latency)
+        result = replay_trace(args.trace, backend, honor_timing=args.timing)
+        print(
+            f"재생: 이벤트 {result.events:,}개, 인스턴스 {result.instances}개, "
+            f"{result.elapsed:.3f}초"
+        )
+        print(
+            f"FakeHwp 호출 {backend.stats.total_calls:,}회, "
+            f"모의 지연 {backend.stats.simulated_time:.3f}초"
+        )
+        print(f"결과 불일치 {len(result.mismatches)}건, 오류 {len(result.errors)}건")
+        for index, name, error in result.errors[:10]:
+            print(f"  #{index} {name}: {error}")
+
+
+if __name__ == "__main__":
+    main()
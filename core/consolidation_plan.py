@@ -0,0 +1,320 @@
+"""
+Consolidation Plan - 이름 충돌/중복을 가린 통합 계획 + 매니페스트
+
+폴더마다 "문제1.hwp"처럼 같은 이름이 흔해서 target_dir / source.name으로 바로 복사하면
+뒤에 복사된 파일이 앞의 것을 덮어씁니다. 복사 전에 계획을 세웁니다.
+
+- 내용 해시: blake2b, 청크 단위 스트리밍 읽기, 스레드 풀에서 병렬
+  (hashlib은 큰 update에서 GIL을 놓음)
+- 내용이 같은 파일(진짜 중복)은 하나만 복사하고 나머지는 건너뜀
+- 이름만 같은 파일(충돌)은 "이름_해시8자리.확장자"로 바꿈 - 실행 순서와 무관하게 항상 같은 이름
+- 이름 비교는 대소문자 무시 (Windows/NTFS에서 "문제1.HWP"와 "문제1.hwp"는 같은 파일)
+- 우선순위: 소스 폴더 순서 → 폴더 안 파일 이름 순서 (앞선 파일이 원래 이름/대표 자리를 가짐)
+- 매니페스트(대상 폴더/.consolidation.json): 대상 이름 → 해시/원본,
+  원본 → (크기, 수정 시각, 해시, 대상 이름)
+- 다시 실행하면 크기/수정 시각이 같은 원본은 해시를 다시 계산하지 않고,
+  대상에 같은 내용이 이미 있으면 건너뜀 (새 파일/바뀐 파일만 복사). 원본별 대상 이름은 유지
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+from .progress import progress_bus
+
+MANIFEST_FILE = ".consolidation.json"
+MANIFEST_VERSION = 1
+
+DIGEST_SIZE = 16
+CHUNK_SIZE = 1 << 20
+
+# 충돌 이름에 붙이는 해시 길이 (그래도 겹치면 늘림)
+SUFFIX_LENGTH = 8
+
+# PlannedFile.action
+COPY = "copy"  # 새 파일 또는 바뀐 파일
+UNCHANGED = "unchanged"  # 대상에 같은 내용이 이미 있음
+DUPLICATE = "duplicate"  # 다른 원본과 내용이 같음 - 건너뜀
+
+
+def file_digest(path: str) -> str:
+    """파일 내용 해시 (청크 단위로 읽음)"""
+    digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_files(paths: Sequence[str], max_workers: int = 4) -> Dict[str, str]:
+    """
+    여러 파일 해시를 병렬로
+
+    Returns:
+        {경로: 해시} - 읽지 못한 파일은 빠짐
+    """
+    digests = {}
+    if not paths:
+        return digests
+    stage = progress_bus.stage("hash", len(paths))
+    stage.start(f"{len(paths)}개 파일")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(file_digest, path): path for path in paths}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                digests[path] = future.result()
+                stage.advance(Path(path).name)
+            except OSError as e:
+                stage.advance(Path(path).name, ok=False, message=str(e))
+    return digests
+
+
+@dataclass
+class PlannedFile:
+    """원본 파일 하나의 처리 계획"""
+
+    source: str
+    size: int
+    mtime_ns: int
+    digest: Optional[str]  # None: 읽기 실패
+    action: str = COPY
+    dest_name: Optional[str] = None
+    duplicate_of: Optional[str] = None  # DUPLICATE일 때 대표 파일의 대상 이름
+
+    @property
+    def renamed(self) -> bool:
+        return self.dest_name is not None and self.dest_name != Path(self.source).name
+
+
+@dataclass
+class ConsolidationPlan:
+    """통합 계획 - files는 우선순위 순서"""
+
+    target_dir: str
+    files: List[PlannedFile] = field(default_factory=list)
+    previous: Dict = field(default_factory=dict)  # 이전 매니페스트
+
+    @property
+    def to_copy(self) -> List[PlannedFile]:
+        return [item for item in self.files if item.action == COPY and item.digest is not None]
+
+    @property
+    def unreadable(self) -> List[PlannedFile]:
+        return [item for item in self.files if item.digest is None]
+
+    def summary(self) -> Dict[str, int]:
+        counts = {COPY: 0, UNCHANGED: 0, DUPLICATE: 0, "renamed": 0, "unreadable": 0}
+        for item in self.files:
+            if item.digest is None:
+                counts["unreadable"] += 1
+                continue
+            counts[item.action] += 1
+            if item.action != DUPLICATE and item.renamed:
+                counts["renamed"] += 1
+        return counts
+
+    def manifest(self, failed: Sequence[str] = ()) -> Dict:
+        """
+        매니페스트 내용 (failed: 복사에 실패한 원본 - 기록하지 않음)
+
+        대표 원본이 실패한 중복도 기록하지 않습니다 (대상에 없는 파일을 가리키게 됨).
+        이번에 안 보인 원본(다른 소스 폴더로 돌린 실행 등)의 기록은 유지합니다.
+        """
+        failed = set(failed)
+        failed_digests = {
+            item.digest for item in self.files if item.action != DUPLICATE and item.source in failed
+        }
+        files = dict(self.previous.get("files", {}))
+        sources = dict(self.previous.get("sources", {}))
+        for item in self.files:
+            if item.digest is None or item.source in failed:
+                continue
+            if item.action == DUPLICATE and item.digest in failed_digests:
+                continue
+            dest_name = item.duplicate_of if item.action == DUPLICATE else item.dest_name
+            sources[item.source] = {
+                "size": item.size,
+                "mtime_ns": item.mtime_ns,
+                "digest": item.digest,
+                "dest": dest_name,
+            }
+            if item.action != DUPLICATE:
+                files[item.dest_name] = {
+                    "digest": item.digest,
+                    "size": item.size,
+                    "source": item.source,
+                }
+        return {"version": MANIFEST_VERSION, "files": files, "sources": sources}
+
+    def write_manifest(self, failed: Sequence[str] = ()) -> str:
+        """매니페스트를 임시 파일에 쓰고 rename"""
+        path = Path(self.target_dir) / MANIFEST_FILE
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(
+            json.dumps(self.manifest(failed), ensure_ascii=False, indent=2, sort_keys=True),
+            encoding="utf-8",
+        )
+        os.replace(temp_path, path)
+        return str(path)
+
+
+def load_manifest(target_dir: str) -> Dict:
+    """이전 매니페스트 (없거나 깨졌거나 버전이 다르면 빈 dict)"""
+    try:
+        data = json.loads((Path(target_dir) / MANIFEST_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        return {}
+    return data
+
+
+def _priority_order(files: Sequence[str]) -> List[str]:
+    """소스 폴더가 처음 나온 순서 → 폴더 안 이름 순서"""
+    folder_rank = {}
+    for path in files:
+        folder_rank.setdefault(str(Path(path).parent), len(folder_rank))
+    return sorted(
+        dict.fromkeys(files),
+        key=lambda path: (folder_rank[str(Path(path).parent)], Path(path).name),
+    )
+
+
+def name_key(name: str) -> str:
+    """대상 폴더 이름 비교 키 (대소문자 무시 파일시스템 기준)"""
+    return os.path.normcase(name).casefold()
+
+
+def collision_name(name: str, digest: str, occupied: Callable[[str, str], bool]) -> str:
+    """이름_해시.확장자 - occupied(후보, 해시)가 거짓일 때까지 해시를 길게
+
+    occupied: 계획에서 다른 내용이 받은 이름 + 대상 폴더에 있는 다른 내용의 파일 모두 확인
+    """
+    path = Path(name)
+    for length in range(SUFFIX_LENGTH, len(digest) + 1, 4):
+        candidate = f"{path.stem}_{digest[:length]}{path.suffix}"
+        if not occupied(candidate, digest):
+            return candidate
+    raise ValueError(f"충돌 이름을 만들 수 없음: {name}")
+
+
+def plan_consolidation(
+    files: Sequence[str], target_dir: str, max_workers: int = 4
+) -> ConsolidationPlan:
+    """
+    통합 계획 세우기 (파일은 건드리지 않음)
+
+    Args:
+        files: 원본 파일 경로 (scan_folders 결과)
+        target_dir: 대상 디렉토리 (이전 매니페스트를 읽음)
+        max_workers: 해시 스레드 수
+
+    Returns:
+        ConsolidationPlan - to_copy의 파일만 dest_name으로 복사하면 됨
+    """
+    target = Path(target_dir)
+    previous = load_manifest(target_dir)
+    previous_sources = previous.get("sources", {})
+    previous_files = previous.get("files", {})
+
+    # 1. stat + 크기/수정 시각이 같으면 이전 해시 재사용
+    items, to_hash = [], []
+    for path in _priority_order(files):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            items.append(PlannedFile(path, 0, 0, None))
+            continue
+        item = PlannedFile(path, stat.st_size, stat.st_mtime_ns, None)
+        record = previous_sources.get(path)
+        if record and (record.get("size"), record.get("mtime_ns")) == (item.size, item.mtime_ns):
+            item.digest = record.get("digest")
+        if item.digest is None:
+            to_hash.append(path)
+        items.append(item)
+
+    # 2. 나머지는 병렬 해시
+    digests = hash_files(to_hash, max_workers)
+    for item in items:
+        if item.digest is None:
+            item.digest = digests.get(item.source)
+
+    # 3. 내용별 대표 (우선순위가 가장 앞선 원본)
+    keepers = {}
+    for item in items:
+        if item.digest is None:
+            continue
+        if item.digest in keepers:
+            item.action = DUPLICATE
+        else:
+            keepers[item.digest] = item
+
+    # 4. 대상 이름: 이전에 받은 이름 유지 → 원래 이름 → 다른 내용이 차지했으면 이름_해시
+    taken = {}  # name_key(대상 이름) → 해시
+    for item in keepers.values():
+        record = previous_sources.get(item.source)
+        name = record.get("dest") if record else None
+        if (
+            name
+            and previous_files.get(name, {}).get("source") == item.source
+            and name_key(name) not in taken
+        ):
+            item.dest_name = name
+            taken[name_key(name)] = item.digest
+
+    try:
+        on_disk = {name_key(entry): entry for entry in os.listdir(target)}
+    except OSError:
+        on_disk = {}
+    existing = {}  # 매니페스트에 없는 대상 파일 이름 → 해시 (필요할 때만 계산)
+
+    def occupied_by_other(name: str, digest: str) -> bool:
+        key = name_key(name)
+        if key in taken:
+            return taken[key] != digest
+        if key not in on_disk:
+            return False
+        name = on_disk[key]  # 대상 폴더에 있는 표기 그대로
+        dest = target / name
+        if not dest.is_file():
+            return True  # 같은 이름의 폴더 등
+        record = previous_files.get(name)
+        if record:
+            return record.get("digest") != digest
+        if name not in existing:
+            try:
+                existing[name] = file_digest(str(target / name))
+            except OSError:
+                existing[name] = None
+        return existing[name] != digest
+
+    for item in keepers.values():
+        if item.dest_name:
+            continue
+        name = Path(item.source).name
+        if name_key(name) == name_key(MANIFEST_FILE) or occupied_by_other(name, item.digest):
+            name = collision_name(name, item.digest, occupied_by_other)
+        # 같은 내용이 대소문자만 다른 이름으로 이미 있으면 그 이름 사용 (5단계에서 건너뜀)
+        name = on_disk.get(name_key(name), name)
+        item.dest_name = name
+        taken[name_key(name)] = item.digest
+
+    for item in items:
+        if item.action == DUPLICATE:
+            item.duplicate_of = keepers[item.digest].dest_name
+
+    # 5. 대상에 같은 내용이 이미 있으면 건너뜀
+    for item in keepers.values():
+        dest = target / item.dest_name
+        record = previous_files.get(item.dest_name)
+        same_record = record and record.get("digest") == item.digest
+        same_file = existing.get(item.dest_name) == item.digest
+        if (same_record or same_file) and dest.is_file() and dest.stat().st_size == item.size:
+            item.action = UNCHANGED
+
+    return ConsolidationPlan(str(target), items, previous)
@@ -0,0 +1,924 @@
+"""
+가짜 한글 백엔드 (FakeHwp)
+
+core/ 와 automations/ 가 사용하는 IHwpObject 기능 일부를 메모리 문서 모델 위에
+구현합니다. Windows/한글 없이 추출기, 합병기, 변환기를 실행하여 COM 호출 수와
+(모의) 소요 시간을 측정하는 용도입니다.
+
+지원 범위:
+- Run(액션 ID): 커서 이동, 선택, 복사/붙여넣기/삭제, 단/쪽 나누기
+- GetPos / SetPos, GetText
+- HeadCtrl 체인 (CtrlID, Next, GetAnchorPos) - 구역/단 정의, 미주('en')
+- HAction.GetDefault / Execute + HParameterSet.H*
+  (FileSaveAs_S[saveblock], FileSaveAsPdf, MultiColumn, PageSetup, InsertFile, FileOpen)
+- Open / SaveAs / Clear / Quit / PageCount / EditMode
+- XHwpDocuments / XHwpWindows (Item, Count, Close, Visible)
+
+모든 COM 표면 호출은 FakeStats에 기록되고, 호출마다 설정된 지연이 모의 시간에
+더해집니다 (realtime=True이면 실제로 sleep).
+
+저장 형식: FAKE_MAGIC + JSON 한 줄 + 패딩 (실제 HWP의 최소 크기를 흉내 내어
+크기 검사를 통과). Open은 이 형식과 HWPX를 읽고, 그 밖의 파일은 빈 문서로 엽니다.
+
+사용 예:
+    backend = FakeBackend(latency=0.002, latency_map={"Run:Paste": 0.05})
+    with use_hwp_factory(backend):
+        merger.merge_files(config)
+    print(backend.stats.total_calls, backend.stats.simulated_time)
+"""
+
+import json
+import math
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+FAKE_MAGIC = b"FAKEHWP1\n"
+DEFAULT_MIN_FILE_SIZE = 16 * 1024  # 빈 HWP 파일 크기 정도
+
+Pos = Tuple[int, int]  # (para, pos) - list는 항상 0 (본문)
+
+
+# ============================================================================
+# 문서 모델
+# ============================================================================
+
+
+@dataclass
+class FakeParagraph:
+    """문단 (텍스트 + 미주 앵커 위치)"""
+
+    text: str = ""
+    column_break: bool = False
+    endnotes: List[int] = field(default_factory=list)  # 문단 내 글자 위치
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"text": self.text, "column_break": self.column_break, "endnotes": self.endnotes}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FakeParagraph":
+        return cls(
+            data.get("text", ""), data.get("column_break", False), list(data.get("endnotes", []))
+        )
+
+
+@dataclass
+class FakeDocument:
+    """메모리 문서 (본문 문단 목록)"""
+
+    paragraphs: List[FakeParagraph] = field(default_factory=lambda: [FakeParagraph()])
+    columns: int = 1
+    page_setup: Dict[str, Any] = field(default_factory=dict)
+    path: Optional[str] = None
+    modified: bool = False
+    lines_per_column: int = 40
+    chars_per_line: int = 40
+
+    # ------------------------------------------------------------------
+    # 생성 / 저장
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_problems(
+        cls, problem_texts: List[List[str]], trailing_empty: int = 0, columns: int = 1
+    ) -> "FakeDocument":
+        """문항별 문단 목록 → 문서 (각 문항 첫 문단 끝에 미주)"""
+        paragraphs = []
+        for texts in problem_texts:
+            for index, text in enumerate(texts):
+                endnotes = [len(text)] if index == 0 else []
+                paragraphs.append(FakeParagraph(text, endnotes=endnotes))
+        paragraphs.extend(FakeParagraph() for _ in range(trailing_empty))
+        return cls(paragraphs or [FakeParagraph()], columns=columns)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "paragraphs": [p.to_dict() for p in self.paragraphs],
+            "columns": self.columns,
+            "page_setup": self.page_setup,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FakeDocument":
+        paragraphs = [FakeParagraph.from_dict(p) for p in data.get("paragraphs", [])]
+        return cls(
+            paragraphs or [FakeParagraph()],
+            data.get("columns", 1),
+            dict(data.get("page_setup", {})),
+        )
+
+    def save(self, path: Union[str, Path], min_size: int = DEFAULT_MIN_FILE_SIZE):
+        body = FAKE_MAGIC + json.dumps(self.to_dict(), ensure_ascii=False).encode("utf-8") + b"\n"
+        padding = max(0, min_size - len(body))
+        Path(path).write_bytes(body + b"\0" * padding)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "FakeDocument":
+        """FakeHwp 저장 형식 또는 HWPX 읽기 (그 밖의 형식은 빈 문서)"""
+        path = Path(path)
+        with open(path, "rb") as f:
+            head = f.read(len(FAKE_MAGIC))
+
+        if head == FAKE_MAGIC:
+            data = path.read_bytes()[len(FAKE_MAGIC) :].split(b"\n", 1)[0]
+            document = cls.from_dict(json.loads(data.decode("utf-8")))
+        elif head[:2] == b"PK":
+            document = cls._from_hwpx(path)
+        else:
+            document = cls()
+
+        document.path = str(path)
+        return document
+
+    @classmethod
+    def _from_hwpx(cls, path: Path) -> "FakeDocument":
+        from .hwpx_package import open_package
+        from .hwpx_xml import HP_P, HP_RUN, HP_T, HP_CTRL, HP_COL_PR, NS_PARAGRAPH, qname, parse_xml
+
+        end_note = qname(NS_PARAGRAPH, "endNote")
+        paragraphs = []
+        columns = 1
+        with open_package(path) as package:
+            for name in package.section_names():
+                root, _ = parse_xml(package.read(name))
+                col_pr = root.find(f".//{HP_COL_PR}")
+                if col_pr is not None and not paragraphs:
+                    columns = int(col_pr.get("colCount", "1"))
+                for p in root.findall(HP_P):
+                    text, endnotes = "", []
+                    for run in p.findall(HP_RUN):
+                        for child in run:
+                            if child.tag == HP_T:
+                                text += child.text or ""
+                            elif child.tag == HP_CTRL and child.find(end_note) is not None:
+                                endnotes.append(len(text))
+                    paragraphs.append(FakeParagraph(text, p.get("columnBreak") == "1", endnotes))
+        return cls(paragraphs or [FakeParagraph()], columns)
+
+    # ------------------------------------------------------------------
+    # 위치 / 범위
+    # ------------------------------------------------------------------
+
+    def end(self) -> Pos:
+        return (len(self.paragraphs) - 1, len(self.paragraphs[-1].text))
+
+    def clamp(self, para: int, pos: int) -> Pos:
+        para = min(max(para, 0), len(self.paragraphs) - 1)
+        return (para, min(max(pos, 0), len(self.paragraphs[para].text)))
+
+    def slice(self, start: Pos, end: Pos) -> "FakeDocument":
+        """범위 복사 (새 문서)"""
+        (sp, spos), (ep, epos) = sorted((start, end))
+        paragraphs = []
+        for index in range(sp, ep + 1):
+            source = self.paragraphs[index]
+            lo = spos if index == sp else 0
+            hi = epos if index == ep else len(source.text)
+            paragraphs.append(
+                FakeParagraph(
+                    source.text[lo:hi],
+                    source.column_break and index != sp,
+                    [n - lo for n in source.endnotes if lo <= n < hi or (n == hi and index != ep)],
+                )
+            )
+        return FakeDocument(paragraphs, self.columns, dict(self.page_setup))
+
+    def delete(self, start: Pos, end: Pos) -> Pos:
+        """범위 삭제 → 삭제 후 커서 위치"""
+        (sp, spos), (ep, epos) = sorted((start, end))
+        first, last = self.paragraphs[sp], self.paragraphs[ep]
+        merged = FakeParagraph(
+            first.text[:spos] + last.text[epos:],
+            first.column_break,
+            [n for n in first.endnotes if n < spos]
+            + [n - epos + spos for n in last.endnotes if n >= epos],
+        )
+        self.paragraphs[sp : ep + 1] = [merged]
+        self.modified = True
+        return (sp, spos)
+
+    def insert(self, at: Pos, other: "FakeDocument") -> Pos:
+        """다른 문서를 위치에 삽입 → 삽입 끝 위치"""
+        para, pos = at
+        target = self.paragraphs[para]
+        head = FakeParagraph(
+            target.text[:pos], target.column_break, [n for n in target.endnotes if n < pos]
+        )
+        tail_text = target.text[pos:]
+        tail_notes = [n - pos for n in target.endnotes if n >= pos]
+
+        inserted = [
+            FakeParagraph(p.text, p.column_break, list(p.endnotes)) for p in other.paragraphs
+        ]
+        first = inserted[0]
+        head.endnotes += [n + len(head.text) for n in first.endnotes]
+        head.text += first.text
+        new = [head] + inserted[1:]
+
+        last = new[-1]
+        end = (para + len(new) - 1, len(last.text))
+        last.endnotes += [n + len(last.text) for n in tail_notes]
+        last.text += tail_text
+
+        self.paragraphs[para : para + 1] = new
+        self.modified = True
+        return end
+
+    def split(self, at: Pos, column_break: bool = False) -> Pos:
+        """문단 나누기 → 새 문단 시작 위치"""
+        para, pos = at
+        target = self.paragraphs[para]
+        tail = FakeParagraph(
+            target.text[pos:], column_break, [n - pos for n in target.endnotes if n >= pos]
+        )
+        target.text = target.text[:pos]
+        target.endnotes = [n for n in target.endnotes if n < pos]
+        self.paragraphs.insert(para + 1, tail)
+        self.modified = True
+        return (para + 1, 0)
+
+    def text(self, start: Optional[Pos] = None, end: Optional[Pos] = None) -> str:
+        part = self if start is None else self.slice(start, end)
+        return "\r\n".join(p.text for p in part.paragraphs)
+
+    def page_count(self) -> int:
+        """단 나누기와 문단 길이로 추정한 쪽 수"""
+        used_columns, lines = 1, 0
+        for index, paragraph in enumerate(self.paragraphs):
+            if paragraph.column_break and index > 0:
+                used_columns += 1
+                lines = 0
+            lines += 1 + len(paragraph.text) // self.chars_per_line
+            while lines > self.lines_per_column:
+                used_columns += 1
+                lines -= self.lines_per_column
+        return max(1, math.ceil(used_columns / max(1, self.columns)))
+
+
+def write_fake_pdf(path: Union[str, Path], page_count: int, width: int = 595, height: int = 842):
+    """빈 쪽 page_count개짜리 최소 PDF"""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        (
+            "<< /Type /Pages /Kids [%s] /Count %d >>"
+            % (" ".join(f"{3 + i} 0 R" for i in range(page_count)), page_count)
+        ).encode(),
+    ]
+    for _ in range(page_count):
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {width} {height}] >>".encode())
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    Path(path).write_bytes(bytes(out))
+
+
+# ============================================================================
+# 호출 통계
+# ============================================================================
+
+
+class FakeStats:
+    """COM 호출 수 및 모의 지연 합계 (스레드 안전, 여러 인스턴스 공유)"""
+
+    def __init__(self):
+        self.calls: Counter = Counter()
+        self.simulated_time = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, name: str, latency: float):
+        with self._lock:
+            self.calls[name] += 1
+            self.simulated_time += latency
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    def reset(self):
+        with self._lock:
+            self.calls.clear()
+            self.simulated_time = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "total_calls": self.total_calls,
+            "simulated_time": self.simulated_time,
+            "calls": dict(self.calls.most_common()),
+        }
+
+
+# ============================================================================
+# COM 객체
+# ============================================================================
+
+
+class _FakeComObject:
+    """호출 기록이 있는 COM 객체 기반 클래스"""
+
+    def __init__(self, hwp: "FakeHwp"):
+        object.__setattr__(self, "_hwp", hwp)
+
+    def _call(self, name: str):
+        self._hwp._call(name)
+
+
+class FakeParameterSet(_FakeComObject):
+    """HParameterSet.H* / HSet (속성과 SetItem 항목이 같은 저장소)"""
+
+    # 하위 파라미터 셋 (예: HSecDef.PageDef)
+    SUBSETS = {"PageDef"}
+
+    def __init__(self, hwp: "FakeHwp", name: str):
+        super().__init__(hwp)
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_items", {})
+
+    @property
+    def HSet(self) -> "FakeParameterSet":
+        self._call(f"{self._name}.HSet")
+        return self
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        self._call(f"{self._name}.{name}")
+        if name not in self._items and name in self.SUBSETS:
+            self._items[name] = FakeParameterSet(self._hwp, f"{self._name}.{name}")
+        return self._items.get(name)
+
+    def __setattr__(self, name: str, value: Any):
+        self._call(f"{self._name}.{name}=")
+        self._items[name] = value
+
+    def SetItem(self, name: str, value: Any):
+        self._call(f"{self._name}.SetItem")
+        self._items[name] = value
+
+    def Item(self, name: str) -> Any:
+        self._call(f"{self._name}.Item")
+        return self._items.get(name)
+
+    def ItemExist(self, name: str) -> bool:
+        self._call(f"{self._name}.ItemExist")
+        return name in self._items
+
+    def RemoveItem(self, name: str):
+        self._call(f"{self._name}.RemoveItem")
+        self._items.pop(name, None)
+
+    def items(self) -> Dict[str, Any]:
+        """저장된 항목 (기록 없음, 액션 실행용)"""
+        return {
+            key: value.items() if isinstance(value, FakeParameterSet) else value
+            for key, value in self._items.items()
+        }
+
+    def reset(self):
+        self._items.clear()
+
+
+class FakeParameterSets(_FakeComObject):
+    """hwp.HParameterSet - H* 파라미터 셋 (처음 접근 시 생성)"""
+
+    def __init__(self, hwp: "FakeHwp"):
+        super().__init__(hwp)
+        object.__setattr__(self, "_sets", {})
+
+    def __getattr__(self, name: str) -> FakeParameterSet:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        self._call(f"HParameterSet.{name}")
+        if name not in self._sets:
+            self._sets[name] = FakeParameterSet(self._hwp, name)
+        return self._sets[name]
+
+
+class FakeHAction(_FakeComObject):
+    """hwp.HAction"""
+
+    def GetDefault(self, action: str, parameter_set: FakeParameterSet) -> bool:
+        self._call(f"HAction.GetDefault:{action}")
+        parameter_set.reset()
+        return True
+
+    def Execute(self, action: str, parameter_set: FakeParameterSet) -> bool:
+        self._call(f"HAction.Execute:{action}")
+        return self._hwp._execute(action, parameter_set.items())
+
+    def Run(self, action: str) -> bool:
+        return self._hwp.Run(action)
+
+
+class FakeCtrl(_FakeComObject):
+    """HeadCtrl 체인의 컨트롤"""
+
+    def __init__(self, hwp: "FakeHwp", ctrl_id: str, anchor: Pos, next_ctrl: Optional["FakeCtrl"]):
+        super().__init__(hwp)
+        self._ctrl_id = ctrl_id
+        self._anchor = anchor
+        self._next = next_ctrl
+
+    @property
+    def CtrlID(self) -> str:
+        self._call("Ctrl.CtrlID")
+        return self._ctrl_id
+
+    @property
+    def Next(self) -> Optional["FakeCtrl"]:
+        self._call("Ctrl.Next")
+        return self._next
+
+    def GetAnchorPos(self, option: int = 0) -> FakeParameterSet:
+        self._call("Ctrl.GetAnchorPos")
+        pset = FakeParameterSet(self._hwp, "ListParaPos")
+        pset._items.update({"List": 0, "Para": self._anchor[0], "Pos": self._anchor[1]})
+        return pset
+
+
+class FakeXHwpDocument(_FakeComObject):
+    """IXHwpDocument"""
+
+    @property
+    def Path(self) -> str:
+        self._call("Document.Path")
+        return self._hwp.document.path or ""
+
+    @property
+    def IsModified(self) -> bool:
+        self._call("Document.IsModified")
+        return self._hwp.document.modified
+
+    @property
+    def DocumentName(self) -> str:
+        self._call("Document.DocumentName")
+        return Path(self._hwp.document.path or "빈 문서").name
+
+    def Save(self, *args) -> bool:
+        self._call("Document.Save")
+        if not self._hwp.document.path:
+            return False
+        return self._hwp._save(self._hwp.document, self._hwp.document.path)
+
+    def Close(self, save_changes: bool = False) -> bool:
+        self._call("Document.Close")
+        self._hwp._close_document()
+        return True
+
+
+class FakeXHwpDocuments(_FakeComObject):
+    """IXHwpDocuments"""
+
+    @property
+    def Count(self) -> int:
+        self._call("Documents.Count")
+        return 1 if self._hwp._is_open else 0
+
+    def Item(self, index: int) -> Optional[FakeXHwpDocument]:
+        self._call("Documents.Item")
+        return FakeXHwpDocument(self._hwp) if self._hwp._is_open and index == 0 else None
+
+    @property
+    def Active_XHwpDocument(self) -> Optional[FakeXHwpDocument]:
+        self._call("Documents.Active_XHwpDocument")
+        return FakeXHwpDocument(self._hwp) if self._hwp._is_open else None
+
+
+class FakeXHwpWindow(_FakeComObject):
+    """IXHwpWindow (Visible만 의미 있음)"""
+
+    def __init__(self, hwp: "FakeHwp"):
+        super().__init__(hwp)
+        object.__setattr__(self, "_visible", True)
+
+    @property
+    def Visible(self) -> bool:
+        self._call("Window.Visible")
+        return self._visible
+
+    @Visible.setter
+    def Visible(self, value: bool):
+        self._call("Window.Visible=")
+        object.__setattr__(self, "_visible", bool(value))
+
+
+class FakeXHwpWindows(_FakeComObject):
+    """IXHwpWindows"""
+
+    def __init__(self, hwp: "FakeHwp"):
+        super().__init__(hwp)
+        object.__setattr__(self, "_window", FakeXHwpWindow(hwp))
+
+    @property
+    def Count(self) -> int:
+        self._call("Windows.Count")
+        return 1
+
+    def Item(self, index: int) -> FakeXHwpWindow:
+        self._call("Windows.Item")
+        return self._window
+
+    @property
+    def ActiveWindow(self) -> FakeXHwpWindow:
+        self._call("Windows.ActiveWindow")
+        return self._window
+
+
+# ============================================================================
+# IHwpObject
+# ============================================================================
+
+
+class FakeHwp:
+    """IHwpObject 대체 (메모리 문서 + 호출 기록)
+
+    Args:
+        latency: 모든 호출의 기본 지연 (초)
+        latency_map: 호출별 지연 {"Run:Paste": 0.05, "Open": 0.4, "HAction.Execute": 0.1}
+                     (정확한 이름 → ':' 앞 이름 순으로 찾음)
+        realtime: True이면 지연만큼 실제로 sleep
+        stats: 공유 통계 (없으면 새로 생성)
+        clipboard: 공유 클립보드 (인스턴스 간 복사/붙여넣기)
+        min_file_size: 저장 파일 최소 크기
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        latency_map: Optional[Dict[str, float]] = None,
+        realtime: bool = False,
+        stats: Optional[FakeStats] = None,
+        clipboard: Optional[Dict[str, Any]] = None,
+        min_file_size: int = DEFAULT_MIN_FILE_SIZE,
+    ):
+        self.latency = latency
+        self.latency_map = latency_map or {}
+        self.realtime = realtime
+        self.stats = stats or FakeStats()
+        self.clipboard = clipboard if clipboard is not None else {}
+        self.min_file_size = min_file_size
+
+        self.document = FakeDocument()
+        self._is_open = False
+        self._quit = False
+        self._cursor: Pos = (0, 0)
+        self._anchor: Optional[Pos] = None
+        self.registered_modules: List[str] = []
+
+        self._action = FakeHAction(self)
+        self._parameter_sets = FakeParameterSets(self)
+        self._documents = FakeXHwpDocuments(self)
+        self._windows = FakeXHwpWindows(self)
+
+    # ------------------------------------------------------------------
+    # 호출 기록
+    # ------------------------------------------------------------------
+
+    def _latency_for(self, name: str) -> float:
+        if name in self.latency_map:
+            return self.latency_map[name]
+        base = name.split(":", 1)[0]
+        return self.latency_map.get(base, self.latency)
+
+    def _call(self, name: str):
+        if self._quit:
+            raise RuntimeError("RPC 서버를 사용할 수 없습니다 (Quit 이후 호출)")
+        latency = self._latency_for(name)
+        self.stats.record(name, latency)
+        if self.realtime and latency > 0:
+            time.sleep(latency)
+
+    # ------------------------------------------------------------------
+    # 속성
+    # ------------------------------------------------------------------
+
+    @property
+    def HAction(self) -> FakeHAction:
+        self._call("get:HAction")
+        return self._action
+
+    @property
+    def HParameterSet(self) -> FakeParameterSets:
+        self._call("get:HParameterSet")
+        return self._parameter_sets
+
+    @property
+    def XHwpDocuments(self) -> FakeXHwpDocuments:
+        self._call("get:XHwpDocuments")
+        return self._documents
+
+    @property
+    def XHwpWindows(self) -> FakeXHwpWindows:
+        self._call("get:XHwpWindows")
+        return self._windows
+
+    @property
+    def PageCount(self) -> int:
+        self._call("get:PageCount")
+        return self.document.page_count() if self._is_open else 0
+
+    @property
+    def EditMode(self) -> int:
+        self._call("get:EditMode")
+        return 1
+
+    @property
+    def IsEmpty(self) -> bool:
+        self._call("get:IsEmpty")
+        return self.document.text() == ""
+
+    @property
+    def Version(self) -> str:
+        self._call("get:Version")
+        return "FakeHwp"
+
+    @property
+    def Path(self) -> str:
+        self._call("get:Path")
+        return self.document.path or ""
+
+    @property
+    def HeadCtrl(self) -> Optional[FakeCtrl]:
+        """구역 정의 → 단 정의 → 미주 순서의 컨트롤 체인"""
+        self._call("get:HeadCtrl")
+        anchors = [
+            (para, pos)
+            for para, paragraph in enumerate(self.document.paragraphs)
+            for pos in paragraph.endnotes
+        ]
+        ctrl = None
+        for anchor in reversed(anchors):
+            ctrl = FakeCtrl(self, "en", anchor, ctrl)
+        ctrl = FakeCtrl(self, "cold", (0, 0), ctrl)
+        return FakeCtrl(self, "secd", (0, 0), ctrl)
+
+    # ------------------------------------------------------------------
+    # 메서드
+    # ------------------------------------------------------------------
+
+    def RegisterModule(self, module_type: str, module_name: str) -> bool:
+        self._call("RegisterModule")
+        self.registered_modules.append(module_name)
+        return True
+
+    def Open(self, path: str, format: str = "", arg: str = "") -> bool:
+        self._call("Open")
+        return self._open(path)
+
+    def SaveAs(self, path: str, format: str = "HWP", arg: str = "") -> bool:
+        self._call("SaveAs")
+        return self._save(self.document, path, format)
+
+    def Clear(self, option: int = 0) -> bool:
+        self._call("Clear")
+        self._close_document()
+        return True
+
+    def Quit(self):
+        self._call("Quit")
+        self._close_document()
+        self._quit = True
+
+    def GetPos(self) -> Tuple[int, int, int]:
+        self._call("GetPos")
+        return (0,) + self._cursor
+
+    def SetPos(self, lst: int, para: int, pos: int) -> bool:
+        self._call("SetPos")
+        self._cursor = self.document.clamp(para, pos)
+        return True
+
+    def GetText(self) -> Tuple[int, str]:
+        self._call("GetText")
+        if self._anchor is not None:
+            return (1, self.document.text(self._anchor, self._cursor))
+        return (1, self.document.text())
+
+    def Run(self, action: str) -> bool:
+        self._call(f"Run:{action}")
+        handler = getattr(self, f"_run_{action}", None)
+        if handler is not None:
+            handler()
+        return True
+
+    # ------------------------------------------------------------------
+    # 문서 열기 / 저장
+    # ------------------------------------------------------------------
+
+    def _open(self, path: str) -> bool:
+        if not Path(path).exists():
+            return False
+        self.document = FakeDocument.load(path)
+        self._is_open = True
+        self._cursor, self._anchor = (0, 0), None
+        return True
+
+    def _save(self, document: FakeDocument, path: str, format: str = "HWP") -> bool:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        if str(format).upper() == "PDF":
+            write_fake_pdf(path, document.page_count())
+        else:
+            document.save(path, self.min_file_size)
+        if document is self.document:
+            document.path = str(path)
+            document.modified = False
+        return True
+
+    def _close_document(self):
+        self.document = FakeDocument()
+        self._is_open = False
+        self._cursor, self._anchor = (0, 0), None
+
+    def _selection(self) -> Optional[Tuple[Pos, Pos]]:
+        if self._anchor is None or self._anchor == self._cursor:
+            return None
+        return tuple(sorted((self._anchor, self._cursor)))
+
+    # ------------------------------------------------------------------
+    # HAction 실행
+    # ------------------------------------------------------------------
+
+    def _execute(self, action: str, items: Dict[str, Any]) -> bool:
+        if action in ("FileSaveAs_S", "FileSaveAs", "FileSaveAsPdf"):
+            filename = items.get("filename") or items.get("FileName")
+            if not filename:
+                return False
+            fmt = "PDF" if action == "FileSaveAsPdf" else items.get("Format", "HWP")
+            document = self.document
+            if str(items.get("Argument", "")).lower() == "saveblock":
+                selection = self._selection()
+                if selection is None:
+                    return False
+                document = self.document.slice(*selection)
+            return self._save(document, filename, fmt)
+
+        if action == "FileOpen":
+            return self._open(items.get("filename") or items.get("FileName", ""))
+
+        if action == "InsertFile":
+            path = items.get("FileName") or items.get("filename")
+            if not path or not Path(path).exists():
+                return False
+            # InsertFile은 커서를 움직이지 않음
+            self.document.insert(self._cursor, FakeDocument.load(path))
+            return True
+
+        if action == "MultiColumn":
+            self.document.columns = int(items.get("Count") or 1)
+            self.document.modified = True
+            return True
+
+        if action == "PageSetup":
+            self.document.page_setup = dict(items.get("PageDef") or {})
+            self.document.modified = True
+            return True
+
+        return True
+
+    # ------------------------------------------------------------------
+    # Run 액션
+    # ------------------------------------------------------------------
+
+    def _run_MoveDocBegin(self):
+        self._cursor = (0, 0)
+
+    def _run_MoveDocEnd(self):
+        self._cursor = self.document.end()
+
+    def _run_MoveParaBegin(self):
+        self._cursor = (self._cursor[0], 0)
+
+    def _run_MoveParaEnd(self):
+        para = self._cursor[0]
+        self._cursor = (para, len(self.document.paragraphs[para].text))
+
+    _run_MoveLineBegin = _run_MoveParaBegin
+    _run_MoveLineEnd = _run_MoveParaEnd
+
+    def _run_MoveNextParaBegin(self):
+        para = self._cursor[0]
+        if para + 1 < len(self.document.paragraphs):
+            self._cursor = (para + 1, 0)
+
+    def _run_MovePrevParaBegin(self):
+        para, pos = self._cursor
+        self._cursor = (para if pos > 0 else max(para - 1, 0), 0)
+
+    def _run_MoveLeft(self):
+        para, pos = self._cursor
+        if pos > 0:
+            self._cursor = (para, pos - 1)
+        elif para > 0:
+            self._cursor = (para - 1, len(self.document.paragraphs[para - 1].text))
+
+    def _run_MoveRight(self):
+        para, pos = self._cursor
+        if pos < len(self.document.paragraphs[para].text):
+            self._cursor = (para, pos + 1)
+        elif para + 1 < len(self.document.paragraphs):
+            self._cursor = (para + 1, 0)
+
+    def _run_Select(self):
+        self._anchor = self._cursor
+
+    def _run_SelectAll(self):
+        self._anchor = (0, 0)
+        self._cursor = self.document.end()
+
+    def _run_Cancel(self):
+        self._anchor = None
+
+    def _run_Copy(self):
+        selection = self._selection()
+        if selection is not None:
+            self.clipboard["document"] = self.document.slice(*selection)
+
+    def _run_Cut(self):
+        self._run_Copy()
+        self._run_Delete()
+
+    def _run_Paste(self):
+        clip = self.clipboard.get("document")
+        if clip is None:
+            return
+        selection = self._selection()
+        if selection is not None:
+            self._cursor = self.document.delete(*selection)
+        self._anchor = None
+        self._cursor = self.document.insert(self._cursor, clip)
+
+    def _run_Delete(self):
+        selection = self._selection()
+        if selection is None:
+            para, pos = self._cursor
+            if pos < len(self.document.paragraphs[para].text):
+                selection = ((para, pos), (para, pos + 1))
+            elif para + 1 < len(self.document.paragraphs):
+                selection = ((para, pos), (para + 1, 0))
+            else:
+                return
+        self._cursor = self.document.delete(*selection)
+        self._anchor = None
+
+    def _run_BreakPara(self):
+        self._cursor = self.document.split(self._cursor)
+
+    def _run_BreakColumn(self):
+        self._cursor = self.document.split(self._cursor, column_break=True)
+
+    _run_BreakPage = _run_BreakColumn
+
+    def _run_FileNew(self):
+        self.document = FakeDocument()
+        self._is_open = True
+        self._cursor, self._anchor = (0, 0), None
+
+    def _run_FileClose(self):
+        self._close_document()
+
+
+class FakeBackend:
+    """FakeHwp factory (com_backend.set_hwp_factory에 전달)
+
+    생성한 모든 인스턴스가 통계와 클립보드를 공유합니다.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        latency_map: Optional[Dict[str, float]] = None,
+        realtime: bool = False,
+        min_file_size: int = DEFAULT_MIN_FILE_SIZE,
+    ):
+        self.latency = latency
+        self.latency_map = latency_map or {}
+        self.realtime = realtime
+        self.min_file_size = min_file_size
+        self.stats = FakeStats()
+        self.clipboard: Dict[str, Any] = {}
+        self.instances: List[FakeHwp] = []
+
+    def __call__(self) -> FakeHwp:
+        hwp = FakeHwp(
+            latency=self.latency,
+            latency_map=self.latency_map,
+            realtime=self.realtime,
+            stats=self.stats,
+            clipboard=self.clipboard,
+            min_file_size=self.min_file_size,
+        )
+        self.instances.append(hwp)
+        return hwp
@@ -5,20 +5,172 @@ Idris2 명세: Specs/Consolidator/Types.idr, Workflow.idr
 
 주요 기능:
 - 여러 폴더의 파일을 하나의 폴더로 통합
-- 병렬 처리 (ProcessPoolExecutor, max_workers=5)
+- 병렬 처리 (기본 스레드 엔진, max_workers=5 / engine="process"는 이전 프로세스 풀)
 - 복사 또는 이동 모드
+- 복사 대신 하드링크/reflink (link_mode)
+- 같은 이름/같은 내용 처리 + 증분 재실행 (dedupe, core/consolidation_plan.py)
+
+파일 복사는 CPU가 아니라 I/O라서 프로세스를 띄울 이유가 없습니다.
+스레드 엔진은 워커 기동/인자 피클링 없이 커널 복사(copy_file_range → sendfile)를 쓰고,
+같은 파일시스템 이동은 os.replace(rename) 한 번으로 끝냅니다.
 """
-from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Tuple, Optional
+import errno
 import shutil
 import os
 
+try:
+    import fcntl
+except ImportError:  # Windows: reflink 없음
+    fcntl = None
+
+from .consolidation_plan import plan_consolidation
+from .progress import progress_bus
+
+ENGINES = ("thread", "process")
+LINK_MODES = ("hardlink", "reflink")
+
+# 커널 복사 한 번에 넘길 바이트 수
+COPY_CHUNK = 1 << 24
+
+# linux/fs.h FICLONE = _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+# 이 에러면 아직 아무것도 안 쓴 상태에서 다음 방법으로 넘어감 (파일시스템/커널 미지원)
+_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    getattr(errno, "ENOTSUP", errno.EOPNOTSUPP),
+    errno.EBADF,
+    errno.ETXTBSY,
+}
+
+
+# ============================================================
+# 복사/링크/이동 기본 동작
+# ============================================================
+
+
+def _kernel_copy(syscall, src_fd: int, dst_fd: int) -> bool:
+    """syscall(src_fd, dst_fd)을 0이 나올 때까지 반복. 첫 호출부터 미지원이거나 0이면 False"""
+    copied = 0
+    while True:
+        try:
+            sent = syscall(src_fd, dst_fd)
+        except OSError as e:
+            if copied == 0 and e.errno in _UNSUPPORTED_ERRNOS:
+                return False
+            raise
+        if sent == 0:
+            # procfs/일부 FUSE/overlay는 내용이 있어도 첫 호출부터 0을 돌려줌
+            # (크기가 0으로 보이기도 함)
+            # → 한 바이트도 못 옮겼으면 다음 방법으로 (빈 파일은 버퍼 복사도 금방 끝남)
+            return copied > 0
+        copied += sent
+
+
+def _copy_file_range(src_fd: int, dst_fd: int) -> int:
+    return os.copy_file_range(src_fd, dst_fd, COPY_CHUNK)
+
+
+def _sendfile(src_fd: int, dst_fd: int) -> int:
+    return os.sendfile(dst_fd, src_fd, None, COPY_CHUNK)
+
+
+_KERNEL_COPIES = [
+    syscall
+    for syscall, name in ((_copy_file_range, "copy_file_range"), (_sendfile, "sendfile"))
+    if hasattr(os, name)
+]
+
+
+def fast_copy(source: str, dest: str) -> None:
+    """
+    shutil.copy2와 같은 결과(내용 + 시간/권한)를 커널 복사로
+
+    copy_file_range(같은 파일시스템이면 reflink/서버측 복사까지 커널이 처리) →
+    sendfile → 일반 버퍼 복사 순서로 시도합니다.
+    """
+    if os.path.exists(dest) and os.path.samefile(source, dest):
+        raise shutil.SameFileError(f"{source}와 {dest}는 같은 파일")
+
+    with open(source, "rb") as fsrc, open(dest, "wb") as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        if not any(_kernel_copy(syscall, src_fd, dst_fd) for syscall in _KERNEL_COPIES):
+            shutil.copyfileobj(fsrc, fdst, 1 << 20)
+    shutil.copystat(source, dest)
+
+
+# FICLONE이 안 된 (원본 장치, 대상 폴더 장치) - 같은 조합은 다시 시도하지 않음
+_NO_REFLINK = set()
+
+
+def reflink(source: str, dest: str) -> bool:
+    """FICLONE으로 블록 공유 복사 (btrfs/XFS 등). 지원 안 하면 False"""
+    if fcntl is None:
+        return False
+    devices = (os.stat(source).st_dev, os.stat(os.path.dirname(dest) or ".").st_dev)
+    if devices in _NO_REFLINK:
+        return False
+    with open(source, "rb") as fsrc, open(dest, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        except OSError as e:
+            if e.errno in _UNSUPPORTED_ERRNOS | {errno.ENOTTY}:
+                _NO_REFLINK.add(devices)
+            return False
+    shutil.copystat(source, dest)
+    return True
+
+
+def link_or_copy(source: str, dest: str, link_mode: Optional[str] = None) -> str:
+    """
+    link_mode대로 링크하고 안 되면 복사
+
+    Returns:
+        실제로 쓴 방법 ("hardlink", "reflink", "copy")
+    """
+    if link_mode == "hardlink":
+        if os.path.exists(dest):
+            if os.path.samefile(source, dest):
+                return "hardlink"  # 이전 실행에서 이미 링크됨
+            os.unlink(dest)
+        try:
+            os.link(source, dest)
+            return "hardlink"
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED_ERRNOS | {errno.EPERM, errno.EMLINK}:
+                raise
+    elif link_mode == "reflink":
+        if reflink(source, dest):
+            return "reflink"
+
+    fast_copy(source, dest)
+    return "copy"
+
+
+def fast_move(source: str, dest: str) -> None:
+    """같은 파일시스템이면 rename 한 번, 아니면 복사 후 원본 삭제"""
+    try:
+        os.replace(source, dest)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        fast_copy(source, dest)
+        os.unlink(source)
+
 
 def worker_copy_file(
     source_path: str,
     target_dir: str,
-    verbose: bool = False
+    verbose: bool = False,
+    link_mode: Optional[str] = None,
+    dest_name: Optional[str] = None,
 ) -> Tuple[bool, Optional[str], Optional[str]]:
     """
     워커 함수: 파일 복사
@@ -29,6 +181,8 @@ def worker_copy_file(
         source_path: 원본 파일 경로
         target_dir: 대상 디렉토리
         verbose: 상세 로그
+        link_mode: None(복사), "hardlink", "reflink" - 안 되면 복사
+        dest_name: 대상 파일 이름 (None이면 원본 이름)
 
     Returns:
         (success, dest_path, error)
@@ -39,14 +193,15 @@ def worker_copy_file(
             return False, None, f"파일 없음: {source_path}"
 
         # 대상 경로
-        dest = Path(target_dir) / source.name
+        dest = Path(target_dir) / (dest_name or source.name)
 
-        # 파일 복사
-        shutil.copy2(source, dest)
+        # 파일 복사 (또는 링크)
+        method = link_or_copy(str(source), str(dest), link_mode)
 
         if verbose:
             size_kb = dest.stat().st_size / 1024
-            print(f"[복사 완료] {source.name} ({size_kb:.1f} KB)")
+            label = "복사 완료" if method == "copy" else f"{method} 완료"
+            print(f"[{label}] {source.name} ({size_kb:.1f} KB)")
 
         return True, str(dest), None
 
@@ -55,12 +210,10 @@ def worker_copy_file(
 
 
 def worker_move_file(
-    source_path: str,
-    target_dir: str,
-    verbose: bool = False
+    source_path: str, target_dir: str, verbose: bool = False, dest_name: Optional[str] = None
 ) -> Tuple[bool, Optional[str], Optional[str]]:
     """
-    워커 함수: 파일 이동 (복사 + 삭제)
+    워커 함수: 파일 이동 (같은 파일시스템이면 rename, 아니면 복사 + 삭제)
 
     Idris2 명세: Workflow.ProcessFiles (MoveMode)
 
@@ -68,6 +221,7 @@ def worker_move_file(
         source_path: 원본 파일 경로
         target_dir: 대상 디렉토리
         verbose: 상세 로그
+        dest_name: 대상 파일 이름 (None이면 원본 이름)
 
     Returns:
         (success, dest_path, error)
@@ -78,10 +232,10 @@ def worker_move_file(
             return False, None, f"파일 없음: {source_path}"
 
         # 대상 경로
-        dest = Path(target_dir) / source.name
+        dest = Path(target_dir) / (dest_name or source.name)
 
         # 파일 이동
-        shutil.move(str(source), str(dest))
+        fast_move(str(source), str(dest))
 
         if verbose:
             size_kb = dest.stat().st_size / 1024
@@ -170,7 +324,10 @@ def consolidate_parallel(
     target_name: str,
     mode: str = "copy",
     max_workers: int = 5,
-    verbose: bool = False
+    verbose: bool = False,
+    engine: str = "thread",
+    link_mode: Optional[str] = None,
+    dedupe: bool = False,
 ) -> Tuple[int, int, int]:
     """
     병렬 파일 통합
@@ -186,12 +343,24 @@ def consolidate_parallel(
         mode: "copy" 또는 "move"
         max_workers: 최대 병렬 워커 수
         verbose: 상세 로그
+        engine: "thread" (기본) 또는 "process" (이전 ProcessPoolExecutor)
+        link_mode: 복사 모드에서 "hardlink"/"reflink" (안 되는 파일은 복사)
+        dedupe: 통합 계획 사용 (core/consolidation_plan.py) - 내용이 같은 파일은 하나만,
+            이름만 같은 파일은 이름_해시로, 대상 폴더에 매니페스트를 남겨 다시 실행하면
+            새 파일/바뀐 파일만 처리. 건너뛴 파일은 성공으로 셈 (이동 모드에서는 원본에 남음)
 
     Returns:
         (total, success, failed) - OperationStats
     """
+    if engine not in ENGINES:
+        raise ValueError(f"engine은 {ENGINES} 중 하나: {engine!r}")
+    if link_mode is not None and link_mode not in LINK_MODES:
+        raise ValueError(f"link_mode는 {LINK_MODES} 중 하나: {link_mode!r}")
+    if link_mode is not None and mode == "move":
+        raise ValueError("link_mode는 복사 모드에서만 사용")
+
     if verbose:
-        print(f"[시작] 모드: {mode}, 워커: {max_workers}")
+        print(f"[시작] 모드: {mode}, 엔진: {engine}, 워커: {max_workers}")
 
     # 1. ScanSources
     files = scan_folders(source_folders, verbose)
@@ -205,17 +374,42 @@ def consolidate_parallel(
     if not target_dir:
         return len(files), 0, len(files)
 
-    # 3. ProcessFiles (병렬)
+    # 3. PlanFiles (dedupe만) - 처리할 파일과 대상 이름
+    plan = None
+    names = {}
+    pending = files
+    if dedupe:
+        plan = plan_consolidation(files, target_dir, max_workers)
+        names = {item.source: item.dest_name for item in plan.to_copy}
+        pending = list(names)
+        if verbose:
+            counts = plan.summary()
+            print(
+                f"\n[계획] 처리 {counts['copy']}, 그대로 {counts['unchanged']}, "
+                f"중복 {counts['duplicate']}, 이름 변경 {counts['renamed']}, "
+                f"읽기 실패 {counts['unreadable']}"
+            )
+
+    # 4. ProcessFiles (병렬)
     if verbose:
-        print(f"\n[병렬 처리 시작] {len(files)}개 파일...")
+        print(f"\n[병렬 처리 시작] {len(pending)}개 파일...")
 
-    worker_fn = worker_move_file if mode == "move" else worker_copy_file
+    if mode == "move":
+        worker_fn, extra = worker_move_file, ()
+    else:
+        worker_fn, extra = worker_copy_file, (link_mode,)
+    executor_cls = ThreadPoolExecutor if engine == "thread" else ProcessPoolExecutor
     results = []
+    failed_paths = []
+    stage = progress_bus.stage("consolidate", len(pending))
+    stage.start(mode)
 
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+    with executor_cls(max_workers=max_workers) as executor:
         futures = {
-            executor.submit(worker_fn, file_path, target_dir, verbose): file_path
-            for file_path in files
+            executor.submit(
+                worker_fn, file_path, target_dir, verbose, *extra, dest_name=names.get(file_path)
+            ): file_path
+            for file_path in pending
         }
 
         for future in as_completed(futures):
@@ -223,16 +417,22 @@ def consolidate_parallel(
             try:
                 success, dest, error = future.result()
                 results.append((success, dest, error))
-
-                if not success and verbose:
-                    print(f"[실패] {Path(file_path).name}: {error}")
-
             except Exception as e:
                 results.append((False, None, f"워커 예외: {str(e)}"))
+
+            success, _, error = results[-1]
+            stage.advance(Path(file_path).name, ok=success, message=error or "")
+            if not success:
+                failed_paths.append(file_path)
                 if verbose:
-                    print(f"[실패] {Path(file_path).name}: 워커 예외 {e}")
+                    print(f"[실패] {Path(file_path).name}: {error}")
+
+    if plan is not None:
+        manifest_path = plan.write_manifest(failed_paths)
+        if verbose:
+            print(f"[매니페스트] {manifest_path}")
 
-    # 4. Cleanup (MoveMode만)
+    # 5. Cleanup (MoveMode만)
     if mode == "move":
         if verbose:
             print(f"\n[정리] 빈 폴더 삭제...")
@@ -248,9 +448,10 @@ def consolidate_parallel(
                     if verbose:
                         print(f"[경고] 폴더 삭제 실패: {e}")
 
-    # 5. CollectStats
+    # 6. CollectStats
     total = len(files)
-    success = sum(1 for s, _, _ in results if s)
+    skipped = len(files) - len(pending) - (len(plan.unreadable) if plan else 0)
+    success = sum(1 for s, _, _ in results if s) + skipped
     failed = total - success
 
     if verbose:
@@ -5,8 +5,8 @@ pywin32 기반 한글 COM 클라이언트
 모든 플러그인이 이 클라이언트를 통해 HWP를 제어합니다.
 """
 
-import win32com.client
 from typing import Optional
+from .com_backend import dispatch_hwp
 from .types import DocumentState
 
 
@@ -20,7 +20,7 @@ class HwpClient:
     def start(self) -> bool:
         """HWP 프로세스 시작"""
         try:
-            self.hwp = win32com.client.gencache.EnsureDispatch("HWPFrame.HwpObject")
+            self.hwp = dispatch_hwp(early_binding=True)
             return True
         except Exception as e:
             print(f"Failed to start HWP: {e}")
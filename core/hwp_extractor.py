@@ -4,13 +4,13 @@ HWP 문제 추출 모듈 - math-collector의 검증된 로직 사용
 이 모듈은 math-collector/src/tools/handle_hwp.py의 검증된 로직을 기반으로 합니다.
 EndNote 앵커를 사용하여 HWP 파일에서 개별 문제를 추출합니다.
 """
-import win32com.client as win32
-import pythoncom
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Generator, Tuple, Optional
 from itertools import islice
 from .sync import wait_for_hwp_ready
+from .com_backend import dispatch_hwp, co_initialize, co_uninitialize
+from .param_cache import parameter_cache
 
 # 타입 정의
 Block = Tuple[Tuple[int, int, int], Tuple[int, int, int]]
@@ -27,9 +27,9 @@ def open_hwp(file_path: str):
     Yields:
         HWP COM 객체
     """
-    pythoncom.CoInitialize()
+    co_initialize()
     try:
-        hwp = win32.DispatchEx('HwpFrame.HwpObject')
+        hwp = dispatch_hwp()
         hwp.RegisterModule('FilePathCheckDLL', 'FilePathCheckerModule')
         hwp.Open(file_path, 'HWP', 'lock:false;forceopen:true')
         hwp.XHwpWindows.Item(0).Visible = False
@@ -41,7 +41,7 @@ def open_hwp(file_path: str):
 
         hwp.Quit()
     finally:
-        pythoncom.CoUninitialize()
+        co_uninitialize()
 
 
 def iter_note_blocks(hwp) -> Generator[Block, None, None]:
@@ -121,12 +121,9 @@ def save_block(hwp, *, filepath: str | Path, fmt: str = "HWP") -> bool:
     """
     filepath_str = str(filepath)
 
-    hwp.HAction.GetDefault("FileSaveAs_S", hwp.HParameterSet.HFileOpenSave.HSet)
-    hwp.HParameterSet.HFileOpenSave.filename = filepath_str
-    hwp.HParameterSet.HFileOpenSave.Format = fmt
-    hwp.HParameterSet.HFileOpenSave.Attributes = 1
-
-    result_bool: bool = hwp.HAction.Execute("FileSaveAs_S", hwp.HParameterSet.HFileOpenSave.HSet)
+    result_bool: bool = parameter_cache(hwp).execute(
+        "FileSaveAs_S", "HFileOpenSave", filename=filepath_str, Format=fmt, Attributes=1
+    )
 
     return result_bool
 
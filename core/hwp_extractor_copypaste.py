@@ -9,14 +9,12 @@ Idris2 명세: Specs/Extractor/SequentialExtraction.idr (Solution4_SaveBlock)
 
 이전 Copy/Paste 방식은 FileNew 후 Paste가 실패하는 문제로 SaveBlock 방식으로 변경
 """
-import win32com.client as win32
-import pythoncom
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Tuple, Optional, List
 
 from .hwp_extractor import open_hwp, iter_note_blocks, Block
-
+from .param_cache import parameter_cache
 
 def extract_block_copypaste(
     hwp,
@@ -61,13 +59,14 @@ def extract_block_copypaste(
             print(f"  [2] SaveBlock 저장: {filepath_str}")
 
         # 2. FileSaveAs_S with Argument="saveblock"
-        hwp.HAction.GetDefault("FileSaveAs_S", hwp.HParameterSet.HFileOpenSave.HSet)
-        hwp.HParameterSet.HFileOpenSave.filename = filepath_str
-        hwp.HParameterSet.HFileOpenSave.Format = "HWP"
-        hwp.HParameterSet.HFileOpenSave.Attributes = 1
-        hwp.HParameterSet.HFileOpenSave.Argument = "saveblock"  # ✨ 핵심!
-
-        result = hwp.HAction.Execute("FileSaveAs_S", hwp.HParameterSet.HFileOpenSave.HSet)
+        result = parameter_cache(hwp).execute(
+            "FileSaveAs_S",
+            "HFileOpenSave",
+            filename=filepath_str,
+            Format="HWP",
+            Attributes=1,
+            Argument="saveblock",  # ✨ 핵심!
+        )
 
         # 선택 해제
         hwp.Run("Cancel")
@@ -16,8 +16,6 @@ Idris2 명세: Specs/Extractor/ParallelExtraction.idr
 4. 배치 완료 후 복사본 삭제
 5. 다음 배치 진행
 """
-import win32com.client as win32
-import pythoncom
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Tuple, Optional, List
@@ -25,9 +23,10 @@ import shutil
 import os
 import time
 
+from .com_backend import co_initialize, co_uninitialize
 from .hwp_extractor import open_hwp, iter_note_blocks, Block
 from .hwp_extractor_copypaste import extract_block_copypaste
-
+from .progress import progress_bus
 
 def worker_extract_group(
     file_copy_path: str,
@@ -58,7 +57,7 @@ def worker_extract_group(
         (성공 여부, 저장 경로 또는 None)
     """
     # ProcessPoolExecutor에서는 각 프로세스가 COM 초기화 필요
-    pythoncom.CoInitialize()
+    co_initialize()
 
     try:
         if verbose:
@@ -105,7 +104,7 @@ def worker_extract_group(
         return (False, None)
 
     finally:
-        pythoncom.CoUninitialize()
+        co_uninitialize()
 
 
 def extract_blocks_parallel(
@@ -188,6 +187,8 @@ def extract_blocks_parallel(
     print(f"\n4단계: 병렬 추출 시작\n")
 
     all_results = []
+    stage = progress_bus.stage("separate", len(groups))
+    stage.start(Path(hwp_file_path).name)
 
     for batch_idx, batch in enumerate(batches, 1):
         print(f"=== 배치 {batch_idx}/{len(batches)} 처리 중 ({len(batch)}개 그룹) ===\n")
@@ -264,23 +265,31 @@ def extract_blocks_parallel(
                 )
                 futures[future] = (group, output_file)
 
-            # 결과 대기
+            # 결과 대기 (latency: 배치 제출부터 완료까지)
+            submitted = time.perf_counter()
             for future in as_completed(futures):
                 group, output_file = futures[future]
                 try:
                     success, result_path = future.result()
 
                     if success and output_file.exists():
-                        file_size = output_file.stat().st_size
-                        print(f"[OK] 그룹 {[g+1 for g in group]}: {file_size:,} bytes")
                         batch_results.append((True, output_file))
+                        stage.advance(
+                            output_file.name,
+                            latency=time.perf_counter() - submitted,
+                            message=f"{output_file.stat().st_size:,} bytes",
+                        )
                     else:
-                        print(f"[FAIL] 그룹 {[g+1 for g in group]}: 실패")
                         batch_results.append((False, None))
+                        print(f"[FAIL] 그룹 {[g+1 for g in group]}: 실패")
+                        stage.advance(
+                            output_file.name, latency=time.perf_counter() - submitted, ok=False
+                        )
 
                 except Exception as e:
-                    print(f"[ERROR] 그룹 {[g+1 for g in group]}: 오류 - {e}")
                     batch_results.append((False, None))
+                    print(f"[ERROR] 그룹 {[g+1 for g in group]}: 오류 - {e}")
+                    stage.advance(output_file.name, ok=False, message=f"오류 - {e}")
 
         # 4-3. 복사본 삭제
         if verbose:
@@ -15,13 +15,14 @@ FileSaveAsPdf 액션:
 - HParameterSet.HFileOpenSave.Attributes = 16384
 - HAction.Execute("FileSaveAsPdf", HParameterSet.HFileOpenSave.HSet)
 """
-import win32com.client as win32
-import pythoncom
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Tuple, Optional, List
+from typing import Callable, Tuple, Optional, List
 import os
 
+from .com_backend import dispatch_hwp, co_initialize, co_uninitialize
+from .param_cache import parameter_cache
+from .progress import progress_bus
 
 def worker_convert_to_pdf(
     hwp_file_path: str,
@@ -43,7 +44,7 @@ def worker_convert_to_pdf(
     Returns:
         (success, output_path, error_message)
     """
-    pythoncom.CoInitialize()
+    co_initialize()
 
     try:
         hwp_path = Path(hwp_file_path)
@@ -57,19 +58,20 @@ def worker_convert_to_pdf(
             print(f"[변환 시작] {hwp_path.name} → {pdf_path.name}")
 
         # HWP COM 객체 생성 (gencache 대신 DispatchEx 사용 - 캐시 손상 문제 방지)
-        hwp = win32.DispatchEx("HWPFrame.HwpObject")
+        hwp = dispatch_hwp()
         hwp.RegisterModule("FilePathCheckDLL", "FilePathCheckerModule")
 
         # 파일 열기
         hwp.Open(str(hwp_path.absolute()), "HWP", "")
 
         # FileSaveAsPdf 액션 실행
-        hwp.HAction.GetDefault("FileSaveAsPdf", hwp.HParameterSet.HFileOpenSave.HSet)
-        hwp.HParameterSet.HFileOpenSave.filename = str(pdf_path.absolute())
-        hwp.HParameterSet.HFileOpenSave.Format = "PDF"
-        hwp.HParameterSet.HFileOpenSave.Attributes = 16384
-
-        result = hwp.HAction.Execute("FileSaveAsPdf", hwp.HParameterSet.HFileOpenSave.HSet)
+        result = parameter_cache(hwp).execute(
+            "FileSaveAsPdf",
+            "HFileOpenSave",
+            filename=str(pdf_path.absolute()),
+            Format="PDF",
+            Attributes=16384,
+        )
 
         if not result:
             hwp.Quit()
@@ -93,13 +95,14 @@ def worker_convert_to_pdf(
         return False, None, f"변환 중 에러: {str(e)}"
 
     finally:
-        pythoncom.CoUninitialize()
+        co_uninitialize()
 
 
 def convert_hwp_to_pdf_parallel(
     hwp_files: List[str],
     max_workers: int = 5,
-    verbose: bool = False
+    verbose: bool = False,
+    on_result: Optional[Callable[[str, Tuple[bool, Optional[str], Optional[str]]], None]] = None,
 ) -> List[Tuple[bool, Optional[str], Optional[str]]]:
     """
     여러 HWP 파일을 병렬로 PDF로 변환
@@ -116,6 +119,7 @@ def convert_hwp_to_pdf_parallel(
         hwp_files: HWP/HWPX 파일 경로 목록
         max_workers: 최대 병렬 워커 수 (기본 5)
         verbose: 상세 로그 출력 여부
+        on_result: 파일 하나가 끝날 때마다 (hwp_file, 결과 튜플)로 호출 (완료 순서)
 
     Returns:
         List of (success, output_path, error_message)
@@ -127,6 +131,8 @@ def convert_hwp_to_pdf_parallel(
         print(f"[병렬 변환 시작] {len(hwp_files)}개 파일, {max_workers} 워커")
 
     results = []
+    stage = progress_bus.stage("pdf", len(hwp_files))
+    stage.start()
 
     with ProcessPoolExecutor(max_workers=max_workers) as executor:
         # 작업 제출
@@ -153,6 +159,11 @@ def convert_hwp_to_pdf_parallel(
                 if verbose:
                     print(f"[실패] {Path(hwp_file).name}: 워커 예외 {e}")
 
+            success, _, error = results[-1]
+            stage.advance(Path(hwp_file).name, ok=success, message=error or "")
+            if on_result:
+                on_result(hwp_file, results[-1])
+
     # 통계
     success_count = sum(1 for s, _, _ in results if s)
     fail_count = len(results) - success_count
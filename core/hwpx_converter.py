@@ -9,7 +9,30 @@ from pathlib import Path
 from typing import Optional, Tuple
 import os
 
-from core.automation_client import AutomationClient
+from core.hwpx_package import open_package, SECTION_PATH_FORMAT
+
+
+def inspect_hwpx(hwpx_path: str) -> Tuple[bool, Optional[str]]:
+    """
+    HWPX 패키지 사전 검사 (COM 실행 전)
+
+    core.hwpx_package.open_package()로 열기 때문에, 호출 시점에 같은 파일을
+    연 HwpxParser/BinData 리더가 있으면 그 매핑을 빌려 씁니다. 다른 사용자가
+    없으면 검사하는 동안만 매핑하고 반환 전에 해제합니다 (이후 COM 변환은
+    한글이 파일을 직접 엽니다).
+
+    Returns:
+        Tuple[valid, error_message]
+    """
+    try:
+        with open_package(hwpx_path) as package:
+            if SECTION_PATH_FORMAT.format(0) not in package:
+                return False, f"section0.xml 없음: {hwpx_path}"
+            return True, None
+    except FileNotFoundError:
+        return False, f"File not found: {hwpx_path}"
+    except ValueError as e:
+        return False, f"Invalid HWPX: {e}"
 
 
 def convert_hwpx_to_hwp(
@@ -38,6 +61,11 @@ def convert_hwpx_to_hwp(
         if not hwpx_path_obj.exists():
             return False, None, f"File not found: {hwpx_path}"
 
+        # 손상된 패키지는 Hangul을 띄우기 전에 걸러냄
+        valid, error = inspect_hwpx(str(hwpx_path_obj))
+        if not valid:
+            return False, None, error
+
         # 출력 경로 생성
         if output_path is None:
             # 같은 폴더에 확장자만 변경
@@ -46,6 +74,8 @@ def convert_hwpx_to_hwp(
         output_path_obj = Path(output_path).absolute()
 
         # AutomationClient 사용
+        from core.automation_client import AutomationClient
+
         client = AutomationClient()
 
         # 보안 모듈 등록 (팝업 방지)
@@ -0,0 +1,412 @@
+"""
+HWPX 패키지 리더 - 메모리 맵 기반 ZIP 멤버 접근
+
+Idris2 명세: Specs/Separator/Separator/XmlParser.idr (OpenZip, ReadSection)
+
+BinData 이미지가 포함된 HWPX는 수백 MB에 이르지만, 실제로 필요한 것은
+대부분 section XML 뿐입니다. 이 모듈은 HWPX 파일을 한 번만 mmap 하고
+그 매핑을 HwpxParser, hwpx_converter, BinData 리더가 함께 사용합니다.
+
+멤버 접근 방식:
+- STORED (비압축) 멤버: memoryview (zero-copy)
+- DEFLATED 멤버: 스트리밍 inflater (청크 단위 압축 해제)
+
+사용 예:
+    with open_package("exam.hwpx") as pkg:
+        xml_bytes = pkg.read("Contents/section0.xml")
+        for name, data in pkg.iter_bindata():
+            ...
+"""
+
+import io
+import mmap
+import os
+import struct
+import threading
+import zipfile
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+# HWPX 표준 멤버 경로
+MIMETYPE_PATH = "mimetype"
+HEADER_PATH = "Contents/header.xml"
+CONTENT_HPF_PATH = "Contents/content.hpf"
+SECTION_PATH_FORMAT = "Contents/section{}.xml"
+BINDATA_PREFIX = "BinData/"
+
+HWPX_MIMETYPE = "application/hwp+zip"
+
+# ZIP 로컬 파일 헤더 (PKZIP APPNOTE 4.3.7)
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_LOCAL_HEADER_SIGNATURE = b"PK\003\004"
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class MemberInfo:
+    """ZIP 멤버 위치 정보 (매핑 내 오프셋)"""
+
+    name: str
+    data_offset: int  # 압축 데이터 시작 위치
+    compress_size: int
+    file_size: int
+    compress_type: int  # zipfile.ZIP_STORED / ZIP_DEFLATED
+    crc: int
+
+    @property
+    def is_stored(self) -> bool:
+        return self.compress_type == zipfile.ZIP_STORED
+
+
+class MemberStream(io.RawIOBase):
+    """멤버 스트리밍 읽기 (ET.parse / iterparse 입력용)"""
+
+    def __init__(self, chunks: Iterator[Union[bytes, memoryview]]):
+        self._chunks = chunks
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk)
+
+        n = min(len(buffer), len(self._pending))
+        buffer[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+
+class HwpxPackage:
+    """메모리 맵 기반 HWPX 패키지
+
+    ZIP 중앙 디렉토리는 열 때 한 번만 읽고, 이후 멤버 접근은 모두
+    매핑에서 직접 수행합니다 (파일 재오픈 없음).
+
+    open_package()로 얻은 인스턴스는 같은 파일을 여는 모든 사용자가
+    공유하며, 마지막 사용자가 close() 할 때 매핑이 해제됩니다.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"HWPX 파일을 찾을 수 없습니다: {self.path}")
+
+        self._file = open(self.path, "rb")
+        try:
+            if os.fstat(self._file.fileno()).st_size == 0:
+                raise ValueError(f"빈 파일입니다: {self.path}")
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+        self._view = memoryview(self._mm)
+        self._users = 1
+        self._cache_key: Optional[Tuple] = None
+
+        try:
+            self._members = self._read_central_directory()
+        except Exception:
+            self._unmap()
+            raise
+
+    # ------------------------------------------------------------------
+    # ZIP 구조 읽기
+    # ------------------------------------------------------------------
+
+    def _read_central_directory(self) -> Dict[str, MemberInfo]:
+        """중앙 디렉토리 → 멤버별 데이터 오프셋 계산"""
+        try:
+            # mmap은 seek/tell/read를 지원하므로 ZipFile에 그대로 전달 (복사 없음)
+            with zipfile.ZipFile(self._mm) as zf:
+                infos = zf.infolist()
+        except zipfile.BadZipFile as e:
+            raise ValueError(f"HWPX(ZIP) 형식이 아닙니다: {self.path} ({e})")
+
+        members = {}
+        for zinfo in infos:
+            if zinfo.flag_bits & 0x1:
+                raise ValueError(f"암호화된 멤버는 지원하지 않습니다: {zinfo.filename}")
+            if zinfo.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+                raise ValueError(
+                    f"지원하지 않는 압축 방식({zinfo.compress_type}): {zinfo.filename}"
+                )
+
+            header = _LOCAL_HEADER.unpack_from(self._mm, zinfo.header_offset)
+            if header[0] != _LOCAL_HEADER_SIGNATURE:
+                raise ValueError(f"손상된 로컬 헤더: {zinfo.filename}")
+
+            name_len, extra_len = header[10], header[11]
+            data_offset = zinfo.header_offset + _LOCAL_HEADER.size + name_len + extra_len
+
+            members[zinfo.filename] = MemberInfo(
+                name=zinfo.filename,
+                data_offset=data_offset,
+                compress_size=zinfo.compress_size,
+                file_size=zinfo.file_size,
+                compress_type=zinfo.compress_type,
+                crc=zinfo.CRC,
+            )
+
+        return members
+
+    # ------------------------------------------------------------------
+    # 멤버 조회
+    # ------------------------------------------------------------------
+
+    @property
+    def closed(self) -> bool:
+        return self._mm is None
+
+    def _check_open(self):
+        if self.closed:
+            raise ValueError(f"이미 닫힌 패키지입니다: {self.path}")
+
+    def names(self) -> List[str]:
+        """전체 멤버 이름 (ZIP 저장 순서)"""
+        return list(self._members)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._members
+
+    def info(self, name: str) -> MemberInfo:
+        """멤버 정보 (없으면 KeyError)"""
+        try:
+            return self._members[name]
+        except KeyError:
+            raise KeyError(f"HWPX 멤버가 없습니다: {name}")
+
+    def section_names(self) -> List[str]:
+        """Contents/section*.xml 목록 (섹션 번호 순)"""
+        sections = []
+        index = 0
+        while SECTION_PATH_FORMAT.format(index) in self._members:
+            sections.append(SECTION_PATH_FORMAT.format(index))
+            index += 1
+        return sections
+
+    def bindata_names(self) -> List[str]:
+        """BinData/ 하위 멤버 목록"""
+        return [name for name in self._members if name.startswith(BINDATA_PREFIX)]
+
+    # ------------------------------------------------------------------
+    # 멤버 데이터 접근
+    # ------------------------------------------------------------------
+
+    def raw_view(self, name: str) -> memoryview:
+        """압축된 그대로의 멤버 데이터 (zero-copy)
+
+        DEFLATED 멤버를 다른 ZIP으로 재압축 없이 옮길 때 사용합니다.
+        """
+        self._check_open()
+        member = self.info(name)
+        return self._view[member.data_offset : member.data_offset + member.compress_size]
+
+    def open_view(self, name: str) -> memoryview:
+        """STORED 멤버의 zero-copy memoryview
+
+        Raises:
+            ValueError: DEFLATED 멤버 (iter_chunks/open 사용)
+        """
+        member = self.info(name)
+        if not member.is_stored:
+            raise ValueError(f"압축된 멤버는 memoryview로 열 수 없습니다: {name}")
+        return self.raw_view(name)
+
+    def iter_chunks(
+        self, name: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[Union[bytes, memoryview]]:
+        """멤버 데이터를 청크 단위로 순회
+
+        - STORED: 매핑의 memoryview 조각 (복사 없음)
+        - DEFLATED: 스트리밍 inflater (청크당 최대 chunk_size 바이트)
+        """
+        view = self.raw_view(name)
+        member = self.info(name)
+
+        if member.is_stored:
+            for start in range(0, len(view), chunk_size):
+                yield view[start : start + chunk_size]
+            return
+
+        inflater = zlib.decompressobj(-zlib.MAX_WBITS)
+        produced = 0
+        for start in range(0, len(view), chunk_size):
+            data = view[start : start + chunk_size]
+            while data:
+                out = inflater.decompress(data, chunk_size)
+                if out:
+                    produced += len(out)
+                    yield out
+                data = inflater.unconsumed_tail
+
+        tail = inflater.flush()
+        if tail:
+            produced += len(tail)
+            yield tail
+
+        if produced != member.file_size:
+            raise ValueError(f"압축 해제 크기 불일치: {name} ({produced} != {member.file_size})")
+
+    def open(self, name: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> io.BufferedReader:
+        """멤버를 파일 객체처럼 스트리밍으로 열기"""
+        return io.BufferedReader(MemberStream(self.iter_chunks(name, chunk_size)))
+
+    def read(self, name: str) -> bytes:
+        """멤버 전체 읽기 (압축 해제 포함)"""
+        member = self.info(name)
+        if member.is_stored:
+            return self.open_view(name).tobytes()
+        return b"".join(self.iter_chunks(name))
+
+    def read_text(self, name: str, encoding: str = "utf-8") -> str:
+        """멤버를 문자열로 읽기"""
+        return self.read(name).decode(encoding)
+
+    def iter_bindata(self) -> Iterator[Tuple[str, Union[bytes, memoryview]]]:
+        """BinData 리더: (멤버 이름, 데이터)
+
+        이미지 등 대부분의 BinData는 STORED로 저장되므로 memoryview를
+        그대로 돌려줍니다. DEFLATED 멤버만 압축 해제합니다.
+        """
+        for name in self.bindata_names():
+            if self.info(name).is_stored:
+                yield name, self.open_view(name)
+            else:
+                yield name, self.read(name)
+
+    # ------------------------------------------------------------------
+    # 수명 관리
+    # ------------------------------------------------------------------
+
+    def _acquire(self) -> "HwpxPackage":
+        self._users += 1
+        return self
+
+    def close(self):
+        """사용 해제 (마지막 사용자일 때 매핑 해제)"""
+        with _registry_lock:
+            if self.closed:
+                return
+            self._users -= 1
+            if self._users > 0:
+                return
+            if self._cache_key is not None and _registry.get(self._cache_key) is self:
+                del _registry[self._cache_key]
+        self._unmap()
+
+    def _unmap(self):
+        self._view.release()
+        try:
+            self._mm.close()
+        except BufferError:
+            # 외부에 memoryview가 남아 있으면 해당 view가 해제될 때 GC가 정리
+            pass
+        self._mm = None
+        self._file.close()
+
+    def __enter__(self) -> "HwpxPackage":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self):
+        state = "closed" if self.closed else f"{len(self._members)} members"
+        return f"HwpxPackage({self.path.name}, {state})"
+
+
+# ============================================================================
+# 공유 매핑 레지스트리
+# ============================================================================
+
+_registry: Dict[Tuple, HwpxPackage] = {}
+_registry_lock = threading.Lock()
+
+
+def open_package(path: Union[str, Path]) -> HwpxPackage:
+    """HWPX 패키지 열기 (같은 파일이면 기존 매핑 공유)
+
+    파일이 수정되면 (mtime/크기 변경) 새 매핑을 만듭니다.
+    반환된 패키지는 사용 후 반드시 close() 해야 합니다 (with 문 권장).
+    """
+    resolved = Path(path).resolve()
+    try:
+        stat = resolved.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"HWPX 파일을 찾을 수 없습니다: {path}")
+
+    key = (str(resolved), stat.st_mtime_ns, stat.st_size)
+
+    with _registry_lock:
+        package = _registry.get(key)
+        if package is not None and not package.closed:
+            return package._acquire()
+
+        package = HwpxPackage(resolved)
+        package._cache_key = key
+        _registry[key] = package
+        return package
+
+
+def is_hwpx_package(path: Union[str, Path]) -> bool:
+    """HWPX 패키지 여부 (ZIP + section0.xml 존재)"""
+    try:
+        with open_package(path) as package:
+            return SECTION_PATH_FORMAT.format(0) in package
+    except (FileNotFoundError, ValueError):
+        return False
+
+
+# ============================================================================
+# 패키지 쓰기 도우미
+# ============================================================================
+
+
+def write_member(
+    zout: zipfile.ZipFile,
+    name: str,
+    data: Union[bytes, memoryview],
+    compress_type: int = zipfile.ZIP_DEFLATED,
+    date_time: Tuple[int, int, int, int, int, int] = (1980, 1, 1, 0, 0, 0),
+):
+    """새 멤버 쓰기 (mimetype은 항상 STORED)"""
+    zinfo = zipfile.ZipInfo(name, date_time=date_time)
+    zinfo.compress_type = zipfile.ZIP_STORED if name == MIMETYPE_PATH else compress_type
+    zinfo.external_attr = 0o644 << 16
+    zout.writestr(zinfo, data)
+
+
+def copy_member(
+    zout: zipfile.ZipFile,
+    package: HwpxPackage,
+    name: str,
+    target_name: Optional[str] = None,
+    date_time: Tuple[int, int, int, int, int, int] = (1980, 1, 1, 0, 0, 0),
+):
+    """다른 패키지의 멤버를 그대로 복사 (압축 방식 유지)
+
+    STORED 멤버는 매핑의 memoryview를 그대로 쓰고,
+    DEFLATED 멤버는 청크 단위로 풀어서 다시 압축합니다 (전체 버퍼링 없음).
+    """
+    member = package.info(name)
+    zinfo = zipfile.ZipInfo(target_name or name, date_time=date_time)
+    zinfo.compress_type = member.compress_type
+    zinfo.external_attr = 0o644 << 16
+
+    if member.is_stored:
+        zout.writestr(zinfo, package.open_view(name))
+        return
+
+    zinfo.file_size = member.file_size
+    with zout.open(zinfo, "w") as dest:
+        for chunk in package.iter_chunks(name):
+            dest.write(chunk)
@@ -0,0 +1,145 @@
+"""
+HWPX XML 유틸리티
+
+OWPML(2011) 네임스페이스 상수와, 네임스페이스 접두사를 보존하는
+파싱/직렬화 함수를 제공합니다.
+
+ElementTree는 기본적으로 접두사를 ns0, ns1 ... 로 바꾸고 사용되지 않는
+네임스페이스 선언을 버리므로, 원본 선언을 그대로 유지해 한글이 읽는
+형태와 동일하게 다시 씁니다.
+"""
+
+import io
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Tuple, Union
+
+# OWPML 네임스페이스
+NS_PARAGRAPH = "http://www.hancom.co.kr/hwpml/2011/paragraph"
+NS_SECTION = "http://www.hancom.co.kr/hwpml/2011/section"
+NS_HEAD = "http://www.hancom.co.kr/hwpml/2011/head"
+NS_CORE = "http://www.hancom.co.kr/hwpml/2011/core"
+NS_OPF = "http://www.idpf.org/2007/opf/"
+
+XML_DECLARATION = b'<?xml version="1.0" encoding="UTF-8" standalone="yes" ?>'
+
+# 한글이 만드는 기본 접두사 (원본에 선언이 없을 때 사용)
+DEFAULT_PREFIXES = {
+    "hp": NS_PARAGRAPH,
+    "hs": NS_SECTION,
+    "hh": NS_HEAD,
+    "hc": NS_CORE,
+    "opf": NS_OPF,
+}
+
+NamespaceMap = List[Tuple[str, str]]  # [(prefix, uri), ...] 선언 순서
+
+
+def qname(namespace: str, tag: str) -> str:
+    """ElementTree 태그 이름 ({uri}tag)"""
+    return f"{{{namespace}}}{tag}"
+
+
+def local_name(tag: str) -> str:
+    """네임스페이스를 제외한 태그 이름"""
+    return tag.split("}")[-1] if "}" in tag else tag
+
+
+# 자주 쓰는 태그
+HP_P = qname(NS_PARAGRAPH, "p")
+HP_RUN = qname(NS_PARAGRAPH, "run")
+HP_T = qname(NS_PARAGRAPH, "t")
+HP_CTRL = qname(NS_PARAGRAPH, "ctrl")
+HP_SEC_PR = qname(NS_PARAGRAPH, "secPr")
+HP_COL_PR = qname(NS_PARAGRAPH, "colPr")
+HP_LINESEG_ARRAY = qname(NS_PARAGRAPH, "linesegarray")
+
+
+def parse_xml(data: Union[bytes, memoryview]) -> Tuple[ET.Element, NamespaceMap]:
+    """XML 파싱 + 네임스페이스 선언 수집
+
+    Returns:
+        (루트 요소, [(prefix, uri), ...])
+    """
+    namespaces: NamespaceMap = []
+    root = None
+
+    for event, item in ET.iterparse(io.BytesIO(data), events=("start-ns", "start")):
+        if event == "start-ns":
+            if item not in namespaces:
+                namespaces.append(item)
+        elif root is None:
+            root = item
+
+    # iterparse가 끝나면 root에 전체 트리가 채워져 있음
+    return root, namespaces
+
+
+def _used_namespaces(root: ET.Element) -> set:
+    used = set()
+    for elem in root.iter():
+        if elem.tag.startswith("{"):
+            used.add(elem.tag[1:].split("}")[0])
+        for key in elem.attrib:
+            if key.startswith("{"):
+                used.add(key[1:].split("}")[0])
+    return used
+
+
+def serialize_xml(root: ET.Element, namespaces: NamespaceMap) -> bytes:
+    """원본 접두사/선언을 보존하여 직렬화
+
+    Args:
+        root: 루트 요소
+        namespaces: parse_xml이 돌려준 선언 목록
+
+    Returns:
+        XML 선언을 포함한 UTF-8 바이트
+    """
+    declared = {}
+    for prefix, uri in list(DEFAULT_PREFIXES.items()) + list(namespaces):
+        declared[uri] = prefix
+
+    for uri, prefix in declared.items():
+        if prefix:
+            ET.register_namespace(prefix, uri)
+
+    # ElementTree는 실제로 쓰인 네임스페이스만 선언하므로, 나머지 원본 선언을
+    # 루트 속성으로 되살림 (직렬화 후 제거하여 트리는 변경하지 않음)
+    used = _used_namespaces(root)
+    restored = []
+    for prefix, uri in namespaces:
+        if uri in used:
+            continue
+        key = f"xmlns:{prefix}" if prefix else "xmlns"
+        if key not in root.attrib:
+            root.set(key, uri)
+            restored.append(key)
+
+    try:
+        body = ET.tostring(root, encoding="utf-8", xml_declaration=False)
+    finally:
+        for key in restored:
+            del root.attrib[key]
+
+    return XML_DECLARATION + body
+
+
+def paragraph_text(paragraph: ET.Element) -> str:
+    """문단의 텍스트 (hp:t 기준)"""
+    return "".join("".join(t.itertext()) for t in paragraph.iter(HP_T))
+
+
+def is_empty_paragraph(paragraph: ET.Element) -> bool:
+    """완전히 빈 문단 여부
+
+    para_scanner.remove_empty_paras와 같은 기준 (end_pos[2] == 0):
+    글자가 하나도 없어야 하며, 공백만 있는 문단은 빈 문단이 아닙니다.
+    구역 정의(secPr), 컨트롤, 표/그림 등이 들어 있는 문단도 빈 문단이 아닙니다.
+    """
+    for run in paragraph.findall(HP_RUN):
+        for child in run:
+            if child.tag != HP_T:
+                return False
+            if child.text or len(child):
+                return False
+    return True
@@ -0,0 +1,334 @@
+"""
+HAction 파라미터 셋 템플릿 캐시
+
+저장/변환/삽입 함수들은 호출할 때마다
+    HAction.GetDefault(action, HParameterSet.H*.HSet) → 모든 항목 다시 설정 → Execute
+를 반복합니다. 같은 한글 인스턴스에서 같은 액션을 반복하면 대부분의 항목 값은 직전
+호출과 같으므로, ParameterSetCache는 셋별로 마지막에 쓴 값을 기억하고:
+
+- 같은 액션이고 직전 항목이 이번 항목에 모두 포함되면 GetDefault를 생략
+- 값이 달라진 항목만 다시 씀
+- HAction / HParameterSet.H* / HSet 디스패치 객체는 한 번만 조회
+
+GetDefault는 기본값을 현재 문서/캐럿 위치에서 읽습니다
+(HSecDef의 용지 크기/방향, HColDef의 단 설정 등).
+이런 셋(DOCUMENT_SETS)은 항상 GetDefault를 부르고 값도 전부 다시 씁니다 (디스패치 조회만 절약).
+문서를 열거나 닫으면 invalidate_document(hwp)로 나머지 셋도 무효화합니다
+(AutomationClient.open_document/close_document, ActionBatch의 FileNew/FileOpen/FileClose 등).
+
+항목 값은 Schema/parameter_table.json의 PIT_* 형식 종류(정수/문자열/하위 셋)로
+검사합니다 (core.param_index 인덱스 사용). 표가 PDF 추출본이라 누락과 오류가 있어
+(예: ColDef.ApplyClass가 PIT_UI1로 되어 있지만 실제로는 832 사용) 범위는 검사하지 않고,
+표에 없는 셋/항목은 통과시킵니다.
+
+같은 파라미터 셋을 이 캐시를 거치지 않고 GetDefault/수정하면 캐시가 어긋나므로,
+그런 경우 invalidate()를 호출해야 합니다.
+
+형식 검사는 parameter_table.json에서 셋별 타입 래퍼 코드를 생성하는 대신
+실행 시점에 인덱스로 키워드 인자를 검사하는 방식입니다
+(표가 부정확해 생성 코드가 더 많은 오류를 굳힘).
+
+사용 예:
+    params = parameter_cache(hwp)
+    params.execute("FileSaveAs_S", "HFileOpenSave",
+                   filename=path, Format="HWP", Attributes=1)
+    params.execute("PageSetup", "HSecDef",
+                   PageDef={"PaperWidth": 72851}, items={"ApplyTo": 3})
+    print(cache_stats().skipped_writes)
+"""
+
+import threading
+import weakref
+from dataclasses import dataclass, fields as dataclass_fields
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from .param_index import ParamIndex, TYPE_NAMES, check_value, get_index
+
+# HParameterSet 이름(H 제외) → parameter_table.json 키 (이름이 다른 셋)
+SET_ALIASES = {
+    "FileOpenSave": "FileSaveAs",
+}
+
+# GetDefault가 현재 문서/캐럿 위치의 값을 채우는 셋 - 캐시된 값을 믿지 않고 매번 GetDefault
+DOCUMENT_SETS = frozenset(
+    {
+        "HSecDef",
+        "HColDef",
+        "HPageDef",
+        "HCharShape",
+        "HParaShape",
+        "HTable",
+        "HCell",
+        "HShapeObject",
+        "HPageNumPos",
+        "HPageBorderFill",
+        "HHeaderFooter",
+    }
+)
+
+# 현재 문서를 바꾸는 액션 (hwp.Run) - 실행 후 invalidate_document
+DOCUMENT_ACTIONS = frozenset({"FileNew", "FileNewTab", "FileOpen", "FileClose", "FileQuit"})
+
+
+# ============================================================================
+# 형식 (parameter_table.json 인덱스)
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class ParameterSetSpec:
+    """파라미터 셋 항목 형식 (core.param_index 인덱스의 셋 1개)"""
+
+    name: str
+    index: ParamIndex
+
+    def field_type(self, field: str) -> Optional[str]:
+        code = self.index.param_type(self.name, field)
+        return None if code is None else TYPE_NAMES[code]
+
+    def check(self, field: str, value: Any):
+        """PIT 형식 종류 검사
+
+        Raises:
+            ValueError: 값 종류가 형식과 맞지 않을 때
+        """
+        code = self.index.param_type(self.name, field)
+        if code is None:
+            return
+        problem = check_value(code, value)
+        if problem is not None and problem[0] == "TypeMismatch":
+            raise ValueError(f"{self.name}.{field}: {problem[1]}")
+
+
+def parameter_set_spec(set_name: str) -> Optional[ParameterSetSpec]:
+    """HParameterSet 이름("HColDef") 또는 셋 ID("ColDef") → 형식 (없으면 None)"""
+    name = set_name[1:] if set_name.startswith("H") and set_name[1:2].isupper() else set_name
+    name = SET_ALIASES.get(name, name)
+    try:
+        index = get_index()
+    except (OSError, ValueError):
+        return None
+    return ParameterSetSpec(name, index) if name in index else None
+
+
+# ============================================================================
+# 캐시
+# ============================================================================
+
+
+@dataclass
+class ParamCacheStats:
+    """파라미터 셋 캐시 통계"""
+
+    executes: int = 0
+    get_defaults: int = 0
+    skipped_get_defaults: int = 0
+    writes: int = 0
+    skipped_writes: int = 0
+
+    @property
+    def avoided_calls(self) -> int:
+        """생략된 COM 호출 (GetDefault + 항목 쓰기)"""
+        return self.skipped_get_defaults + self.skipped_writes
+
+    def add(self, other: "ParamCacheStats"):
+        for f in dataclass_fields(self):
+            setattr(self, f.name, getattr(self, f.name) + getattr(other, f.name))
+
+    def reset(self):
+        for f in dataclass_fields(self):
+            setattr(self, f.name, 0)
+
+
+# 프로세스 전체 누적 (벤치마크/보고용)
+_totals = ParamCacheStats()
+_totals_lock = threading.Lock()
+
+
+def cache_stats() -> ParamCacheStats:
+    """프로세스 전체 누적 통계"""
+    return _totals
+
+
+# 항목 키: ("attr", 이름) / ("item", 이름) / ("sub", 하위셋, 이름)
+_Key = Tuple[str, ...]
+
+
+class _SetState:
+    __slots__ = ("parameter_set", "hset", "subsets", "action", "values")
+
+    def __init__(self, parameter_set: Any):
+        self.parameter_set = parameter_set
+        self.hset = parameter_set.HSet
+        self.subsets: Dict[str, Any] = {}
+        self.action: Optional[str] = None
+        self.values: Optional[Dict[_Key, Any]] = None
+
+
+class ParameterSetCache:
+    """한글 인스턴스 1개의 파라미터 셋 템플릿 캐시
+
+    Args:
+        hwp: 한글 객체 (IHwpObject 또는 FakeHwp)
+    """
+
+    def __init__(self, hwp: Any):
+        try:
+            self._hwp = weakref.ref(hwp)
+        except TypeError:
+            self._hwp = lambda: hwp
+        self.stats = ParamCacheStats()
+        self._haction = None
+        self._parameter_sets = None
+        self._states: Dict[str, _SetState] = {}
+
+    @property
+    def hwp(self) -> Any:
+        return self._hwp()
+
+    def _state(self, set_name: str) -> _SetState:
+        state = self._states.get(set_name)
+        if state is None:
+            if self._parameter_sets is None:
+                self._haction = self.hwp.HAction
+                self._parameter_sets = self.hwp.HParameterSet
+            state = _SetState(getattr(self._parameter_sets, set_name))
+            self._states[set_name] = state
+        return state
+
+    @staticmethod
+    def _flatten(
+        set_name: str, fields: Mapping[str, Any], items: Optional[Mapping[str, Any]]
+    ) -> Dict[_Key, Any]:
+        spec = parameter_set_spec(set_name)
+        values: Dict[_Key, Any] = {}
+        for name, value in fields.items():
+            if spec is not None:
+                spec.check(name, value)
+            if isinstance(value, Mapping):
+                sub_spec = parameter_set_spec(name)
+                for sub_name, sub_value in value.items():
+                    if sub_spec is not None:
+                        sub_spec.check(sub_name, sub_value)
+                    values[("sub", name, sub_name)] = sub_value
+            else:
+                values[("attr", name)] = value
+        for name, value in (items or {}).items():
+            if spec is not None:
+                spec.check(name, value)
+            values[("item", name)] = value
+        return values
+
+    def _write(self, state: _SetState, key: _Key, value: Any):
+        if key[0] == "item":
+            state.hset.SetItem(key[1], value)
+        elif key[0] == "attr":
+            setattr(state.parameter_set, key[1], value)
+        else:
+            subset = state.subsets.get(key[1])
+            if subset is None:
+                subset = getattr(state.parameter_set, key[1])
+                state.subsets[key[1]] = subset
+            setattr(subset, key[2], value)
+
+    def prepare(
+        self, action: str, set_name: str, items: Optional[Mapping[str, Any]] = None, **fields: Any
+    ) -> Any:
+        """액션 파라미터 셋 준비 (필요할 때만 GetDefault, 바뀐 항목만 기록)
+
+        Args:
+            action: 액션 ID ("FileSaveAs_S", "InsertFile" ...)
+            set_name: HParameterSet 이름 ("HFileOpenSave", "HInsertFile" ...)
+            items: HSet.SetItem으로 쓸 항목
+            fields: 파라미터 셋 속성으로 쓸 항목 (dict 값은 하위 셋: PageDef={...})
+
+        Returns:
+            HSet (HAction.Execute에 전달)
+
+        Raises:
+            ValueError: parameter_table.json 형식과 맞지 않는 값
+        """
+        values = self._flatten(set_name, fields, items)
+        state = self._state(set_name)
+        stats = ParamCacheStats()
+
+        previous = state.values
+        if (
+            state.action != action
+            or previous is None
+            or set_name in DOCUMENT_SETS
+            or not previous.keys() <= values.keys()
+        ):
+            self._haction.GetDefault(action, state.hset)
+            state.subsets.clear()
+            stats.get_defaults += 1
+            previous = {}
+        else:
+            stats.skipped_get_defaults += 1
+
+        state.values = None  # 쓰는 도중 실패하면 다음 호출에서 GetDefault부터
+        for key, value in values.items():
+            if key in previous and type(previous[key]) is type(value) and previous[key] == value:
+                stats.skipped_writes += 1
+                continue
+            self._write(state, key, value)
+            stats.writes += 1
+
+        state.action = action
+        state.values = values
+        self._record(stats)
+        return state.hset
+
+    def execute(
+        self, action: str, set_name: str, items: Optional[Mapping[str, Any]] = None, **fields: Any
+    ) -> bool:
+        """prepare() → HAction.Execute"""
+        hset = self.prepare(action, set_name, items, **fields)
+        self._record(ParamCacheStats(executes=1))
+        return self._haction.Execute(action, hset)
+
+    def invalidate(self, set_name: Optional[str] = None):
+        """캐시된 값 무효화 (다음 호출은 GetDefault부터)"""
+        targets = [self._states.get(set_name)] if set_name else self._states.values()
+        for state in targets:
+            if state is not None:
+                state.action = None
+                state.values = None
+                state.subsets.clear()
+
+    def _record(self, stats: ParamCacheStats):
+        self.stats.add(stats)
+        with _totals_lock:
+            _totals.add(stats)
+
+
+# id(hwp) → (weakref, 캐시) - COM 객체(CDispatch)는 해시할 수 없어 id로 관리
+_caches: Dict[int, Tuple[Any, ParameterSetCache]] = {}
+_caches_lock = threading.Lock()
+
+
+def invalidate_document(hwp: Any) -> None:
+    """문서를 열거나 닫은 뒤 호출 - 이 인스턴스의 캐시가 있으면 전부 무효화 (없으면 만들지 않음)"""
+    with _caches_lock:
+        entry = _caches.get(id(hwp))
+    if entry is not None and entry[0]() is hwp:
+        entry[1].invalidate()
+
+
+def parameter_cache(hwp: Any) -> ParameterSetCache:
+    """한글 인스턴스별 캐시 (인스턴스가 사라지면 함께 해제)
+
+    weakref를 지원하지 않는 객체는 매번 새 캐시 (캐시 없이 동작)
+    """
+    key = id(hwp)
+    with _caches_lock:
+        entry = _caches.get(key)
+        if entry is not None and entry[0]() is hwp:
+            return entry[1]
+        try:
+            ref = weakref.ref(hwp, lambda _, key=key: _caches.pop(key, None))
+        except TypeError:
+            return ParameterSetCache(hwp)
+        cache = ParameterSetCache(hwp)
+        _caches[key] = (ref, cache)
+        return cache
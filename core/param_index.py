@@ -0,0 +1,429 @@
+"""
+parameter_table.json 컴파일 인덱스
+
+Schema/parameter_table.json(약 210KB, 액션 132개, 파라미터 1,154개)을 매번 읽고
+선형 탐색하는 대신, 한 번 컴파일한 인덱스를 pickle로 저장해 두고 처음 사용할 때
+읽어 옵니다. JSON의 mtime/크기가 바뀌면 자동으로 다시 컴파일합니다.
+
+인덱스 구성:
+- actions: 액션 이름 (정렬)
+- 액션별 파라미터 이름 배열 (정렬, 평탄화된 names 안의 [start, end) 구간)
+- type_codes: 파라미터별 형식 코드 (bytes)
+- enum_low / enum_high: 설명에서 추출한 열거 값 범위 (array, 없으면 ENUM_NONE)
+- slots: (액션, 파라미터) → 평탄화 위치 (O(1) 조회, 대소문자 무시 조회 포함)
+
+검증 규칙:
+- 형식(정수/문자열) 불일치, PIT 정수 범위 초과 → 오류
+- 알 수 없는 파라미터, 열거 범위 밖 값 → 경고 (표가 PDF 추출본이라 설명이 잘려 있음)
+
+사용 예:
+    from core.param_index import validate
+
+    result = validate("CharShape", {"Bold": 1, "Height": 1000})
+    if not result.success:
+        print(result.errors)
+
+빌드/벤치마크:
+    python -m core.param_index build
+    python Tests/Benchmarks/bench_param_index.py
+"""
+
+import os
+import pickle
+import threading
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+
+PARAMETER_TABLE_PATH = Path(__file__).parent.parent / "Schema" / "parameter_table.json"
+INDEX_ENV = "HWP_PARAM_INDEX"
+INDEX_VERSION = 1
+
+# 형식 코드
+TYPE_ANY = 0
+TYPE_BSTR = 1
+TYPE_SET = 2
+TYPE_ARRAY = 3
+TYPE_BINDATA = 4
+TYPE_UI1 = 10
+TYPE_UI2 = 11
+TYPE_UI4 = 12
+TYPE_I1 = 13
+TYPE_I2 = 14
+TYPE_I4 = 15
+
+TYPE_NAMES = {
+    TYPE_ANY: "ANY",
+    TYPE_BSTR: "PIT_BSTR",
+    TYPE_SET: "PIT_SET",
+    TYPE_ARRAY: "PIT_ARRAY",
+    TYPE_BINDATA: "PIT_BINDATA",
+    TYPE_UI1: "PIT_UI1",
+    TYPE_UI2: "PIT_UI2",
+    TYPE_UI4: "PIT_UI4",
+    TYPE_I1: "PIT_I1",
+    TYPE_I2: "PIT_I2",
+    TYPE_I4: "PIT_I4",
+}
+
+INT_RANGES = {
+    TYPE_UI1: (0, 0xFF),
+    TYPE_UI2: (0, 0xFFFF),
+    TYPE_UI4: (0, 0xFFFFFFFF),
+    TYPE_I1: (-0x80, 0x7F),
+    TYPE_I2: (-0x8000, 0x7FFF),
+    TYPE_I4: (-0x80000000, 0x7FFFFFFF),
+}
+
+# 표기 흔들림 정규화 (PIT_UI44, PIT_UI1H, PIT_BSRT ...) - 긴 접두사부터 비교
+_TYPE_PREFIXES = [
+    ("PIT_BINDATA", TYPE_BINDATA),
+    ("PIT_ARRAY", TYPE_ARRAY),
+    ("PIT_BSTR", TYPE_BSTR),
+    ("PIT_BSRT", TYPE_BSTR),
+    ("PIT_SET", TYPE_SET),
+    ("PIT_UI1", TYPE_UI1),
+    ("PIT_UI2", TYPE_UI2),
+    ("PIT_UI4", TYPE_UI4),
+    ("PIT_UI", TYPE_UI4),
+    ("PIT_U", TYPE_UI4),
+    ("PIT_I1", TYPE_I1),
+    ("PIT_I2", TYPE_I2),
+    ("PIT_I4", TYPE_I4),
+    ("PIT_I", TYPE_I4),
+]
+
+ENUM_NONE = -(2**63)
+_ENUM_PATTERN = r"(?<![\w.])(-?\d+)\s*="
+_FLAG_WORDS = ("bit", "비트", "조합", "플래그")
+
+
+def type_code(pit: str) -> int:
+    """PIT 형식 문자열 → 형식 코드 (알 수 없으면 TYPE_ANY)"""
+    for prefix, code in _TYPE_PREFIXES:
+        if pit.startswith(prefix):
+            return code
+    return TYPE_ANY
+
+
+def enum_range(description: str) -> Tuple[int, int]:
+    """설명의 "0 = ..., 1 = ..." 열거 → (최소, 최대), 없으면 (ENUM_NONE, ENUM_NONE)"""
+    lowered = description.lower()
+    if any(word in lowered for word in _FLAG_WORDS):
+        return ENUM_NONE, ENUM_NONE
+    import re  # 컴파일할 때만 필요 (지연 로드 경로에서 import 비용 제외)
+
+    values = [int(v) for v in re.findall(_ENUM_PATTERN, description)]
+    if len(values) < 2:
+        return ENUM_NONE, ENUM_NONE
+    return min(values), max(values)
+
+
+# ============================================================================
+# 인덱스
+# ============================================================================
+
+
+@dataclass
+class ParamIndex:
+    """컴파일된 파라미터 표"""
+
+    actions: Tuple[str, ...]
+    spans: Dict[str, Tuple[int, int]]  # 액션 → names [start, end)
+    names: Tuple[str, ...]
+    type_codes: bytes
+    enum_low: array
+    enum_high: array
+    slots: Dict[Tuple[str, str], int]  # (액션, 파라미터) → 위치
+    folded: Dict[Tuple[str, str], int]  # (액션, 소문자 파라미터) → 위치
+    source_mtime_ns: int = 0
+    source_size: int = 0
+
+    def __contains__(self, action: str) -> bool:
+        return action in self.spans
+
+    def params(self, action: str) -> Tuple[str, ...]:
+        """액션의 파라미터 이름 (정렬)"""
+        start, end = self.spans.get(action, (0, 0))
+        return self.names[start:end]
+
+    def slot(self, action: str, param: str) -> Optional[int]:
+        slot = self.slots.get((action, param))
+        if slot is None:
+            slot = self.folded.get((action, param.lower()))
+        return slot
+
+    def param_type(self, action: str, param: str) -> Optional[int]:
+        slot = self.slot(action, param)
+        return None if slot is None else self.type_codes[slot]
+
+    def enum(self, action: str, param: str) -> Optional[Tuple[int, int]]:
+        slot = self.slot(action, param)
+        if slot is None or self.enum_low[slot] == ENUM_NONE:
+            return None
+        return self.enum_low[slot], self.enum_high[slot]
+
+    def validate(self, action: str, params: Mapping[str, Any]) -> "ValidationResult":
+        return validate_with(self, action, params)
+
+
+def compile_table(table: Mapping[str, Any], mtime_ns: int = 0, size: int = 0) -> ParamIndex:
+    """parameter_table.json 내용 → ParamIndex"""
+    actions_table = table["actions"]
+    actions = tuple(sorted(actions_table))
+    spans: Dict[str, Tuple[int, int]] = {}
+    names: List[str] = []
+    codes = bytearray()
+    enum_low = array("q")
+    enum_high = array("q")
+    slots: Dict[Tuple[str, str], int] = {}
+    folded: Dict[Tuple[str, str], int] = {}
+
+    for action in actions:
+        # 같은 이름이 여러 번 나오면 첫 항목 사용 (InsertFieldTemplate 등)
+        params: Dict[str, Mapping[str, Any]] = {}
+        for param in actions_table[action]:
+            params.setdefault(param["param_name"], param)
+
+        start = len(names)
+        for name in sorted(params):
+            param = params[name]
+            slot = len(names)
+            names.append(name)
+            codes.append(type_code(param.get("param_type", "")))
+            low, high = enum_range(param.get("description", ""))
+            enum_low.append(low)
+            enum_high.append(high)
+            slots[(action, name)] = slot
+            folded.setdefault((action, name.lower()), slot)
+        spans[action] = (start, len(names))
+
+    return ParamIndex(
+        actions=actions,
+        spans=spans,
+        names=tuple(names),
+        type_codes=bytes(codes),
+        enum_low=enum_low,
+        enum_high=enum_high,
+        slots=slots,
+        folded=folded,
+        source_mtime_ns=mtime_ns,
+        source_size=size,
+    )
+
+
+# ============================================================================
+# 검증
+# ============================================================================
+
+
+@dataclass
+class ValidationError:
+    """파라미터 검증 오류/경고"""
+
+    param_name: str
+    error_type: (
+        str  # TypeMismatch / ValueOutOfRange / UnknownParameter / UnknownAction / EnumOutOfRange
+    )
+    message: str
+
+
+@dataclass
+class ValidationResult:
+    """검증 결과 (경고만 있으면 success)"""
+
+    action: str
+    errors: List[ValidationError] = field(default_factory=list)
+    warnings: List[ValidationError] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        return not self.errors
+
+
+def check_value(code: int, value: Any) -> Optional[Tuple[str, str]]:
+    """형식 코드로 값 검사 → None 또는 (오류 종류, 메시지)"""
+    if code in INT_RANGES:
+        if isinstance(value, bool):
+            value = int(value)
+        if not isinstance(value, int):
+            return "TypeMismatch", f"{TYPE_NAMES[code]}에는 정수가 필요합니다 ({value!r})"
+        low, high = INT_RANGES[code]
+        if not low <= value <= high:
+            return "ValueOutOfRange", f"{value}는 {TYPE_NAMES[code]} 범위({low}~{high}) 밖입니다"
+    elif code == TYPE_BSTR:
+        if not isinstance(value, str):
+            return "TypeMismatch", f"PIT_BSTR에는 문자열이 필요합니다 ({value!r})"
+    elif code == TYPE_SET:
+        if not isinstance(value, Mapping):
+            return "TypeMismatch", f"PIT_SET에는 dict가 필요합니다 ({value!r})"
+    elif code == TYPE_ARRAY:
+        if not isinstance(value, (list, tuple)):
+            return "TypeMismatch", f"PIT_ARRAY에는 list가 필요합니다 ({value!r})"
+    return None
+
+
+def validate_with(index: ParamIndex, action: str, params: Mapping[str, Any]) -> ValidationResult:
+    result = ValidationResult(action)
+    if action not in index.spans:
+        result.warnings.append(
+            ValidationError("", "UnknownAction", f"parameter_table에 없는 액션: {action}")
+        )
+        return result
+
+    type_codes = index.type_codes
+    enum_low = index.enum_low
+    for name, value in params.items():
+        slot = index.slot(action, name)
+        if slot is None:
+            result.warnings.append(
+                ValidationError(name, "UnknownParameter", f"{action}에 없는 파라미터: {name}")
+            )
+            continue
+
+        problem = check_value(type_codes[slot], value)
+        if problem is not None:
+            result.errors.append(
+                ValidationError(name, problem[0], f"{action}.{name}: {problem[1]}")
+            )
+            continue
+
+        low = enum_low[slot]
+        if low != ENUM_NONE and isinstance(value, int):
+            high = index.enum_high[slot]
+            if not low <= int(value) <= high:
+                result.warnings.append(
+                    ValidationError(
+                        name,
+                        "EnumOutOfRange",
+                        f"{action}.{name}: {value}는 알려진 값({low}~{high}) 밖입니다",
+                    )
+                )
+    return result
+
+
+# ============================================================================
+# 저장 / 지연 로드
+# ============================================================================
+
+
+def index_cache_paths(source: Path = PARAMETER_TABLE_PATH) -> Iterator[Path]:
+    """인덱스 저장 후보 (HWP_PARAM_INDEX → JSON 옆 → 임시 디렉토리)
+
+    앞쪽 후보에서 찾으면 tempfile을 import하지 않도록 generator로 반환
+    """
+    override = os.environ.get(INDEX_ENV, "").strip()
+    if override:
+        yield Path(override)
+        return
+    name = f".{source.stem}.index.pickle"
+    yield source.with_name(name)
+
+    import tempfile
+
+    yield Path(tempfile.gettempdir()) / "hwp_automation" / name
+
+
+def _source_stamp(source: Path) -> Tuple[int, int]:
+    stat = source.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_cached(path: Path, stamp: Tuple[int, int]) -> Optional[ParamIndex]:
+    try:
+        with open(path, "rb") as f:
+            version, mtime_ns, size, index = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError, AttributeError):
+        return None
+    if version != INDEX_VERSION or (mtime_ns, size) != stamp:
+        return None
+    return index
+
+
+def _write_cached(path: Path, index: ParamIndex) -> bool:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(temp_path, "wb") as f:
+            pickle.dump(
+                (INDEX_VERSION, index.source_mtime_ns, index.source_size, index),
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(temp_path, path)
+        return True
+    except OSError:
+        return False
+
+
+def build_index(source: Union[str, Path] = PARAMETER_TABLE_PATH, write: bool = True) -> ParamIndex:
+    """JSON 컴파일 (write=True이면 쓸 수 있는 첫 후보 경로에 저장)"""
+    import json
+
+    source = Path(source)
+    mtime_ns, size = _source_stamp(source)
+    table = json.loads(source.read_text(encoding="utf-8"))
+    index = compile_table(table, mtime_ns, size)
+    if write:
+        for path in index_cache_paths(source):
+            if _write_cached(path, index):
+                break
+    return index
+
+
+def load_index(source: Union[str, Path] = PARAMETER_TABLE_PATH) -> ParamIndex:
+    """저장된 인덱스 로드 (없거나 JSON이 바뀌었으면 다시 컴파일)"""
+    source = Path(source)
+    stamp = _source_stamp(source)
+    for path in index_cache_paths(source):
+        index = _read_cached(path, stamp)
+        if index is not None:
+            return index
+    return build_index(source)
+
+
+_index: Optional[ParamIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_index() -> ParamIndex:
+    """프로세스 공용 인덱스 (처음 호출 시 로드)"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = load_index()
+    return _index
+
+
+def reset_index():
+    """공용 인덱스 버리기 (다음 get_index()에서 다시 로드)"""
+    global _index
+    with _index_lock:
+        _index = None
+
+
+def validate(action: str, params: Mapping[str, Any]) -> ValidationResult:
+    """액션 파라미터 검증 (파라미터당 O(1))"""
+    return validate_with(get_index(), action, params)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="parameter_table.json 인덱스")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="인덱스 컴파일/저장")
+    build.add_argument("--source", type=Path, default=PARAMETER_TABLE_PATH)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        index = build_index(args.source)
+        stored = next((p for p in index_cache_paths(args.source) if p.exists()), None)
+        print(f"액션 {len(index.actions)}개, 파라미터 {len(index.names)}개")
+        print(f'저장: {stored if stored else "(저장 실패)"}')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,406 @@
+"""
+스트리밍 파이프라인 - 단계가 겹쳐 도는 선형 DAG
+
+단계별 일괄 처리(전부 전처리 → 전부 PDF → 전부 렌더링)는 단계마다 가장 느린 항목을
+기다립니다. 여기서는 항목 하나가 한 단계를 끝내면 바로 다음 단계 큐로 넘어갑니다.
+
+구조 (단계마다):
+    입력 큐(크기 제한) → 디스패처 스레드 → 실행기(프로세스/스레드 풀, 동시 작업 ≤ workers)
+                                         → 수집 스레드 → 다음 단계 입력 큐
+- 디스패처: bypass(항목)가 결과를 주면 워커를 건너뜀 (예: 캐시 적중)
+- 수집: complete(항목, 워커 결과)를 부모에서 실행 (예: 캐시 저장), 다음 큐에 넣은 뒤에야
+  작업 슬롯을 돌려줌 → 다음 단계가 밀리면 이 단계도 멈춤 (역압)
+- 진행 이벤트/on_result는 run()을 부른 스레드에서만 (same_thread 구독자, ProgressAbort 취소)
+
+지표 (단계별): 처리/실패/우회 수, 작업 시간 합, 점유율(작업 시간 / (workers × 전체 시간)),
+입력 대기(굶음) 시간, 다음 단계 대기(막힘) 시간, 입력 큐 최대/평균 길이
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .progress import progress_bus
+
+# (성공, 출력, 오류) - 성공한 출력은 다음 단계의 입력
+StageResult = Tuple[bool, Any, Optional[str]]
+
+EXECUTOR_KINDS = ("process", "thread")
+
+_END = object()
+
+
+@dataclass
+class PipelineStage:
+    """
+    파이프라인 단계
+
+    Attributes:
+        name: 단계 이름 (진행 이벤트 stage)
+        func: 워커 함수 func(입력) → StageResult (process면 pickle 가능한 최상위 함수/partial)
+        workers: 동시 작업 수
+        executor: "process" 또는 "thread"
+        queue_size: 입력 큐 크기 (0이면 workers × 2)
+        bypass: 부모에서 bypass(입력) → StageResult면 워커 생략
+        complete: 부모에서 complete(입력, 워커 결과) → StageResult (후처리)
+    """
+
+    name: str
+    func: Callable[[Any], StageResult]
+    workers: int = 1
+    executor: str = "process"
+    queue_size: int = 0
+    bypass: Optional[Callable[[Any], Optional[StageResult]]] = None
+    complete: Optional[Callable[[Any, StageResult], StageResult]] = None
+
+    def __post_init__(self):
+        if self.executor not in EXECUTOR_KINDS:
+            raise ValueError(f"executor는 {EXECUTOR_KINDS} 중 하나: {self.executor}")
+        if self.workers < 1:
+            raise ValueError(f"workers는 1 이상: {self.workers}")
+
+
+@dataclass
+class StageMetrics:
+    """단계 지표 (점유율은 to_dict에서 전체 시간으로 계산)
+
+    디스패처/수집 스레드와 앞 단계가 함께 갱신하므로 값은 add()/sample()로만 바꿈
+    """
+
+    name: str
+    workers: int
+    processed: int = 0
+    failed: int = 0
+    bypassed: int = 0
+    busy_seconds: float = 0.0
+    starved_seconds: float = 0.0
+    blocked_seconds: float = 0.0
+    max_queue: int = 0
+    queue_samples: List[int] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, **deltas: float):
+        """카운터/시간 더하기 (예: add(processed=1))"""
+        with self.lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+    def sample(self, depth: int):
+        """입력 큐 길이 기록"""
+        with self.lock:
+            self.max_queue = max(self.max_queue, depth)
+            self.queue_samples.append(depth)
+
+    def to_dict(self, wall_seconds: float) -> Dict[str, Any]:
+        capacity = self.workers * wall_seconds
+        return {
+            "workers": self.workers,
+            "processed": self.processed,
+            "failed": self.failed,
+            "bypassed": self.bypassed,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "occupancy": round(self.busy_seconds / capacity, 3) if capacity else 0.0,
+            "starved_seconds": round(self.starved_seconds, 3),
+            "blocked_seconds": round(self.blocked_seconds, 3),
+            "max_queue": self.max_queue,
+            "mean_queue": (
+                round(sum(self.queue_samples) / len(self.queue_samples), 2)
+                if self.queue_samples
+                else 0.0
+            ),
+        }
+
+
+@dataclass
+class PipelineOutcome:
+    """항목 하나의 최종 상태 (마지막으로 거친 단계와 그 결과)"""
+
+    source: Any
+    stage: str
+    result: StageResult
+
+    @property
+    def ok(self) -> bool:
+        return self.result[0]
+
+
+class _Work:
+    __slots__ = ("index", "source", "payload")
+
+    def __init__(self, index: int, source: Any, payload: Any):
+        self.index = index
+        self.source = source
+        self.payload = payload
+
+
+class StreamingPipeline:
+    """단계 목록을 스트리밍으로 실행"""
+
+    def __init__(
+        self,
+        stages: Sequence[PipelineStage],
+        on_result: Optional[Callable[[str, Any, StageResult], None]] = None,
+    ):
+        """
+        Args:
+            stages: 순서대로 실행할 단계
+            on_result: 항목이 한 단계를 끝낼 때마다 (단계 이름, 원래 입력, 결과) - run() 스레드에서
+        """
+        if not stages:
+            raise ValueError("단계가 없습니다")
+        self.stages = list(stages)
+        self.on_result = on_result
+        self.metrics: Dict[str, StageMetrics] = {}
+        self.wall_seconds = 0.0
+
+    def report(self) -> Dict[str, Any]:
+        """단계별 지표 + 전체 시간"""
+        return {
+            "wall_seconds": round(self.wall_seconds, 3),
+            "stages": {
+                name: metrics.to_dict(self.wall_seconds) for name, metrics in self.metrics.items()
+            },
+        }
+
+    def run(self, items: Sequence[Any]) -> List[PipelineOutcome]:
+        """
+        항목들을 파이프라인에 흘려보냄
+
+        Returns:
+            입력 순서의 최종 상태 (성공 항목은 마지막 단계 결과, 실패 항목은 실패한 단계 결과)
+        """
+        items = list(items)
+        self.metrics = {
+            stage.name: StageMetrics(stage.name, stage.workers) for stage in self.stages
+        }
+        outcomes: List[Optional[PipelineOutcome]] = [None] * len(items)
+        if not items:
+            return []
+
+        start = time.perf_counter()
+        queues = [
+            queue.Queue(maxsize=stage.queue_size or stage.workers * 2) for stage in self.stages
+        ]
+        events: "queue.Queue" = queue.Queue()
+        cancel = threading.Event()
+        executors = [self._executor(stage) for stage in self.stages]
+        threads = [
+            threading.Thread(target=self._feed, args=(items, queues[0], cancel), daemon=True)
+        ]
+        for position, stage in enumerate(self.stages):
+            downstream = queues[position + 1] if position + 1 < len(self.stages) else None
+            next_name = self.stages[position + 1].name if downstream is not None else None
+            threads.append(
+                threading.Thread(
+                    target=self._run_stage,
+                    args=(
+                        stage,
+                        executors[position],
+                        queues[position],
+                        downstream,
+                        next_name,
+                        events,
+                        cancel,
+                    ),
+                    name=f"pipeline-{stage.name}",
+                    daemon=True,
+                )
+            )
+
+        progress = {stage.name: progress_bus.stage(stage.name, len(items)) for stage in self.stages}
+        for stage_progress in progress.values():
+            stage_progress.start()
+        for thread in threads:
+            thread.start()
+
+        finished_stages = 0
+        try:
+            while finished_stages < len(self.stages):
+                event = events.get()
+                if event is _END:
+                    finished_stages += 1
+                    continue
+                name, work, result, latency = event
+                if isinstance(result, BaseException):
+                    raise result
+                last = name == self.stages[-1].name
+                if not result[0] or last:
+                    outcomes[work.index] = PipelineOutcome(work.source, name, result)
+                progress[name].advance(
+                    str(work.source), latency=latency, ok=result[0], message=result[2] or ""
+                )
+                if self.on_result:
+                    self.on_result(name, work.source, result)
+        except BaseException:
+            cancel.set()
+            self._drain(queues)
+            for executor in executors:
+                executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            self.wall_seconds = time.perf_counter() - start
+
+        for thread in threads:
+            thread.join()
+        for executor in executors:
+            executor.shutdown(wait=True)
+        return [outcome for outcome in outcomes if outcome is not None]
+
+    # ------------------------------------------------------------------
+    # 내부 스레드
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _executor(stage: PipelineStage) -> Executor:
+        if stage.executor == "thread":
+            return ThreadPoolExecutor(
+                max_workers=stage.workers, thread_name_prefix=f"stage-{stage.name}"
+            )
+        return ProcessPoolExecutor(max_workers=stage.workers)
+
+    @staticmethod
+    def _drain(queues: List["queue.Queue"]):
+        """취소 시 막힌 put이 풀리도록 큐 비우기"""
+        for pending in queues:
+            try:
+                while True:
+                    pending.get_nowait()
+            except queue.Empty:
+                pass
+
+    def _put(
+        self,
+        target: "queue.Queue",
+        item: Any,
+        cancel: threading.Event,
+        metrics: Optional[StageMetrics] = None,
+    ):
+        """다음 큐에 넣기 (가득 차면 기다림 = 역압, 취소되면 버림)"""
+        waited = time.perf_counter()
+        while not cancel.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+        if metrics is not None:
+            metrics.add(blocked_seconds=time.perf_counter() - waited)
+
+    @staticmethod
+    def _get(source: "queue.Queue", cancel: threading.Event) -> Any:
+        """입력 큐에서 꺼내기 (취소되면 _END)"""
+        while not cancel.is_set():
+            try:
+                return source.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _END
+
+    def _sample(self, stage_name: str, target: "queue.Queue"):
+        self.metrics[stage_name].sample(target.qsize())
+
+    def _feed(self, items: List[Any], first: "queue.Queue", cancel: threading.Event):
+        for index, item in enumerate(items):
+            self._put(first, _Work(index, item, item), cancel)
+            self._sample(self.stages[0].name, first)
+        self._put(first, _END, cancel)
+
+    def _run_stage(
+        self,
+        stage: PipelineStage,
+        executor: Executor,
+        inbox: "queue.Queue",
+        downstream: Optional["queue.Queue"],
+        next_name: Optional[str],
+        events: "queue.Queue",
+        cancel: threading.Event,
+    ):
+        """디스패처 (이 스레드) + 수집 스레드"""
+        metrics = self.metrics[stage.name]
+        slots = threading.Semaphore(stage.workers)
+        completed: "queue.Queue" = queue.Queue()
+
+        def forward(work: _Work, result: StageResult, latency: float):
+            if result[0]:
+                metrics.add(processed=1)
+                if downstream is not None:
+                    self._put(
+                        downstream, _Work(work.index, work.source, result[1]), cancel, metrics
+                    )
+                    self._sample(next_name, downstream)
+            else:
+                metrics.add(failed=1)
+            events.put((stage.name, work, result, latency))
+
+        def collect():
+            while True:
+                entry = completed.get()
+                if entry is _END:
+                    return
+                work, future, submitted = entry
+                latency = time.perf_counter() - submitted
+                metrics.add(busy_seconds=latency)
+                try:
+                    result = future.result()
+                    if stage.complete:
+                        result = stage.complete(work.payload, result)
+                except BaseException as e:  # 워커 예외, 프로세스 비정상 종료, 취소
+                    if cancel.is_set():
+                        slots.release()
+                        continue
+                    result = (False, None, f"{stage.name} 실패: {e}")
+                try:
+                    forward(work, result, latency)
+                finally:
+                    slots.release()
+
+        collector = threading.Thread(
+            target=collect, name=f"pipeline-{stage.name}-collect", daemon=True
+        )
+        collector.start()
+        try:
+            while True:
+                waited = time.perf_counter()
+                work = self._get(inbox, cancel)
+                metrics.add(starved_seconds=time.perf_counter() - waited)
+                if work is _END:
+                    break
+
+                try:
+                    bypassed = stage.bypass(work.payload) if stage.bypass else None
+                except Exception as e:
+                    bypassed = (False, None, f"{stage.name} 실패: {e}")
+                if bypassed is not None:
+                    metrics.add(bypassed=1)
+                    forward(work, bypassed, 0.0)
+                    continue
+
+                slots.acquire()
+                if cancel.is_set():
+                    slots.release()
+                    break
+                submitted = time.perf_counter()
+                try:
+                    future = executor.submit(stage.func, work.payload)
+                except RuntimeError as e:  # 취소로 실행기가 닫힘
+                    slots.release()
+                    if cancel.is_set():
+                        break
+                    forward(work, (False, None, f"{stage.name} 실패: {e}"), 0.0)
+                    continue
+                future.add_done_callback(lambda f, w=work, t=submitted: completed.put((w, f, t)))
+
+            # 진행 중인 작업이 모두 수집/전달될 때까지
+            for _ in range(stage.workers):
+                slots.acquire()
+        except BaseException as e:
+            events.put((stage.name, None, e, 0.0))
+        finally:
+            completed.put(_END)
+            collector.join()
+            if downstream is not None:
+                self._put(downstream, _END, cancel)
+            events.put(_END)
@@ -0,0 +1,268 @@
+"""
+진행 이벤트 버스
+
+파이프라인(전처리, 분리, 변환, 합병)이 진행 상황을 print나 제각각인 콜백 대신
+ProgressEvent 하나로 발행하고, UI(PyQt WorkerThread, Tk 다이얼로그)와 MCP 작업이
+구독합니다.
+
+- 발행: 구독자가 없으면 이벤트 객체도 만들지 않음 (핫 루프 비용 최소화)
+    progress_bus.emit("preprocess", completed, total, item=name, latency=0.8)
+    또는 stage = progress_bus.stage("pdf", total); stage.advance(item)
+- 구독: min_interval로 전달 빈도 제한 (마지막 이벤트와 실패 이벤트는 항상 전달)
+    - same_thread=True: 구독한 스레드에서 발행된 이벤트만 (동시에 도는 작업끼리 분리)
+    - 구독자 예외는 무시하되 ProgressAbort는 발행한 파이프라인까지 전달 (취소)
+- 구독자는 발행한 스레드에서 호출됨 (Qt는 시그널, Tk는 메인 스레드에서만 사용)
+"""
+
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, Optional, Tuple
+
+
+class ProgressAbort(BaseException):
+    """구독자가 파이프라인을 중단시킬 때 발생 (취소 버튼, MCP 작업 취소)
+
+    파이프라인 곳곳의 `except Exception`에 잡혀 실패로 바뀌지 않도록
+    KeyboardInterrupt처럼 BaseException을 상속합니다.
+    """
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """진행 이벤트
+
+    Attributes:
+        stage: 단계 이름 ("preprocess", "separate", "pdf", "image", "merge" ...)
+        completed: 완료한 항목 수
+        total: 전체 항목 수 (모르면 None)
+        item: 방금 끝난 항목 (파일 이름 등)
+        latency: 항목 하나 처리 시간 (초)
+        ok: 항목 성공 여부
+        message: 부가 설명 (오류 메시지 등)
+    """
+
+    stage: str
+    completed: int
+    total: Optional[int] = None
+    item: str = ""
+    latency: float = 0.0
+    ok: bool = True
+    message: str = ""
+    timestamp: float = field(default_factory=time.monotonic)
+
+    @property
+    def fraction(self) -> Optional[float]:
+        if not self.total:
+            return None
+        return min(1.0, self.completed / self.total)
+
+    @property
+    def percent(self) -> Optional[int]:
+        fraction = self.fraction
+        return None if fraction is None else int(fraction * 100)
+
+    @property
+    def is_final(self) -> bool:
+        return self.total is not None and self.completed >= self.total
+
+    def describe(self) -> str:
+        """사람이 읽는 한 줄 ("preprocess 3/10 a.hwp 0.80s")"""
+        count = f"{self.completed}/{self.total}" if self.total is not None else str(self.completed)
+        parts = [self.stage, count]
+        if self.item:
+            parts.append(self.item)
+        if self.latency:
+            parts.append(f"{self.latency:.2f}s")
+        if not self.ok:
+            parts.append(f"실패{': ' + self.message if self.message else ''}")
+        elif self.message:
+            parts.append(self.message)
+        return " ".join(parts)
+
+
+ProgressCallback = Callable[[ProgressEvent], None]
+
+
+class Subscription:
+    """구독 1개 (빈도 제한 상태 포함)"""
+
+    __slots__ = (
+        "callback",
+        "min_interval",
+        "thread",
+        "stages",
+        "_bus",
+        "_last",
+        "_pending",
+        "_lock",
+    )
+
+    def __init__(self, bus, callback, min_interval, thread, stages):
+        self.callback = callback
+        self.min_interval = min_interval
+        self.thread = thread
+        self.stages = stages
+        self._bus = bus
+        self._last = 0.0
+        self._pending: Optional[ProgressEvent] = None
+        self._lock = threading.Lock()  # 여러 스레드가 같은 구독에 발행 (전달은 잠금 밖에서)
+
+    def accepts(self, event: ProgressEvent, thread: int) -> bool:
+        if self.thread is not None and thread != self.thread:
+            return False
+        return self.stages is None or event.stage in self.stages
+
+    def offer(self, event: ProgressEvent):
+        """빈도 제한: 간격이 지났거나 마지막/실패 이벤트면 전달, 아니면 보류"""
+        with self._lock:
+            if (
+                self.min_interval
+                and event.ok
+                and not event.is_final
+                and event.timestamp - self._last < self.min_interval
+            ):
+                self._pending = event
+                return
+            self._pending = None
+            self._last = event.timestamp
+        self._deliver(event)
+
+    def flush(self):
+        with self._lock:
+            event, self._pending = self._pending, None
+            if event is not None:
+                self._last = event.timestamp
+        if event is not None:
+            self._deliver(event)
+
+    def _deliver(self, event: ProgressEvent):
+        try:
+            self.callback(event)
+        except Exception as e:  # ProgressAbort(BaseException)는 그대로 전파
+            print(f"[progress] 구독자 오류 무시: {e}", file=sys.stderr)
+
+    def close(self):
+        self._bus.unsubscribe(self)
+
+
+class ProgressBus:
+    """진행 이벤트 발행/구독"""
+
+    def __init__(self):
+        self._subscriptions: Tuple[Subscription, ...] = ()
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        return bool(self._subscriptions)
+
+    def subscribe(
+        self,
+        callback: ProgressCallback,
+        min_interval: float = 0.0,
+        same_thread: bool = False,
+        stages: Optional[Tuple[str, ...]] = None,
+    ) -> Subscription:
+        """구독 추가
+
+        Args:
+            callback: 이벤트 처리 함수 (발행한 스레드에서 호출)
+            min_interval: 최소 전달 간격 (초, 0이면 모든 이벤트)
+            same_thread: 이 스레드에서 발행된 이벤트만 받기
+            stages: 받을 단계 이름 (None이면 전부)
+        """
+        subscription = Subscription(
+            self,
+            callback,
+            min_interval,
+            threading.get_ident() if same_thread else None,
+            frozenset(stages) if stages else None,
+        )
+        with self._lock:
+            self._subscriptions = self._subscriptions + (subscription,)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            self._subscriptions = tuple(s for s in self._subscriptions if s is not subscription)
+
+    @contextmanager
+    def subscribed(self, callback: ProgressCallback, **options) -> Iterator[Subscription]:
+        """with 블록 동안만 구독 (끝날 때 보류된 이벤트 전달)"""
+        subscription = self.subscribe(callback, **options)
+        try:
+            yield subscription
+        finally:
+            self.unsubscribe(subscription)
+            subscription.flush()
+
+    def publish(self, event: ProgressEvent):
+        subscriptions = self._subscriptions
+        if not subscriptions:
+            return
+        thread = threading.get_ident()
+        for subscription in subscriptions:
+            if subscription.accepts(event, thread):
+                subscription.offer(event)
+
+    def emit(
+        self,
+        stage: str,
+        completed: int,
+        total: Optional[int] = None,
+        item: str = "",
+        latency: float = 0.0,
+        ok: bool = True,
+        message: str = "",
+    ):
+        """이벤트 발행 (구독자가 없으면 아무것도 하지 않음)"""
+        if self._subscriptions:
+            self.publish(ProgressEvent(stage, completed, total, item, latency, ok, message))
+
+    def stage(self, name: str, total: Optional[int] = None) -> "StageProgress":
+        return StageProgress(self, name, total)
+
+
+class StageProgress:
+    """단계 하나의 완료 개수/항목별 시간을 세면서 발행
+
+    latency를 주지 않으면 직전 advance() 이후 경과 시간을 씁니다.
+    """
+
+    __slots__ = ("bus", "name", "total", "completed", "_last")
+
+    def __init__(self, bus: ProgressBus, name: str, total: Optional[int] = None):
+        self.bus = bus
+        self.name = name
+        self.total = total
+        self.completed = 0
+        self._last = time.perf_counter()
+
+    def start(self, message: str = ""):
+        """0/total 이벤트 (UI에 단계 시작 표시)"""
+        self._last = time.perf_counter()
+        self.bus.emit(self.name, 0, self.total, message=message)
+
+    def advance(
+        self, item: str = "", latency: Optional[float] = None, ok: bool = True, message: str = ""
+    ):
+        self.completed += 1
+        now = time.perf_counter()
+        if latency is None:
+            latency = now - self._last
+        self._last = now
+        self.bus.emit(self.name, self.completed, self.total, item, latency, ok, message)
+
+
+# 프로세스 전역 버스
+progress_bus = ProgressBus()
+
+
+def console_progress(event: ProgressEvent):
+    """stderr에 한 줄씩 출력하는 구독자 (CLI용)"""
+    percent = event.percent
+    prefix = f"[{percent:3d}%] " if percent is not None else ""
+    print(f"{prefix}{event.describe()}", file=sys.stderr)
@@ -0,0 +1,267 @@
+"""
+시작 시간 프로파일러
+
+런처(run_ui.py, ui/main_pyqt.py)와 MCP 서버가 첫 화면(또는 요청 대기)까지 어디에 시간을
+쓰는지 기록합니다. 환경 변수로 켜며, 꺼져 있으면 phase()/finish()는 아무것도 하지 않습니다.
+
+    HWP_STARTUP_PROFILE=startup.json python run_ui.py
+    HWP_STARTUP_EXIT=1  → 첫 화면 직후 종료 (Tests/Benchmarks/bench_startup.py)
+
+보고서 (JSON):
+- imports: 모듈별 import 시간 (-X importtime과 같은 self/cumulative, 단위 µs)
+- phases: 이름 붙인 구간 (예: "plugins" - 플러그인 목록 등록)
+- marks: 프로파일러 시작 기준 시점 (예: "first_paint", "ready")
+
+entry 스크립트 맨 위에서, 무거운 import보다 먼저 start_from_env()를 호출해야 합니다.
+이 모듈은 표준 라이브러리만 import합니다.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from importlib.abc import MetaPathFinder
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+STARTUP_PROFILE_ENV = "HWP_STARTUP_PROFILE"
+STARTUP_EXIT_ENV = "HWP_STARTUP_EXIT"
+
+
+@dataclass
+class ImportRecord:
+    """모듈 1개 import 시간 (µs, -X importtime과 같은 의미)"""
+
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+# ============================================================================
+# import 시간 측정
+# ============================================================================
+
+
+class _TimedLoader:
+    """원래 로더에 위임하면서 create_module + exec_module 시간을 잼"""
+
+    def __init__(self, loader, timer: "ImportTimer"):
+        self._loader = loader
+        self._timer = timer
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        self._timer._enter(spec.name)
+        create_module = getattr(self._loader, "create_module", None)
+        try:
+            return create_module(spec) if create_module is not None else None
+        except BaseException:
+            self._timer._leave(spec.name)
+            raise
+
+    def exec_module(self, module):
+        # create_module 없이 exec_module만 부르는 경로(reload 등) 대비
+        if self._timer._current() != module.__name__:
+            self._timer._enter(module.__name__)
+        # 모듈에는 원래 로더를 남김 (isinstance 검사, 리소스 읽기)
+        module.__loader__ = self._loader
+        if getattr(module, "__spec__", None) is not None and module.__spec__.loader is self:
+            module.__spec__.loader = self._loader
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._timer._leave(module.__name__)
+
+
+class ImportTimer(MetaPathFinder):
+    """sys.meta_path 맨 앞에서 다른 finder의 결과 로더를 감싸 import 시간을 기록"""
+
+    def __init__(self):
+        self.records: List[ImportRecord] = []
+        self._local = threading.local()
+
+    # -- 설치/해제 ----------------------------------------------------------
+
+    def install(self):
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    # -- MetaPathFinder ----------------------------------------------------
+
+    def find_spec(self, fullname, path, target=None):
+        if getattr(self._local, "finding", False):
+            return None
+        self._local.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.finding = False
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self)
+        return spec
+
+    # -- 스택 ---------------------------------------------------------------
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _current(self) -> Optional[str]:
+        stack = self._stack()
+        return stack[-1][0] if stack else None
+
+    def _enter(self, name: str):
+        # [이름, 시작 시각, 하위 import 누적 시간]
+        self._stack().append([name, time.perf_counter(), 0.0])
+
+    def _leave(self, name: str):
+        stack = self._stack()
+        if not any(entry[0] == name for entry in stack):
+            return
+        while stack[-1][0] != name:  # 실패로 끝나지 않은 하위 항목 정리
+            stack.pop()
+        _, started, children = stack.pop()
+        cumulative = time.perf_counter() - started
+        if stack:
+            stack[-1][2] += cumulative
+        self.records.append(
+            ImportRecord(
+                name,
+                int((cumulative - children) * 1e6),
+                int(cumulative * 1e6),
+                len(stack),
+            )
+        )
+
+    def top(self, limit: int = 20) -> List[ImportRecord]:
+        """누적 시간 기준 상위 모듈"""
+        return sorted(self.records, key=lambda r: r.cumulative_us, reverse=True)[:limit]
+
+
+# ============================================================================
+# 프로파일러
+# ============================================================================
+
+
+class StartupProfiler:
+    """시작 구간 기록 (start() 전에는 모든 호출이 no-op)"""
+
+    def __init__(self):
+        self.entry = ""
+        self.enabled = False
+        self.report_path: Optional[Path] = None
+        self.phases: Dict[str, float] = {}
+        self.marks: Dict[str, float] = {}
+        self.imports = ImportTimer()
+        self._started = 0.0
+
+    def start(self, entry: str, report_path: Optional[str] = None):
+        self.entry = entry
+        self.enabled = True
+        self.report_path = Path(report_path) if report_path else None
+        self._started = time.perf_counter()
+        self.imports.install()
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._started
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """이름 붙인 구간 시간 기록"""
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - started
+
+    def mark(self, name: str):
+        if self.enabled:
+            self.marks[name] = self.elapsed()
+
+    def finish(self, mark: str = "first_paint") -> bool:
+        """첫 화면/요청 대기 시점 기록, 보고서 저장
+
+        Returns:
+            True면 호출한 쪽이 바로 종료해야 함 (HWP_STARTUP_EXIT)
+        """
+        if not self.enabled:
+            return False
+        self.mark(mark)
+        self.imports.uninstall()
+        self.enabled = False
+
+        if self.report_path is not None:
+            self.write(self.report_path)
+        print(self.format_summary(), file=sys.stderr)
+        return bool(os.environ.get(STARTUP_EXIT_ENV))
+
+    # -- 보고서 -------------------------------------------------------------
+
+    def report(self, limit: int = 40) -> dict:
+        records = self.imports.records
+        return {
+            "entry": self.entry,
+            "python": sys.version.split()[0],
+            "marks": {name: round(value, 6) for name, value in self.marks.items()},
+            "phases": {name: round(value, 6) for name, value in self.phases.items()},
+            "import_count": len(records),
+            "import_seconds": round(sum(r.cumulative_us for r in records if r.depth == 0) / 1e6, 6),
+            "top_imports": [asdict(r) for r in self.imports.top(limit)],
+            "imports": [asdict(r) for r in records],
+        }
+
+    def write(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(), ensure_ascii=False, indent=2), encoding="utf-8")
+
+    def format_summary(self, limit: int = 10) -> str:
+        report = self.report(limit)
+        lines = [
+            f"[startup] {self.entry}: "
+            + ", ".join(f"{name} {value * 1000:.0f}ms" for name, value in report["marks"].items())
+        ]
+        lines.append(
+            f"  import {report['import_seconds'] * 1000:.0f}ms ({report['import_count']}개 모듈)"
+            + "".join(f", {name} {value * 1000:.0f}ms" for name, value in report["phases"].items())
+        )
+        for record in report["top_imports"]:
+            lines.append(f"  {record['cumulative_us'] / 1000:8.1f}ms  {record['name']}")
+        return "\n".join(lines)
+
+
+# 프로세스 전역 프로파일러
+startup_profiler = StartupProfiler()
+
+
+def start_from_env(entry: str) -> StartupProfiler:
+    """HWP_STARTUP_PROFILE이 설정되어 있으면 프로파일링 시작
+
+    값이 "1"이면 stderr 요약만, 그 밖의 값은 보고서 JSON 경로로 씁니다.
+    """
+    value = os.environ.get(STARTUP_PROFILE_ENV)
+    if value and not startup_profiler.enabled:
+        startup_profiler.start(entry, None if value == "1" else value)
+    return startup_profiler
@@ -5,6 +5,11 @@ from pathlib import Path
 # 프로젝트 루트를 path에 추가
 sys.path.insert(0, str(Path(__file__).parent))
 
+# 시작 시간 프로파일링 (HWP_STARTUP_PROFILE) - 다른 import보다 먼저
+from core.startup import start_from_env
+
+start_from_env("run_ui")
+
 from ui.main import HwpAutomationLauncher
 
 if __name__ == "__main__":
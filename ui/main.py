@@ -17,7 +17,7 @@ if sys.platform == 'win32':
 import tkinter as tk
 from tkinter import ttk, messagebox
 from automations import get_registry
-
+from core.startup import startup_profiler
 
 class HwpAutomationLauncher:
     """메인 런처 윈도우"""
@@ -37,42 +37,13 @@ class HwpAutomationLauncher:
         self._setup_ui()
 
     def _load_plugins(self):
-        """플러그인 로드"""
-        # Merger 플러그인
-        try:
-            from automations.merger import MergerPlugin
-        except ImportError as e:
-            print(f"Failed to load Merger plugin: {e}")
-
-        # MCP 플러그인
-        try:
-            from automations.mcp import MCPPlugin
-        except ImportError as e:
-            print(f"Failed to load MCP plugin: {e}")
-
-        # Separator 플러그인
-        try:
-            from automations.separator import SeparatorPlugin
-        except ImportError as e:
-            print(f"Failed to load Separator plugin: {e}")
+        """플러그인 로드
 
-        # Converter 플러그인
-        try:
-            from automations.converter import ConverterPlugin
-        except ImportError as e:
-            print(f"Failed to load Converter plugin: {e}")
-
-        # Consolidator 플러그인
-        try:
-            from automations.consolidator import ConsolidatorPlugin
-        except ImportError as e:
-            print(f"Failed to load Consolidator plugin: {e}")
-
-        # Seperate2Img 플러그인
-        try:
-            from automations.seperate2Img import Seperate2ImgPlugin
-        except ImportError as e:
-            print(f"Failed to load Seperate2Img plugin: {e}")
+        내장 플러그인은 automations/manifest.py에 선언되어 있어 목록 표시에는 import가
+        필요 없습니다. 플러그인 모듈은 실행할 때 registry.get_plugin()이 import합니다.
+        """
+        with startup_profiler.phase("plugins"):
+            self.plugins = self.registry.get_all_metadata()
 
     def _setup_ui(self):
         """UI 구성"""
@@ -108,7 +79,6 @@ class HwpAutomationLauncher:
         scrollbar.config(command=self.plugin_list.yview)
 
         # 플러그인 목록 채우기
-        self.plugins = self.registry.get_all_metadata()
         for plugin in self.plugins:
             display_text = f"{plugin.name} (v{plugin.version}) - {plugin.description}"
             self.plugin_list.insert(tk.END, display_text)
@@ -206,8 +176,14 @@ ID: {plugin.id}
 
     def run(self):
         """UI 실행"""
+        self.root.after_idle(self._on_first_paint)
         self.root.mainloop()
 
+    def _on_first_paint(self):
+        """첫 화면 표시 후 (시작 프로파일 기록)"""
+        if startup_profiler.finish("first_paint"):
+            self.root.destroy()
+
 
 def main():
     """메인 함수"""
@@ -24,6 +24,15 @@ from pathlib import Path
 # UTF-8 출력 설정 (Windows CP949 호환성)
 # main() 함수에서 설정 (import 시점 문제 방지)
 
+# 프로젝트 루트 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# 시작 시간 프로파일링 (HWP_STARTUP_PROFILE) - PyQt5 import보다 먼저
+from core.startup import start_from_env, startup_profiler
+
+start_from_env("main_pyqt")
+
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QListWidget, QListWidgetItem, QPushButton, QMessageBox,
@@ -31,13 +40,10 @@ from PyQt5.QtWidgets import (
     QGroupBox, QCheckBox, QSpinBox, QComboBox, QSplitter, QFrame,
     QDialog, QTreeWidget, QTreeWidgetItem, QDialogButtonBox, QInputDialog
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt5.QtGui import QFont, QTextCursor, QColor, QIcon
 
-# 프로젝트 루트 추가
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
+from core.progress import ProgressAbort, ProgressEvent, progress_bus
 
 # =============================================================================
 # 로그 레벨 색상 (Specs/UI/PyQtMigration.idr Section 9)
@@ -176,11 +182,16 @@ QSplitter::handle {
 # 워커 스레드 (백그라운드 작업용)
 # =============================================================================
 class WorkerThread(QThread):
-    """플러그인 실행을 위한 워커 스레드"""
+    """플러그인 실행을 위한 워커 스레드
+
+    작업 중 이 스레드에서 발행된 core.progress 이벤트를 진행률/로그 시그널로 전달합니다.
+    """
     progress = pyqtSignal(int)           # 진행률 (0-100)
     log = pyqtSignal(str, str)           # (level, message)
     finished_signal = pyqtSignal(bool, str)  # (success, message)
 
+    PROGRESS_INTERVAL = 0.1  # 시그널 최소 간격 (초) - UI 이벤트 큐 과부하 방지
+
     def __init__(self, task_func: Callable, *args, **kwargs):
         super().__init__()
         self.task_func = task_func
@@ -195,7 +206,10 @@ class WorkerThread(QThread):
             self.kwargs['log_callback'] = self._emit_log
             self.kwargs['cancel_check'] = lambda: self._is_cancelled
 
-            result = self.task_func(*self.args, **self.kwargs)
+            with progress_bus.subscribed(
+                self._on_progress_event, min_interval=self.PROGRESS_INTERVAL, same_thread=True
+            ):
+                result = self.task_func(*self.args, **self.kwargs)
 
             if self._is_cancelled:
                 self.finished_signal.emit(False, "작업이 취소되었습니다.")
@@ -204,9 +218,18 @@ class WorkerThread(QThread):
                 message = result.get('message', '완료') if isinstance(result, dict) else '완료'
                 self.finished_signal.emit(success, message)
 
+        except ProgressAbort:
+            self.finished_signal.emit(False, "작업이 취소되었습니다.")
         except Exception as e:
             self.finished_signal.emit(False, f"오류: {str(e)}")
 
+    def _on_progress_event(self, event: ProgressEvent):
+        if self._is_cancelled:
+            raise ProgressAbort()
+        if event.percent is not None:
+            self._emit_progress(event.percent)
+        self._emit_log("info" if event.ok else "error", event.describe())
+
     def _emit_progress(self, percent: int):
         self.progress.emit(min(100, max(0, percent)))
 
@@ -617,28 +640,15 @@ class PluginListPage(QWidget):
         layout.addLayout(button_bar)
 
     def load_plugins(self):
-        """플러그인 로드 (mcp 제외)"""
+        """플러그인 목록 표시 (mcp 제외)
+
+        매니페스트 메타데이터만 읽고, 플러그인 모듈은 선택해서 실행할 때 import합니다.
+        """
         from automations import get_registry
         registry = get_registry()
 
-        # 플러그인 import
-        plugin_modules = [
-            ('automations.merger', 'MergerPlugin'),
-            ('automations.separator', 'SeparatorPlugin'),
-            ('automations.converter', 'ConverterPlugin'),
-            ('automations.consolidator', 'ConsolidatorPlugin'),
-            ('automations.seperate2Img', 'Seperate2ImgPlugin'),
-            ('automations.latex2hwp', 'Latex2HwpPlugin'),
-        ]
-
-        for module_name, class_name in plugin_modules:
-            try:
-                module = __import__(module_name, fromlist=[class_name])
-                getattr(module, class_name)
-            except (ImportError, AttributeError) as e:
-                print(f"[WARN] Failed to load {module_name}: {e}")
-
-        self.plugins = registry.get_all_metadata()
+        with startup_profiler.phase("plugins"):
+            self.plugins = registry.get_all_metadata(exclude=("mcp",))
         self.plugin_list.clear()
 
         for plugin in self.plugins:
@@ -1090,7 +1100,8 @@ class PluginExecutionPage(QWidget):
                 target_name=target_name,
                 mode=self.consolidator_mode,
                 max_workers=5,
-                verbose=True
+                verbose=True,
+                dedupe=True,
             )
 
             # 결과 경로 저장
@@ -1294,6 +1305,9 @@ def main():
     window = MainWindow()
     window.show()
 
+    # 첫 화면 표시 후 (시작 프로파일 기록)
+    QTimer.singleShot(0, lambda: startup_profiler.finish("first_paint") and app.quit())
+
     sys.exit(app.exec_())
 
 